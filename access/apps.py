@@ -1,5 +1,17 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_delete, post_save
 
 
 class AccessConfig(AppConfig):
     name = "access"
+
+    def ready(self):
+        from .models import Permission
+        from .permission_index import permission_changed
+        from .permissions import TRACKED_MODELS, assignment_changed
+
+        for model in TRACKED_MODELS:
+            post_save.connect(assignment_changed, sender=model)
+            post_delete.connect(assignment_changed, sender=model)
+        post_save.connect(permission_changed, sender=Permission)
+        post_delete.connect(permission_changed, sender=Permission)
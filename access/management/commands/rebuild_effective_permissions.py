@@ -0,0 +1,28 @@
+from django.core.management.base import BaseCommand
+
+from access.permissions import rebuild_all, refresh_user_permissions
+
+
+class Command(BaseCommand):
+    help = (
+        "Recalcula la tabla de permisos efectivos "
+        "(acc_effective_user_permission) de todos los usuarios o de los "
+        "indicados con --user."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--user",
+            action="append",
+            default=[],
+            help="ID de usuario a recalcular (se puede repetir).",
+        )
+
+    def handle(self, *args, **options):
+        if options["user"]:
+            inserted, deleted = refresh_user_permissions(options["user"])
+        else:
+            inserted, deleted = rebuild_all()
+        self.stdout.write(self.style.SUCCESS(
+            f"Permisos efectivos actualizados: {inserted} insertados, "
+            f"{deleted} eliminados"))
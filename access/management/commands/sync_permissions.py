@@ -0,0 +1,59 @@
+import os
+
+from django.core.management.base import BaseCommand, CommandError
+
+from access.models import System
+from access.permission_sync import sync_permissions
+from auth.models import User
+
+
+class Command(BaseCommand):
+    help = (
+        "Registra en acc_permission los permisos usados por las vistas "
+        "(MiddlewareAutentication) y los asocia al sistema indicado."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--system",
+            default=os.getenv("SYSTEM_ID"),
+            help="ID del sistema para PermissionSystem (default SYSTEM_ID).",
+        )
+        parser.add_argument(
+            "--user",
+            help="Usuario registrado como creador (default: primer "
+                 "administrador activo).",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Muestra los cambios sin guardarlos.",
+        )
+
+    def handle(self, *args, **options):
+        if options["user"]:
+            user = User.objects.filter(username=options["user"]).first()
+        else:
+            user = User.objects.filter(
+                is_admin=True, is_active=True).order_by("date_created").first()
+        if user is None:
+            raise CommandError("No se encontró el usuario creador")
+
+        system = None
+        if options["system"]:
+            system = System.objects.filter(pk=options["system"]).first()
+            if system is None:
+                raise CommandError(f"Sistema {options['system']} no existe")
+
+        result = sync_permissions(user, system, dry_run=options["dry_run"])
+        for label in ("created", "updated", "linked"):
+            for name in result[label]:
+                self.stdout.write(f"  [{label}] {name}")
+        for name in result["orphans"]:
+            self.stdout.write(self.style.WARNING(
+                f"  [sin vista] {name}"))
+        prefix = "(dry-run) " if options["dry_run"] else ""
+        self.stdout.write(self.style.SUCCESS(
+            f"{prefix}Permisos: {len(result['created'])} creados, "
+            f"{len(result['updated'])} actualizados, "
+            f"{len(result['linked'])} asociados al sistema"))
@@ -30,7 +30,10 @@ def seed_audit_events(apps, schema_editor):
     # We'll use the first user found or a hardcoded one if known
     User = apps.get_model('meteorite_auth', 'User')
     user = User.objects.first()
-    user_id = user.id if user else None
+    if user is None:
+        # Base nueva (p. ej. la de los tests): sin autor para las filas
+        return
+    user_id = user.id
     
     # Needs a valid status to match BaseModel requirements
     Status = apps.get_model('config', 'Status')
@@ -0,0 +1,73 @@
+# Generated by Django 6.0.1 on 2026-10-19 17:09
+
+from django.db import migrations, models
+
+# Carga inicial con la misma regla que access/permissions.py
+STATUS_ACTIVO = "2bd04756-cf71-438d-b8be-7d6dd58e5e34"
+
+POPULATE_SQL = f"""
+WITH user_roles AS (
+    SELECT ur.user_id, ur.role_id
+    FROM acc_user_role ur
+    JOIN acc_role r ON r.id = ur.role_id
+    WHERE ur.status_id = '{STATUS_ACTIVO}' AND r.status_id = '{STATUS_ACTIVO}'
+    UNION
+    SELECT ugr.user_id, ugr.role_id
+    FROM acc_user_group_role ugr
+    JOIN acc_role r ON r.id = ugr.role_id
+    JOIN acc_group g ON g.id = ugr.group_id
+    WHERE ugr.status_id = '{STATUS_ACTIVO}' AND r.status_id = '{STATUS_ACTIVO}'
+      AND g.status_id = '{STATUS_ACTIVO}'
+)
+INSERT INTO acc_effective_user_permission (user_id, decorator_name)
+SELECT ur.user_id, btrim(p.decorator_name)
+FROM user_roles ur
+JOIN acc_permission_role pr ON pr.role_id = ur.role_id
+JOIN acc_permission p ON p.id = pr.permission_id
+WHERE pr.status_id = '{STATUS_ACTIVO}' AND p.status_id = '{STATUS_ACTIVO}'
+  AND coalesce(p.decorator_name, '') <> ''
+UNION
+SELECT ur.user_id, 'ALL_PERMISSIONS'
+FROM user_roles ur
+JOIN acc_role r ON r.id = ur.role_id
+WHERE r.name = 'ALL PERMISSIONS'
+ON CONFLICT DO NOTHING;
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("access", "0006_alter_permissionrole_unique_together_and_more"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="EffectiveUserPermission",
+            fields=[
+                (
+                    "pk",
+                    models.CompositePrimaryKey(
+                        "user_id",
+                        "decorator_name",
+                        blank=True,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                ("user_id", models.UUIDField()),
+                ("decorator_name", models.TextField()),
+            ],
+            options={
+                "db_table": "acc_effective_user_permission",
+                "indexes": [
+                    models.Index(
+                        fields=["decorator_name", "user_id"],
+                        name="acc_eff_perm_decorator_idx",
+                    )
+                ],
+            },
+        ),
+        migrations.RunSQL(POPULATE_SQL, migrations.RunSQL.noop),
+    ]
@@ -0,0 +1,144 @@
+# Generated by Django 6.0.1 on 2026-10-19 17:44
+
+import config.ids
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("access", "0007_effective_user_permission"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="action",
+            name="id",
+            field=models.UUIDField(
+                default=config.ids.new_id,
+                editable=False,
+                primary_key=True,
+                serialize=False,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="event",
+            name="id",
+            field=models.UUIDField(
+                default=config.ids.new_id,
+                editable=False,
+                primary_key=True,
+                serialize=False,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="group",
+            name="id",
+            field=models.UUIDField(
+                default=config.ids.new_id,
+                editable=False,
+                primary_key=True,
+                serialize=False,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="menu",
+            name="id",
+            field=models.UUIDField(
+                default=config.ids.new_id,
+                editable=False,
+                primary_key=True,
+                serialize=False,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="permission",
+            name="id",
+            field=models.UUIDField(
+                default=config.ids.new_id,
+                editable=False,
+                primary_key=True,
+                serialize=False,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="permissionrole",
+            name="id",
+            field=models.UUIDField(
+                default=config.ids.new_id,
+                editable=False,
+                primary_key=True,
+                serialize=False,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="permissionsystem",
+            name="id",
+            field=models.UUIDField(
+                default=config.ids.new_id,
+                editable=False,
+                primary_key=True,
+                serialize=False,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="role",
+            name="id",
+            field=models.UUIDField(
+                default=config.ids.new_id,
+                editable=False,
+                primary_key=True,
+                serialize=False,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="rolemenu",
+            name="id",
+            field=models.UUIDField(
+                default=config.ids.new_id,
+                editable=False,
+                primary_key=True,
+                serialize=False,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="system",
+            name="id",
+            field=models.UUIDField(
+                default=config.ids.new_id,
+                editable=False,
+                primary_key=True,
+                serialize=False,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="usergroup",
+            name="id",
+            field=models.UUIDField(
+                default=config.ids.new_id,
+                editable=False,
+                primary_key=True,
+                serialize=False,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="usergrouprole",
+            name="id",
+            field=models.UUIDField(
+                default=config.ids.new_id,
+                editable=False,
+                primary_key=True,
+                serialize=False,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="userrole",
+            name="id",
+            field=models.UUIDField(
+                default=config.ids.new_id,
+                editable=False,
+                primary_key=True,
+                serialize=False,
+            ),
+        ),
+    ]
@@ -0,0 +1,216 @@
+# Generated by Django 6.0.1 on 2026-10-19 17:48
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("access", "0008_uuid7_default"),
+        ("config", "0008_meteorite_uuid7"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="action",
+            index=models.Index(
+                condition=models.Q(
+                    ("status_id", "bd7a3ed1-efdb-429b-9cb2-9999b7a12bab"), _negated=True
+                ),
+                fields=["-created_at"],
+                name="acc_action_live_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="action",
+            index=models.Index(
+                condition=models.Q(
+                    ("status_id", "2bd04756-cf71-438d-b8be-7d6dd58e5e34")
+                ),
+                fields=["name"],
+                name="acc_action_active_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="event",
+            index=models.Index(
+                condition=models.Q(
+                    ("status_id", "bd7a3ed1-efdb-429b-9cb2-9999b7a12bab"), _negated=True
+                ),
+                fields=["-created_at"],
+                name="acc_event_live_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="event",
+            index=models.Index(
+                condition=models.Q(
+                    ("status_id", "2bd04756-cf71-438d-b8be-7d6dd58e5e34")
+                ),
+                fields=["name"],
+                name="acc_event_active_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="group",
+            index=models.Index(
+                condition=models.Q(
+                    ("status_id", "bd7a3ed1-efdb-429b-9cb2-9999b7a12bab"), _negated=True
+                ),
+                fields=["-created_at"],
+                name="acc_group_live_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="group",
+            index=models.Index(
+                condition=models.Q(
+                    ("status_id", "2bd04756-cf71-438d-b8be-7d6dd58e5e34")
+                ),
+                fields=["name"],
+                name="acc_group_active_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="menu",
+            index=models.Index(
+                condition=models.Q(
+                    ("status_id", "bd7a3ed1-efdb-429b-9cb2-9999b7a12bab"), _negated=True
+                ),
+                fields=["-created_at"],
+                name="acc_menu_live_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="menu",
+            index=models.Index(
+                condition=models.Q(
+                    ("status_id", "2bd04756-cf71-438d-b8be-7d6dd58e5e34")
+                ),
+                fields=["title"],
+                name="acc_menu_active_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="permission",
+            index=models.Index(
+                condition=models.Q(
+                    ("status_id", "bd7a3ed1-efdb-429b-9cb2-9999b7a12bab"), _negated=True
+                ),
+                fields=["-created_at"],
+                name="acc_permission_live_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="permission",
+            index=models.Index(
+                condition=models.Q(
+                    ("status_id", "2bd04756-cf71-438d-b8be-7d6dd58e5e34")
+                ),
+                fields=["name"],
+                name="acc_permission_active_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="permissionrole",
+            index=models.Index(
+                condition=models.Q(
+                    ("status_id", "bd7a3ed1-efdb-429b-9cb2-9999b7a12bab"), _negated=True
+                ),
+                fields=["-created_at"],
+                name="acc_permission_role_live_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="permissionsystem",
+            index=models.Index(
+                condition=models.Q(
+                    ("status_id", "bd7a3ed1-efdb-429b-9cb2-9999b7a12bab"), _negated=True
+                ),
+                fields=["-created_at"],
+                name="acc_perm_system_live_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="role",
+            index=models.Index(
+                condition=models.Q(
+                    ("status_id", "bd7a3ed1-efdb-429b-9cb2-9999b7a12bab"), _negated=True
+                ),
+                fields=["-created_at"],
+                name="acc_role_live_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="role",
+            index=models.Index(
+                condition=models.Q(
+                    ("status_id", "2bd04756-cf71-438d-b8be-7d6dd58e5e34")
+                ),
+                fields=["name"],
+                name="acc_role_active_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="rolemenu",
+            index=models.Index(
+                condition=models.Q(
+                    ("status_id", "bd7a3ed1-efdb-429b-9cb2-9999b7a12bab"), _negated=True
+                ),
+                fields=["-created_at"],
+                name="acc_role_menu_live_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="system",
+            index=models.Index(
+                condition=models.Q(
+                    ("status_id", "bd7a3ed1-efdb-429b-9cb2-9999b7a12bab"), _negated=True
+                ),
+                fields=["-created_at"],
+                name="acc_system_live_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="system",
+            index=models.Index(
+                condition=models.Q(
+                    ("status_id", "2bd04756-cf71-438d-b8be-7d6dd58e5e34")
+                ),
+                fields=["name"],
+                name="acc_system_active_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="usergroup",
+            index=models.Index(
+                condition=models.Q(
+                    ("status_id", "bd7a3ed1-efdb-429b-9cb2-9999b7a12bab"), _negated=True
+                ),
+                fields=["-created_at"],
+                name="acc_user_group_live_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="usergrouprole",
+            index=models.Index(
+                condition=models.Q(
+                    ("status_id", "bd7a3ed1-efdb-429b-9cb2-9999b7a12bab"), _negated=True
+                ),
+                fields=["-created_at"],
+                name="acc_user_group_role_live_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="userrole",
+            index=models.Index(
+                condition=models.Q(
+                    ("status_id", "bd7a3ed1-efdb-429b-9cb2-9999b7a12bab"), _negated=True
+                ),
+                fields=["-created_at"],
+                name="acc_user_role_live_idx",
+            ),
+        ),
+    ]
@@ -1,6 +1,6 @@
 from django.db import models
 
-from config.models import BaseModel
+from config.models import BaseModel, soft_delete_indexes
 
 
 class System(BaseModel):
@@ -12,6 +12,7 @@ class System(BaseModel):
 
     class Meta:
         db_table = "acc_system"
+        indexes = soft_delete_indexes("acc_system")
 
 
 class Menu(BaseModel):
@@ -33,6 +34,7 @@ class Menu(BaseModel):
 
     class Meta:
         db_table = "acc_menu"
+        indexes = soft_delete_indexes("acc_menu", "title")
 
 
 class Action(BaseModel):
@@ -44,6 +46,7 @@ class Action(BaseModel):
 
     class Meta:
         db_table = "acc_action"
+        indexes = soft_delete_indexes("acc_action")
 
 
 class Event(BaseModel):
@@ -55,6 +58,7 @@ class Event(BaseModel):
 
     class Meta:
         db_table = "acc_event"
+        indexes = soft_delete_indexes("acc_event")
 
 
 class Role(BaseModel): 
@@ -66,6 +70,7 @@ class Role(BaseModel):
 
     class Meta:
         db_table = "acc_role"
+        indexes = soft_delete_indexes("acc_role")
 
 
 class UserRole(BaseModel):
@@ -77,6 +82,7 @@ class UserRole(BaseModel):
 
     class Meta:
         db_table = "acc_user_role"
+        indexes = soft_delete_indexes("acc_user_role", None)
         unique_together = ("user_id", "role")
 
 
@@ -89,6 +95,7 @@ class Group(BaseModel):
 
     class Meta:
         db_table = "acc_group"
+        indexes = soft_delete_indexes("acc_group")
 
 
 class UserGroup(BaseModel):
@@ -100,6 +107,7 @@ class UserGroup(BaseModel):
 
     class Meta:
         db_table = "acc_user_group"
+        indexes = soft_delete_indexes("acc_user_group", None)
         unique_together = ("user_id", "group")
 
 
@@ -113,6 +121,7 @@ class UserGroupRole(BaseModel):
 
     class Meta:
         db_table = "acc_user_group_role"
+        indexes = soft_delete_indexes("acc_user_group_role", None)
         unique_together = ("user_id", "group", "role")
 
 
@@ -125,6 +134,7 @@ class Permission(BaseModel):
 
     class Meta:
         db_table = "acc_permission"
+        indexes = soft_delete_indexes("acc_permission")
 
 
 class PermissionRole(BaseModel):
@@ -136,6 +146,7 @@ class PermissionRole(BaseModel):
 
     class Meta:
         db_table = "acc_permission_role"
+        indexes = soft_delete_indexes("acc_permission_role", None)
         unique_together = ("permission", "role")
 
 
@@ -148,6 +159,7 @@ class PermissionSystem(BaseModel):
 
     class Meta:
         db_table = "acc_permission_system"
+        indexes = soft_delete_indexes("acc_perm_system", None)
         unique_together = ("permission", "system")
 
 
@@ -166,4 +178,31 @@ class RoleMenu(BaseModel):
 
     class Meta:
         db_table = "acc_role_menu"
+        indexes = soft_delete_indexes("acc_role_menu", None)
         unique_together = ("role", "menu")
+
+
+class EffectiveUserPermission(models.Model):
+    """
+    Permisos efectivos por usuario (decorator_name), materializados a partir
+    de roles directos y por grupo, permisos y sus estados. Se mantiene con
+    access/permissions.py; no se edita a mano.
+    """
+    # Fila especial para usuarios con el rol "ALL PERMISSIONS"
+    ALL_PERMISSIONS = "ALL_PERMISSIONS"
+
+    pk = models.CompositePrimaryKey("user_id", "decorator_name")
+    user_id = models.UUIDField()
+    decorator_name = models.TextField()
+
+    def __str__(self):
+        return f"{self.user_id} - {self.decorator_name}"
+
+    class Meta:
+        db_table = "acc_effective_user_permission"
+        indexes = [
+            models.Index(
+                fields=["decorator_name", "user_id"],
+                name="acc_eff_perm_decorator_idx",
+            ),
+        ]
@@ -0,0 +1,101 @@
+"""
+Índice en memoria decorator_name -> id de los permisos ACTIVOS.
+
+MiddlewareAutentication lo consulta antes de ir a la base de datos: un
+permiso inexistente o inactivo se deniega sin consulta. Se invalida al
+guardar o eliminar un Permission (y tras sync_permissions) con la versión
+del espacio "permissions" en la cache compartida; los demás procesos la
+comprueban como máximo cada PERMISSION_INDEX_CHECK_SECONDS o ante un
+nombre desconocido (como máximo cada PERMISSION_INDEX_RECHECK_SECONDS, para
+que las peticiones a permisos inexistentes no consulten la cache cada vez).
+"""
+import threading
+import time
+from types import MappingProxyType
+
+from django.conf import settings
+from django.db import transaction
+
+from config.cache import bump_namespace, namespace_version
+
+from .models import Permission
+
+CACHE_NAMESPACE = "permissions"
+
+_index = None
+_lock = threading.Lock()
+
+
+class _Index:
+    __slots__ = ("ids", "version", "checked_at")
+
+    def __init__(self, ids, version):
+        self.ids = ids
+        self.version = version
+        self.checked_at = time.monotonic()
+
+
+def _current_version():
+    try:
+        return namespace_version(CACHE_NAMESPACE)
+    except Exception:
+        return None
+
+
+def _load(version):
+    # Import diferido: config.utils importa este módulo
+    from config.utils import STATUS_ACTIVO
+
+    rows = Permission.objects.filter(
+        status_id=STATUS_ACTIVO, decorator_name__isnull=False,
+    ).values_list("decorator_name", "id")
+    ids = {name.strip(): pk for name, pk in rows if name.strip()}
+    return _Index(MappingProxyType(ids), version)
+
+
+def _get_index(check=False):
+    global _index
+    index = _index
+    if index is not None and not check and (
+            time.monotonic() - index.checked_at
+            < settings.PERMISSION_INDEX_CHECK_SECONDS):
+        return index
+
+    with _lock:
+        version = _current_version()
+        if _index is None or version != _index.version:
+            _index = _load(version)
+        else:
+            _index.checked_at = time.monotonic()
+        return _index
+
+
+def permission_index():
+    """
+    Mapeo inmutable decorator_name -> id.
+    """
+    return _get_index().ids
+
+
+def permission_id(decorator_name):
+    index = _get_index()
+    pk = index.ids.get(decorator_name)
+    if pk is None and (
+            time.monotonic() - index.checked_at
+            >= settings.PERMISSION_INDEX_RECHECK_SECONDS):
+        # Puede haberse creado en otro proceso
+        pk = _get_index(check=True).ids.get(decorator_name)
+    return pk
+
+
+def invalidate():
+    def _bump():
+        global _index
+        bump_namespace(CACHE_NAMESPACE)
+        _index = None
+
+    transaction.on_commit(_bump)
+
+
+def permission_changed(sender, **kwargs):
+    invalidate()
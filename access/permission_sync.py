@@ -0,0 +1,167 @@
+"""
+Sincronización del catálogo de permisos con el código.
+
+Recorre el resolver de URLs, obtiene el decorator_name de cada vista
+protegida con MiddlewareAutentication y crea o actualiza en una sola
+transacción los registros de Permission (y PermissionSystem). Los permisos
+que ya no existen en el código solo se informan; no se eliminan.
+"""
+from django.db import transaction
+from django.urls import URLPattern, URLResolver, get_resolver
+
+from config.utils import STATUS_ACTIVO, STATUS_ANULADO
+
+from . import permission_index
+from .models import Permission, PermissionSystem
+
+# Preferencia para elegir un único método (Permission.method es corto)
+METHOD_ORDER = ("GET", "POST", "PATCH", "PUT", "DELETE")
+
+
+def view_permission(callback):
+    """
+    decorator_name de la vista, esté MiddlewareAutentication por encima o
+    por debajo de @api_view (se recorren __wrapped__, handlers y closures).
+    """
+    return _view_attribute(callback, "permission_name")
+
+
+def view_dynamic_permissions(callback):
+    """
+    Permisos que la vista verifica según la petición (permission_names, p.
+    ej. el permiso de log de cada tabla en el historial de auditoría).
+    """
+    return _view_attribute(callback, "permission_names") or ()
+
+
+def _view_attribute(callback, attribute):
+    seen = set()
+    stack = [callback]
+    while stack:
+        func = stack.pop()
+        if id(func) in seen:
+            continue
+        seen.add(id(func))
+        value = getattr(func, attribute, None)
+        if value:
+            return value
+        wrapped = getattr(func, "__wrapped__", None)
+        if wrapped is not None:
+            stack.append(wrapped)
+        view_class = getattr(func, "cls", None)
+        if view_class is not None:
+            for method in getattr(view_class, "http_method_names", []):
+                handler = view_class.__dict__.get(method)
+                if handler is not None:
+                    stack.append(handler)
+        for cell in getattr(func, "__closure__", None) or ():
+            try:
+                content = cell.cell_contents
+            except ValueError:
+                continue
+            if callable(content):
+                stack.append(content)
+    return None
+
+
+def _view_method(callback):
+    view_class = getattr(callback, "cls", None)
+    methods = {
+        m.upper() for m in getattr(view_class, "http_method_names", [])
+    }
+    for method in METHOD_ORDER:
+        if method in methods:
+            return method
+    return None
+
+
+def collect_view_permissions(urlconf=None):
+    """
+    Retorna {decorator_name: {"api_url": ..., "method": ...}}.
+    """
+    found = {}
+    dynamic = {}
+
+    def walk(patterns, prefix):
+        for pattern in patterns:
+            route = prefix + str(pattern.pattern)
+            if isinstance(pattern, URLResolver):
+                walk(pattern.url_patterns, route)
+            elif isinstance(pattern, URLPattern):
+                info = {
+                    "api_url": "/" + route.lstrip("^").rstrip("$"),
+                    "method": _view_method(pattern.callback),
+                }
+                name = view_permission(pattern.callback)
+                if name and name not in found:
+                    found[name] = info
+                for name in view_dynamic_permissions(pattern.callback):
+                    dynamic.setdefault(name, info)
+
+    walk(get_resolver(urlconf).url_patterns, "")
+    # Un permiso con vista propia conserva su api_url
+    for name, info in dynamic.items():
+        found.setdefault(name, info)
+    return found
+
+
+def sync_permissions(user, system=None, dry_run=False):
+    """
+    Crea los permisos que faltan y actualiza api_url/method de los
+    existentes. Con system, asegura su PermissionSystem. Retorna un dict
+    con listas created, updated, linked y orphans.
+    """
+    found = collect_view_permissions()
+    audit = {
+        "key_user_created_id": user.id,
+        "key_user_updated_id": user.id,
+        "status_id": STATUS_ACTIVO,
+    }
+
+    with transaction.atomic():
+        existing = {}
+        for permission in Permission.objects.exclude(
+                status_id=STATUS_ANULADO).exclude(decorator_name__isnull=True):
+            existing.setdefault(permission.decorator_name.strip(), permission)
+
+        to_create = []
+        to_update = []
+        for name, info in sorted(found.items()):
+            permission = existing.get(name)
+            if permission is None:
+                to_create.append(Permission(
+                    name=name[:50], decorator_name=name, **info, **audit))
+            elif (permission.api_url, permission.method) != (
+                    info["api_url"], info["method"]):
+                permission.api_url = info["api_url"]
+                permission.method = info["method"]
+                permission.key_user_updated_id = user.id
+                to_update.append(permission)
+
+        Permission.objects.bulk_create(to_create)
+        Permission.objects.bulk_update(
+            to_update, ["api_url", "method", "key_user_updated_id"])
+
+        linked = []
+        if system is not None:
+            permissions = list(existing.values()) + to_create
+            already = set(PermissionSystem.objects.filter(
+                system=system).values_list("permission_id", flat=True))
+            links = [
+                PermissionSystem(permission=p, system=system, **audit)
+                for p in permissions if p.pk not in already
+            ]
+            PermissionSystem.objects.bulk_create(links)
+            linked = [link.permission.decorator_name for link in links]
+
+        result = {
+            "created": [p.decorator_name for p in to_create],
+            "updated": [p.decorator_name for p in to_update],
+            "linked": linked,
+            "orphans": sorted(set(existing) - set(found)),
+        }
+        if dry_run:
+            transaction.set_rollback(True)
+        else:
+            permission_index.invalidate()
+    return result
@@ -0,0 +1,212 @@
+"""
+Mantenimiento de la tabla de permisos efectivos (EffectiveUserPermission).
+
+Un usuario tiene un permiso si alguno de sus roles ACTIVOS (directos, o por
+grupo ACTIVO) tiene asignado ese permiso, con la asignación y el permiso
+ACTIVOS. Los cambios en asignaciones, roles, grupos o permisos programan,
+al confirmar la transacción, el recálculo solo de los usuarios afectados.
+"""
+import threading
+from collections import defaultdict
+
+from django.db import transaction
+from django.db.models import Q
+
+from auth.models import User
+from config.utils import STATUS_ACTIVO
+
+from .models import (
+    EffectiveUserPermission,
+    Group,
+    Permission,
+    PermissionRole,
+    Role,
+    UserGroupRole,
+    UserRole,
+)
+
+ALL_PERMISSIONS_ROLE = "ALL PERMISSIONS"
+REFRESH_BATCH_SIZE = 500
+
+_pending = threading.local()
+
+
+def effective_role_pairs(user_ids):
+    """
+    Conjunto de (user_id, role_id) con roles activos de cada usuario.
+    """
+    direct = UserRole.objects.filter(
+        user_id__in=user_ids,
+        status_id=STATUS_ACTIVO,
+        role__status_id=STATUS_ACTIVO,
+    ).values_list("user_id", "role_id")
+    by_group = UserGroupRole.objects.filter(
+        user_id__in=user_ids,
+        status_id=STATUS_ACTIVO,
+        group__status_id=STATUS_ACTIVO,
+        role__status_id=STATUS_ACTIVO,
+    ).values_list("user_id", "role_id")
+    return set(direct) | set(by_group)
+
+
+def effective_role_ids(user_id):
+    return {role_id for _, role_id in effective_role_pairs([user_id])}
+
+
+def compute_user_permissions(user_ids):
+    """
+    Retorna {user_id: set(decorator_name)} para los usuarios indicados.
+    """
+    user_ids = list(user_ids)
+    result = {user_id: set() for user_id in user_ids}
+    pairs = effective_role_pairs(user_ids)
+    if not pairs:
+        return result
+
+    role_ids = {role_id for _, role_id in pairs}
+    all_roles = set(Role.objects.filter(
+        id__in=role_ids, name=ALL_PERMISSIONS_ROLE,
+    ).values_list("id", flat=True))
+    role_permissions = defaultdict(set)
+    for role_id, name in PermissionRole.objects.filter(
+        role_id__in=role_ids,
+        status_id=STATUS_ACTIVO,
+        permission__status_id=STATUS_ACTIVO,
+    ).exclude(
+        Q(permission__decorator_name__isnull=True)
+        | Q(permission__decorator_name="")
+    ).values_list("role_id", "permission__decorator_name"):
+        role_permissions[role_id].add(name.strip())
+
+    for user_id, role_id in pairs:
+        result[user_id] |= role_permissions[role_id]
+        if role_id in all_roles:
+            result[user_id].add(EffectiveUserPermission.ALL_PERMISSIONS)
+    return result
+
+
+def refresh_user_permissions(user_ids):
+    """
+    Recalcula las filas de los usuarios indicados (solo inserta/elimina
+    las diferencias). Retorna (insertadas, eliminadas).
+    """
+    user_ids = list(set(user_ids))
+    inserted = deleted = 0
+    for start in range(0, len(user_ids), REFRESH_BATCH_SIZE):
+        batch = user_ids[start:start + REFRESH_BATCH_SIZE]
+        desired = compute_user_permissions(batch)
+        with transaction.atomic():
+            current = defaultdict(set)
+            rows = EffectiveUserPermission.objects.filter(
+                user_id__in=batch).values_list("user_id", "decorator_name")
+            for user_id, name in rows:
+                current[user_id].add(name)
+
+            to_delete = Q()
+            to_create = []
+            for user_id in batch:
+                stale = current[user_id] - desired[user_id]
+                if stale:
+                    to_delete |= Q(user_id=user_id, decorator_name__in=stale)
+                to_create.extend(
+                    EffectiveUserPermission(
+                        user_id=user_id, decorator_name=name)
+                    for name in desired[user_id] - current[user_id]
+                )
+            if to_delete:
+                deleted += EffectiveUserPermission.objects.filter(
+                    to_delete).delete()[0]
+            if to_create:
+                EffectiveUserPermission.objects.bulk_create(
+                    to_create, ignore_conflicts=True)
+                inserted += len(to_create)
+    return inserted, deleted
+
+
+def rebuild_all():
+    """
+    Recalcula la tabla completa (usuarios con asignaciones o con filas).
+    """
+    user_ids = set(UserRole.objects.values_list("user_id", flat=True))
+    user_ids |= set(UserGroupRole.objects.values_list("user_id", flat=True))
+    user_ids |= set(EffectiveUserPermission.objects.values_list(
+        "user_id", flat=True))
+    return refresh_user_permissions(user_ids)
+
+
+def user_permissions(user_id):
+    """
+    Conjunto de decorator_name del usuario (incluye ALL_PERMISSIONS).
+    """
+    return set(EffectiveUserPermission.objects.filter(
+        user_id=user_id).values_list("decorator_name", flat=True))
+
+
+def users_with_permission(decorator_name):
+    """
+    Usuarios activos que pueden ejecutar decorator_name: por rol, por
+    "ALL PERMISSIONS" o por ser administradores.
+    """
+    user_ids = EffectiveUserPermission.objects.filter(
+        decorator_name__in=[
+            decorator_name, EffectiveUserPermission.ALL_PERMISSIONS],
+    ).values("user_id")
+    return User.objects.filter(
+        Q(id__in=user_ids) | Q(is_admin=True) | Q(is_superuser=True),
+        is_active=True,
+    )
+
+
+# ---------------------------------------------------------
+# RECÁLCULO INCREMENTAL (SEÑALES)
+# ---------------------------------------------------------
+def _users_for_roles(role_ids):
+    users = set(UserRole.objects.filter(
+        role_id__in=role_ids).values_list("user_id", flat=True))
+    users |= set(UserGroupRole.objects.filter(
+        role_id__in=role_ids).values_list("user_id", flat=True))
+    return users
+
+
+def _affected_users(sender, instance):
+    if sender in (UserRole, UserGroupRole):
+        return {instance.user_id}
+    if sender is Role:
+        return _users_for_roles([instance.pk])
+    if sender is PermissionRole:
+        return _users_for_roles([instance.role_id])
+    if sender is Group:
+        return set(UserGroupRole.objects.filter(
+            group_id=instance.pk).values_list("user_id", flat=True))
+    if sender is Permission:
+        return _users_for_roles(PermissionRole.objects.filter(
+            permission_id=instance.pk).values_list("role_id", flat=True))
+    return set()
+
+
+def _flush_pending():
+    users = getattr(_pending, "users", None)
+    _pending.users = set()
+    if users:
+        refresh_user_permissions(users)
+
+
+def schedule_refresh(user_ids):
+    """
+    Acumula usuarios y los recalcula una sola vez al confirmar la
+    transacción en curso (de inmediato si no hay transacción).
+    """
+    if not user_ids:
+        return
+    if getattr(_pending, "users", None) is None:
+        _pending.users = set()
+    _pending.users |= set(user_ids)
+    transaction.on_commit(_flush_pending)
+
+
+def assignment_changed(sender, instance, **kwargs):
+    schedule_refresh(_affected_users(sender, instance))
+
+
+TRACKED_MODELS = (
+    UserRole, UserGroupRole, Role, Group, Permission, PermissionRole)
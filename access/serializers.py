@@ -1,5 +1,6 @@
 from rest_framework import serializers
 from auth.models import User
+from config.serializers import StatusNameField
 
 from .models import (
     Action,
@@ -19,8 +20,7 @@ from .models import (
 
 
 class SystemSerializer(serializers.ModelSerializer):
-    status_name = serializers.CharField(
-        source="status.name", read_only=True)
+    status_name = StatusNameField()
 
     class Meta:
         model = System
@@ -34,8 +34,7 @@ class SystemSerializer(serializers.ModelSerializer):
 
 
 class MenuSerializer(serializers.ModelSerializer):
-    status_name = serializers.CharField(
-        source="status.name", read_only=True)
+    status_name = StatusNameField()
     parent_title = serializers.CharField(
         source="parent.title", read_only=True, default=None)
 
@@ -52,8 +51,7 @@ class MenuSerializer(serializers.ModelSerializer):
 
 
 class ActionSerializer(serializers.ModelSerializer):
-    status_name = serializers.CharField(
-        source="status.name", read_only=True)
+    status_name = StatusNameField()
 
     class Meta:
         model = Action
@@ -67,8 +65,7 @@ class ActionSerializer(serializers.ModelSerializer):
 
 
 class EventSerializer(serializers.ModelSerializer):
-    status_name = serializers.CharField(
-        source="status.name", read_only=True)
+    status_name = StatusNameField()
 
     class Meta:
         model = Event
@@ -82,8 +79,7 @@ class EventSerializer(serializers.ModelSerializer):
 
 
 class RoleSerializer(serializers.ModelSerializer):
-    status_name = serializers.CharField(
-        source="status.name", read_only=True)
+    status_name = StatusNameField()
 
     class Meta:
         model = Role
@@ -97,8 +93,7 @@ class RoleSerializer(serializers.ModelSerializer):
 
 
 class GroupSerializer(serializers.ModelSerializer):
-    status_name = serializers.CharField(
-        source="status.name", read_only=True)
+    status_name = StatusNameField()
 
     class Meta:
         model = Group
@@ -112,8 +107,7 @@ class GroupSerializer(serializers.ModelSerializer):
 
 
 class PermissionSerializer(serializers.ModelSerializer):
-    status_name = serializers.CharField(
-        source="status.name", read_only=True)
+    status_name = StatusNameField()
 
     class Meta:
         model = Permission
@@ -129,8 +123,7 @@ class PermissionSerializer(serializers.ModelSerializer):
 # ─── Pivote: UserRole ────────────────────────────────────────────────────────
 class UserRoleSerializer(serializers.ModelSerializer):
     role_name = serializers.CharField(source="role.name", read_only=True)
-    status_name = serializers.CharField(
-        source="status.name", read_only=True)
+    status_name = StatusNameField()
 
     class Meta:
         model = UserRole
@@ -143,22 +136,49 @@ class UserRoleSerializer(serializers.ModelSerializer):
         read_only_fields = ["key_user_created", "key_user_updated", "status"]
 
 
+# Nombre de usuario en pivotes (user_id no es FK)
+def user_full_names(user_ids):
+    users = User.objects.filter(id__in=set(user_ids)).values_list(
+        "id", "first_name", "last_name")
+    return {
+        user_id: f"{first_name} {last_name}".strip()
+        for user_id, first_name, last_name in users
+    }
+
+
+class UserFullNameListSerializer(serializers.ListSerializer):
+    """
+    Carga los nombres de todos los usuarios de la página en una consulta.
+    """
+
+    def to_representation(self, data):
+        rows = list(data.all() if hasattr(data, "all") else data)
+        self.child.user_names = user_full_names(row.user_id for row in rows)
+        try:
+            return super().to_representation(rows)
+        finally:
+            self.child.user_names = None
+
+
+class UserFullNameMixin:
+    user_names = None
+
+    def get_user_full_name(self, obj):
+        names = self.user_names
+        if names is None:
+            names = user_full_names([obj.user_id])
+        return names.get(obj.user_id) or str(obj.user_id)
+
+
 # ─── Pivote: UserGroup ───────────────────────────────────────────────────────
-class UserGroupSerializer(serializers.ModelSerializer):
+class UserGroupSerializer(UserFullNameMixin, serializers.ModelSerializer):
     group_name = serializers.CharField(source="group.name", read_only=True)
-    status_name = serializers.CharField(
-        source="status.name", read_only=True)
+    status_name = StatusNameField()
     user_full_name = serializers.SerializerMethodField()
 
-    def get_user_full_name(self, obj):
-        try:
-            user = User.objects.get(id=obj.user_id)
-            return f"{user.first_name} {user.last_name}".strip() or str(obj.user_id)
-        except User.DoesNotExist:
-            return str(obj.user_id)
-
     class Meta:
         model = UserGroup
+        list_serializer_class = UserFullNameListSerializer
         fields = [
             "id", "user_id", "user_full_name", "group", "group_name",
             "status_name", "status",
@@ -169,22 +189,15 @@ class UserGroupSerializer(serializers.ModelSerializer):
 
 
 # ─── Pivote: UserGroupRole ───────────────────────────────────────────────────
-class UserGroupRoleSerializer(serializers.ModelSerializer):
+class UserGroupRoleSerializer(UserFullNameMixin, serializers.ModelSerializer):
     group_name = serializers.CharField(source="group.name", read_only=True)
     role_name = serializers.CharField(source="role.name", read_only=True)
-    status_name = serializers.CharField(
-        source="status.name", read_only=True)
+    status_name = StatusNameField()
     user_full_name = serializers.SerializerMethodField()
 
-    def get_user_full_name(self, obj):
-        try:
-            user = User.objects.get(id=obj.user_id)
-            return f"{user.first_name} {user.last_name}".strip() or str(obj.user_id)
-        except User.DoesNotExist:
-            return str(obj.user_id)
-
     class Meta:
         model = UserGroupRole
+        list_serializer_class = UserFullNameListSerializer
         fields = [
             "id", "user_id", "user_full_name",
             "group", "group_name", "role", "role_name",
@@ -201,8 +214,7 @@ class PermissionRoleSerializer(serializers.ModelSerializer):
     decorator_name = serializers.SerializerMethodField()
     permission_decorator = serializers.SerializerMethodField()
     role_name = serializers.CharField(source="role.name", read_only=True)
-    status_name = serializers.CharField(
-        source="status.name", read_only=True)
+    status_name = StatusNameField()
 
     def get_permission_name(self, obj):
         return obj.permission.name if obj.permission else ""
@@ -232,8 +244,7 @@ class PermissionSystemSerializer(serializers.ModelSerializer):
     permission_decorator = serializers.SerializerMethodField()
     system_name = serializers.CharField(
         source="system.name", read_only=True)
-    status_name = serializers.CharField(
-        source="status.name", read_only=True)
+    status_name = StatusNameField()
 
     def get_permission_name(self, obj):
         return obj.permission.name if obj.permission else ""
@@ -260,8 +271,7 @@ class PermissionSystemSerializer(serializers.ModelSerializer):
 class RoleMenuSerializer(serializers.ModelSerializer):
     role_name = serializers.CharField(source="role.name", read_only=True)
     menu_title = serializers.CharField(source="menu.title", read_only=True)
-    status_name = serializers.CharField(
-        source="status.name", read_only=True)
+    status_name = StatusNameField()
 
     class Meta:
         model = RoleMenu
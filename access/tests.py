@@ -1,2 +1,446 @@
+from unittest import mock
 
-# Create your tests here.
+from django.conf import settings
+from django.db import connection
+from django.http import JsonResponse
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import path, reverse
+from rest_framework.decorators import api_view
+
+from config.testing import QueryBudgetTestMixin, grant_permissions, make_user
+from config.utils import (
+    STATUS_ACTIVO,
+    STATUS_ANULADO,
+    STATUS_INACTIVO,
+    MiddlewareAutentication,
+    succescall,
+)
+
+from . import permission_index
+
+from .models import (
+    Action,
+    EffectiveUserPermission,
+    Event,
+    Group,
+    Menu,
+    Permission,
+    PermissionRole,
+    PermissionSystem,
+    Role,
+    RoleMenu,
+    System,
+    UserGroup,
+    UserGroupRole,
+    UserRole,
+)
+from .permissions import (
+    ALL_PERMISSIONS_ROLE,
+    rebuild_all,
+    refresh_user_permissions,
+    user_permissions,
+)
+from .permission_sync import collect_view_permissions, sync_permissions
+
+# Nombre de URL -> prefijo de permiso de las vistas de BaseViewFactory
+LIST_VIEWS = {
+    "action": "access_action",
+    "event": "access_event",
+    "system": "access_system",
+    "role": "access_role",
+    "group": "access_group",
+    "permission": "access_permission",
+    "menu": "access_menu",
+    "user-role": "access_user_role",
+    "user-group": "access_user_group",
+    "user-group-role": "access_user_group_role",
+    "permission-role": "access_permission_role",
+    "permission-system": "access_permission_system",
+    "role-menu": "access_role_menu",
+}
+SELECT_VIEWS = (
+    "action", "event", "system", "role", "group", "permission", "menu")
+ROWS = 3
+
+
+class FactoryQueryBudgetTests(QueryBudgetTestMixin, TestCase):
+    """
+    get/select de las vistas de BaseViewFactory con varias filas por tabla:
+    en modo estricto QueryInstrumentationMiddleware falla si se supera
+    settings.QUERY_BUDGETS (p. ej. una consulta por fila).
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = make_user("owner", admin=True)
+        cls.viewer = make_user("viewer")
+        audit = {
+            "key_user_created": cls.owner,
+            "key_user_updated": cls.owner,
+            "status_id": STATUS_ACTIVO,
+        }
+        users = [cls.owner, cls.viewer, make_user("other")]
+        for i in range(ROWS):
+            Action.objects.create(name=f"ACCION {i}", **audit)
+            Event.objects.create(name=f"EVENTO {i}", **audit)
+            system = System.objects.create(name=f"SISTEMA {i}", **audit)
+            role = Role.objects.create(name=f"ROL {i}", **audit)
+            group = Group.objects.create(name=f"GRUPO {i}", **audit)
+            permission = Permission.objects.create(
+                name=f"PERMISO {i}", decorator_name=f"budget_{i}", **audit)
+            parent = Menu.objects.create(
+                title=f"MENU {i}", ordering=i, **audit)
+            menu = Menu.objects.create(
+                title=f"SUBMENU {i}", ordering=i, parent=parent, **audit)
+            user_id = users[i].id
+            UserRole.objects.create(user_id=user_id, role=role, **audit)
+            UserGroup.objects.create(user_id=user_id, group=group, **audit)
+            UserGroupRole.objects.create(
+                user_id=user_id, group=group, role=role, **audit)
+            PermissionRole.objects.create(
+                permission=permission, role=role, **audit)
+            PermissionSystem.objects.create(
+                permission=permission, system=system, **audit)
+            RoleMenu.objects.create(role=role, menu=menu, **audit)
+
+    def setUp(self):
+        # Sin atajo de administrador: cada petición consulta su permiso.
+        # Antes de super().setUp(), que carga el índice de permisos.
+        grant_permissions(self, self.viewer, *(
+            [f"{prefix}_get" for prefix in LIST_VIEWS.values()]
+            + [f"{LIST_VIEWS[name]}_select" for name in SELECT_VIEWS]
+        ))
+        super().setUp()
+        self.client.force_login(self.viewer)
+
+    def post(self, url_name):
+        self.assertIn(url_name, settings.QUERY_BUDGETS)
+        return self.client.post(
+            reverse(url_name), {"page": 1, "page_size": 50},
+            content_type="application/json")
+
+    def test_get_views(self):
+        for name in LIST_VIEWS:
+            with self.subTest(name):
+                response = self.post(f"{name}-get")
+                self.assertEqual(response.status_code, 200)
+                self.assertGreaterEqual(
+                    response.json()["data"]["total"], ROWS)
+
+    def test_select_views(self):
+        for name in SELECT_VIEWS:
+            with self.subTest(name):
+                response = self.post(f"{name}-select")
+                self.assertEqual(response.status_code, 200)
+                self.assertGreaterEqual(len(response.json()["data"]), ROWS)
+
+    def test_user_names_in_one_query(self):
+        response = self.post("user-group-get")
+        names = {row["user_full_name"] for row in response.json()["data"][
+            "results"]}
+        self.assertEqual(names, {"OWNER TEST", "VIEWER TEST", "OTHER TEST"})
+
+
+class EffectivePermissionTests(TestCase):
+    """
+    Recálculo de la tabla de permisos efectivos por señales, al confirmar
+    la transacción.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = make_user("owner", admin=True)
+        cls.user = make_user("user")
+        cls.audit = {
+            "key_user_created": cls.owner,
+            "key_user_updated": cls.owner,
+            "status_id": STATUS_ACTIVO,
+        }
+        cls.read = Permission.objects.create(
+            name="LEER", decorator_name="test_read", **cls.audit)
+        cls.write = Permission.objects.create(
+            name="ESCRIBIR", decorator_name="test_write", **cls.audit)
+        cls.role = Role.objects.create(name="LECTOR", **cls.audit)
+        PermissionRole.objects.create(
+            permission=cls.read, role=cls.role, **cls.audit)
+
+    def committed(self):
+        return self.captureOnCommitCallbacks(execute=True)
+
+    def permissions(self):
+        return user_permissions(self.user.id)
+
+    def assign(self):
+        with self.committed():
+            return UserRole.objects.create(
+                user_id=self.user.id, role=self.role, **self.audit)
+
+    def set_status(self, instance, status_id):
+        with self.committed():
+            instance.status_id = status_id
+            instance.save()
+
+    def test_user_role_applies_after_commit(self):
+        with self.committed() as callbacks:
+            UserRole.objects.create(
+                user_id=self.user.id, role=self.role, **self.audit)
+            self.assertEqual(self.permissions(), set())
+        self.assertEqual(len(callbacks), 1)
+        self.assertEqual(self.permissions(), {"test_read"})
+
+    def test_user_role_annulled(self):
+        user_role = self.assign()
+        self.set_status(user_role, STATUS_ANULADO)
+        self.assertEqual(self.permissions(), set())
+
+    def test_permission_role_changes(self):
+        self.assign()
+        with self.committed():
+            link = PermissionRole.objects.create(
+                permission=self.write, role=self.role, **self.audit)
+        self.assertEqual(self.permissions(), {"test_read", "test_write"})
+        self.set_status(link, STATUS_ANULADO)
+        self.assertEqual(self.permissions(), {"test_read"})
+        with self.committed():
+            PermissionRole.objects.filter(permission=self.read).get().delete()
+        self.assertEqual(self.permissions(), set())
+
+    def test_role_inactivated(self):
+        self.assign()
+        self.set_status(self.role, STATUS_INACTIVO)
+        self.assertEqual(self.permissions(), set())
+        self.set_status(self.role, STATUS_ACTIVO)
+        self.assertEqual(self.permissions(), {"test_read"})
+
+    def test_group_role(self):
+        group = Group.objects.create(name="GRUPO", **self.audit)
+        with self.committed():
+            UserGroupRole.objects.create(
+                user_id=self.user.id, group=group, role=self.role,
+                **self.audit)
+        self.assertEqual(self.permissions(), {"test_read"})
+        self.set_status(group, STATUS_INACTIVO)
+        self.assertEqual(self.permissions(), set())
+
+    def test_permission_annulled_or_inactivated(self):
+        self.assign()
+        for status_id in (STATUS_INACTIVO, STATUS_ANULADO):
+            with self.subTest(status_id):
+                self.set_status(self.read, STATUS_ACTIVO)
+                self.assertEqual(self.permissions(), {"test_read"})
+                self.set_status(self.read, status_id)
+                self.assertEqual(self.permissions(), set())
+
+    def test_all_permissions_role(self):
+        role = Role.objects.create(name=ALL_PERMISSIONS_ROLE, **self.audit)
+        with self.committed():
+            UserRole.objects.create(
+                user_id=self.user.id, role=role, **self.audit)
+        self.assertEqual(
+            self.permissions(), {EffectiveUserPermission.ALL_PERMISSIONS})
+
+    def test_changes_batched_per_transaction(self):
+        with mock.patch(
+                "access.permissions.refresh_user_permissions",
+                wraps=refresh_user_permissions) as refresh:
+            with self.committed():
+                UserRole.objects.create(
+                    user_id=self.user.id, role=self.role, **self.audit)
+                PermissionRole.objects.create(
+                    permission=self.write, role=self.role, **self.audit)
+        refresh.assert_called_once()
+        self.assertEqual(set(refresh.call_args.args[0]), {self.user.id})
+        self.assertEqual(self.permissions(), {"test_read", "test_write"})
+
+    def test_refresh_applies_only_the_diff(self):
+        self.assign()
+        self.assertEqual(refresh_user_permissions([self.user.id]), (0, 0))
+        # Cambios sin señales (update por QuerySet)
+        PermissionRole.objects.filter(permission=self.read).update(
+            permission=self.write)
+        self.assertEqual(refresh_user_permissions([self.user.id]), (1, 1))
+        self.assertEqual(self.permissions(), {"test_write"})
+
+    def test_rebuild_all(self):
+        self.assign()
+        EffectiveUserPermission.objects.all().delete()
+        EffectiveUserPermission.objects.create(
+            user_id=self.owner.id, decorator_name="obsoleto")
+        self.assertEqual(rebuild_all(), (1, 1))
+        self.assertEqual(self.permissions(), {"test_read"})
+        self.assertEqual(user_permissions(self.owner.id), set())
+
+
+# Vistas para PermissionSyncTests y PermissionCheckTests
+@MiddlewareAutentication("test_sync_above")
+@api_view(["GET"])
+def above_view(request):
+    return succescall()
+
+
+@api_view(["POST"])
+@MiddlewareAutentication("test_sync_below")
+def below_view(request):
+    return succescall()
+
+
+@MiddlewareAutentication("test_sync_async")
+async def async_view(request):
+    return JsonResponse({})
+
+
+def dynamic_view(request):
+    return JsonResponse({})
+
+
+dynamic_view.permission_names = ("test_sync_dynamic",)
+
+
+urlpatterns = [
+    path("sync/above/", above_view),
+    path("sync/below/", below_view),
+    path("sync/async/", async_view),
+    path("sync/dynamic/", dynamic_view),
+]
+
+SYNCED = {
+    "test_sync_above": {"api_url": "/sync/above/", "method": "GET"},
+    "test_sync_below": {"api_url": "/sync/below/", "method": "POST"},
+    "test_sync_async": {"api_url": "/sync/async/", "method": None},
+    "test_sync_dynamic": {"api_url": "/sync/dynamic/", "method": None},
+}
+
+
+@override_settings(ROOT_URLCONF=__name__)
+class PermissionSyncTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = make_user("owner", admin=True)
+        cls.audit = {
+            "key_user_created": cls.owner,
+            "key_user_updated": cls.owner,
+            "status_id": STATUS_ACTIVO,
+        }
+        cls.system = System.objects.create(name="SISTEMA", **cls.audit)
+
+    def synced(self):
+        return {
+            p.decorator_name: {"api_url": p.api_url, "method": p.method}
+            for p in Permission.objects.all()
+        }
+
+    def test_collect_finds_decorator_above_or_below_api_view(self):
+        self.assertEqual(collect_view_permissions(), SYNCED)
+
+    def test_creates_and_links(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            result = sync_permissions(self.owner, self.system)
+        self.assertEqual(result["created"], sorted(SYNCED))
+        self.assertEqual(result["updated"], [])
+        self.assertEqual(sorted(result["linked"]), sorted(SYNCED))
+        self.assertEqual(result["orphans"], [])
+        self.assertEqual(self.synced(), SYNCED)
+        self.assertEqual(
+            PermissionSystem.objects.filter(system=self.system).count(),
+            len(SYNCED))
+        self.assertIsNotNone(permission_index.permission_id("test_sync_below"))
+
+        again = sync_permissions(self.owner, self.system)
+        for label in ("created", "updated", "linked", "orphans"):
+            self.assertEqual(again[label], [])
+
+    def test_updates_and_reports_orphans(self):
+        Permission.objects.create(
+            name="ARRIBA", decorator_name="test_sync_above",
+            api_url="/antigua/", method="POST", **self.audit)
+        Permission.objects.create(
+            name="HUERFANO", decorator_name="test_sync_orphan", **self.audit)
+        result = sync_permissions(self.owner)
+        self.assertEqual(result["updated"], ["test_sync_above"])
+        self.assertNotIn("test_sync_above", result["created"])
+        self.assertEqual(result["linked"], [])
+        self.assertEqual(result["orphans"], ["test_sync_orphan"])
+        self.assertEqual(
+            self.synced()["test_sync_above"], SYNCED["test_sync_above"])
+        # Los huérfanos solo se informan
+        self.assertTrue(Permission.objects.filter(
+            decorator_name="test_sync_orphan").exists())
+
+    def test_dry_run_rolls_back(self):
+        with self.captureOnCommitCallbacks() as callbacks:
+            result = sync_permissions(self.owner, self.system, dry_run=True)
+        self.assertEqual(result["created"], sorted(SYNCED))
+        self.assertEqual(sorted(result["linked"]), sorted(SYNCED))
+        self.assertFalse(Permission.objects.exists())
+        self.assertFalse(PermissionSystem.objects.exists())
+        self.assertEqual(callbacks, [])
+
+
+@override_settings(ROOT_URLCONF=__name__)
+class PermissionCheckTests(TestCase):
+    """
+    MiddlewareAutentication con el índice de permisos: un permiso
+    inexistente o inactivo se deniega sin consultar los permisos efectivos,
+    también a los usuarios con el rol ALL PERMISSIONS.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = make_user("owner", admin=True)
+        cls.user = make_user("user")
+        audit = {
+            "key_user_created": cls.owner,
+            "key_user_updated": cls.owner,
+            "status_id": STATUS_ACTIVO,
+        }
+        cls.below = Permission.objects.create(
+            name="ABAJO", decorator_name="test_sync_below", **audit)
+        cls.async_ = Permission.objects.create(
+            name="ASYNC", decorator_name="test_sync_async", **audit)
+        role = Role.objects.create(name=ALL_PERMISSIONS_ROLE, **audit)
+        UserRole.objects.create(user_id=cls.user.id, role=role, **audit)
+        rebuild_all()
+
+    def setUp(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            permission_index.invalidate()
+        self.client.force_login(self.user)
+
+    def effective_queries(self, method, url):
+        table = EffectiveUserPermission._meta.db_table
+        with CaptureQueriesContext(connection) as queries:
+            response = getattr(self.client, method)(url)
+        return response, [q for q in queries if table in q["sql"]]
+
+    def test_known_permission_queries_table(self):
+        for method, url in (("post", "/sync/below/"), ("get", "/sync/async/")):
+            with self.subTest(url):
+                response, queries = self.effective_queries(method, url)
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(len(queries), 1)
+
+    def test_unknown_or_inactive_permission_denied_without_query(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            for permission in (self.below, self.async_):
+                permission.status_id = STATUS_INACTIVO
+                permission.save()
+        for method, url in (
+                ("get", "/sync/above/"), ("post", "/sync/below/"),
+                ("get", "/sync/async/")):
+            with self.subTest(url):
+                response, queries = self.effective_queries(method, url)
+                self.assertEqual(response.status_code, 403)
+                self.assertEqual(queries, [])
+
+    def test_unknown_name_recheck_rate_limited(self):
+        permission_index.permission_index()
+        with mock.patch.object(
+                permission_index, "_current_version",
+                wraps=permission_index._current_version) as version:
+            for _ in range(3):
+                self.assertIsNone(permission_index.permission_id("otro"))
+            version.assert_not_called()
+            with override_settings(PERMISSION_INDEX_RECHECK_SECONDS=0):
+                self.assertIsNone(permission_index.permission_id("otro"))
+            version.assert_called_once()
@@ -4,7 +4,9 @@ def build_menu_tree(menus, parent=None):
     Can receive a queryset or a list of Menu instances.
     """
     tree = []
-    level_menus = [m for m in menus if m.parent == parent]
+    # Por parent_id: comparar m.parent cargaría cada padre con una consulta
+    parent_id = parent.id if parent else None
+    level_menus = [m for m in menus if m.parent_id == parent_id]
     level_menus.sort(key=lambda x: x.ordering)
 
     for menu in level_menus:
@@ -7,7 +7,8 @@ from access.utils import build_menu_tree
 from ..models import Menu
 from ..serializers import MenuSerializer
 
-factory = BaseViewFactory(Menu, MenuSerializer, "menús", "access_menu")
+factory = BaseViewFactory(
+    Menu, MenuSerializer, "menús", "access_menu", select_related=["parent"])
 
 menu_get_view = factory.get_view()
 menu_select_view = factory.select_view()
@@ -3,7 +3,9 @@ from config.base_views import BaseViewFactory
 from ..models import PermissionRole
 from ..serializers import PermissionRoleSerializer
 
-factory = BaseViewFactory(PermissionRole, PermissionRoleSerializer, "permiso-rol", "access_permission_role")
+factory = BaseViewFactory(
+    PermissionRole, PermissionRoleSerializer, "permiso-rol",
+    "access_permission_role", select_related=["permission", "role"])
 
 permission_role_get_view = factory.get_view(filters=["role_id", "permission_id"])
 permission_role_assign_view = factory.bulk_assign_view("role_id", "permission")
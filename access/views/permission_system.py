@@ -3,7 +3,9 @@ from config.base_views import BaseViewFactory
 from ..models import PermissionSystem
 from ..serializers import PermissionSystemSerializer
 
-factory = BaseViewFactory(PermissionSystem, PermissionSystemSerializer, "permiso-sistema", "access_permission_system")
+factory = BaseViewFactory(
+    PermissionSystem, PermissionSystemSerializer, "permiso-sistema",
+    "access_permission_system", select_related=["permission", "system"])
 
 permission_system_get_view = factory.get_view(filters=["system_id", "permission_id"])
 permission_system_assign_view = factory.bulk_assign_view("system_id", "permission")
@@ -3,7 +3,9 @@ from config.base_views import BaseViewFactory
 from ..models import UserGroup
 from ..serializers import UserGroupSerializer
 
-factory = BaseViewFactory(UserGroup, UserGroupSerializer, "usuario-grupo", "access_user_group")
+factory = BaseViewFactory(
+    UserGroup, UserGroupSerializer, "usuario-grupo", "access_user_group",
+    select_related=["group"])
 
 user_group_get_view = factory.get_view(filters=["user_id", "group_id"])
 user_group_assign_view = factory.bulk_assign_view("user_id", "group")
@@ -3,7 +3,9 @@ from config.base_views import BaseViewFactory
 from ..models import UserGroupRole
 from ..serializers import UserGroupRoleSerializer
 
-factory = BaseViewFactory(UserGroupRole, UserGroupRoleSerializer, "usuario-grupo-rol", "access_user_group_role")
+factory = BaseViewFactory(
+    UserGroupRole, UserGroupRoleSerializer, "usuario-grupo-rol",
+    "access_user_group_role", select_related=["group", "role"])
 
 user_group_role_get_view = factory.get_view(filters=["user_id", "group_id"])
 user_group_role_assign_view = factory.bulk_assign_view("user_id", "role", extra_fields=["group_id"])
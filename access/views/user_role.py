@@ -3,7 +3,9 @@ from config.base_views import BaseViewFactory
 from ..models import UserRole
 from ..serializers import UserRoleSerializer
 
-factory = BaseViewFactory(UserRole, UserRoleSerializer, "usuario-rol", "access_user_role")
+factory = BaseViewFactory(
+    UserRole, UserRoleSerializer, "usuario-rol", "access_user_role",
+    select_related=["role"])
 
 user_role_get_view = factory.get_view(filters=["user_id", "role_id"])
 user_role_assign_view = factory.bulk_assign_view("user_id", "role")
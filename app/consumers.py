@@ -1,8 +1,13 @@
 import json
 from channels.generic.websocket import AsyncWebsocketConsumer
 
+from config.metrics import WEBSOCKET_CONNECTIONS, WEBSOCKET_EVENTS
+
 
 class NotificationConsumer(AsyncWebsocketConsumer):
+    # True tras accept(): solo esas conexiones cuentan en el gauge
+    accepted = False
+
     async def connect(self):
         # We can group by user ID if authenticated
         self.user = self.scope.get("user")
@@ -16,8 +21,16 @@ class NotificationConsumer(AsyncWebsocketConsumer):
             self.channel_name
         )
         await self.accept()
+        self.accepted = True
+        WEBSOCKET_CONNECTIONS.inc()
+        WEBSOCKET_EVENTS.labels("connect").inc()
 
     async def disconnect(self, _close_code):
+        if not self.accepted:
+            return
+        self.accepted = False
+        WEBSOCKET_CONNECTIONS.dec()
+        WEBSOCKET_EVENTS.labels("disconnect").inc()
         await self.channel_layer.group_discard(
             self.group_name,
             self.channel_name
@@ -35,3 +48,4 @@ class NotificationConsumer(AsyncWebsocketConsumer):
             "message": message,
             "type": type_notif
         }))
+        WEBSOCKET_EVENTS.labels("send").inc()
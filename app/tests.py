@@ -1,2 +1,42 @@
+from unittest import mock
 
-# Create your tests here.
+from channels.exceptions import DenyConnection
+from channels.layers import InMemoryChannelLayer
+from channels.testing import WebsocketCommunicator
+from django.test import SimpleTestCase, override_settings
+from prometheus_client import REGISTRY
+
+from meteorite_backend.asgi import application
+
+IN_MEMORY_LAYERS = {
+    "default": {"BACKEND": "channels.layers.InMemoryChannelLayer"},
+}
+
+
+def open_connections():
+    return REGISTRY.get_sample_value("meteorite_websocket_connections") or 0
+
+
+@override_settings(CHANNEL_LAYERS=IN_MEMORY_LAYERS)
+class NotificationConsumerTests(SimpleTestCase):
+    async def test_gauge_follows_accepted_connections(self):
+        before = open_connections()
+        communicator = WebsocketCommunicator(
+            application, "/ws/notifications/")
+        connected, _ = await communicator.connect()
+        self.assertTrue(connected)
+        self.assertEqual(open_connections(), before + 1)
+        await communicator.disconnect()
+        self.assertEqual(open_connections(), before)
+
+    async def test_denied_connection_does_not_decrement(self):
+        before = open_connections()
+        communicator = WebsocketCommunicator(
+            application, "/ws/notifications/")
+        with mock.patch.object(
+            InMemoryChannelLayer, "group_add", side_effect=DenyConnection
+        ):
+            connected, _ = await communicator.connect()
+        self.assertFalse(connected)
+        await communicator.disconnect()
+        self.assertEqual(open_connections(), before)
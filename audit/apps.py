@@ -1,5 +1,21 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_migrate
+
+
+def install_triggers_after_migrate(sender, **kwargs):
+    """
+    En modo trigger, mantiene los triggers al día tras cada migrate
+    (incluye tablas nuevas de BaseModel).
+    """
+    from .triggers import install_audit_triggers
+    from .utils import is_trigger_mode
+
+    if is_trigger_mode():
+        install_audit_triggers()
 
 
 class AuditConfig(AppConfig):
     name = "audit"
+
+    def ready(self):
+        post_migrate.connect(install_triggers_after_migrate, sender=self)
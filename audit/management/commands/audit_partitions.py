@@ -0,0 +1,76 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.utils import timezone
+
+from audit.partitions import (
+    PARTITIONED_TABLES,
+    archive_month,
+    ensure_partitions,
+    expired_months,
+    is_partitioned,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Crea por adelantado las particiones mensuales de auditoría y "
+        "archiva (CSV comprimido) las que superan el periodo de retención."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--ahead",
+            type=int,
+            default=settings.AUDIT_PARTITIONS_AHEAD,
+            help="Meses a crear por adelantado.",
+        )
+        parser.add_argument(
+            "--retention-months",
+            type=int,
+            default=settings.AUDIT_RETENTION_MONTHS,
+            help="Meses a conservar en la base de datos (0 = sin archivado).",
+        )
+        parser.add_argument(
+            "--archive-dir",
+            default=settings.AUDIT_ARCHIVE_DIR,
+            help="Directorio local donde se guardan los archivos .csv.gz.",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Solo muestra las particiones que se archivarían.",
+        )
+
+    def handle(self, *args, **options):
+        if connection.vendor != "postgresql":
+            raise CommandError("El particionado requiere PostgreSQL")
+        with connection.cursor() as cursor:
+            for table in PARTITIONED_TABLES:
+                if not is_partitioned(cursor, table):
+                    raise CommandError(
+                        f"La tabla {table} no está particionada; "
+                        "ejecute 'migrate' primero"
+                    )
+
+        now = timezone.now()
+        if not options["dry_run"]:
+            created = ensure_partitions(now, options["ahead"])
+            for name in created:
+                self.stdout.write(f"Partición creada: {name}")
+
+        retention = options["retention_months"]
+        if retention <= 0:
+            return
+
+        for month in expired_months(now, retention):
+            label = f"{month:%Y-%m}"
+            if options["dry_run"]:
+                self.stdout.write(f"Se archivaría el mes {label}")
+                continue
+            files = archive_month(month, options["archive_dir"])
+            for path in files:
+                self.stdout.write(f"Archivado {label}: {path}")
+
+        self.stdout.write(
+            self.style.SUCCESS("Particiones de auditoría al día"))
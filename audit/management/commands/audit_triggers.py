@@ -0,0 +1,35 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+
+from audit.triggers import install_audit_triggers, remove_audit_triggers
+
+
+class Command(BaseCommand):
+    help = (
+        "Instala (o elimina con --remove) los triggers de auditoría en las "
+        "tablas de BaseModel."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--remove",
+            action="store_true",
+            help="Elimina los triggers y la función de captura.",
+        )
+
+    def handle(self, *args, **options):
+        if connection.vendor != "postgresql":
+            raise CommandError("La captura por triggers requiere PostgreSQL")
+
+        with transaction.atomic():
+            if options["remove"]:
+                tables = remove_audit_triggers()
+                action = "eliminados"
+            else:
+                tables = install_audit_triggers()
+                action = "instalados"
+
+        for table in tables:
+            self.stdout.write(f"  {table}")
+        self.stdout.write(self.style.SUCCESS(
+            f"Triggers de auditoría {action} en {len(tables)} tablas"))
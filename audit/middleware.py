@@ -0,0 +1,60 @@
+from asgiref.sync import (
+    iscoroutinefunction,
+    markcoroutinefunction,
+    sync_to_async,
+)
+
+from .triggers import set_audit_user
+from .utils import is_trigger_mode
+
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+
+
+class AuditUserMiddleware:
+    """
+    En modo de auditoría por triggers, expone el usuario autenticado a
+    PostgreSQL (parámetro meteorite.user_id) durante la petición y lo
+    limpia al terminar, ya que la conexión puede reutilizarse.
+    Las peticiones de solo lectura (GET/HEAD/OPTIONS) no lo necesitan.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        user = getattr(request, "user", None)
+        if (
+            request.method in SAFE_METHODS
+            or not is_trigger_mode()
+            or user is None
+            or not user.is_authenticated
+        ):
+            return self.get_response(request)
+
+        set_audit_user(user.id)
+        try:
+            return self.get_response(request)
+        finally:
+            set_audit_user(None)
+
+    async def __acall__(self, request):
+        if request.method in SAFE_METHODS or not is_trigger_mode():
+            return await self.get_response(request)
+
+        user = await request.auser()
+        if not user.is_authenticated:
+            return await self.get_response(request)
+
+        await sync_to_async(set_audit_user)(user.id)
+        try:
+            return await self.get_response(request)
+        finally:
+            await sync_to_async(set_audit_user)(None)
@@ -0,0 +1,20 @@
+# Generated by Django 6.0.1 on 2026-10-19 16:47
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("audit", "0002_alter_auditlog_record_id"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="auditlog",
+            index=models.Index(
+                fields=["name_table", "record_id", "-created_at", "-id"],
+                name="audit_log_table_record_idx",
+            ),
+        ),
+    ]
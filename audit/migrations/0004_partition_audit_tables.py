@@ -0,0 +1,132 @@
+# Generated by Django 6.0.1 on 2026-10-19 16:48
+
+import re
+from datetime import datetime, timezone as dt_timezone
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+# Copias congeladas de audit/partitions.py: la migración no debe cambiar si
+# se modifican esos helpers. Solo se crean las particiones de los meses con
+# filas; los meses siguientes los crea el comando audit_partitions (hasta
+# entonces las filas nuevas van a la partición DEFAULT y el comando las
+# reubica), de modo que el resultado no depende de la fecha de ejecución.
+PARTITIONED_TABLES = ("audit_log", "audit_log_detail")
+
+
+def month_start(value):
+    return datetime(value.year, value.month, 1, tzinfo=dt_timezone.utc)
+
+
+def add_months(value, months):
+    index = value.year * 12 + (value.month - 1) + months
+    return datetime(index // 12, index % 12 + 1, 1, tzinfo=dt_timezone.utc)
+
+
+def create_month_partition(cursor, table, month):
+    name = f"{table}_p{month:%Y_%m}"
+    cursor.execute(
+        f'CREATE TABLE "{name}" PARTITION OF "{table}" '
+        f"FOR VALUES FROM ('{month.isoformat()}') "
+        f"TO ('{add_months(month, 1).isoformat()}')"
+    )
+
+
+def create_default_partition(cursor, table):
+    cursor.execute(f'CREATE TABLE "{table}_default" PARTITION OF "{table}" DEFAULT')
+
+
+def _rebuild_table(cursor, table, partitioned):
+    """
+    Recrea la tabla (particionada o normal) conservando columnas, datos e
+    índices con sus nombres originales, para que el estado de Django siga
+    coincidiendo con la base de datos.
+    """
+    old = f"{table}_old"
+    cursor.execute(f'ALTER TABLE "{table}" RENAME TO "{old}"')
+    cursor.execute(
+        "SELECT indexname, indexdef FROM pg_indexes "
+        "WHERE tablename = %s AND indexname <> %s",
+        [old, f"{table}_pkey"],
+    )
+    indexes = cursor.fetchall()
+    for name, _ in indexes:
+        cursor.execute(f'DROP INDEX "{name}"')
+    cursor.execute(f'ALTER TABLE "{old}" DROP CONSTRAINT "{table}_pkey"')
+
+    if partitioned:
+        cursor.execute(
+            f'CREATE TABLE "{table}" (LIKE "{old}" INCLUDING DEFAULTS) '
+            "PARTITION BY RANGE (created_at)"
+        )
+        cursor.execute(
+            f'ALTER TABLE "{table}" ADD CONSTRAINT "{table}_pkey" '
+            "PRIMARY KEY (id, created_at)"
+        )
+        cursor.execute(f'SELECT min(created_at), max(created_at) FROM "{old}"')
+        first, last = cursor.fetchone()
+        if first is not None:
+            month = month_start(first)
+            while month <= last:
+                create_month_partition(cursor, table, month)
+                month = add_months(month, 1)
+        create_default_partition(cursor, table)
+    else:
+        cursor.execute(f'CREATE TABLE "{table}" (LIKE "{old}" INCLUDING DEFAULTS)')
+        cursor.execute(
+            f'ALTER TABLE "{table}" ADD CONSTRAINT "{table}_pkey" PRIMARY KEY (id)'
+        )
+
+    pattern = re.compile(rf' ON (\S+\.)?"?{re.escape(old)}"? ')
+    for _, definition in indexes:
+        cursor.execute(pattern.sub(f' ON "{table}" ', definition, count=1))
+
+    cursor.execute(f'INSERT INTO "{table}" SELECT * FROM "{old}"')
+    cursor.execute(f'DROP TABLE "{old}" CASCADE')
+
+
+def partition_audit_tables(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(
+            "UPDATE audit_log_detail AS d SET created_at = l.created_at "
+            "FROM audit_log AS l WHERE l.id = d.key_audit_log_id"
+        )
+        for table in PARTITIONED_TABLES:
+            _rebuild_table(cursor, table, partitioned=True)
+
+
+def unpartition_audit_tables(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    with schema_editor.connection.cursor() as cursor:
+        for table in PARTITIONED_TABLES:
+            _rebuild_table(cursor, table, partitioned=False)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("audit", "0003_auditlog_table_record_index"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="auditlogdetail",
+            name="created_at",
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+        migrations.AlterField(
+            model_name="auditlogdetail",
+            name="key_audit_log",
+            field=models.ForeignKey(
+                db_constraint=False,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="details",
+                to="audit.auditlog",
+            ),
+        ),
+        migrations.RunPython(partition_audit_tables, unpartition_audit_tables),
+    ]
@@ -1,10 +1,11 @@
-import uuid
-
 from django.db import models
+from django.utils import timezone
+
+from config.ids import new_id
 
 
 class AuditLog(models.Model):
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=new_id, editable=False)
 
     key_event = models.UUIDField(db_index=True)
     name_module = models.CharField(max_length=50, db_index=True)
@@ -21,19 +22,35 @@ class AuditLog(models.Model):
 
     class Meta:
         db_table = "audit_log"
+        indexes = [
+            # Historial de un registro: filtra por tabla + registro y
+            # recorre por fecha descendente (paginación keyset).
+            models.Index(
+                fields=["name_table", "record_id", "-created_at", "-id"],
+                name="audit_log_table_record_idx",
+            ),
+        ]
 
 
 class AuditLogDetail(models.Model):
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=new_id, editable=False)
 
+    # Sin FK a nivel de base de datos: audit_log está particionada y su PK
+    # es (id, created_at). La cascada la sigue resolviendo Django.
     key_audit_log = models.ForeignKey(
-        AuditLog, on_delete=models.CASCADE, related_name="details"
+        AuditLog,
+        on_delete=models.CASCADE,
+        related_name="details",
+        db_constraint=False,
     )
 
     column_name = models.CharField(max_length=50, db_index=True)
     old_value = models.TextField(null=True, blank=True)
     new_value = models.TextField(null=True, blank=True)
 
+    # Copia de AuditLog.created_at: clave de partición del detalle.
+    created_at = models.DateTimeField(default=timezone.now)
+
     def __str__(self):
         return self.column_name
 
@@ -0,0 +1,192 @@
+"""
+Particionado mensual (RANGE por created_at) de audit_log y
+audit_log_detail en PostgreSQL.
+
+Cada tabla tiene una partición por mes (<tabla>_pAAAA_MM) y una partición
+DEFAULT de respaldo para que una inserción nunca falle si aún no se creó
+la partición del mes. Las particiones vencidas se exportan a CSV
+comprimido y luego se eliminan.
+"""
+import gzip
+import os
+import re
+from datetime import datetime, timezone as dt_timezone
+
+from django.db import connection, transaction
+
+PARTITIONED_TABLES = ("audit_log", "audit_log_detail")
+
+_PARTITION_RE = re.compile(
+    r"^(?P<table>.+)_p(?P<year>\d{4})_(?P<month>\d{2})$")
+
+
+def month_start(value):
+    return datetime(value.year, value.month, 1, tzinfo=dt_timezone.utc)
+
+
+def add_months(value, months):
+    index = value.year * 12 + (value.month - 1) + months
+    return datetime(index // 12, index % 12 + 1, 1, tzinfo=dt_timezone.utc)
+
+
+def partition_name(table, month):
+    return f"{table}_p{month:%Y_%m}"
+
+
+def default_partition_name(table):
+    return f"{table}_default"
+
+
+def is_partitioned(cursor, table):
+    cursor.execute(
+        "SELECT relkind FROM pg_class "
+        "WHERE relname = %s AND pg_table_is_visible(oid)",
+        [table],
+    )
+    row = cursor.fetchone()
+    return bool(row) and row[0] == "p"
+
+
+def list_month_partitions(cursor, table):
+    """
+    Retorna {mes: nombre_particion} de las particiones mensuales adjuntas.
+    """
+    cursor.execute(
+        "SELECT child.relname FROM pg_inherits "
+        "JOIN pg_class parent ON parent.oid = pg_inherits.inhparent "
+        "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+        "WHERE parent.relname = %s",
+        [table],
+    )
+    partitions = {}
+    for (name,) in cursor.fetchall():
+        match = _PARTITION_RE.match(name)
+        if match and match.group("table") == table:
+            month = datetime(
+                int(match.group("year")),
+                int(match.group("month")),
+                1,
+                tzinfo=dt_timezone.utc,
+            )
+            partitions[month] = name
+    return partitions
+
+
+def _table_exists(cursor, name):
+    cursor.execute("SELECT to_regclass(%s) IS NOT NULL", [name])
+    return cursor.fetchone()[0]
+
+
+def create_month_partition(cursor, table, month):
+    """
+    Crea y adjunta la partición del mes. Si la partición DEFAULT ya tiene
+    filas de ese rango, se mueven primero (PostgreSQL no permite adjuntar
+    la partición mientras existan). Retorna False si ya existía.
+    """
+    name = partition_name(table, month)
+    if _table_exists(cursor, name):
+        return False
+
+    start = f"'{month.isoformat()}'"
+    end = f"'{add_months(month, 1).isoformat()}'"
+    default = default_partition_name(table)
+
+    cursor.execute(
+        f'CREATE TABLE "{name}" (LIKE "{table}" INCLUDING DEFAULTS)')
+    if _table_exists(cursor, default):
+        range_sql = f"created_at >= {start} AND created_at < {end}"
+        cursor.execute(
+            f'INSERT INTO "{name}" SELECT * FROM "{default}" '
+            f"WHERE {range_sql}")
+        cursor.execute(f'DELETE FROM "{default}" WHERE {range_sql}')
+    cursor.execute(
+        f'ALTER TABLE "{table}" ATTACH PARTITION "{name}" '
+        f"FOR VALUES FROM ({start}) TO ({end})"
+    )
+    return True
+
+
+def create_default_partition(cursor, table):
+    name = default_partition_name(table)
+    if not _table_exists(cursor, name):
+        cursor.execute(f'CREATE TABLE "{name}" PARTITION OF "{table}" DEFAULT')
+
+
+def _default_partition_months(cursor, table):
+    """
+    Meses con filas que cayeron en la partición DEFAULT.
+    """
+    cursor.execute(
+        "SELECT DISTINCT date_trunc('month', created_at AT TIME ZONE 'UTC') "
+        f'FROM "{default_partition_name(table)}"'
+    )
+    return [month_start(row[0]) for row in cursor.fetchall()]
+
+
+def ensure_partitions(now, months_ahead):
+    """
+    Garantiza las particiones desde el mes actual hasta months_ahead meses
+    adelante y reubica en su partición mensual las filas que hayan caído en
+    la DEFAULT. Retorna la lista de particiones creadas.
+    """
+    created = []
+    current = month_start(now)
+    with transaction.atomic(), connection.cursor() as cursor:
+        for table in PARTITIONED_TABLES:
+            create_default_partition(cursor, table)
+            months = {add_months(current, i) for i in range(months_ahead + 1)}
+            months.update(_default_partition_months(cursor, table))
+            for month in sorted(months):
+                if create_month_partition(cursor, table, month):
+                    created.append(partition_name(table, month))
+    return created
+
+
+def expired_months(now, retention_months):
+    """
+    Meses con particiones adjuntas anteriores al periodo de retención.
+    """
+    cutoff = add_months(month_start(now), -retention_months)
+    months = set()
+    with connection.cursor() as cursor:
+        for table in PARTITIONED_TABLES:
+            months.update(
+                month for month in list_month_partitions(cursor, table)
+                if month < cutoff
+            )
+    return sorted(months)
+
+
+def archive_month(month, archive_dir):
+    """
+    Exporta las particiones del mes a <archive_dir>/<particion>.csv.gz y
+    luego las separa y elimina en una sola transacción. Si la exportación
+    falla, las particiones quedan intactas y se puede reintentar.
+    Retorna la lista de archivos generados.
+    """
+    os.makedirs(archive_dir, exist_ok=True)
+    files = []
+    with connection.cursor() as cursor:
+        for table in PARTITIONED_TABLES:
+            name = partition_name(table, month)
+            if not _table_exists(cursor, name):
+                continue
+            path = os.path.join(archive_dir, f"{name}.csv.gz")
+            tmp_path = f"{path}.tmp"
+            with gzip.open(tmp_path, "wb") as fh:
+                with cursor.copy(
+                    f'COPY "{name}" TO STDOUT WITH (FORMAT csv, HEADER true)'
+                ) as copy:
+                    for data in copy:
+                        fh.write(data)
+            os.replace(tmp_path, path)
+            files.append(path)
+
+    with transaction.atomic(), connection.cursor() as cursor:
+        for table in PARTITIONED_TABLES:
+            name = partition_name(table, month)
+            if _table_exists(cursor, name):
+                cursor.execute(
+                    f'ALTER TABLE "{table}" DETACH PARTITION "{name}"')
+                cursor.execute(f'DROP TABLE "{name}"')
+    return files
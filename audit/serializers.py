@@ -1,7 +1,7 @@
 from rest_framework import serializers
 from drf_spectacular.utils import extend_schema_field
 from .models import AuditLog, AuditLogDetail
-from auth.models import User
+from .utils import USER_NAME_NOT_FOUND, resolve_user_names
 
 
 class AuditLogDetailSerializer(serializers.ModelSerializer):
@@ -19,8 +19,12 @@ class AuditLogSerializer(serializers.ModelSerializer):
 
     @extend_schema_field(serializers.CharField())
     def get_user_name(self, obj):
-        try:
-            user = User.objects.get(id=obj.key_user)
-            return user.username
-        except User.DoesNotExist:
-            return "Usuario no encontrado"
+        # Las vistas de historial pasan los nombres ya resueltos en lote
+        user_names = self.context.get("user_names")
+        if user_names is None:
+            user_names = resolve_user_names([obj.key_user])
+        return user_names.get(obj.key_user, USER_NAME_NOT_FOUND)
+
+
+class AuditLogWithDetailsSerializer(AuditLogSerializer):
+    details = AuditLogDetailSerializer(many=True, read_only=True)
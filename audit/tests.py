@@ -1,2 +1,265 @@
+import gzip
+import os
+import tempfile
+import uuid
+from datetime import datetime, timezone as dt_timezone
+from io import StringIO
+from unittest import mock
 
-# Create your tests here.
+from django.conf import settings
+from django.core.management import call_command
+from django.db import IntegrityError, connection, transaction
+from django.test import TestCase, override_settings
+
+from config.ids import SQL_ID_SETTING
+from config.testing import grant_permissions, make_user
+from config.utils import STATUS_ACTIVO
+from general_master.config_master.models import Country
+
+from .models import AuditLog
+from .partitions import (
+    archive_month,
+    ensure_partitions,
+    expired_months,
+    is_partitioned,
+)
+from .triggers import EVENT_SETTING, audit_event, install_audit_triggers
+from .utils import EVENT_CREATE, EVENT_IMPORT, EVENT_MASS_ANNUL, EVENT_UPDATE
+
+
+def current_event():
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT current_setting(%s, true)", [EVENT_SETTING])
+        return cursor.fetchone()[0] or ""
+
+
+@override_settings(AUDIT_CAPTURE_MODE="trigger")
+class TriggerAuditTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = make_user("auditor", admin=True)
+
+    def setUp(self):
+        # DDL transaccional: se revierte con el test
+        install_audit_triggers()
+
+    def country(self, code):
+        return Country.objects.create(
+            code=code,
+            name=f"PAIS {code}",
+            key_user_created=self.user,
+            key_user_updated=self.user,
+            status_id=STATUS_ACTIVO,
+        )
+
+    def events(self, countries):
+        return set(
+            AuditLog.objects.filter(
+                record_id__in=[c.id for c in countries],
+            ).exclude(key_event=EVENT_CREATE).values_list(
+                "key_event", flat=True)
+        )
+
+    def test_audit_event_tags_rows(self):
+        with transaction.atomic(), audit_event(EVENT_IMPORT):
+            country = self.country("CL")
+        log = AuditLog.objects.get(record_id=country.id)
+        self.assertEqual(str(log.key_event), EVENT_IMPORT)
+        self.assertEqual(current_event(), "")
+
+    def test_audit_event_keeps_original_error(self):
+        self.country("PE")
+        with self.assertRaises(IntegrityError):
+            with transaction.atomic(), audit_event(EVENT_IMPORT):
+                self.country("PE")
+        self.assertEqual(current_event(), "")
+        # La conexión sigue utilizable
+        self.assertTrue(Country.objects.filter(code="PE").exists())
+
+    def test_id_version_set_at_connect(self):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT current_setting(%s, true)", [SQL_ID_SETTING])
+            value = cursor.fetchone()[0]
+        self.assertEqual(value, "on" if settings.UUID_V7_ENABLED else "off")
+
+    def test_id_version_chosen_at_runtime(self):
+        # Los triggers ya están instalados: solo cambia el parámetro
+        versions = []
+        for code, value in (("UY", "on"), ("PY", "off")):
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    "SELECT set_config(%s, %s, true)", [SQL_ID_SETTING, value])
+            country = self.country(code)
+            versions.append(
+                AuditLog.objects.get(record_id=country.id).id.version)
+        self.assertEqual(versions, [7, 4])
+
+    def test_mass_status_change_keeps_event(self):
+        countries = [self.country("AR"), self.country("BO")]
+        self.client.force_login(self.user)
+        response = self.client.patch(
+            "/config-master/country/annul/",
+            {"ids": [str(c.id) for c in countries]},
+            content_type="application/json",
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            {str(e) for e in self.events(countries)}, {EVENT_MASS_ANNUL})
+
+
+class AuditHistoryPermissionTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = make_user("owner", admin=True)
+        cls.country = Country.objects.create(
+            code="PE", name="PERU", key_user_created=cls.owner,
+            key_user_updated=cls.owner, status_id=STATUS_ACTIVO)
+        AuditLog.objects.create(
+            key_event=EVENT_UPDATE, name_module="general_master",
+            name_table="config_master_country", record_id=cls.country.id,
+            key_user=cls.owner.id)
+        cls.viewer = make_user("viewer")
+
+    def setUp(self):
+        grant_permissions(self, self.viewer, "general_master_country_log")
+        self.client.force_login(self.viewer)
+
+    def history(self, table, record_id=None):
+        return self.client.post(
+            "/audit/history/",
+            {"table": table, "record_id": str(record_id or self.country.id)},
+            content_type="application/json",
+        )
+
+    def test_table_log_permission_grants_history(self):
+        response = self.history("config_master_country")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["data"]["total"], 1)
+
+    def test_other_tables_need_their_own_permission(self):
+        response = self.history("acc_user_role")
+        self.assertEqual(response.status_code, 403)
+        self.assertIn("access_user_role_log", response.json()["message"])
+
+    def test_detail_needs_detail_permission(self):
+        response = self.client.post(
+            "/audit/history/detail/",
+            {"table": "config_master_country", "id": str(self.country.id)},
+            content_type="application/json",
+        )
+        self.assertEqual(response.status_code, 403)
+
+    def test_detail_invalid_id(self):
+        grant_permissions(
+            self, self.viewer, "general_master_country_log_detail")
+        cases = [("no-es-un-uuid", 400), (123, 400), (str(uuid.uuid4()), 404)]
+        for pk, status_code in cases:
+            with self.subTest(pk):
+                response = self.client.post(
+                    "/audit/history/detail/",
+                    {"table": "config_master_country", "id": pk},
+                    content_type="application/json",
+                )
+                self.assertEqual(response.status_code, status_code)
+
+    def test_unknown_table(self):
+        self.assertEqual(self.history("auth_user").status_code, 400)
+
+    def test_anonymous(self):
+        self.client.logout()
+        self.assertEqual(
+            self.history("config_master_country").status_code, 401)
+
+
+def month(year, number, day=1):
+    return datetime(year, number, day, tzinfo=dt_timezone.utc)
+
+
+class AuditPartitionTests(TestCase):
+    """
+    Particiones mensuales de audit_log y audit_log_detail (DDL
+    transaccional: se revierten con cada test).
+    """
+
+    def log(self, created_at):
+        log = AuditLog.objects.create(
+            key_event=EVENT_UPDATE, name_module="general_master",
+            name_table="config_master_country", record_id=uuid.uuid4(),
+            key_user=uuid.uuid4())
+        # auto_now_add: la fecha se fija después (mueve la fila de partición)
+        AuditLog.objects.filter(pk=log.pk).update(created_at=created_at)
+        return log
+
+    def partition_of(self, log):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT tableoid::regclass::text FROM audit_log WHERE id = %s",
+                [log.pk])
+            return cursor.fetchone()[0]
+
+    def test_tables_are_partitioned(self):
+        with connection.cursor() as cursor:
+            self.assertTrue(is_partitioned(cursor, "audit_log"))
+            self.assertTrue(is_partitioned(cursor, "audit_log_detail"))
+
+    def test_ensure_creates_months_ahead(self):
+        created = ensure_partitions(month(2030, 1, 15), months_ahead=1)
+        self.assertEqual(sorted(created), [
+            "audit_log_detail_p2030_01", "audit_log_detail_p2030_02",
+            "audit_log_p2030_01", "audit_log_p2030_02",
+        ])
+        self.assertEqual(ensure_partitions(month(2030, 1), 1), [])
+        log = self.log(month(2030, 2, 10))
+        self.assertEqual(self.partition_of(log), "audit_log_p2030_02")
+
+    def test_default_partition_rows_moved(self):
+        log = self.log(month(2031, 6, 3))
+        self.assertEqual(self.partition_of(log), "audit_log_default")
+        ensure_partitions(month(2031, 6), months_ahead=0)
+        self.assertEqual(self.partition_of(log), "audit_log_p2031_06")
+
+    def test_archive_expired_month(self):
+        ensure_partitions(month(2020, 1), months_ahead=1)
+        old = self.log(month(2020, 1, 20))
+        kept = self.log(month(2020, 2, 1))
+        self.assertEqual(
+            expired_months(month(2021, 2, 5), retention_months=12),
+            [month(2020, 1)])
+
+        with tempfile.TemporaryDirectory() as tmp:
+            files = archive_month(month(2020, 1), tmp)
+            self.assertEqual(
+                [os.path.basename(path) for path in files],
+                ["audit_log_p2020_01.csv.gz",
+                 "audit_log_detail_p2020_01.csv.gz"])
+            with gzip.open(files[0], "rt") as f:
+                self.assertIn(str(old.pk), f.read())
+
+        self.assertFalse(AuditLog.objects.filter(pk=old.pk).exists())
+        self.assertEqual(self.partition_of(kept), "audit_log_p2020_02")
+        self.assertEqual(expired_months(month(2021, 2, 5), 12), [])
+
+    def test_command(self):
+        ensure_partitions(month(2020, 1), months_ahead=0)
+        self.log(month(2020, 1, 20))
+        now = month(2021, 6, 1)
+        with mock.patch(
+                "audit.management.commands.audit_partitions.timezone.now",
+                return_value=now), \
+                tempfile.TemporaryDirectory() as tmp:
+            out = StringIO()
+            call_command(
+                "audit_partitions", "--dry-run", "--retention-months=12",
+                f"--archive-dir={tmp}", stdout=out)
+            self.assertIn("Se archivaría el mes 2020-01", out.getvalue())
+            self.assertEqual(os.listdir(tmp), [])
+
+            out = StringIO()
+            call_command(
+                "audit_partitions", "--ahead=1", "--retention-months=12",
+                f"--archive-dir={tmp}", stdout=out)
+            output = out.getvalue()
+            self.assertIn("Partición creada: audit_log_p2021_07", output)
+            self.assertIn("Archivado 2020-01", output)
+            self.assertEqual(len(os.listdir(tmp)), 2)
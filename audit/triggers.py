@@ -0,0 +1,206 @@
+"""
+Modo de captura de auditoría por triggers de PostgreSQL.
+
+Con AUDIT_CAPTURE_MODE = "trigger" cada tabla de un BaseModel tiene un
+trigger AFTER INSERT/UPDATE/DELETE que escribe AuditLog y, en los UPDATE,
+un AuditLogDetail por cada columna modificada (diff completo OLD/NEW). El
+usuario se toma del parámetro de sesión meteorite.user_id (lo fija
+AuditUserMiddleware) o, si no existe, de key_user_updated_id de la fila.
+
+El evento se deduce de la operación y del cambio de estado. Los eventos que
+la fila no refleja (EVENT_IMPORT, EVENT_MASS_*) se fijan con audit_event()
+alrededor de la escritura.
+"""
+import json
+from contextlib import contextmanager
+
+from django.db import connection, transaction
+
+from config.ids import SQL_ID_FUNCTION
+from config.utils import STATUS_ACTIVO, STATUS_ANULADO, STATUS_INACTIVO
+
+from .utils import (
+    EVENT_ANNUL,
+    EVENT_CREATE,
+    EVENT_INACTIVATE,
+    EVENT_RESTORE,
+    EVENT_UPDATE,
+    audited_models,
+    is_trigger_mode,
+)
+
+USER_SETTING = "meteorite.user_id"
+EVENT_SETTING = "meteorite.audit_event"
+
+TRIGGER_NAME = "meteorite_audit"
+FUNCTION_NAME = "meteorite_audit_capture"
+
+# Mismas columnas que ignora compare_and_save_details.
+EXCLUDED_COLUMNS = (
+    "created_at",
+    "updated_at",
+    "key_user_created_id",
+    "key_user_updated_id",
+)
+
+
+# Los ids se generan con meteorite_new_id(): la versión de UUID se decide al
+# ejecutar (config/ids.py), no al instalar
+FUNCTION_SQL = f"""
+CREATE OR REPLACE FUNCTION {FUNCTION_NAME}() RETURNS trigger AS $$
+DECLARE
+    v_log_id uuid := {SQL_ID_FUNCTION}();
+    v_now timestamptz := clock_timestamp();
+    v_fields jsonb := COALESCE(TG_ARGV[1], '{{}}')::jsonb;
+    v_user text := NULLIF(current_setting('{USER_SETTING}', true), '');
+    v_event text := NULLIF(current_setting('{EVENT_SETTING}', true), '');
+    v_old jsonb;
+    v_new jsonb;
+    v_record uuid;
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        v_new := to_jsonb(NEW);
+        v_record := NEW.id;
+        v_user := COALESCE(v_user, NEW.key_user_updated_id::text);
+        v_event := COALESCE(v_event, '{EVENT_CREATE}');
+    ELSIF TG_OP = 'DELETE' THEN
+        v_old := to_jsonb(OLD);
+        v_record := OLD.id;
+        v_user := COALESCE(v_user, OLD.key_user_updated_id::text);
+        v_event := COALESCE(v_event, '{EVENT_ANNUL}');
+    ELSE
+        v_old := to_jsonb(OLD);
+        v_new := to_jsonb(NEW);
+        v_record := NEW.id;
+        IF (v_old - 'updated_at') = (v_new - 'updated_at') THEN
+            RETURN NULL;
+        END IF;
+        v_user := COALESCE(v_user, NEW.key_user_updated_id::text);
+        IF v_event IS NULL AND OLD.status_id IS DISTINCT FROM NEW.status_id
+        THEN
+            v_event := CASE NEW.status_id::text
+                WHEN '{STATUS_INACTIVO}' THEN '{EVENT_INACTIVATE}'
+                WHEN '{STATUS_ACTIVO}' THEN '{EVENT_RESTORE}'
+                WHEN '{STATUS_ANULADO}' THEN '{EVENT_ANNUL}'
+                ELSE NULL
+            END;
+        END IF;
+        v_event := COALESCE(v_event, '{EVENT_UPDATE}');
+    END IF;
+
+    INSERT INTO audit_log (
+        id, key_event, name_module, name_table, record_id, key_user,
+        created_at
+    ) VALUES (
+        v_log_id, v_event::uuid, TG_ARGV[0], TG_TABLE_NAME, v_record,
+        v_user::uuid, v_now
+    );
+
+    IF TG_OP = 'UPDATE' THEN
+        INSERT INTO audit_log_detail (
+            id, key_audit_log_id, column_name, old_value, new_value,
+            created_at
+        )
+        SELECT
+            {SQL_ID_FUNCTION}(),
+            v_log_id,
+            COALESCE(v_fields ->> n.key, n.key),
+            COALESCE(o.value #>> '{{}}', ''),
+            COALESCE(n.value #>> '{{}}', ''),
+            v_now
+        FROM jsonb_each(v_new) AS n
+        JOIN jsonb_each(v_old) AS o ON o.key = n.key
+        WHERE n.value IS DISTINCT FROM o.value
+          AND n.key NOT IN ({", ".join(f"'{c}'" for c in EXCLUDED_COLUMNS)});
+    END IF;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+
+def _field_names_by_column(model):
+    """
+    Columnas cuyo nombre difiere del campo (FKs: status_id -> status), para
+    que el detalle use el mismo column_name que compare_and_save_details.
+    """
+    return {
+        field.column: field.name
+        for field in model._meta.concrete_fields
+        if field.column != field.name
+    }
+
+
+def install_audit_triggers(models=None):
+    """
+    Crea (o reemplaza) la función y los triggers. Retorna las tablas.
+    """
+    models = models or audited_models()
+    tables = []
+    with connection.cursor() as cursor:
+        cursor.execute(FUNCTION_SQL)
+        for model in models:
+            table = model._meta.db_table
+            fields = json.dumps(_field_names_by_column(model))
+            cursor.execute(
+                f'DROP TRIGGER IF EXISTS {TRIGGER_NAME} ON "{table}"')
+            cursor.execute(
+                f"CREATE TRIGGER {TRIGGER_NAME} "
+                f'AFTER INSERT OR UPDATE OR DELETE ON "{table}" '
+                f"FOR EACH ROW EXECUTE FUNCTION {FUNCTION_NAME}("
+                f"'{model._meta.app_label}', '{fields}')"
+            )
+            tables.append(table)
+    return tables
+
+
+def remove_audit_triggers(models=None):
+    models = models or audited_models()
+    tables = []
+    with connection.cursor() as cursor:
+        for model in models:
+            table = model._meta.db_table
+            cursor.execute(
+                f'DROP TRIGGER IF EXISTS {TRIGGER_NAME} ON "{table}"')
+            tables.append(table)
+        cursor.execute(f"DROP FUNCTION IF EXISTS {FUNCTION_NAME}()")
+    return tables
+
+
+def set_audit_user(user_id):
+    """
+    Fija (o limpia, con None) el usuario que registrarán los triggers en la
+    conexión actual.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT set_config(%s, %s, false)",
+            [USER_SETTING, str(user_id) if user_id else ""],
+        )
+
+
+def _set_event(event_type):
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT set_config(%s, %s, true)", [EVENT_SETTING, event_type])
+
+
+@contextmanager
+def audit_event(event_type):
+    """
+    Fuerza el evento que registran los triggers dentro del bloque
+    (p. ej. EVENT_IMPORT en una carga masiva). Sin efecto en modo python.
+
+    El parámetro es local a la transacción y el bloque abre un atomic: si
+    falla, el rollback lo restaura sin ejecutar nada más sobre una
+    transacción abortada (la excepción original se propaga intacta).
+    """
+    if not is_trigger_mode():
+        yield
+        return
+    with transaction.atomic():
+        _set_event(event_type)
+        yield
+        # Sin error: se limpia para el resto de la transacción exterior
+        _set_event("")
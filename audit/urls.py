@@ -0,0 +1,10 @@
+from django.urls import path
+from .views import audit_history_view, audit_history_detail_view
+
+urlpatterns = [
+    path("history/", audit_history_view, name="audit-history"),
+    path(
+        "history/detail/",
+        audit_history_detail_view,
+        name="audit-history-detail"),
+]
@@ -1,4 +1,17 @@
-from django.db import models
+import base64
+import binascii
+import re
+import threading
+import time
+import uuid
+
+from django.apps import apps
+from django.conf import settings
+from django.db import connection, models
+from django.utils.dateparse import parse_datetime
+
+from config.metrics import AUDIT_LOG_SECONDS, AUDIT_LOGS, CACHE_REQUESTS
+
 from .models import AuditLog, AuditLogDetail
 
 # ---------------------------------------------------------
@@ -26,8 +39,26 @@ EVENT_NAMES = {
     EVENT_MASS_ANNUL: "ANULACIÓN MASIVA",
 }
 
+# Modos de captura (settings.AUDIT_CAPTURE_MODE). En modo "trigger" la
+# auditoría la escriben triggers de PostgreSQL (ver audit/triggers.py).
+AUDIT_MODE_PYTHON = "python"
+AUDIT_MODE_TRIGGER = "trigger"
+
+
+def is_trigger_mode():
+    return (
+        getattr(settings, "AUDIT_CAPTURE_MODE", AUDIT_MODE_PYTHON)
+        == AUDIT_MODE_TRIGGER
+        and connection.vendor == "postgresql"
+    )
+
 
 def save_audit_log(instance, user_id, event_type, old_instance=None):
+    # En modo trigger la fila ya fue auditada por la base de datos.
+    if is_trigger_mode():
+        return None
+
+    start = time.perf_counter()
     try:
         # 1. Crear el encabezado de auditoría
         audit_log = AuditLog.objects.create(
@@ -44,11 +75,43 @@ def save_audit_log(instance, user_id, event_type, old_instance=None):
         if event_type == EVENT_UPDATE and old_instance:
             compare_and_save_details(audit_log, instance, old_instance)
 
+        AUDIT_LOGS.labels(instance._meta.db_table, "ok").inc()
         return audit_log
     except Exception as e:
         # Loguear el error si es necesario, pero no detener el flujo principal
         print(f"Error saving audit log: {e}")
+        AUDIT_LOGS.labels(instance._meta.db_table, "error").inc()
         return None
+    finally:
+        AUDIT_LOG_SECONDS.observe(time.perf_counter() - start)
+
+
+def save_audit_logs(instances, user_id, event_type):
+    """
+    Variante masiva de save_audit_log (solo encabezados, un INSERT por
+    lote) para cargas de catálogos.
+    """
+    if is_trigger_mode() or not instances:
+        return []
+
+    start = time.perf_counter()
+    meta = instances[0]._meta
+    logs = AuditLog.objects.bulk_create(
+        [
+            AuditLog(
+                key_event=event_type,
+                name_module=meta.app_label,
+                name_table=meta.db_table,
+                record_id=instance.id,
+                key_user=user_id,
+            )
+            for instance in instances
+        ],
+        batch_size=1000,
+    )
+    AUDIT_LOGS.labels(meta.db_table, "ok").inc(len(logs))
+    AUDIT_LOG_SECONDS.observe(time.perf_counter() - start)
+    return logs
 
 
 def compare_and_save_details(audit_log, instance, old_instance):
@@ -95,8 +158,160 @@ def compare_and_save_details(audit_log, instance, old_instance):
                 key_audit_log=audit_log,
                 column_name=field_name,
                 old_value=str_old,
-                new_value=str_new
+                new_value=str_new,
+                created_at=audit_log.created_at,
             ))
 
     if details:
         AuditLogDetail.objects.bulk_create(details)
+
+
+# ---------------------------------------------------------
+# CONSULTAS DE HISTORIAL (PAGINACIÓN KEYSET)
+# ---------------------------------------------------------
+def encode_audit_cursor(audit_log):
+    """
+    Codifica la posición (created_at, id) de un log como cursor opaco.
+    """
+    raw = f"{audit_log.created_at.isoformat()}|{audit_log.id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_audit_cursor(cursor):
+    """
+    Decodifica un cursor generado por encode_audit_cursor.
+    Lanza ValueError si el cursor es inválido.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+        created_at_str, pk_str = raw.split("|", 1)
+        created_at = parse_datetime(created_at_str)
+        pk = uuid.UUID(pk_str)
+    except (binascii.Error, UnicodeError, ValueError) as e:
+        raise ValueError("Cursor inválido") from e
+    if created_at is None:
+        raise ValueError("Cursor inválido")
+    return created_at, pk
+
+
+def get_audit_history(
+        name_table,
+        record_id,
+        cursor=None,
+        page_size=10,
+        with_details=False):
+    """
+    Retorna (logs, next_cursor) del historial de uno o varios registros,
+    ordenado por fecha descendente. Usa el índice compuesto
+    (name_table, record_id, created_at DESC, id DESC) y no ejecuta COUNT.
+    Con with_details=True los detalles se cargan en una segunda consulta.
+    """
+    qs = AuditLog.objects.filter(name_table=name_table)
+    if isinstance(record_id, (list, tuple, set)):
+        qs = qs.filter(record_id__in=record_id)
+    else:
+        qs = qs.filter(record_id=record_id)
+
+    if cursor:
+        created_at, pk = decode_audit_cursor(cursor)
+        qs = qs.filter(created_at__lte=created_at).exclude(
+            created_at=created_at, id__gte=pk)
+
+    qs = qs.order_by("-created_at", "-id")
+    if with_details:
+        qs = qs.prefetch_related("details")
+
+    logs = list(qs[:page_size + 1])
+    has_more = len(logs) > page_size
+    logs = logs[:page_size]
+    next_cursor = encode_audit_cursor(logs[-1]) if has_more else None
+    return logs, next_cursor
+
+
+def audited_models():
+    """
+    Modelos concretos que heredan de BaseModel (tablas con auditoría).
+    """
+    from config.models import BaseModel
+
+    return [
+        model for model in apps.get_models()
+        if issubclass(model, BaseModel) and not model._meta.proxy
+    ]
+
+
+# Prefijo de los permisos de cada app (el de sus BaseViewFactory:
+# access_role, general_master_country, general_master_crop, ...)
+PERMISSION_APP_PREFIXES = {
+    "access": "access",
+    "general_master_config_master": "general_master",
+    "agricultural": "general_master",
+}
+_CAMEL_BOUNDARY = re.compile(r"(?<!^)(?=[A-Z])")
+
+
+def log_permission(model, detail=False):
+    """
+    Permiso del historial de auditoría de model: el de su endpoint log
+    (general_master_country_log, access_user_role_log, ...), o
+    <...>_log_detail para los detalles. None si la app no tiene prefijo.
+    """
+    prefix = PERMISSION_APP_PREFIXES.get(model._meta.app_label)
+    if prefix is None:
+        return None
+    name = _CAMEL_BOUNDARY.sub("_", model.__name__).lower()
+    return f"{prefix}_{name}_log{'_detail' if detail else ''}"
+
+
+def get_audited_model(name_table):
+    """
+    Modelo auditado correspondiente a un db_table, o None.
+    """
+    for model in audited_models():
+        if model._meta.db_table == name_table:
+            return model
+    return None
+
+
+# ---------------------------------------------------------
+# RESOLUCIÓN DE NOMBRES DE USUARIO (CACHE EN PROCESO)
+# ---------------------------------------------------------
+USER_NAME_NOT_FOUND = "Usuario no encontrado"
+_USER_NAME_TTL = 300
+_USER_NAME_MAX_ENTRIES = 5000
+_user_name_cache = {}
+_user_name_lock = threading.Lock()
+
+
+def resolve_user_names(user_ids):
+    """
+    Retorna {user_id: username} para los ids dados con una sola consulta
+    para los que no estén en la cache del proceso (TTL de 5 minutos).
+    """
+    now = time.monotonic()
+    ids = {uuid.UUID(str(user_id)) for user_id in user_ids if user_id}
+    names = {}
+    missing = set()
+    with _user_name_lock:
+        for user_id in ids:
+            cached = _user_name_cache.get(user_id)
+            if cached and cached[1] > now:
+                names[user_id] = cached[0]
+            else:
+                missing.add(user_id)
+
+    CACHE_REQUESTS.labels("audit_user_names", "hit").inc(len(names))
+    if missing:
+        CACHE_REQUESTS.labels("audit_user_names", "miss").inc(len(missing))
+        from auth.models import User
+
+        found = dict(
+            User.objects.filter(id__in=missing).values_list("id", "username"))
+        with _user_name_lock:
+            if len(_user_name_cache) > _USER_NAME_MAX_ENTRIES:
+                _user_name_cache.clear()
+            for user_id in missing:
+                name = found.get(user_id, USER_NAME_NOT_FOUND)
+                _user_name_cache[user_id] = (name, now + _USER_NAME_TTL)
+                names[user_id] = name
+    return names
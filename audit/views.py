@@ -1,2 +1,197 @@
+import uuid
 
-# Create your views here.
+from rest_framework import status
+from rest_framework.decorators import api_view
+from drf_spectacular.utils import extend_schema
+
+from config.db_router import use_replica
+from config.querycount import query_budget
+from config.utils import errorcall, permission_denied, succescall
+
+from .models import AuditLog, AuditLogDetail
+from .serializers import (
+    AuditLogDetailSerializer,
+    AuditLogSerializer,
+    AuditLogWithDetailsSerializer,
+)
+from .utils import (
+    audited_models,
+    get_audit_history,
+    get_audited_model,
+    log_permission,
+    resolve_user_names,
+)
+
+MAX_PAGE_SIZE = 200
+MAX_BATCH_RECORDS = 100
+
+
+def _serialize_logs(logs, details):
+    logs = list(logs)
+    serializer_class = (
+        AuditLogWithDetailsSerializer if details else AuditLogSerializer)
+    # Un solo lote de nombres de usuario por página
+    user_names = resolve_user_names(log.key_user for log in logs)
+    return serializer_class(
+        logs, many=True, context={"user_names": user_names}).data
+
+
+def audit_history_response(data, name_table, record_ids, message):
+    """
+    Respuesta común del historial de auditoría de uno o varios registros.
+    Con "cursor" en el body usa paginación keyset; si no, page/page_size.
+    """
+    try:
+        page = max(int(data.get("page", 1)), 1)
+        page_size = min(max(int(data.get("page_size", 10)), 1), MAX_PAGE_SIZE)
+    except (TypeError, ValueError):
+        return errorcall("Paginación inválida", status.HTTP_400_BAD_REQUEST)
+
+    details = str(data.get("details", "false")).lower() == "true"
+
+    if "cursor" in data:
+        try:
+            logs, next_cursor = get_audit_history(
+                name_table,
+                record_ids,
+                cursor=data.get("cursor"),
+                page_size=page_size,
+                with_details=details,
+            )
+        except ValueError as e:
+            return errorcall(str(e), status.HTTP_400_BAD_REQUEST)
+        return succescall(
+            {
+                "results": _serialize_logs(logs, details),
+                "next_cursor": next_cursor,
+                "page_size": page_size,
+            },
+            message
+        )
+
+    qs = AuditLog.objects.filter(
+        name_table=name_table,
+        record_id__in=record_ids,
+    ).order_by("-created_at", "-id")
+    if details:
+        qs = qs.prefetch_related("details")
+
+    total = qs.count()
+    start = (page - 1) * page_size
+    return succescall(
+        {
+            "results": _serialize_logs(qs[start:start + page_size], details),
+            "total": total,
+            "page": page,
+            "page_size": page_size,
+        },
+        message
+    )
+
+
+def audit_detail_response(pk, name_table, message):
+    """
+    Respuesta común con los detalles (diff por columna) de un log.
+    """
+    if not pk:
+        return errorcall("ID no proporcionado", status.HTTP_400_BAD_REQUEST)
+    try:
+        pk = uuid.UUID(str(pk))
+    except ValueError:
+        return errorcall("ID de log inválido", status.HTTP_400_BAD_REQUEST)
+
+    log = AuditLog.objects.filter(pk=pk, name_table=name_table).first()
+    if not log:
+        return errorcall("Log no encontrado", status.HTTP_404_NOT_FOUND)
+
+    details = AuditLogDetail.objects.filter(
+        key_audit_log=log).order_by("column_name")
+    serializer = AuditLogDetailSerializer(details, many=True)
+    return succescall(serializer.data, message)
+
+
+def _parse_record_ids(data):
+    record_ids = data.get("record_ids")
+    if record_ids is None:
+        record_ids = [data.get("record_id")] if data.get("record_id") else []
+    if not isinstance(record_ids, list) or not record_ids:
+        raise ValueError("Debe enviar record_id o record_ids")
+    if len(record_ids) > MAX_BATCH_RECORDS:
+        raise ValueError(
+            f"Máximo {MAX_BATCH_RECORDS} registros por consulta")
+    try:
+        return list({uuid.UUID(str(record_id)) for record_id in record_ids})
+    except ValueError:
+        raise ValueError("ID de registro inválido")
+
+
+def _table_model(request, detail=False):
+    """
+    Retorna (modelo, None) o (None, respuesta de error). Cada tabla exige el
+    permiso de log de su maestro (log_permission), no uno común: el
+    historial expone los valores anteriores y nuevos de cada columna.
+    """
+    model = get_audited_model(request.data.get("table") or "")
+    permission = log_permission(model, detail) if model else None
+    denied = permission_denied(request, permission)
+    if denied is not None:
+        return None, denied
+    if model is None or permission is None:
+        return None, errorcall(
+            "Tabla no auditada", status.HTTP_400_BAD_REQUEST)
+    return model, None
+
+
+def _log_permissions(detail):
+    return sorted(filter(None, (
+        log_permission(model, detail) for model in audited_models())))
+
+
+@extend_schema(request=None, responses={200: AuditLogSerializer(many=True)})
+@query_budget(max_queries=15, max_duplicates=2)
+@api_view(["POST"])
+@use_replica
+def audit_history_view(request):
+    """
+    Historial de auditoría de cualquier tabla de BaseModel.
+    Body: table, record_id o record_ids (lote), cursor, page, page_size,
+    details.
+    """
+    model, error = _table_model(request)
+    if error is not None:
+        return error
+
+    try:
+        record_ids = _parse_record_ids(request.data)
+    except ValueError as e:
+        return errorcall(str(e), status.HTTP_400_BAD_REQUEST)
+
+    return audit_history_response(
+        request.data,
+        model._meta.db_table,
+        record_ids,
+        "Historial obtenido correctamente"
+    )
+
+
+@extend_schema(
+    request=None,
+    responses={200: AuditLogDetailSerializer(many=True)})
+@query_budget(max_queries=15, max_duplicates=2)
+@api_view(["POST"])
+@use_replica
+def audit_history_detail_view(request):
+    model, error = _table_model(request, detail=True)
+    if error is not None:
+        return error
+
+    return audit_detail_response(
+        request.data.get("id"),
+        model._meta.db_table,
+        "Detalles del log obtenidos correctamente"
+    )
+
+
+# Catálogo para sync_permissions (access/permission_sync.py)
+audit_history_view.permission_names = _log_permissions(detail=False)
+audit_history_detail_view.permission_names = _log_permissions(detail=True)
@@ -1,6 +1,15 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_delete, post_save
 
 
 class AuthConfig(AppConfig):
     name = "auth"
     label = "meteorite_auth"
+
+    def ready(self):
+        from .models import User
+        from .views import user_autocomplete
+
+        post_save.connect(user_autocomplete.changed, sender=User, weak=False)
+        post_delete.connect(
+            user_autocomplete.changed, sender=User, weak=False)
@@ -0,0 +1,44 @@
+# Generated by Django 6.0.1 on 2026-10-19 17:41
+
+import config.search
+import django.contrib.postgres.indexes
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("config", "0007_meteorite_normalize"),
+        ("auth", "0012_alter_user_first_name_max_length"),
+        ("meteorite_auth", "0003_user_dni"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="user",
+            index=models.Index(
+                django.contrib.postgres.indexes.OpClass(
+                    config.search.Normalize("first_name"), name="text_pattern_ops"
+                ),
+                name="auth_user_first_name_ac_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="user",
+            index=models.Index(
+                django.contrib.postgres.indexes.OpClass(
+                    config.search.Normalize("last_name"), name="text_pattern_ops"
+                ),
+                name="auth_user_last_name_ac_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="user",
+            index=models.Index(
+                django.contrib.postgres.indexes.OpClass(
+                    config.search.Normalize("username"), name="text_pattern_ops"
+                ),
+                name="auth_user_username_ac_idx",
+            ),
+        ),
+    ]
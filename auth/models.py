@@ -5,6 +5,8 @@ from django.contrib.auth.models import AbstractBaseUser, PermissionsMixin
 from django.db import models
 from django.utils import timezone
 
+from config.search import autocomplete_index
+
 
 class UserManager(BaseUserManager):
     def create_user(self, username, email, password=None, **extra_fields):
@@ -78,6 +80,11 @@ class User(AbstractBaseUser, PermissionsMixin):
 
     class Meta:
         db_table = "auth_user"
+        indexes = [
+            autocomplete_index("first_name", "auth_user_first_name_ac_idx"),
+            autocomplete_index("last_name", "auth_user_last_name_ac_idx"),
+            autocomplete_index("username", "auth_user_username_ac_idx"),
+        ]
 
 
 class VerificationCode(models.Model):
@@ -1,2 +1,58 @@
+from django.test import TestCase
 
-# Create your tests here.
+from access.models import Menu, Role, RoleMenu, UserRole
+from access.permissions import refresh_user_permissions
+from config.testing import QueryBudgetTestMixin, make_user
+from config.utils import STATUS_ACTIVO
+
+MENUS = 4
+
+
+class SessionQueryBudgetTests(QueryBudgetTestMixin, TestCase):
+    """
+    session_view con el presupuesto "session" de settings.QUERY_BUDGETS:
+    el árbol de menús no consulta un padre por menú.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = make_user("admin", admin=True)
+        cls.viewer = make_user("viewer")
+        audit = {
+            "key_user_created": cls.admin,
+            "key_user_updated": cls.admin,
+            "status_id": STATUS_ACTIVO,
+        }
+        role = Role.objects.create(name="LECTOR", **audit)
+        UserRole.objects.create(user_id=cls.viewer.id, role=role, **audit)
+        for i in range(MENUS):
+            parent = Menu.objects.create(
+                title=f"MENU {i}", ordering=i, **audit)
+            child = Menu.objects.create(
+                title=f"SUBMENU {i}", ordering=i, parent=parent, **audit)
+            RoleMenu.objects.create(role=role, menu=parent, **audit)
+            RoleMenu.objects.create(role=role, menu=child, **audit)
+        refresh_user_permissions([cls.viewer.id])
+
+    def session(self, user):
+        self.client.force_login(user)
+        response = self.client.get("/auth/session/")
+        self.assertEqual(response.status_code, 200)
+        return response.json()["data"]["user_info"]
+
+    def test_admin_session(self):
+        info = self.session(self.admin)
+        self.assertTrue(info["role"])
+        self.assertEqual(len(info["menu"]), MENUS)
+
+    def test_role_session(self):
+        info = self.session(self.viewer)
+        self.assertFalse(info["role"])
+        self.assertEqual(len(info["menu"]), MENUS)
+        self.assertEqual(
+            [len(node["children"]) for node in info["menu"]], [1] * MENUS)
+
+    def test_anonymous_session(self):
+        with self.assertQueryBudget(max_queries=0):
+            response = self.client.get("/auth/session/")
+        self.assertEqual(response.status_code, 401)
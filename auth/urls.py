@@ -1,11 +1,15 @@
+from django.conf import settings
 from django.urls import path
 
 from .views import (
+    async_logout_view,
+    async_session_view,
     login_view,
     logout_view,
     register_view,
     resend_code_view,
     session_view,
+    user_autocomplete_view,
     user_get_view,
     user_select_view,
     verify_code_view,
@@ -16,8 +20,21 @@ urlpatterns = [
     path("verify/", verify_code_view, name="verify"),
     path("resend/", resend_code_view, name="resend-code"),
     path("login/", login_view, name="login"),
-    path("logout/", logout_view, name="logout"),
-    path("session/", session_view, name="session"),
+    path(
+        "logout/",
+        async_logout_view if settings.ASYNC_VIEWS_ENABLED else logout_view,
+        name="logout",
+    ),
+    path(
+        "session/",
+        async_session_view if settings.ASYNC_VIEWS_ENABLED else session_view,
+        name="session",
+    ),
     path("user/get/", user_get_view, name="user-get"),
     path("user/select/", user_select_view, name="user-select"),
+    path(
+        "user/autocomplete/",
+        user_autocomplete_view,
+        name="user-autocomplete",
+    ),
 ]
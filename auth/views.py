@@ -1,20 +1,29 @@
 import os
 import secrets
 
-from django.contrib.auth import authenticate, login, logout
+from asgiref.sync import sync_to_async
+from django.contrib.auth import alogout, authenticate, login, logout
 from django.db import transaction
 from django.middleware.csrf import get_token
 from django.utils import timezone
 from django.views.decorators.csrf import ensure_csrf_cookie, csrf_exempt
 from rest_framework import status
 from rest_framework.decorators import api_view, throttle_classes
-from rest_framework.throttling import AnonRateThrottle
 from django.core.mail import send_mail
-from drf_spectacular.utils import extend_schema, OpenApiTypes
+from drf_spectacular.utils import extend_schema, OpenApiParameter, OpenApiTypes
 
-from access.models import Menu, PermissionRole, RoleMenu, UserRole, UserGroupRole
+from access.models import EffectiveUserPermission, Menu, RoleMenu
+from access.permissions import effective_role_ids, user_permissions
 from access.utils import build_menu_tree
 from django.template.loader import render_to_string
+from config.async_views import (
+    async_api_view,
+    async_errorcall,
+    async_succescall,
+)
+from config.db_router import use_replica
+from config.search import Autocomplete, autocomplete_limit
+from config.throttling import AnonRateThrottle
 from config.utils import errorcall, succescall
 
 from .models import User, VerificationCode
@@ -50,33 +59,22 @@ def get_user_session_data(user, request=None):
     Helper function to gather user info, menus, and permissions.
     """
     try:
-        # 1. Obtener Roles del usuario (Directos + Roles por Grupo)
-        direct_roles = list(UserRole.objects.filter(
-            user_id=user.id).select_related("role"))
-        group_roles = list(UserGroupRole.objects.filter(
-            user_id=user.id).select_related("role"))
-
-        all_role_objs = [ur.role for ur in direct_roles] + [gr.role for gr in group_roles]
-        
-        # Eliminar duplicados por ID
-        roles = []
-        seen_ids = set()
-        for r in all_role_objs:
-            if r.id not in seen_ids:
-                roles.append(r)
-                seen_ids.add(r.id)
-        
-        role_names = [r.name for r in roles]
+        # 1. Permisos efectivos (tabla materializada)
+        permissions = user_permissions(user.id)
 
         # 2. Verificar si es Superusuario o tiene "ALL PERMISSIONS"
-        is_all_permissions = "ALL PERMISSIONS" in role_names or user.is_admin
+        is_all_permissions = (
+            EffectiveUserPermission.ALL_PERMISSIONS in permissions
+            or user.is_admin
+        )
 
         # 3. Obtener Menús permitidos
         if is_all_permissions:
             allowed_menus = list(Menu.objects.all())
         else:
             role_menu_ids = RoleMenu.objects.filter(
-                role__in=roles).values_list("menu_id", flat=True)
+                role_id__in=effective_role_ids(user.id)
+            ).values_list("menu_id", flat=True)
             allowed_menus = list(
                 Menu.objects.filter(
                     id__in=role_menu_ids).distinct())
@@ -86,13 +84,7 @@ def get_user_session_data(user, request=None):
             permisos_back = ["ALL_PERMISSIONS"]
             permisos_front = [{"action": "manage", "subject": "all"}]
         else:
-            perms = PermissionRole.objects.filter(
-                role__in=roles).select_related("permission")
-            # Usamos strip() para evitar errores por espacios invisibles
-            permisos_back = list(set([
-                str(p.permission.decorator_name).strip() 
-                for p in perms
-            ]))
+            permisos_back = sorted(permissions)
             permisos_front = [{"action": "read", "subject": p}
                                for p in permisos_back]
 
@@ -140,6 +132,7 @@ def get_user_session_data(user, request=None):
 )
 @api_view(["GET"])
 @ensure_csrf_cookie
+@use_replica
 def session_view(request):
     """
     Returns user info if the session is valid.
@@ -158,6 +151,25 @@ def session_view(request):
     return succescall(data, "Sesión válida")
 
 
+@ensure_csrf_cookie
+@async_api_view(["GET"], twin=session_view)
+@use_replica
+async def async_session_view(request):
+    """
+    Variante async de session_view (ASYNC_VIEWS_ENABLED).
+    """
+    if not request.user.is_authenticated:
+        return async_errorcall(
+            "No autenticado",
+            status.HTTP_401_UNAUTHORIZED,
+            data={"csrfToken": get_token(request)}
+        )
+
+    data = await sync_to_async(get_user_session_data)(request.user, request)
+    data["csrfToken"] = get_token(request)
+    return async_succescall(data, "Sesión válida")
+
+
 @extend_schema(
     request=UserRegisterSerializer,
     responses={201: UserRegisterSerializer},
@@ -401,6 +413,18 @@ def logout_view(request):
     return response
 
 
+@async_api_view(["POST"], twin=logout_view)
+async def async_logout_view(request):
+    """
+    Variante async de logout_view (ASYNC_VIEWS_ENABLED).
+    """
+    await alogout(request)
+    response = async_succescall(None, "Cierre de sesión exitoso")
+    response.delete_cookie("sessionid")
+    response.delete_cookie("csrftoken")
+    return response
+
+
 @extend_schema(request=ResendCodeSerializer, responses={200: OpenApiTypes.STR})
 @csrf_exempt
 @api_view(["POST"])
@@ -524,3 +548,49 @@ def user_select_view(request):
         for u in users
     ]
     return succescall(results, "Usuarios obtenidos")
+
+
+def _user_option(u):
+    return {
+        "id": str(u.id),
+        "full_name": f"{u.first_name} {u.last_name}".strip() or u.username,
+        "email": u.email,
+    }
+
+
+# Se invalida en AuthConfig.ready al guardar o eliminar usuarios
+user_autocomplete = Autocomplete(
+    User,
+    ["first_name", "last_name", "username"],
+    _user_option,
+    order_by=["first_name", "last_name"],
+)
+
+
+@extend_schema(
+    request=None,
+    parameters=[
+        OpenApiParameter("q", str, required=True),
+        OpenApiParameter("limit", int),
+    ],
+    responses={200: OpenApiTypes.OBJECT},
+)
+@api_view(["GET"])
+@use_replica
+def user_autocomplete_view(request):
+    """
+    Usuarios activos cuyo nombre, apellido o usuario empieza por q (sin
+    tildes ni distinción de mayúsculas), para selectores con búsqueda.
+    """
+    if not request.user.is_authenticated:
+        return errorcall("No autenticado", status.HTTP_401_UNAUTHORIZED)
+
+    users = User.objects.filter(is_active=True).only(
+        "id", "first_name", "last_name", "username", "email")
+    results = user_autocomplete.search(
+        users,
+        request.query_params.get("q", ""),
+        autocomplete_limit(request.query_params.get("limit")),
+    )
+    return succescall(
+        {"results": results, "total": len(results)}, "Usuarios obtenidos")
@@ -1,5 +1,27 @@
 from django.apps import AppConfig
+from django.db import router
+from django.db.models.signals import post_delete, post_migrate, post_save
+
+
+def install_trigram_after_migrate(sender, using, **kwargs):
+    """
+    Con AUTOCOMPLETE_TRIGRAM_ENABLED, crea los índices trigram que falten
+    (incluye autocomplete_index nuevos).
+    """
+    from .search import install_trigram_indexes, trigram_enabled
+
+    if trigram_enabled() and router.allow_migrate(using, sender.label):
+        install_trigram_indexes(using)
 
 
 class ConfigConfig(AppConfig):
     name = "config"
+
+    def ready(self):
+        from . import checks  # noqa: F401
+        from .models import Status
+        from .status_registry import status_changed
+
+        post_save.connect(status_changed, sender=Status)
+        post_delete.connect(status_changed, sender=Status)
+        post_migrate.connect(install_trigram_after_migrate, sender=self)
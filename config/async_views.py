@@ -0,0 +1,128 @@
+"""
+Camino async nativo para vistas de solo lectura (ASYNC_VIEWS_ENABLED).
+
+Bajo daphne las vistas DRF son síncronas y cada petición completa ocupa el
+hilo compartido de sync_to_async. En estas vistas la sesión
+(request.auser()), el throttling (cache async) y la verificación de
+permisos se resuelven en el event loop. El ORM async de Django sigue
+ejecutando cada consulta en ese hilo, por lo que el trabajo de base de
+datos y la serialización de una vista se agrupan en una sola llamada
+sync_to_async.
+
+DRF no admite vistas async: aquí se reproducen el sobre de respuesta
+(status/message/data), el parseo del cuerpo, los throttles por defecto y
+la comprobación CSRF de SessionAuthentication (como @api_view, la vista
+queda csrf_exempt y solo se exige el token a usuarios autenticados).
+"""
+import json
+import math
+from functools import wraps
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import JsonResponse
+from django.views.decorators.csrf import csrf_exempt
+from rest_framework import exceptions, status
+from rest_framework.authentication import CSRFCheck
+from rest_framework.settings import api_settings
+
+from .metrics import API_RESPONSES
+
+
+def async_succescall(data=None, message="Operación exitosa"):
+    API_RESPONSES.labels("success", status.HTTP_200_OK).inc()
+    return JsonResponse(
+        {"status": "success", "message": message, "data": data},
+        status=status.HTTP_200_OK,
+        encoder=DjangoJSONEncoder,
+    )
+
+
+def async_errorcall(
+    message="Error crítico",
+    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+    data=None,
+):
+    API_RESPONSES.labels("error", status_code).inc()
+    return JsonResponse(
+        {"status": "error", "message": message, "data": data},
+        status=status_code,
+        encoder=DjangoJSONEncoder,
+    )
+
+
+def _detail(exc):
+    # Mismo cuerpo que las excepciones de DRF
+    return JsonResponse({"detail": str(exc.detail)}, status=exc.status_code)
+
+
+def _parse_data(request):
+    if request.content_type == "application/json":
+        return json.loads(request.body) if request.body else {}
+    return request.POST
+
+
+def _csrf_failure(request):
+    """
+    Igual que SessionAuthentication.enforce_csrf; retorna la respuesta 403
+    o None.
+    """
+    if not request.user.is_authenticated:
+        return None
+    check = CSRFCheck(lambda request: None)
+    check.process_request(request)
+    reason = check.process_view(request, None, (), {})
+    if reason:
+        return _detail(exceptions.PermissionDenied(f"CSRF Failed: {reason}"))
+    return None
+
+
+async def athrottle(request):
+    """
+    Aplica DEFAULT_THROTTLE_CLASSES; retorna la respuesta 429 o None.
+    """
+    for throttle_class in api_settings.DEFAULT_THROTTLE_CLASSES:
+        throttle = throttle_class()
+        if not await throttle.aallow_request(request, None):
+            wait = throttle.wait()
+            response = _detail(exceptions.Throttled(wait))
+            if wait is not None:
+                response["Retry-After"] = str(math.ceil(wait))
+            return response
+    return None
+
+
+def async_api_view(http_method_names, twin=None):
+    """
+    Equivalente async mínimo de @api_view: valida el método, resuelve el
+    usuario, comprueba el CSRF, aplica throttling y expone el cuerpo en
+    request.data.
+    twin es la vista DRF equivalente: se copian su `cls` e `initkwargs`
+    para que drf-spectacular siga documentando el endpoint.
+    """
+    def decorator(view_func):
+        @wraps(view_func)
+        async def _wrapped_view(request, *args, **kwargs):
+            if request.method not in http_method_names:
+                return _detail(exceptions.MethodNotAllowed(request.method))
+
+            request.user = await request.auser()
+            csrf_failed = _csrf_failure(request)
+            if csrf_failed is not None:
+                return csrf_failed
+            throttled = await athrottle(request)
+            if throttled is not None:
+                return throttled
+
+            try:
+                request.data = _parse_data(request)
+            except ValueError as e:
+                return _detail(
+                    exceptions.ParseError(f"JSON parse error - {e}"))
+            return await view_func(request, *args, **kwargs)
+
+        if twin is not None:
+            _wrapped_view.cls = twin.cls
+            _wrapped_view.initkwargs = twin.initkwargs
+        return csrf_exempt(_wrapped_view)
+
+    return decorator
@@ -1,10 +1,18 @@
 import copy
+from asgiref.sync import sync_to_async
+from django.conf import settings
 from django.db import transaction
 from rest_framework import status
 from rest_framework.decorators import api_view
-from drf_spectacular.utils import extend_schema, OpenApiTypes
+from drf_spectacular.utils import extend_schema, OpenApiParameter, OpenApiTypes
 from django.db.models import Q
+from django.db.models.signals import post_delete, post_save
 
+from .async_views import async_api_view, async_succescall
+from .db_router import use_replica
+from .excel_handler import ExcelMasterHandler
+from .search import Autocomplete, autocomplete_limit
+from .signals import post_import
 from .utils import (
     STATUS_ACTIVO,
     STATUS_ANULADO,
@@ -16,6 +24,7 @@ from .utils import (
 from audit.utils import (
     EVENT_ANNUL,
     EVENT_CREATE,
+    EVENT_IMPORT,
     EVENT_INACTIVATE,
     EVENT_RESTORE,
     EVENT_UPDATE,
@@ -25,77 +34,197 @@ from audit.utils import (
 class BaseViewFactory:
     """
     Factoría para generar vistas CRUD estándar con auditoría automática.
+    select_related: FKs que lee el serializer (ej: role para role_name),
+    así get/select no hacen una consulta por fila.
     """
-    def __init__(self, model, serializer_class, module_name, permission_prefix):
+    def __init__(self, model, serializer_class, module_name, permission_prefix,
+                 select_related=None):
         self.model = model
         self.serializer_class = serializer_class
         self.module_name = module_name
         self.permission_prefix = permission_prefix
+        self.select_related = list(select_related or [])
+
+    def _queryset(self):
+        qs = self.model.objects.all()
+        if self.select_related:
+            qs = qs.select_related(*self.select_related)
+        return qs
+
+    def _list_queryset(self, data, filters=None, order_by=None):
+        status_filter = data.get("status", None)
+        qs = self._queryset().exclude(status_id=STATUS_ANULADO)
+        if status_filter == "activo":
+            qs = qs.filter(status_id=STATUS_ACTIVO)
+        elif status_filter == "inactivo":
+            qs = qs.filter(status_id=STATUS_INACTIVO)
+
+        # Filtros personalizados (ej: user_id, group_id)
+        if filters:
+            for f in filters:
+                val = data.get(f)
+                if val:
+                    qs = qs.filter(**{f: val})
+
+        # Búsqueda genérica
+        query = data.get("query", "").strip()
+        if query and hasattr(self.model, 'name'):
+            qs = qs.filter(name__icontains=query)
+        elif query and hasattr(self.model, 'title'):
+            qs = qs.filter(title__icontains=query)
+
+        if order_by:
+            qs = qs.order_by(
+                *order_by if isinstance(order_by, list) else [order_by])
+        else:
+            qs = qs.order_by(
+                "-created_at" if hasattr(self.model, "created_at") else "id")
+        return qs
+
+    def _list_page(self, qs, page, page_size):
+        total = qs.count()
+        start = (page - 1) * page_size
+        end = start + page_size
+        serializer = self.serializer_class(qs[start:end], many=True)
+        return {
+            "results": serializer.data,
+            "total": total,
+            "page": page,
+            "page_size": page_size,
+            "pages": (total + page_size - 1) // page_size,
+        }
+
+    def _select_queryset(self, order_by=None):
+        qs = self._queryset().filter(status_id=STATUS_ACTIVO)
+        if order_by:
+            qs = qs.order_by(
+                *order_by if isinstance(order_by, list) else [order_by])
+        elif hasattr(self.model, 'name'):
+            qs = qs.order_by("name")
+        elif hasattr(self.model, 'title'):
+            qs = qs.order_by("title")
+        return qs
+
+    def _select_data(self, qs):
+        return self.serializer_class(qs, many=True).data
 
     def get_view(self, filters=None, order_by=None):
         """
         filters: lista de strings que representan los campos a filtrar desde request.data
+        Con ASYNC_VIEWS_ENABLED retorna la variante async (async_get_view).
         """
         @extend_schema(request=None, responses={200: self.serializer_class(many=True)})
         @MiddlewareAutentication(f"{self.permission_prefix}_get")
         @api_view(["POST"])
+        @use_replica
         def view(request):
-            status_filter = request.data.get("status", None)
             page = int(request.data.get("page", 1))
             page_size = min(int(request.data.get("page_size", 10)), 200)
+            qs = self._list_queryset(request.data, filters, order_by)
+            return succescall(
+                self._list_page(qs, page, page_size),
+                f"Lista de {self.module_name} obtenida")
 
-            qs = self.model.objects.exclude(status_id=STATUS_ANULADO)
-            if status_filter == "activo":
-                qs = qs.filter(status_id=STATUS_ACTIVO)
-            elif status_filter == "inactivo":
-                qs = qs.filter(status_id=STATUS_INACTIVO)
-            
-            # Filtros personalizados (ej: user_id, group_id)
-            if filters:
-                for f in filters:
-                    val = request.data.get(f)
-                    if val:
-                        qs = qs.filter(**{f: val})
-
-            # Búsqueda genérica
-            query = request.data.get("query", "").strip()
-            if query and hasattr(self.model, 'name'):
-                qs = qs.filter(name__icontains=query)
-            elif query and hasattr(self.model, 'title'):
-                qs = qs.filter(title__icontains=query)
-
-            if order_by:
-                qs = qs.order_by(*order_by) if isinstance(order_by, list) else qs.order_by(order_by)
-            else:
-                qs = qs.order_by("-created_at") if hasattr(self.model, 'created_at') else qs.order_by("id")
-            
-            total = qs.count()
-            start = (page - 1) * page_size
-            end = start + page_size
-            serializer = self.serializer_class(qs[start:end], many=True)
-            return succescall({
-                "results": serializer.data,
-                "total": total,
-                "page": page,
-                "page_size": page_size,
-                "pages": (total + page_size - 1) // page_size,
-            }, f"Lista de {self.module_name} obtenida")
+        if settings.ASYNC_VIEWS_ENABLED:
+            return self.async_get_view(filters, order_by, twin=view)
+        return view
+
+    def async_get_view(self, filters=None, order_by=None, twin=None):
+        @MiddlewareAutentication(f"{self.permission_prefix}_get")
+        @async_api_view(["POST"], twin=twin)
+        @use_replica
+        async def view(request):
+            page = int(request.data.get("page", 1))
+            page_size = min(int(request.data.get("page_size", 10)), 200)
+            qs = self._list_queryset(request.data, filters, order_by)
+            # Consultas y serialización en una sola llamada al hilo del ORM
+            data = await sync_to_async(self._list_page)(qs, page, page_size)
+            return async_succescall(
+                data, f"Lista de {self.module_name} obtenida")
         return view
 
     def select_view(self, order_by=None):
-        @extend_schema(request=None, responses={200: self.serializer_class(many=True)})
+        """
+        Con ASYNC_VIEWS_ENABLED retorna la variante async (async_select_view).
+        """
+        @extend_schema(
+            request=None,
+            responses={200: self.serializer_class(many=True)})
         @MiddlewareAutentication(f"{self.permission_prefix}_select")
         @api_view(["POST"])
+        @use_replica
+        def view(request):
+            qs = self._select_queryset(order_by)
+            return succescall(
+                self._select_data(qs), f"{self.module_name} activos obtenidos")
+
+        if settings.ASYNC_VIEWS_ENABLED:
+            return self.async_select_view(order_by, twin=view)
+        return view
+
+    def async_select_view(self, order_by=None, twin=None):
+        @MiddlewareAutentication(f"{self.permission_prefix}_select")
+        @async_api_view(["POST"], twin=twin)
+        @use_replica
+        async def view(request):
+            qs = self._select_queryset(order_by)
+            data = await sync_to_async(self._select_data)(qs)
+            return async_succescall(
+                data, f"{self.module_name} activos obtenidos")
+        return view
+
+    def autocomplete_view(self, search_fields=None, fields=None, filters=None):
+        """
+        Sugerencias por prefijo (GET ?q=&limit=) de los registros activos,
+        sin tildes ni distinción de mayúsculas (config/search.py).
+        search_fields: default code y name. fields: claves de cada opción.
+        filters: parámetros opcionales que filtran por igualdad
+        (ej: key_province)
+        """
+        search_fields = search_fields or [
+            f for f in ("name", "code") if hasattr(self.model, f)]
+        fields = fields or ["id"] + [
+            f for f in ("code", "name") if hasattr(self.model, f)]
+
+        def to_option(obj):
+            return {f: str(v) if (v := getattr(obj, f)) is not None else None
+                    for f in fields}
+
+        autocomplete = Autocomplete(self.model, search_fields, to_option)
+        for signal in (post_save, post_delete, post_import):
+            signal.connect(
+                autocomplete.changed, sender=self.model, weak=False,
+                dispatch_uid=autocomplete.cache.namespace)
+
+        @extend_schema(
+            request=None,
+            parameters=[
+                OpenApiParameter("q", str, required=True),
+                OpenApiParameter("limit", int),
+            ] + [OpenApiParameter(f, str) for f in filters or []],
+            responses={200: OpenApiTypes.OBJECT},
+        )
+        @MiddlewareAutentication(f"{self.permission_prefix}_select")
+        @api_view(["GET"])
+        @use_replica
         def view(request):
-            qs = self.model.objects.filter(status_id=STATUS_ACTIVO)
-            if order_by:
-                qs = qs.order_by(*order_by) if isinstance(order_by, list) else qs.order_by(order_by)
-            elif hasattr(self.model, 'name'):
-                qs = qs.order_by("name")
-            elif hasattr(self.model, 'title'):
-                qs = qs.order_by("title")
-            serializer = self.serializer_class(qs, many=True)
-            return succescall(serializer.data, f"{self.module_name} activos obtenidos")
+            qs = self.model.objects.filter(
+                status_id=STATUS_ACTIVO).only(*fields)
+            cache_key = []
+            for f in filters or []:
+                val = request.query_params.get(f)
+                if val:
+                    qs = qs.filter(**{f: val})
+                    cache_key.append(f"{f}={val}")
+            results = autocomplete.search(
+                qs,
+                request.query_params.get("q", ""),
+                autocomplete_limit(request.query_params.get("limit")),
+                cache_key="&".join(cache_key),
+            )
+            return succescall(
+                {"results": results, "total": len(results)},
+                f"{self.module_name} sugeridos")
         return view
 
     def create_view(self, unique_fields=None):
@@ -238,3 +367,56 @@ class BaseViewFactory:
             
             return succescall(None, f"{count} registros procesados")
         return view
+
+    def export_view(self, field_mapping, filename_prefix, order_by=None):
+        """
+        Exporta a Excel los registros no anulados.
+        field_mapping: { 'campo_serializer': 'COLUMNA EXCEL' }
+        """
+        @extend_schema(request=None, responses={200: OpenApiTypes.STR})
+        @MiddlewareAutentication(f"{self.permission_prefix}_export")
+        @api_view(["GET"])
+        @use_replica
+        def view(request):
+            qs = self.model.objects.exclude(
+                status_id=STATUS_ANULADO).order_by(*(order_by or ["code"]))
+            handler = ExcelMasterHandler(
+                self.model, list(field_mapping.values()), filename_prefix,
+                request.user.id)
+            return handler.export_data(
+                qs, self.serializer_class, field_mapping)
+        return view
+
+    def template_view(self, headers, filename_prefix):
+        @extend_schema(request=None, responses={200: OpenApiTypes.STR})
+        @MiddlewareAutentication(f"{self.permission_prefix}_template")
+        @api_view(["GET"])
+        def view(request):
+            handler = ExcelMasterHandler(
+                self.model, headers, filename_prefix, request.user.id)
+            return handler.generate_template()
+        return view
+
+    def import_view(
+            self, headers, field_mapping, filename_prefix, validator_factory):
+        """
+        Importa desde Excel con ExcelMasterHandler.
+        field_mapping: { 'COLUMNA EXCEL': 'campo_modelo' }
+        validator_factory: se llama en cada importación y retorna el validador
+        de filas (permite precargar datos una sola vez por archivo).
+        """
+        @extend_schema(request=None, responses={200: OpenApiTypes.STR})
+        @MiddlewareAutentication(f"{self.permission_prefix}_import")
+        @api_view(["POST"])
+        @transaction.atomic
+        def view(request):
+            handler = ExcelMasterHandler(
+                self.model, headers, filename_prefix, request.user.id)
+
+            def _audit_import(instance):
+                save_audit_log(instance, request.user.id, EVENT_IMPORT)
+
+            return handler.import_data(
+                request, validator_factory(), field_mapping,
+                audit_save_fn=_audit_import)
+        return view
@@ -0,0 +1,604 @@
+"""
+Benchmark de endpoints con datos sintéticos.
+
+- seed_data(): crea volúmenes configurables de usuarios, roles, menús,
+  permisos por rol, países, departamentos y logs de auditoría. Todo queda
+  marcado con BENCH_PREFIX y pertenece a usuarios bench_*, por lo que
+  purge_data() lo elimina en cascada.
+- collect_endpoints(): recorre el resolver de meteorite_backend/urls.py.
+- BenchmarkRunner: mide latencia (p50/p95/p99) y número de consultas por
+  endpoint con el Client de Django. Las escrituras se ejecutan dentro de
+  una transacción que se revierte; los imports se miden en modo dry_run.
+- explain_request(): planes (EXPLAIN) de las consultas de un endpoint de
+  lectura: índices usados y tablas recorridas con Seq Scan.
+"""
+import io
+import json
+import logging
+import math
+import os
+import statistics
+import time
+from contextlib import ExitStack, contextmanager
+from datetime import timedelta
+from unittest import mock
+
+from django.contrib.auth.hashers import make_password
+from django.apps import apps
+from django.db import connection, connections, transaction
+from django.test import Client
+from django.urls import URLPattern, URLResolver, get_resolver
+from django.utils import timezone
+from drf_spectacular.drainage import GENERATOR_STATS
+from rest_framework.throttling import SimpleRateThrottle
+
+from access.models import Menu, Permission, PermissionRole, Role, UserRole
+from access.permissions import refresh_user_permissions
+from audit.models import AuditLog, AuditLogDetail
+from audit.utils import EVENT_UPDATE, audited_models
+from auth.models import User
+from general_master.config_master.models import Country, Department
+
+from .ids import new_id
+from .models import BaseModel
+from .querycount import record_queries
+from .throttling import AtomicRateThrottleMixin
+from .utils import STATUS_ACTIVO, STATUS_ANULADO
+
+BENCH_PREFIX = "BENCH"
+BENCH_USER_PREFIX = "bench_user_"
+BENCH_PASSWORD = "bench-Password-1"
+
+DEFAULT_VOLUMES = {
+    "users": 50,
+    "roles": 10,
+    "menus": 50,
+    "countries": 200,
+    "departments": 1000,
+    "audit_logs": 20000,
+}
+
+# Rutas que no son API (interfaz de admin y documentación interactiva)
+EXCLUDED_PREFIXES = ("admin/", "api/docs/", "api/redoc/")
+
+# Último segmento del nombre de la URL (country-log-detail -> detail)
+READ_SUFFIXES = ("get", "select", "log", "detail", "history")
+STATUS_SUFFIXES = ("inactivate", "restore", "annul")
+
+QUIET_LOGGERS = ("django.request",)
+
+INDEX_SCANS = ("Index Scan", "Index Only Scan", "Bitmap Index Scan")
+# Un Seq Scan sobre tablas menores es lo esperado; no se reporta
+SEQ_SCAN_MIN_ROWS = 1000
+
+BATCH_SIZE = 1000
+
+
+# ---------------------------------------------------------
+# DATOS SINTÉTICOS
+# ---------------------------------------------------------
+def seed_data(volumes=None, stdout=None, as_admin=False):
+    """
+    Crea los datos de benchmark con bulk_create. Retorna el usuario bench
+    principal: tiene un rol con todos los permisos activos o, con as_admin,
+    es administrador (sin consultas de permisos).
+    """
+    volumes = {**DEFAULT_VOLUMES, **(volumes or {})}
+    now = timezone.now()
+
+    def log(msg):
+        if stdout:
+            stdout.write(msg)
+
+    with transaction.atomic():
+        password = make_password(BENCH_PASSWORD)
+        users = User.objects.bulk_create(
+            [
+                User(
+                    username=f"{BENCH_USER_PREFIX}{i}",
+                    email=f"{BENCH_USER_PREFIX}{i}@bench.local",
+                    first_name=BENCH_PREFIX,
+                    last_name=str(i),
+                    password=password,
+                    is_admin=as_admin and i == 0,
+                )
+                for i in range(max(volumes["users"], 1))
+            ],
+            batch_size=BATCH_SIZE,
+        )
+        owner = users[0]
+        audit = {
+            "key_user_created_id": owner.id,
+            "key_user_updated_id": owner.id,
+            "status_id": STATUS_ACTIVO,
+        }
+        log(f"  usuarios: {len(users)}")
+
+        roles = Role.objects.bulk_create(
+            [
+                Role(name=f"{BENCH_PREFIX} Rol {i}", **audit)
+                for i in range(max(volumes["roles"], 1))
+            ]
+        )
+        UserRole.objects.bulk_create(
+            [
+                UserRole(user_id=user.id, role=roles[i % len(roles)], **audit)
+                for i, user in enumerate(users)
+            ],
+            batch_size=BATCH_SIZE,
+        )
+        # El primer rol tiene todos los permisos para recorrer el camino
+        # completo de MiddlewareAutentication (sin atajo de administrador).
+        permissions = Permission.objects.filter(status_id=STATUS_ACTIVO)
+        PermissionRole.objects.bulk_create(
+            [
+                PermissionRole(permission=permission, role=roles[0], **audit)
+                for permission in permissions
+            ],
+            batch_size=BATCH_SIZE,
+        )
+        # bulk_create no emite señales: materializar permisos efectivos
+        refresh_user_permissions([user.id for user in users])
+        log(f"  roles: {len(roles)} ({permissions.count()} permisos)")
+
+        menus = []
+        for i in range(volumes["menus"]):
+            menus.append(Menu(
+                title=f"{BENCH_PREFIX} Menú {i}",
+                ordering=i,
+                parent=menus[i - i % 10] if i % 10 else None,
+                **audit,
+            ))
+        # Los padres deben existir antes que sus hijos
+        Menu.objects.bulk_create([m for m in menus if m.parent is None])
+        Menu.objects.bulk_create([m for m in menus if m.parent is not None])
+        log(f"  menús: {len(menus)}")
+
+        countries = Country.objects.bulk_create(
+            [
+                Country(
+                    code=f"{BENCH_PREFIX}{i:05d}",
+                    name=f"{BENCH_PREFIX} País {i}",
+                    abbreviation=f"B{i}"[:10],
+                    **audit,
+                )
+                for i in range(max(volumes["countries"], 1))
+            ],
+            batch_size=BATCH_SIZE,
+        )
+        log(f"  países: {len(countries)}")
+
+        departments = Department.objects.bulk_create(
+            [
+                Department(
+                    code=f"{BENCH_PREFIX}{i:05d}",
+                    name=f"{BENCH_PREFIX} Departamento {i}",
+                    key_country=countries[i % len(countries)],
+                    **audit,
+                )
+                for i in range(volumes["departments"])
+            ],
+            batch_size=BATCH_SIZE,
+        )
+        log(f"  departamentos: {len(departments)}")
+
+        # Historial repartido entre los países en los últimos 90 días
+        records = [(Country, c.id) for c in countries] + [
+            (Department, d.id) for d in departments]
+        logs = []
+        details = []
+        for i in range(volumes["audit_logs"]):
+            model, record_id = records[i % len(records)]
+            created_at = now - timedelta(minutes=(i * 7) % (90 * 24 * 60))
+            audit_log = AuditLog(
+                id=new_id(),
+                key_event=EVENT_UPDATE,
+                name_module=model._meta.app_label,
+                name_table=model._meta.db_table,
+                record_id=record_id,
+                key_user=users[i % len(users)].id,
+                created_at=created_at,
+            )
+            logs.append(audit_log)
+            details.append(AuditLogDetail(
+                key_audit_log=audit_log,
+                column_name="name",
+                old_value=f"{BENCH_PREFIX} {i}",
+                new_value=f"{BENCH_PREFIX} {i + 1}",
+                created_at=created_at,
+            ))
+        # Sin auto_now_add para conservar las fechas distribuidas
+        with mock.patch.object(
+                AuditLog._meta.get_field("created_at"), "auto_now_add", False):
+            AuditLog.objects.bulk_create(logs, batch_size=BATCH_SIZE)
+        AuditLogDetail.objects.bulk_create(details, batch_size=BATCH_SIZE)
+        log(f"  logs de auditoría: {len(logs)}")
+
+    return owner
+
+
+def bench_users():
+    return User.objects.filter(username__startswith=BENCH_USER_PREFIX)
+
+
+def purge_data():
+    """
+    Elimina los datos de benchmark. Los registros de BaseModel caen en
+    cascada con sus usuarios creadores; los logs se borran por usuario.
+    """
+    user_ids = list(bench_users().values_list("id", flat=True))
+    with transaction.atomic():
+        AuditLog.objects.filter(key_user__in=user_ids).delete()
+        deleted, _ = bench_users().delete()
+    return deleted
+
+
+# ---------------------------------------------------------
+# ENDPOINTS
+# ---------------------------------------------------------
+def _http_methods(callback):
+    view_class = getattr(callback, "cls", None) or getattr(
+        callback, "view_class", None)
+    if view_class is None:
+        return ["get"]
+    return [
+        method for method in ("get", "post", "patch", "put", "delete")
+        if hasattr(view_class, method)
+    ]
+
+
+def collect_endpoints(urlconf=None):
+    """
+    Lista de endpoints sin parámetros de ruta: dicts con name, path y
+    methods.
+    """
+    endpoints = []
+
+    def walk(patterns, prefix):
+        for pattern in patterns:
+            route = prefix + str(pattern.pattern)
+            if route.startswith(EXCLUDED_PREFIXES) or "<" in route:
+                continue
+            if isinstance(pattern, URLResolver):
+                walk(pattern.url_patterns, route)
+            elif isinstance(pattern, URLPattern):
+                endpoints.append({
+                    "name": pattern.name or route,
+                    "path": "/" + route.lstrip("^").rstrip("$"),
+                    "methods": _http_methods(pattern.callback),
+                })
+
+    walk(get_resolver(urlconf).url_patterns, "")
+    return endpoints
+
+
+def _model_for_path(path):
+    """
+    Modelo auditado al que pertenece una ruta (p. ej. /access/role/get/).
+    """
+    models = {m._meta.model_name: m for m in audited_models()}
+    for segment in reversed(path.strip("/").split("/")):
+        if segment in models:
+            return models[segment]
+    return None
+
+
+def _suffix(endpoint):
+    return endpoint["name"].rsplit("-", 1)[-1]
+
+
+def _sample_ids(model, limit=5):
+    """
+    Ids de registros bench del modelo o, si no hay, de cualquier registro
+    no anulado (las escrituras se revierten).
+    """
+    qs = model.objects.exclude(status_id=STATUS_ANULADO)
+    bench = qs.filter(
+        key_user_created__username__startswith=BENCH_USER_PREFIX)
+    ids = list(bench.values_list("id", flat=True)[:limit]) or list(
+        qs.values_list("id", flat=True)[:limit])
+    return [str(pk) for pk in ids]
+
+
+# ---------------------------------------------------------
+# PLANES DE EJECUCIÓN
+# ---------------------------------------------------------
+def analyze_tables():
+    """
+    VACUUM (ANALYZE) de las tablas BaseModel: estadísticas y mapa de
+    visibilidad al día tras seed_data, como los dejaría autovacuum.
+    Requiere estar fuera de una transacción.
+    """
+    with connection.cursor() as cursor:
+        for model in apps.get_models():
+            if issubclass(model, BaseModel):
+                table = connection.ops.quote_name(model._meta.db_table)
+                cursor.execute(f"VACUUM (ANALYZE) {table}")
+
+
+@contextmanager
+def capture_selects():
+    """
+    Lista de (alias, sql, params) de los SELECT ejecutados en el bloque,
+    en todas las conexiones (las lecturas de las vistas van a la réplica).
+    """
+    statements = []
+
+    def wrapper(execute, sql, params, many, context):
+        if not many and sql.lstrip().upper().startswith("SELECT"):
+            statements.append((context["connection"].alias, sql, params))
+        return execute(sql, params, many, context)
+
+    with ExitStack() as stack:
+        for conn in connections.all():
+            stack.enter_context(conn.execute_wrapper(wrapper))
+        yield statements
+
+
+def _walk_plan(node, indexes, seq_scans):
+    if node["Node Type"] in INDEX_SCANS:
+        indexes.add(node["Index Name"])
+    elif node["Node Type"] == "Seq Scan":
+        seq_scans.add(node["Relation Name"])
+    for child in node.get("Plans", ()):
+        _walk_plan(child, indexes, seq_scans)
+
+
+def explain_request(request_fn):
+    """
+    Ejecuta request_fn una vez y explica sus SELECT (sin ejecutarlos de
+    nuevo). Retorna los índices usados y las tablas de al menos
+    SEQ_SCAN_MIN_ROWS filas (estimadas) recorridas con Seq Scan.
+    """
+    with capture_selects() as statements:
+        request_fn()
+    indexes, seq_scans = set(), set()
+    for alias, sql, params in statements:
+        with connections[alias].cursor() as cursor:
+            cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+            plan = cursor.fetchone()[0]
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        _walk_plan(plan[0]["Plan"], indexes, seq_scans)
+    if seq_scans:
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT relname FROM pg_class WHERE relname = ANY(%s) "
+                "AND reltuples >= %s",
+                [list(seq_scans), SEQ_SCAN_MIN_ROWS],
+            )
+            seq_scans = {row[0] for row in cursor.fetchall()}
+    return {"indexes": sorted(indexes), "seq_scans": sorted(seq_scans)}
+
+
+class BenchmarkRunner:
+    """
+    Ejecuta y mide endpoints. Puede usarse desde tests (measure) o desde el
+    comando benchmark (run).
+    """
+
+    def __init__(self, user, iterations=20, warmup=2, include_writes=False,
+                 explain=False):
+        self.user = user
+        self.iterations = iterations
+        self.warmup = warmup
+        self.include_writes = include_writes
+        self.explain = explain
+        self.client = Client()
+        self.client.force_login(user)
+
+    # --- medición ---------------------------------------------------
+    @staticmethod
+    def percentile(samples, pct):
+        ordered = sorted(samples)
+        index = max(math.ceil(pct / 100 * len(ordered)) - 1, 0)
+        return ordered[index]
+
+    def summarize(self, timings, queries, status_codes):
+        duplicates = [r.duplicates() for r in queries]
+        return {
+            "iterations": len(timings),
+            "status": sorted(set(status_codes)),
+            "p50_ms": round(self.percentile(timings, 50), 2),
+            "p95_ms": round(self.percentile(timings, 95), 2),
+            "p99_ms": round(self.percentile(timings, 99), 2),
+            "mean_ms": round(statistics.fmean(timings), 2),
+            "queries": max(r.count for r in queries),
+            "db_ms": round(
+                statistics.median(r.duration_ms for r in queries), 2),
+            "max_repeated": max(
+                (d[0][1] for d in duplicates if d), default=0),
+        }
+
+    def measure(self, request_fn, rollback=False):
+        """
+        Ejecuta request_fn (retorna una respuesta) warmup + iterations
+        veces y retorna el resumen de latencia y consultas.
+        """
+        timings, queries, status_codes = [], [], []
+        for i in range(self.warmup + self.iterations):
+            with ExitStack() as stack:
+                if rollback:
+                    stack.enter_context(transaction.atomic())
+                recorder = stack.enter_context(record_queries())
+                start = time.perf_counter()
+                response = request_fn()
+                elapsed = (time.perf_counter() - start) * 1000
+                if rollback:
+                    transaction.set_rollback(True)
+            if i < self.warmup:
+                continue
+            timings.append(elapsed)
+            queries.append(recorder)
+            status_codes.append(response.status_code)
+        return self.summarize(timings, queries, status_codes)
+
+    # --- payloads ---------------------------------------------------
+    def _log_id(self, model):
+        log = AuditLog.objects.filter(
+            name_table=model._meta.db_table,
+            key_user__in=bench_users().values("id"),
+        ).values_list("id", flat=True).first()
+        return str(log) if log else None
+
+    def _export_file(self, endpoint):
+        export_path = endpoint["path"].replace("/import/", "/export/")
+        response = self.client.get(export_path)
+        if response.status_code != 200:
+            return None
+        content = b"".join(response.streaming_content) if getattr(
+            response, "streaming", False) else response.content
+        upload = io.BytesIO(content)
+        upload.name = "benchmark.xlsx"
+        return upload
+
+    def build_request(self, endpoint):
+        """
+        Retorna (request_fn, rollback) o (None, motivo) si se omite.
+        """
+        methods = endpoint["methods"]
+        path = endpoint["path"]
+        suffix = _suffix(endpoint)
+        model = _model_for_path(path)
+        client = self.client
+
+        if endpoint["name"] == "login":
+            payload = {
+                "username": self.user.username,
+                "password": BENCH_PASSWORD,
+                "system": os.getenv("SYSTEM_ID", ""),
+            }
+            login_client = Client()
+            return (lambda: login_client.post(
+                path, payload, content_type="application/json")), True
+
+        if endpoint["name"] == "logout":
+            # Cerraría la sesión del cliente de benchmark
+            return None, "omitido"
+
+        if "get" in methods:
+            return (lambda: client.get(path)), False
+
+        if suffix == "import":
+            if self._export_file(endpoint) is None:
+                return None, "sin archivo de exportación"
+
+            def do_import():
+                upload = self._export_file(endpoint)
+                return client.post(path, {"file": upload, "dry_run": "true"})
+            return do_import, False
+
+        if suffix in READ_SUFFIXES:
+            payload = {"page": 1, "page_size": 50}
+            if suffix == "log" and model:
+                payload["id"] = (_sample_ids(model, 1) or [None])[0]
+            elif suffix == "history":
+                payload.update({
+                    "table": Country._meta.db_table,
+                    "record_ids": _sample_ids(Country),
+                    "cursor": "",
+                })
+            elif suffix == "detail":
+                payload.update({
+                    "id": self._log_id(model or Country),
+                    "table": (model or Country)._meta.db_table,
+                })
+            return (lambda: client.post(
+                path, payload, content_type="application/json")), False
+
+        if not self.include_writes:
+            return None, "escritura (usar --include-writes)"
+
+        sample_ids = _sample_ids(model) if model else []
+        if not sample_ids:
+            return None, "sin payload sintético"
+
+        if suffix in STATUS_SUFFIXES:
+            payload = {"ids": sample_ids}
+            method = client.patch if "patch" in methods else client.delete
+            return (lambda: method(
+                path, payload, content_type="application/json")), True
+
+        if suffix in ("create", "update"):
+            counter = iter(range(10 ** 9))
+            country_id = (_sample_ids(Country, 1) or [None])[0]
+
+            def do_write():
+                n = next(counter)
+                payload = {
+                    "name": f"{BENCH_PREFIX} W{n}",
+                    "title": f"{BENCH_PREFIX} W{n}",
+                    "code": f"BW{n:08d}"[:10],
+                    "key_country": country_id,
+                }
+                if suffix == "update":
+                    payload["id"] = sample_ids[0]
+                    return client.patch(
+                        path, payload, content_type="application/json")
+                return client.post(
+                    path, payload, content_type="application/json")
+            return do_write, True
+
+        return None, "sin payload sintético"
+
+    # --- ejecución --------------------------------------------------
+    def run(self, endpoints, stdout=None):
+        results = {}
+        # Sin límite de peticiones ni logs de 4xx durante la medición
+        with ExitStack() as stack:
+            for throttle in (SimpleRateThrottle, AtomicRateThrottleMixin):
+                stack.enter_context(mock.patch.object(
+                    throttle, "allow_request", return_value=True))
+            stack.enter_context(GENERATOR_STATS.silence())
+            for name in QUIET_LOGGERS:
+                logger = logging.getLogger(name)
+                stack.callback(logger.setLevel, logger.level)
+                logger.setLevel(logging.CRITICAL)
+            for endpoint in endpoints:
+                request_fn, extra = self.build_request(endpoint)
+                if request_fn is None:
+                    results[endpoint["name"]] = {
+                        "path": endpoint["path"], "skipped": extra}
+                    continue
+                stats = self.measure(request_fn, rollback=extra)
+                if self.explain and not extra:
+                    # Solo lecturas: las escrituras se revierten
+                    stats["plan"] = explain_request(request_fn)
+                results[endpoint["name"]] = {"path": endpoint["path"], **stats}
+                if stdout:
+                    stdout.write(
+                        f"  {endpoint['path']:<45} p50={stats['p50_ms']:>8}ms "
+                        f"p95={stats['p95_ms']:>8}ms q={stats['queries']:>4} "
+                        f"{stats['status']}"
+                    )
+                    if "plan" in stats:
+                        indexes = ", ".join(stats["plan"]["indexes"])
+                        scans = ", ".join(stats["plan"]["seq_scans"])
+                        stdout.write(
+                            f"      índices: {indexes or '-'} | "
+                            f"seq scan: {scans or '-'}"
+                        )
+        return results
+
+
+def compare_results(old, new):
+    """
+    Diferencias de p95 y consultas entre dos ejecuciones (por endpoint).
+    """
+    rows = []
+    for name, current in new["results"].items():
+        previous = old.get("results", {}).get(name)
+        if not previous or "p95_ms" not in current or "p95_ms" not in previous:
+            continue
+        base = previous["p95_ms"] or 0.001
+        rows.append({
+            "name": name,
+            "path": current["path"],
+            "p95_old": previous["p95_ms"],
+            "p95_new": current["p95_ms"],
+            "p95_change_pct": round(
+                (current["p95_ms"] - previous["p95_ms"]) / base * 100, 1),
+            "queries_old": previous["queries"],
+            "queries_new": current["queries"],
+        })
+    return rows
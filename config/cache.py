@@ -0,0 +1,106 @@
+"""
+Caches de aplicación sobre la cache compartida (Redis).
+
+Las claves se agrupan por espacio de nombres con versión: invalidar un
+espacio completo consiste en incrementar su versión (bump_namespace); las
+claves antiguas dejan de leerse y expiran solas. La versión inicial se toma
+del reloj para que, si Redis la desaloja, no se reutilice una versión
+anterior con datos obsoletos.
+
+Un fallo de la cache nunca rompe la petición: se registra y se trata como
+un fallo de lectura.
+"""
+import logging
+import time
+
+from django.core.cache import cache
+
+from .metrics import CACHE_REQUESTS
+
+logger = logging.getLogger("meteorite.cache")
+
+DEFAULT_TIMEOUT = 300
+_MISSING = object()
+
+
+def _version_key(namespace):
+    return f"ns:{namespace}:version"
+
+
+def namespace_version(namespace):
+    key = _version_key(namespace)
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, int(time.time()), timeout=None)
+        version = cache.get(key, int(time.time()))
+    return version
+
+
+def bump_namespace(namespace):
+    """
+    Invalida todas las claves del espacio de nombres.
+    """
+    key = _version_key(namespace)
+    try:
+        return cache.incr(key)
+    except ValueError:
+        # La versión no existía: cualquier valor nuevo invalida lo anterior
+        version = int(time.time()) + 1
+        cache.set(key, version, timeout=None)
+        return version
+    except Exception:
+        logger.exception("No se pudo invalidar la cache %s", namespace)
+        return None
+
+
+class NamespacedCache:
+    """
+    Cache de un espacio de nombres, p. ej.:
+
+        statuses = NamespacedCache("statuses", timeout=600)
+        data = statuses.get_or_set("all", load_statuses)
+        statuses.invalidate()
+    """
+
+    def __init__(self, namespace, timeout=DEFAULT_TIMEOUT):
+        self.namespace = namespace
+        self.timeout = timeout
+
+    def make_key(self, key):
+        return f"{self.namespace}:{namespace_version(self.namespace)}:{key}"
+
+    def get(self, key, default=None):
+        try:
+            value = cache.get(self.make_key(key), _MISSING)
+        except Exception:
+            logger.exception("Error leyendo la cache %s", self.namespace)
+            value = _MISSING
+        hit = value is not _MISSING
+        CACHE_REQUESTS.labels(self.namespace, "hit" if hit else "miss").inc()
+        return value if hit else default
+
+    def set(self, key, value, timeout=_MISSING):
+        timeout = self.timeout if timeout is _MISSING else timeout
+        try:
+            cache.set(self.make_key(key), value, timeout)
+        except Exception:
+            logger.exception("Error escribiendo la cache %s", self.namespace)
+
+    def get_or_set(self, key, default, timeout=_MISSING):
+        """
+        Retorna el valor cacheado o calcula default() y lo guarda.
+        """
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = default() if callable(default) else default
+            self.set(key, value, timeout)
+        return value
+
+    def delete(self, key):
+        try:
+            cache.delete(self.make_key(key))
+        except Exception:
+            logger.exception("Error eliminando de la cache %s", self.namespace)
+
+    def invalidate(self):
+        return bump_namespace(self.namespace)
@@ -0,0 +1,32 @@
+"""
+Comprobaciones de sistema propias (manage.py check).
+"""
+from django.apps import apps
+from django.core import checks
+
+from .models import BaseModel
+
+
+@checks.register(checks.Tags.models)
+def soft_delete_indexes_check(app_configs=None, **kwargs):
+    """
+    Todo modelo BaseModel debe declarar soft_delete_indexes() en
+    Meta.indexes: get_view y select_view filtran siempre por estado.
+    """
+    errors = []
+    for model in apps.get_models():
+        if not issubclass(model, BaseModel) or model._meta.proxy:
+            continue
+        if app_configs and model._meta.app_config not in app_configs:
+            continue
+        names = {index.name for index in model._meta.indexes}
+        if not any(name.endswith("_live_idx") for name in names):
+            errors.append(checks.Warning(
+                f"{model._meta.label} no tiene los índices parciales por "
+                "estado.",
+                hint="Agregar soft_delete_indexes(<prefijo>) a Meta.indexes "
+                     "y ejecutar makemigrations.",
+                obj=model,
+                id="config.W001",
+            ))
+    return errors
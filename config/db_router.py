@@ -0,0 +1,114 @@
+"""
+Enrutamiento de lecturas a la réplica.
+
+Solo las vistas marcadas con @use_replica leen de la réplica; el resto del
+código sigue usando default. Para garantizar read-your-writes, las lecturas
+vuelven a default cuando:
+  - la petición actual ya escribió algo,
+  - hay una transacción abierta en default,
+  - el cliente escribió hace menos de REPLICA_STICKY_SECONDS (cookie que
+    fija ReplicaStickinessMiddleware).
+"""
+from contextvars import ContextVar
+from functools import wraps
+
+from asgiref.sync import iscoroutinefunction
+from django.conf import settings
+from django.db import connections
+
+PRIMARY_DB = "default"
+REPLICA_DB = "replica"
+
+# Tablas que siempre se leen y escriben en default (la sesión se guarda en
+# cada request y no debe marcar al cliente como "con escrituras").
+PRIMARY_ONLY_APPS = ("sessions",)
+
+_use_replica = ContextVar("use_replica", default=False)
+# Estado de la petición: {"sticky": bool, "wrote": bool}. Es un dict mutable
+# para que el router pueda marcar escrituras aunque se ejecute en otro
+# contexto (sync_to_async copia el contexto).
+_request_state = ContextVar("replica_request_state", default=None)
+
+
+def replica_available():
+    return REPLICA_DB in settings.DATABASES
+
+
+def _is_test_replica():
+    """
+    True cuando la réplica apunta a su base de pruebas (create_test_db
+    reemplaza NAME por TEST.NAME).
+    """
+    if not replica_available():
+        return False
+    settings_dict = connections[REPLICA_DB].settings_dict
+    test_name = settings_dict.get("TEST", {}).get("NAME")
+    return bool(test_name) and settings_dict["NAME"] == test_name
+
+
+def use_replica(view_func):
+    """
+    Ejecuta la vista (sync o async) con las lecturas dirigidas a la réplica.
+    """
+    if iscoroutinefunction(view_func):
+        @wraps(view_func)
+        async def _async_wrapped_view(*args, **kwargs):
+            token = _use_replica.set(True)
+            try:
+                return await view_func(*args, **kwargs)
+            finally:
+                _use_replica.reset(token)
+
+        return _async_wrapped_view
+
+    @wraps(view_func)
+    def _wrapped_view(*args, **kwargs):
+        token = _use_replica.set(True)
+        try:
+            return view_func(*args, **kwargs)
+        finally:
+            _use_replica.reset(token)
+
+    return _wrapped_view
+
+
+def start_request(sticky):
+    return _request_state.set({"sticky": sticky, "wrote": False})
+
+
+def end_request(token):
+    state = _request_state.get()
+    _request_state.reset(token)
+    return bool(state and state["wrote"])
+
+
+class PrimaryReplicaRouter:
+    def db_for_read(self, model, **hints):
+        if model._meta.app_label in PRIMARY_ONLY_APPS:
+            return PRIMARY_DB
+        if not _use_replica.get() or not replica_available():
+            return PRIMARY_DB
+        state = _request_state.get()
+        if state and (state["sticky"] or state["wrote"]):
+            return PRIMARY_DB
+        if connections[PRIMARY_DB].in_atomic_block:
+            return PRIMARY_DB
+        return REPLICA_DB
+
+    def db_for_write(self, model, **hints):
+        state = _request_state.get()
+        if state is not None and (
+                model._meta.app_label not in PRIMARY_ONLY_APPS):
+            state["wrote"] = True
+        return PRIMARY_DB
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Ambos alias contienen los mismos datos
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # La réplica real se alimenta de la primaria; la de los tests es una
+        # base independiente y necesita el mismo esquema.
+        if db == REPLICA_DB:
+            return _is_test_replica()
+        return db == PRIMARY_DB
@@ -1,12 +1,19 @@
-from openpyxl import Workbook, load_workbook
+import time
+
 from django.conf import settings
 from django.http import HttpResponse
 from rest_framework import status
 from config.utils import errorcall, succescall, STATUS_ACTIVO
 from django.db import transaction
+from audit.triggers import audit_event
+from audit.utils import EVENT_IMPORT
+from config.metrics import observe_stage, record_stage
+from config.signals import post_import
 
 
 class ExcelMasterHandler:
+    # openpyxl se importa solo al generar o leer un Excel: es la dependencia
+    # más pesada del arranque y la mayoría de procesos nunca la usa.
     def __init__(self, model, headers, filename_prefix, user_id):
         self.model = model
         self.headers = headers
@@ -14,6 +21,8 @@ class ExcelMasterHandler:
         self.user_id = user_id
 
     def generate_template(self):
+        from openpyxl import Workbook
+
         wb = Workbook()
         ws = wb.active
         ws.title = "Plantilla"
@@ -26,7 +35,8 @@ class ExcelMasterHandler:
         response["Content-Disposition"] = (
             f'attachment; filename="plantilla_{self.filename_prefix}.xlsx"'
         )
-        wb.save(response)
+        with observe_stage(self.model, "template"):
+            wb.save(response)
         return response
 
     def export_data(self, queryset, serializer_class, field_mapping):
@@ -34,6 +44,8 @@ class ExcelMasterHandler:
         Exporta los datos usando un field_mapping:
         { 'CampoModelo': 'NombreColumnaExcel' }
         """
+        from openpyxl import Workbook
+
         wb = Workbook()
         ws = wb.active
         ws.title = "Datos"
@@ -45,9 +57,12 @@ class ExcelMasterHandler:
         serializer = serializer_class(queryset, many=True)
         model_fields = list(field_mapping.keys())
 
-        for item in serializer.data:
-            row = [item.get(field, "") for field in model_fields]
-            ws.append(row)
+        with observe_stage(self.model, "export_query"):
+            data = serializer.data
+        with observe_stage(self.model, "export_write", rows=len(data)):
+            for item in data:
+                row = [item.get(field, "") for field in model_fields]
+                ws.append(row)
 
         response = HttpResponse(
             content_type=(
@@ -59,15 +74,11 @@ class ExcelMasterHandler:
         wb.save(response)
         return response
 
-    def import_data(
-            self,
-            request,
-            validator_func,
-            field_mapping,
-            audit_save_fn=None):
-        file = request.FILES.get("file")
-        dry_run = request.data.get("dry_run", "false").lower() == "true"
-
+    def check_file(self, file):
+        """
+        Valida presencia, tamaño y extensión del archivo. Retorna un
+        errorcall o None si es válido.
+        """
         if not file:
             return errorcall(
                 "No se ha proporcionado ningún archivo",
@@ -92,24 +103,52 @@ class ExcelMasterHandler:
                 "Solo se permiten archivos Excel (.xlsx, .xlsm)",
                 status.HTTP_400_BAD_REQUEST,
             )
+        return None
+
+    def read_rows(self, file):
+        """
+        Retorna (filas, errorcall): las filas incluyen la cabecera, que debe
+        contener self.headers.
+        """
+        with observe_stage(self.model, "import_parse"):
+            from openpyxl import load_workbook
 
-        try:
             wb = load_workbook(file)
             ws = wb.active
             rows = list(ws.iter_rows(values_only=True))
 
-            if len(rows) < 2:
-                return errorcall(
-                    "El archivo Excel está vacío", status.HTTP_400_BAD_REQUEST
-                )
+        if len(rows) < 2:
+            return rows, errorcall(
+                "El archivo Excel está vacío", status.HTTP_400_BAD_REQUEST
+            )
+
+        headers_in_file = [str(h).strip() if h else "" for h in rows[0]]
+        if not all(h in headers_in_file for h in self.headers):
+            return rows, errorcall(
+                f"Columnas requeridas faltantes. Se espera: "
+                f"{', '.join(self.headers)}",
+                status.HTTP_400_BAD_REQUEST,
+            )
+        return rows, None
 
+    def import_data(
+            self,
+            request,
+            validator_func,
+            field_mapping,
+            audit_save_fn=None):
+        file = request.FILES.get("file")
+        dry_run = request.data.get("dry_run", "false").lower() == "true"
+
+        error = self.check_file(file)
+        if error:
+            return error
+
+        try:
+            rows, error = self.read_rows(file)
+            if error:
+                return error
             headers_in_file = [str(h).strip() if h else "" for h in rows[0]]
-            if not all(h in headers_in_file for h in self.headers):
-                return errorcall(
-                    f"Columnas requeridas faltantes. Se espera: "
-                    f"{', '.join(self.headers)}",
-                    status.HTTP_400_BAD_REQUEST,
-                )
 
             # Mapeo de índices
             col_indices = {h: headers_in_file.index(h) for h in self.headers}
@@ -121,6 +160,7 @@ class ExcelMasterHandler:
 
             # We wrap the logic in a transaction block to ensure atomicity
             # but catch exceptions at the outer level to return errorcall.
+            validate_start = time.perf_counter()
             with transaction.atomic():
                 for i, row in enumerate(rows[1:], start=2):
                     data = {
@@ -179,6 +219,13 @@ class ExcelMasterHandler:
                     unique_val = data.get(self.headers[0])
                     seen_unique_keys.add(unique_val)
 
+                record_stage(
+                    self.model,
+                    "import_validate",
+                    time.perf_counter() - validate_start,
+                    rows=len(preview_data),
+                )
+
                 if dry_run:
                     return succescall(
                         {
@@ -190,11 +237,17 @@ class ExcelMasterHandler:
                     )
 
                 if to_create:
-                    created_instances = self.model.objects.bulk_create(
-                        to_create)
+                    # En modo trigger, las filas se auditan como importación
+                    with audit_event(EVENT_IMPORT), observe_stage(
+                            self.model, "import_save", rows=len(to_create)):
+                        created_instances = self.model.objects.bulk_create(
+                            to_create)
+                    post_import.send(
+                        sender=self.model, instances=created_instances)
                     if audit_save_fn:
-                        for instance in created_instances:
-                            audit_save_fn(instance)
+                        with observe_stage(self.model, "import_audit"):
+                            for instance in created_instances:
+                                audit_save_fn(instance)
 
             return succescall(
                 None,
@@ -0,0 +1,72 @@
+"""
+Generación de las claves primarias UUID.
+
+new_id() es el default del id de BaseModel, AuditLog y AuditLogDetail. Con
+UUID_V7_ENABLED genera UUIDv7 (RFC 9562): los primeros 48 bits son los
+milisegundos Unix, por lo que las filas nuevas se insertan al final del
+índice de la PK en lugar de repartirse por todo el B-tree (menos divisiones
+de página y menos bloat en tablas de mucha escritura como audit_log). Sin
+la opción se mantiene uuid4. Ambos son UUID estándar: las filas existentes,
+las FK y las APIs no cambian.
+
+En modo trigger la auditoría genera sus ids en SQL con meteorite_new_id()
+(migración config 0009): meteorite_uuid7() o gen_random_uuid() según el
+parámetro de sesión meteorite.uuid_v7, que settings fija con la misma
+opción en las opciones de arranque de cada conexión física (sin consultas
+por petición). Cambiarla no requiere reinstalar los triggers.
+"""
+import os
+import threading
+import time
+import uuid
+
+from django.conf import settings
+
+SQL_UUID7_FUNCTION = "meteorite_uuid7"
+SQL_ID_FUNCTION = "meteorite_new_id"
+SQL_ID_SETTING = "meteorite.uuid_v7"
+
+_lock = threading.Lock()
+_last_ms = 0
+_counter = 0
+
+
+def uuid7():
+    """
+    UUIDv7: 48 bits de milisegundos Unix, versión, 12 bits de contador
+    (monótono dentro del mismo milisegundo en el proceso), variante y 62
+    bits aleatorios.
+    """
+    global _last_ms, _counter
+    with _lock:
+        ms = time.time_ns() // 1_000_000
+        if ms > _last_ms:
+            _last_ms = ms
+            # Inicio aleatorio en la mitad baja: deja margen al contador
+            _counter = int.from_bytes(os.urandom(2), "big") & 0x7FF
+        else:
+            # Mismo milisegundo (o reloj atrasado): sigue el contador y,
+            # si se agota, avanza el milisegundo
+            _counter += 1
+            if _counter > 0xFFF:
+                _last_ms += 1
+                _counter = 0
+        ms, counter = _last_ms, _counter
+    rand_b = int.from_bytes(os.urandom(8), "big") & ((1 << 62) - 1)
+    return uuid.UUID(
+        int=(ms << 80) | (0x7 << 76) | (counter << 64) | (0b10 << 62) | rand_b)
+
+
+def uuid7_time_ms(value):
+    """
+    Milisegundos Unix de un UUIDv7 (None si no es v7).
+    """
+    if value.version != 7:
+        return None
+    return value.int >> 80
+
+
+def new_id():
+    if settings.UUID_V7_ENABLED:
+        return uuid7()
+    return uuid.uuid4()
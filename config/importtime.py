@@ -0,0 +1,106 @@
+"""
+Perfil de importación del arranque (python -X importtime).
+
+Se mide en un proceso nuevo lo mismo que carga un worker: la aplicación
+ASGI y el URLconf completo. El resultado permite ver qué módulos pesan
+en un arranque en frío y validar el presupuesto de arranque
+(settings.STARTUP_IMPORT_BUDGET_MS) y los módulos que deben cargarse de
+forma diferida (settings.STARTUP_LAZY_MODULES).
+"""
+import os
+import subprocess  # nosec B404
+import sys
+from collections import defaultdict
+from dataclasses import dataclass
+
+from django.conf import settings
+
+STARTUP_CODE = (
+    "import meteorite_backend.asgi\n"
+    "from django.urls import get_resolver\n"
+    "get_resolver().url_patterns\n"
+)
+
+
+@dataclass(frozen=True)
+class ImportEntry:
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+    @property
+    def package(self):
+        return self.module.split(".", 1)[0]
+
+
+def parse_importtime(text):
+    """
+    Entradas en el orden de la salida de -X importtime (los hijos aparecen
+    antes que su padre; la profundidad viene de la sangría).
+    """
+    entries = []
+    for line in text.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        try:
+            self_us, cumulative_us, name = line[12:].split("|", 2)
+            self_us, cumulative_us = int(self_us), int(cumulative_us)
+        except ValueError:
+            # Cabecera "self [us] | cumulative | imported package"
+            continue
+        module = name.strip()
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        entries.append(ImportEntry(module, self_us, cumulative_us, depth))
+    return entries
+
+
+def measure(code=STARTUP_CODE):
+    """
+    Ejecuta code con -X importtime en un intérprete nuevo y retorna sus
+    entradas.
+    """
+    env = {
+        **os.environ,
+        "DJANGO_SETTINGS_MODULE": os.environ.get(
+            "DJANGO_SETTINGS_MODULE", "meteorite_backend.settings"),
+    }
+    result = subprocess.run(  # nosec B603
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=settings.BASE_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1])
+    return parse_importtime(result.stderr)
+
+
+def total_ms(entries):
+    return round(
+        sum(e.cumulative_us for e in entries if e.depth == 0) / 1000, 1)
+
+
+def by_package(entries):
+    """
+    Tiempo propio agregado por paquete de primer nivel, de mayor a menor.
+    """
+    totals = defaultdict(int)
+    for entry in entries:
+        totals[entry.package] += entry.self_us
+    return sorted(totals.items(), key=lambda item: -item[1])
+
+
+def slowest(entries, limit=25):
+    return sorted(entries, key=lambda e: -e.cumulative_us)[:limit]
+
+
+def imported_lazy_modules(entries, modules=None):
+    """
+    Módulos de STARTUP_LAZY_MODULES que se importaron durante el arranque.
+    """
+    if modules is None:
+        modules = settings.STARTUP_LAZY_MODULES
+    loaded = {e.module for e in entries}
+    return [m for m in modules if m in loaded]
@@ -0,0 +1,35 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+
+from config.search import install_trigram_indexes, remove_trigram_indexes
+
+
+class Command(BaseCommand):
+    help = (
+        "Instala (o elimina con --remove) los índices trigram del "
+        "autocompletado (extensión pg_trgm)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--remove",
+            action="store_true",
+            help="Elimina los índices trigram.",
+        )
+
+    def handle(self, *args, **options):
+        if connection.vendor != "postgresql":
+            raise CommandError("Los índices trigram requieren PostgreSQL")
+
+        with transaction.atomic():
+            if options["remove"]:
+                names = remove_trigram_indexes()
+                action = "eliminados"
+            else:
+                names = install_trigram_indexes()
+                action = "instalados"
+
+        for name in names:
+            self.stdout.write(f"  {name}")
+        self.stdout.write(self.style.SUCCESS(
+            f"Índices trigram {action}: {len(names)}"))
@@ -0,0 +1,208 @@
+import json
+import os
+import platform
+import subprocess  # nosec B404
+from datetime import datetime, timezone
+
+import django
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from config.benchmark import (
+    DEFAULT_VOLUMES,
+    BenchmarkRunner,
+    analyze_tables,
+    bench_users,
+    collect_endpoints,
+    compare_results,
+    purge_data,
+    seed_data,
+)
+
+
+def _git_commit():
+    try:
+        return subprocess.check_output(  # nosec B603 B607
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=settings.BASE_DIR,
+            stderr=subprocess.DEVNULL,
+            text=True,
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+class Command(BaseCommand):
+    help = (
+        "Genera datos sintéticos y mide latencia (p50/p95/p99) y número de "
+        "consultas de cada endpoint. Guarda el resultado en JSON para "
+        "comparar entre commits."
+    )
+
+    def add_arguments(self, parser):
+        for name, default in DEFAULT_VOLUMES.items():
+            parser.add_argument(
+                f"--{name.replace('_', '-')}",
+                type=int,
+                default=default,
+                help=f"Cantidad de {name} a generar (default {default}).",
+            )
+        parser.add_argument("--iterations", type=int, default=20)
+        parser.add_argument("--warmup", type=int, default=2)
+        parser.add_argument(
+            "--filter",
+            default="",
+            help="Solo endpoints cuya ruta contenga este texto.",
+        )
+        parser.add_argument(
+            "--include-writes",
+            action="store_true",
+            help="Mide también create/update/cambios de estado "
+                 "(con rollback).",
+        )
+        parser.add_argument(
+            "--explain",
+            action="store_true",
+            help="Registra los índices y los Seq Scan sobre tablas grandes "
+                 "de los planes (EXPLAIN) de cada endpoint de lectura. "
+                 "Requiere PostgreSQL.",
+        )
+        parser.add_argument(
+            "--as-admin",
+            action="store_true",
+            help="El usuario bench es administrador (omite la verificación "
+                 "de permisos por rol).",
+        )
+        parser.add_argument(
+            "--reuse",
+            action="store_true",
+            help="Reutiliza los datos bench existentes en vez de "
+                 "regenerarlos.",
+        )
+        parser.add_argument(
+            "--keep",
+            action="store_true",
+            help="No elimina los datos generados al terminar.",
+        )
+        parser.add_argument(
+            "--purge",
+            action="store_true",
+            help="Solo elimina los datos de benchmark y termina.",
+        )
+        parser.add_argument(
+            "--output",
+            help="Archivo JSON de salida "
+                 "(default benchmark_results/<commit>.json).",
+        )
+        parser.add_argument(
+            "--compare",
+            help="JSON de una ejecución anterior para comparar.",
+        )
+        parser.add_argument(
+            "--max-regression",
+            type=float,
+            default=None,
+            help="Falla si algún p95 empeora más de este porcentaje "
+                 "(requiere --compare).",
+        )
+
+    def handle(self, *args, **options):
+        if options["purge"]:
+            deleted = purge_data()
+            self.stdout.write(self.style.SUCCESS(
+                f"Datos de benchmark eliminados ({deleted} filas)"))
+            return
+
+        if options["explain"] and connection.vendor != "postgresql":
+            raise CommandError("--explain requiere PostgreSQL")
+
+        volumes = {name: options[name] for name in DEFAULT_VOLUMES}
+        if options["reuse"] and bench_users().exists():
+            user = bench_users().order_by("username").first()
+        else:
+            purge_data()
+            self.stdout.write("Generando datos sintéticos...")
+            user = seed_data(
+                volumes, stdout=self.stdout, as_admin=options["as_admin"])
+
+        endpoints = [
+            e for e in collect_endpoints()
+            if options["filter"] in e["path"]
+        ]
+        runner = BenchmarkRunner(
+            user,
+            iterations=options["iterations"],
+            warmup=options["warmup"],
+            include_writes=options["include_writes"],
+            explain=options["explain"],
+        )
+        if options["explain"]:
+            analyze_tables()
+        self.stdout.write(f"Midiendo {len(endpoints)} endpoints...")
+        try:
+            results = runner.run(endpoints, stdout=self.stdout)
+        finally:
+            if not options["keep"]:
+                purge_data()
+
+        commit = _git_commit()
+        report = {
+            "meta": {
+                "commit": commit,
+                "created_at": datetime.now(timezone.utc).isoformat(),
+                "python": platform.python_version(),
+                "django": django.get_version(),
+                "iterations": options["iterations"],
+                "volumes": volumes,
+            },
+            "results": results,
+        }
+        output = options["output"] or os.path.join(
+            settings.BASE_DIR, "benchmark_results", f"{commit}.json")
+        os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+        with open(output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+        self.stdout.write(self.style.SUCCESS(f"Resultados en {output}"))
+
+        if options["explain"]:
+            self._seq_scans(results)
+
+        if options["compare"]:
+            self._compare(
+                options["compare"], report, options["max_regression"])
+
+    def _seq_scans(self, results):
+        scans = {
+            result["path"]: result["plan"]["seq_scans"]
+            for result in results.values()
+            if result.get("plan", {}).get("seq_scans")
+        }
+        if not scans:
+            self.stdout.write(self.style.SUCCESS(
+                "Ningún endpoint de lectura usa Seq Scan"))
+            return
+        self.stdout.write("Endpoints con Seq Scan:")
+        for path, tables in sorted(scans.items()):
+            self.stdout.write(f"  {path:<45} {', '.join(tables)}")
+
+    def _compare(self, path, report, max_regression):
+        with open(path, encoding="utf-8") as f:
+            previous = json.load(f)
+        rows = compare_results(previous, report)
+        self.stdout.write(
+            f"Comparación con {previous['meta'].get('commit', path)}:")
+        regressions = []
+        for row in sorted(rows, key=lambda r: -r["p95_change_pct"]):
+            self.stdout.write(
+                f"  {row['path']:<45} p95 {row['p95_old']:>8} -> "
+                f"{row['p95_new']:>8}ms ({row['p95_change_pct']:+}%) "
+                f"q {row['queries_old']} -> {row['queries_new']}"
+            )
+            if max_regression is not None and (
+                    row["p95_change_pct"] > max_regression):
+                regressions.append(row["path"])
+        if regressions:
+            raise CommandError(
+                f"Regresión de p95 > {max_regression}% en: "
+                f"{', '.join(regressions)}")
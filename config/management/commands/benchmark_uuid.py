@@ -0,0 +1,148 @@
+import json
+import time
+import uuid
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.utils import timezone
+
+from config.ids import uuid7
+
+GENERATORS = {"uuid4": uuid.uuid4, "uuid7": uuid7}
+
+# Misma forma que audit_log: PK uuid, registro indexado y fecha
+TABLE_SQL = """
+CREATE TEMP TABLE {table} (
+    id uuid PRIMARY KEY,
+    record_id uuid NOT NULL,
+    key_user uuid NOT NULL,
+    name_table varchar(50) NOT NULL,
+    created_at timestamptz NOT NULL
+)
+"""
+INDEX_SQL = "CREATE INDEX {table}_record_idx ON {table} (record_id)"
+SIZE_SQL = """
+SELECT pg_relation_size('{table}'),
+       pg_relation_size('{table}_pkey'),
+       pg_relation_size('{table}_record_idx')
+"""
+
+
+class Command(BaseCommand):
+    help = (
+        "Compara uuid4 y UUIDv7 como PK: velocidad de inserción y tamaño "
+        "del índice en cargas masivas (bulk) y escrituras de auditoría "
+        "fila a fila (single), sobre tablas temporales."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--rows",
+            type=int,
+            default=100000,
+            help="Filas a insertar por generador y modo (default 100000).",
+        )
+        parser.add_argument(
+            "--batch",
+            type=int,
+            default=1000,
+            help="Filas por INSERT en bulk y por transacción en single.",
+        )
+        parser.add_argument(
+            "--mode",
+            choices=["bulk", "single", "all"],
+            default="all",
+        )
+        parser.add_argument(
+            "--json",
+            action="store_true",
+            help="Imprime el resultado en JSON.",
+        )
+
+    def handle(self, *args, **options):
+        if connection.vendor != "postgresql":
+            raise CommandError("Requiere PostgreSQL")
+        modes = (
+            ["bulk", "single"] if options["mode"] == "all"
+            else [options["mode"]])
+
+        results = []
+        for mode in modes:
+            for name, generator in GENERATORS.items():
+                results.append(self._run(
+                    name, generator, mode, options["rows"],
+                    max(1, options["batch"])))
+
+        if options["json"]:
+            self.stdout.write(json.dumps(results, indent=2))
+            return
+        self.stdout.write(
+            f"{'modo':<7}{'generador':<10}{'filas/s':>10}"
+            f"{'PK MB':>9}{'record MB':>11}{'tabla MB':>10}")
+        for r in results:
+            self.stdout.write(
+                f"{r['mode']:<7}{r['generator']:<10}{r['rows_per_s']:>10}"
+                f"{r['pk_index_mb']:>9}{r['record_index_mb']:>11}"
+                f"{r['table_mb']:>10}")
+        for mode in modes:
+            by_name = {r["generator"]: r for r in results if r["mode"] == mode}
+            v4, v7 = by_name["uuid4"], by_name["uuid7"]
+            if v4["pk_index_mb"]:
+                ratio = v7["pk_index_mb"] / v4["pk_index_mb"]
+                speedup = v7["rows_per_s"] / v4["rows_per_s"]
+                self.stdout.write(self.style.SUCCESS(
+                    f"{mode}: índice PK con uuid7 {ratio:.0%} del de uuid4, "
+                    f"inserción x{speedup:.2f}"))
+
+    def _run(self, name, generator, mode, rows, batch):
+        table = f"bench_uuid_{name}_{mode}"
+        now = timezone.now()
+        # Pocos registros y usuarios: como el historial real de auditoría
+        records = [uuid.uuid4() for _ in range(max(1, rows // 20))]
+        users = [uuid.uuid4() for _ in range(50)]
+
+        def row(i):
+            return (
+                generator(), records[i % len(records)],
+                users[i % len(users)], "bench", now)
+
+        with connection.cursor() as cursor:
+            cursor.execute(f"DROP TABLE IF EXISTS {table}")
+            cursor.execute(TABLE_SQL.format(table=table))
+            cursor.execute(INDEX_SQL.format(table=table))
+
+        start = time.perf_counter()
+        for offset in range(0, rows, batch):
+            size = min(batch, rows - offset)
+            with transaction.atomic(), connection.cursor() as cursor:
+                values = [row(offset + i) for i in range(size)]
+                if mode == "bulk":
+                    placeholders = ", ".join(["(%s, %s, %s, %s, %s)"] * size)
+                    cursor.execute(
+                        f"INSERT INTO {table} VALUES {placeholders}",
+                        [v for value in values for v in value])
+                else:
+                    for value in values:
+                        cursor.execute(
+                            f"INSERT INTO {table} VALUES (%s, %s, %s, %s, %s)",
+                            value)
+        elapsed = time.perf_counter() - start
+
+        with connection.cursor() as cursor:
+            cursor.execute(SIZE_SQL.format(table=table))
+            table_bytes, pk_bytes, record_bytes = cursor.fetchone()
+            cursor.execute(f"DROP TABLE {table}")
+
+        def mb(value):
+            return round(value / (1024 * 1024), 2)
+
+        return {
+            "mode": mode,
+            "generator": name,
+            "rows": rows,
+            "seconds": round(elapsed, 3),
+            "rows_per_s": int(rows / elapsed) if elapsed else 0,
+            "pk_index_mb": mb(pk_bytes),
+            "record_index_mb": mb(record_bytes),
+            "table_mb": mb(table_bytes),
+        }
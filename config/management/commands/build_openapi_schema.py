@@ -0,0 +1,22 @@
+from django.core.management.base import BaseCommand
+
+from config.openapi import build_schema
+
+
+class Command(BaseCommand):
+    help = (
+        "Genera el esquema OpenAPI (JSON y YAML, con versión .gz) que sirve "
+        "/api/schema/. Se ejecuta en el build de la imagen."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--output-dir",
+            help="Directorio de salida (default settings.OPENAPI_SCHEMA_DIR).",
+        )
+
+    def handle(self, *args, **options):
+        written = build_schema(options["output_dir"])
+        for path, size in written.items():
+            self.stdout.write(f"  {path} ({size} bytes)")
+        self.stdout.write(self.style.SUCCESS("Esquema OpenAPI generado"))
@@ -0,0 +1,112 @@
+import json
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from config.importtime import (
+    STARTUP_CODE,
+    by_package,
+    imported_lazy_modules,
+    measure,
+    slowest,
+    total_ms,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Mide el tiempo de importación del arranque (python -X importtime) "
+        "y valida el presupuesto y los módulos de carga diferida."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--top",
+            type=int,
+            default=25,
+            help="Cantidad de módulos y paquetes a mostrar (default 25).",
+        )
+        parser.add_argument(
+            "--min-ms",
+            type=float,
+            default=0.0,
+            help="Omite del detalle los módulos por debajo de este tiempo.",
+        )
+        parser.add_argument(
+            "--code",
+            default=STARTUP_CODE,
+            help="Código a medir (default: aplicación ASGI y URLconf).",
+        )
+        parser.add_argument(
+            "--budget-ms",
+            type=float,
+            default=settings.STARTUP_IMPORT_BUDGET_MS,
+            help="Falla si el total supera este tiempo (default "
+                 "settings.STARTUP_IMPORT_BUDGET_MS, 0 = sin límite).",
+        )
+        parser.add_argument(
+            "--check",
+            action="store_true",
+            help="Solo valida presupuesto y módulos diferidos (para CI).",
+        )
+        parser.add_argument(
+            "--json",
+            action="store_true",
+            help="Imprime el resultado en JSON.",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            entries = measure(options["code"])
+        except RuntimeError as exc:
+            raise CommandError(f"Error al importar: {exc}")
+
+        total = total_ms(entries)
+        lazy = imported_lazy_modules(entries)
+        modules = [
+            e for e in slowest(entries, options["top"])
+            if e.cumulative_us / 1000 >= options["min_ms"]
+        ]
+        packages = by_package(entries)[:options["top"]]
+
+        if options["json"]:
+            self.stdout.write(json.dumps({
+                "total_ms": total,
+                "modules": [
+                    {
+                        "module": e.module,
+                        "self_ms": e.self_us / 1000,
+                        "cumulative_ms": e.cumulative_us / 1000,
+                    }
+                    for e in modules
+                ],
+                "packages": {name: us / 1000 for name, us in packages},
+                "lazy_modules_imported": lazy,
+            }, indent=2))
+        elif not options["check"]:
+            self.stdout.write("Módulos más lentos (acumulado):")
+            for e in modules:
+                self.stdout.write(
+                    f"  {e.cumulative_us / 1000:>9.1f} ms "
+                    f"{'  ' * e.depth}{e.module}")
+            self.stdout.write("Tiempo propio por paquete:")
+            for name, us in packages:
+                self.stdout.write(f"  {us / 1000:>9.1f} ms {name}")
+
+        self._check(total, lazy, options["budget_ms"], not options["json"])
+
+    def _check(self, total, lazy, budget, verbose):
+        errors = []
+        if lazy:
+            errors.append(
+                "módulos de carga diferida importados al arrancar: "
+                + ", ".join(lazy))
+        if budget and total > budget:
+            errors.append(
+                f"importación de {total} ms (presupuesto {budget} ms)")
+        if errors:
+            raise CommandError("; ".join(errors))
+        if verbose:
+            self.stdout.write(self.style.SUCCESS(
+                f"Arranque: {total} ms de importación"
+                + (f" (presupuesto {budget} ms)" if budget else "")))
@@ -0,0 +1,119 @@
+"""
+Métricas Prometheus del backend.
+
+Con varios procesos (workers) se define PROMETHEUS_MULTIPROC_DIR: cada
+proceso escribe sus valores en ese directorio y la vista /metrics los
+agrega con MultiProcessCollector. El directorio debe vaciarse al arrancar
+el servidor.
+"""
+import os
+import time
+from contextlib import contextmanager
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+
+MULTIPROCESS = bool(os.getenv("PROMETHEUS_MULTIPROC_DIR"))
+
+REQUEST_LATENCY = Histogram(
+    "meteorite_http_request_duration_seconds",
+    "Latencia de las peticiones HTTP",
+    ["method", "view"],
+    buckets=(0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30),
+)
+REQUESTS = Counter(
+    "meteorite_http_requests_total",
+    "Peticiones HTTP por vista y código de estado",
+    ["method", "view", "status"],
+)
+API_RESPONSES = Counter(
+    "meteorite_api_responses_total",
+    "Respuestas construidas con succescall/errorcall",
+    ["result", "status"],
+)
+PERMISSION_CHECKS = Counter(
+    "meteorite_permission_checks_total",
+    "Decisiones de MiddlewareAutentication",
+    ["decision"],
+)
+EXCEL_STAGE_SECONDS = Histogram(
+    "meteorite_excel_stage_seconds",
+    "Duración de cada etapa de ExcelMasterHandler",
+    ["model", "stage"],
+    buckets=(0.01, 0.05, 0.1, 0.5, 1, 2.5, 5, 10, 30, 60),
+)
+EXCEL_ROWS = Counter(
+    "meteorite_excel_rows_total",
+    "Filas procesadas por ExcelMasterHandler",
+    ["model", "stage"],
+)
+AUDIT_LOGS = Counter(
+    "meteorite_audit_logs_total",
+    "Registros de auditoría escritos por save_audit_log",
+    ["table", "result"],
+)
+AUDIT_LOG_SECONDS = Histogram(
+    "meteorite_audit_log_seconds",
+    "Duración de save_audit_log",
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.5),
+)
+CACHE_REQUESTS = Counter(
+    "meteorite_cache_requests_total",
+    "Consultas a caches internas",
+    ["cache", "result"],
+)
+THROTTLED_REQUESTS = Counter(
+    "meteorite_throttled_requests_total",
+    "Peticiones rechazadas por throttling",
+    ["scope"],
+)
+WEBSOCKET_CONNECTIONS = Gauge(
+    "meteorite_websocket_connections",
+    "Conexiones websocket abiertas",
+    multiprocess_mode="livesum",
+)
+WEBSOCKET_EVENTS = Counter(
+    "meteorite_websocket_events_total",
+    "Eventos de NotificationConsumer",
+    ["event"],
+)
+
+
+def record_stage(model, stage, seconds, rows=None):
+    label = model._meta.model_name
+    EXCEL_STAGE_SECONDS.labels(label, stage).observe(seconds)
+    if rows:
+        EXCEL_ROWS.labels(label, stage).inc(rows)
+
+
+@contextmanager
+def observe_stage(model, stage, rows=None):
+    """
+    Mide una etapa de import/export; rows (opcional) se suma a EXCEL_ROWS.
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record_stage(model, stage, time.perf_counter() - start, rows)
+
+
+def render_metrics():
+    """
+    Retorna (contenido, content_type) con la exposición de todos los
+    procesos.
+    """
+    if MULTIPROCESS:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return generate_latest(registry), CONTENT_TYPE_LATEST
@@ -0,0 +1,167 @@
+import json
+import logging
+import time
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+
+from .db_router import end_request, start_request
+from .metrics import REQUEST_LATENCY, REQUESTS
+from .querycount import QueryBudgetExceeded, budget_violations, record_queries
+
+query_logger = logging.getLogger("meteorite.queries")
+
+REPLICA_STICKY_COOKIE = "replica_sticky"
+
+
+class SyncAsyncMiddleware:
+    """
+    Base para middlewares que funcionan en modo sync y async: con vistas
+    async bajo ASGI evita que Django adapte la cadena con sync_to_async.
+    Las subclases implementan before(request) -> estado y
+    after(request, response, estado) -> response.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        state = self.before(request)
+        try:
+            response = self.get_response(request)
+        except BaseException:
+            self.cleanup(state)
+            raise
+        return self.after(request, response, state)
+
+    async def __acall__(self, request):
+        state = self.before(request)
+        try:
+            response = await self.get_response(request)
+        except BaseException:
+            self.cleanup(state)
+            raise
+        return self.after(request, response, state)
+
+    def before(self, request):
+        return None
+
+    def after(self, request, response, state):
+        return response
+
+    def cleanup(self, state):
+        pass
+
+
+class ReplicaStickinessMiddleware(SyncAsyncMiddleware):
+    """
+    Tras una petición que escribe en la base de datos, marca al cliente con
+    una cookie de corta duración para que sus lecturas siguientes vayan a
+    default mientras la réplica se pone al día.
+    """
+
+    def before(self, request):
+        return start_request(REPLICA_STICKY_COOKIE in request.COOKIES)
+
+    def cleanup(self, token):
+        end_request(token)
+
+    def after(self, request, response, token):
+        if end_request(token):
+            response.set_cookie(
+                REPLICA_STICKY_COOKIE,
+                "1",
+                max_age=settings.REPLICA_STICKY_SECONDS,
+                secure=settings.SESSION_COOKIE_SECURE,
+                httponly=True,
+                samesite=settings.SESSION_COOKIE_SAMESITE,
+            )
+        return response
+
+
+class QueryInstrumentationMiddleware(SyncAsyncMiddleware):
+    """
+    Registra por petición el número de consultas, el tiempo en base de
+    datos y las consultas repetidas. Los expone en la cabecera
+    Server-Timing y en el logger meteorite.queries, y valida el
+    presupuesto de la vista (@query_budget o settings.QUERY_BUDGETS).
+    """
+
+    def before(self, request):
+        if not settings.QUERY_INSTRUMENTATION_ENABLED:
+            return None
+        context = record_queries()
+        return context, context.__enter__(), time.perf_counter()
+
+    def cleanup(self, state):
+        if state is not None:
+            state[0].__exit__(None, None, None)
+
+    def after(self, request, response, state):
+        if state is None:
+            return response
+        context, recorder, start = state
+        context.__exit__(None, None, None)
+        total_ms = round((time.perf_counter() - start) * 1000, 2)
+
+        match = request.resolver_match
+        view_name = match.view_name if match else None
+        budget = getattr(match.func, "query_budget", None) if match else None
+        budget = budget or (
+            settings.QUERY_BUDGETS.get(view_name) if view_name else None)
+        violations = budget_violations(recorder, budget)
+        duplicates = recorder.duplicates(settings.QUERY_DUPLICATE_WARNING)
+
+        if settings.QUERY_SERVER_TIMING:
+            response["Server-Timing"] = (
+                f"db;dur={recorder.duration_ms};"
+                f'desc="{recorder.count} queries", '
+                f"app;dur={total_ms}"
+            )
+
+        level = logging.WARNING if violations or duplicates else logging.INFO
+        if query_logger.isEnabledFor(level):
+            query_logger.log(level, json.dumps({
+                "method": request.method,
+                "path": request.path,
+                "view": view_name,
+                "status": response.status_code,
+                "queries": recorder.count,
+                "db_ms": recorder.duration_ms,
+                "total_ms": total_ms,
+                "duplicates": [
+                    {"sql": sql[:300], "count": count}
+                    for sql, count in duplicates
+                ],
+                "budget_violations": violations,
+            }, ensure_ascii=False))
+
+        if violations and settings.QUERY_BUDGET_STRICT:
+            raise QueryBudgetExceeded(
+                f"{view_name or request.path}: " + "; ".join(violations))
+        return response
+
+
+class MetricsMiddleware(SyncAsyncMiddleware):
+    """
+    Latencia y conteo de peticiones HTTP por vista (nombre de URL, para
+    mantener acotadas las etiquetas).
+    """
+
+    def before(self, request):
+        return time.perf_counter()
+
+    def after(self, request, response, start):
+        match = request.resolver_match
+        view = match.view_name if match else "unmatched"
+        REQUEST_LATENCY.labels(request.method, view).observe(
+            time.perf_counter() - start)
+        REQUESTS.labels(request.method, view, response.status_code).inc()
+        return response
@@ -6,9 +6,10 @@ from django.db import migrations
 def seed_statuses(apps, schema_editor):
     TypeStatus = apps.get_model("config", "TypeStatus")
     Status = apps.get_model("config", "Status")
+    db_alias = schema_editor.connection.alias
 
     # Ensure TypeStatus exists
-    type_status, _ = TypeStatus.objects.get_or_create(
+    type_status, _ = TypeStatus.objects.using(db_alias).get_or_create(
         id=uuid.UUID("853663dd-9c99-43f6-92af-e81fe83681f6"),
         defaults={
             "name": "MAESTRA",
@@ -167,7 +168,7 @@ def seed_statuses(apps, schema_editor):
     ]
 
     for s_id, name, desc, color, icon in statuses:
-        Status.objects.update_or_create(
+        Status.objects.using(db_alias).update_or_create(
             id=uuid.UUID(s_id),
             defaults={
                 "name": name,
@@ -7,7 +7,9 @@ def remove_status_restaurado(apps, schema_editor):
     Status = apps.get_model("config", "Status")
     # UUID for STATUS_RESTAURADO
     restaurado_uuid = uuid.UUID("541e603a-32f4-4ea2-94a4-eb7cbfcc790a")
-    Status.objects.filter(id=restaurado_uuid).delete()
+    Status.objects.using(schema_editor.connection.alias).filter(
+        id=restaurado_uuid
+    ).delete()
 
 
 def reverse_remove_status_restaurado(apps, schema_editor):
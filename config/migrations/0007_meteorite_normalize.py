@@ -0,0 +1,29 @@
+# Generated by Django 6.0.1 on 2026-10-19 18:05
+
+from django.db import migrations
+
+# Misma regla que config/search.py normalize()
+CREATE_SQL = """
+CREATE OR REPLACE FUNCTION meteorite_normalize(value text) RETURNS text
+LANGUAGE sql IMMUTABLE STRICT PARALLEL SAFE AS $$
+    SELECT regexp_replace(
+        translate(
+            upper(trim(value)),
+            'ÁÀÄÂÉÈËÊÍÌÏÎÓÒÖÔÚÙÜÛÑÇ',
+            'AAAAEEEEIIIIOOOOUUUUNC'
+        ),
+        '\\s+', ' ', 'g')
+$$;
+"""
+DROP_SQL = "DROP FUNCTION IF EXISTS meteorite_normalize(text);"
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("config", "0006_alter_status_description_alter_status_name_and_more"),
+    ]
+
+    operations = [
+        migrations.RunSQL(CREATE_SQL, DROP_SQL),
+    ]
@@ -0,0 +1,38 @@
+# Generated by Django 6.0.1 on 2026-10-19 18:40
+
+from django.db import migrations
+
+# UUIDv7 en SQL (ids de los triggers de auditoría, config/ids.py): los 6
+# primeros bytes de un uuid aleatorio se reemplazan por los milisegundos
+# Unix y los bits de versión pasan de 4 (0100) a 7 (0111).
+CREATE_SQL = """
+CREATE OR REPLACE FUNCTION meteorite_uuid7() RETURNS uuid
+LANGUAGE sql VOLATILE PARALLEL SAFE AS $$
+    SELECT encode(
+        set_bit(
+            set_bit(
+                overlay(
+                    uuid_send(gen_random_uuid())
+                    PLACING substring(
+                        int8send(floor(
+                            extract(epoch FROM clock_timestamp()) * 1000
+                        )::bigint)
+                        FROM 3)
+                    FROM 1 FOR 6),
+                52, 1),
+            53, 1),
+        'hex')::uuid
+$$;
+"""
+DROP_SQL = "DROP FUNCTION IF EXISTS meteorite_uuid7();"
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("config", "0007_meteorite_normalize"),
+    ]
+
+    operations = [
+        migrations.RunSQL(CREATE_SQL, DROP_SQL),
+    ]
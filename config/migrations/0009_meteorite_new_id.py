@@ -0,0 +1,27 @@
+# Generated by Django 6.0.1 on 2026-10-19 20:10
+
+from django.db import migrations
+
+# Id de los triggers de auditoría (config/ids.py): la versión de UUID se lee
+# del parámetro de sesión en cada llamada, no al instalar los triggers.
+CREATE_SQL = """
+CREATE OR REPLACE FUNCTION meteorite_new_id() RETURNS uuid
+LANGUAGE sql VOLATILE PARALLEL SAFE AS $$
+    SELECT CASE WHEN current_setting('meteorite.uuid_v7', true) = 'on'
+        THEN meteorite_uuid7()
+        ELSE gen_random_uuid()
+    END
+$$;
+"""
+DROP_SQL = "DROP FUNCTION IF EXISTS meteorite_new_id();"
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("config", "0008_meteorite_uuid7"),
+    ]
+
+    operations = [
+        migrations.RunSQL(CREATE_SQL, DROP_SQL),
+    ]
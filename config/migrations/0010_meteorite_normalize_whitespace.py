@@ -0,0 +1,59 @@
+# Generated by Django 6.0.1 on 2026-10-19 21:40
+
+from django.db import migrations
+
+# trim() solo quita espacios: un tabulador o salto de línea en los extremos
+# quedaba como " " y no coincidía con normalize() (str.strip()). Primero se
+# colapsa todo espacio en blanco a " " y luego se recorta.
+CREATE_SQL = """
+CREATE OR REPLACE FUNCTION meteorite_normalize(value text) RETURNS text
+LANGUAGE sql IMMUTABLE STRICT PARALLEL SAFE AS $$
+    SELECT btrim(regexp_replace(
+        translate(
+            upper(value),
+            'ÁÀÄÂÉÈËÊÍÌÏÎÓÒÖÔÚÙÜÛÑÇ',
+            'AAAAEEEEIIIIOOOOUUUUNC'
+        ),
+        '\\s+', ' ', 'g'), ' ')
+$$;
+"""
+# Versión de 0007
+REVERSE_SQL = """
+CREATE OR REPLACE FUNCTION meteorite_normalize(value text) RETURNS text
+LANGUAGE sql IMMUTABLE STRICT PARALLEL SAFE AS $$
+    SELECT regexp_replace(
+        translate(
+            upper(trim(value)),
+            'ÁÀÄÂÉÈËÊÍÌÏÎÓÒÖÔÚÙÜÛÑÇ',
+            'AAAAEEEEIIIIOOOOUUUUNC'
+        ),
+        '\\s+', ' ', 'g')
+$$;
+"""
+# Los índices por expresión (autocomplete_index y sus trigram) guardan el
+# resultado anterior de la función
+REINDEX_SQL = """
+DO $$
+DECLARE
+    index_name regclass;
+BEGIN
+    FOR index_name IN
+        SELECT indexrelid::regclass FROM pg_index
+        WHERE pg_get_indexdef(indexrelid) LIKE '%meteorite_normalize(%'
+    LOOP
+        EXECUTE format('REINDEX INDEX %s', index_name);
+    END LOOP;
+END
+$$;
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("config", "0009_meteorite_new_id"),
+    ]
+
+    operations = [
+        migrations.RunSQL(CREATE_SQL + REINDEX_SQL, REVERSE_SQL + REINDEX_SQL),
+    ]
@@ -2,6 +2,10 @@ import uuid
 
 from django.conf import settings
 from django.db import models
+from django.db.models import Q
+
+from .ids import new_id
+from .status import STATUS_ACTIVO, STATUS_ANULADO
 
 
 class TypeStatus(models.Model):
@@ -39,7 +43,7 @@ class Status(models.Model):
 
 
 class BaseModel(models.Model):
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=new_id, editable=False)
     key_user_created = models.ForeignKey(
         settings.AUTH_USER_MODEL,
         on_delete=models.CASCADE,
@@ -56,3 +60,30 @@ class BaseModel(models.Model):
 
     class Meta:
         abstract = True
+
+
+def soft_delete_indexes(prefix, order_field="name"):
+    """
+    Índices parciales de un modelo BaseModel (usar en Meta.indexes) para
+    los accesos de BaseViewFactory:
+
+    - {prefix}_live_idx: created_at DESC de los no anulados (get_view).
+    - {prefix}_active_idx: order_field de los activos (select_view); se
+      omite con order_field=None.
+
+    prefix debe dejar los nombres en 30 caracteres como máximo.
+    """
+    indexes = [
+        models.Index(
+            fields=["-created_at"],
+            condition=~Q(status_id=STATUS_ANULADO),
+            name=f"{prefix}_live_idx",
+        ),
+    ]
+    if order_field:
+        indexes.append(models.Index(
+            fields=[order_field],
+            condition=Q(status_id=STATUS_ACTIVO),
+            name=f"{prefix}_active_idx",
+        ))
+    return indexes
@@ -0,0 +1,136 @@
+"""
+Esquema OpenAPI precalculado.
+
+build_openapi_schema (se ejecuta en el build de Docker) genera el esquema
+una vez y lo guarda en OPENAPI_SCHEMA_DIR en JSON y YAML, cada uno con su
+versión .gz. schema_view lo sirve desde memoria con ETag, Cache-Control y
+gzip (cada codificación con su ETag: "<hash>" y "<hash>-gz"); si no
+existe el artefacto o se piden parámetros que cambian el esquema (lang,
+version) lo genera como SpectacularAPIView.
+"""
+import gzip
+import hashlib
+import os
+
+from django.conf import settings
+from django.http import HttpResponse, HttpResponseNotModified
+from django.utils.http import parse_etags
+from drf_spectacular.renderers import OpenApiJsonRenderer, OpenApiYamlRenderer
+from drf_spectacular.settings import spectacular_settings
+from drf_spectacular.views import SpectacularAPIView
+
+from .metrics import CACHE_REQUESTS
+
+RENDERERS = {
+    "json": OpenApiJsonRenderer,
+    "yaml": OpenApiYamlRenderer,
+}
+
+_fallback_view = SpectacularAPIView.as_view()
+# formato -> (contenido, contenido gzip, etag, etag gzip) o None si no hay
+# artefacto
+_artifacts = {}
+
+
+def artifact_path(fmt):
+    return os.path.join(settings.OPENAPI_SCHEMA_DIR, f"schema.{fmt}")
+
+
+def build_schema(output_dir=None):
+    """
+    Genera el esquema y escribe schema.{json,yaml} y sus .gz. Retorna
+    {ruta: tamaño en bytes}.
+    """
+    output_dir = output_dir or settings.OPENAPI_SCHEMA_DIR
+    generator = spectacular_settings.DEFAULT_GENERATOR_CLASS()
+    schema = generator.get_schema(
+        request=None, public=spectacular_settings.SERVE_PUBLIC)
+
+    os.makedirs(output_dir, exist_ok=True)
+    written = {}
+    for fmt, renderer_class in RENDERERS.items():
+        content = renderer_class().render(
+            schema, renderer_class.media_type, {})
+        path = os.path.join(output_dir, f"schema.{fmt}")
+        with open(path, "wb") as f:
+            f.write(content)
+        # mtime=0: el .gz es reproducible entre builds
+        with open(f"{path}.gz", "wb") as f:
+            f.write(gzip.compress(content, compresslevel=9, mtime=0))
+        written[path] = len(content)
+        written[f"{path}.gz"] = os.path.getsize(f"{path}.gz")
+    _artifacts.clear()
+    return written
+
+
+def load_artifact(fmt):
+    """
+    Lee el artefacto del formato una sola vez por proceso.
+    """
+    if fmt not in _artifacts:
+        path = artifact_path(fmt)
+        try:
+            with open(path, "rb") as f:
+                content = f.read()
+        except FileNotFoundError:
+            _artifacts[fmt] = None
+            return None
+        try:
+            with open(f"{path}.gz", "rb") as f:
+                compressed = f.read()
+        except FileNotFoundError:
+            compressed = gzip.compress(content, mtime=0)
+        digest = hashlib.sha256(content).hexdigest()[:32]
+        _artifacts[fmt] = (
+            content, compressed, f'"{digest}"', f'"{digest}-gz"')
+    return _artifacts[fmt]
+
+
+def _requested_format(request):
+    fmt = request.GET.get("format")
+    if fmt:
+        return fmt if fmt in RENDERERS else None
+    # Misma negociación que SpectacularAPIView: YAML salvo que se pida JSON
+    return "json" if "json" in request.headers.get("Accept", "") else "yaml"
+
+
+def schema_view(request):
+    """
+    Esquema OpenAPI (mismo contrato que SpectacularAPIView) servido desde
+    el artefacto de build.
+    """
+    fmt = _requested_format(request)
+    artifact = None
+    if request.method in ("GET", "HEAD") and fmt and not (
+            request.GET.get("lang") or request.GET.get("version")):
+        artifact = load_artifact(fmt)
+    if artifact is None:
+        CACHE_REQUESTS.labels("openapi_schema", "miss").inc()
+        return _fallback_view(request)
+    CACHE_REQUESTS.labels("openapi_schema", "hit").inc()
+
+    content, compressed, identity_etag, gzip_etag = artifact
+    use_gzip = "gzip" in request.headers.get("Accept-Encoding", "")
+    etag = gzip_etag if use_gzip else identity_etag
+    # Comparación débil: el contenido es el mismo con ambas codificaciones
+    # y los proxies pueden anteponer W/
+    requested = {
+        tag.removeprefix("W/") for tag in parse_etags(
+            request.headers.get("If-None-Match", ""))}
+    if requested & {identity_etag, gzip_etag, "*"}:
+        response = HttpResponseNotModified()
+    else:
+        response = HttpResponse(content_type=RENDERERS[fmt].media_type)
+        if use_gzip:
+            response.content = compressed
+            response["Content-Encoding"] = "gzip"
+        else:
+            response.content = content
+        response["Content-Disposition"] = (
+            f'inline; filename="{spectacular_settings.TITLE or "schema"}'
+            f'.{fmt}"')
+    response["ETag"] = etag
+    response["Cache-Control"] = (
+        f"public, max-age={settings.OPENAPI_SCHEMA_MAX_AGE}")
+    response["Vary"] = "Accept, Accept-Encoding"
+    return response
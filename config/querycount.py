@@ -0,0 +1,156 @@
+"""
+Instrumentación de consultas SQL por petición.
+
+Cada conexión lleva un único execute_wrapper (instalado al conectarse) que
+reenvía las consultas a los QueryRecorder activos en el contexto actual.
+Al ir en una ContextVar funciona también con vistas async, cuyas
+consultas se ejecutan en otro hilo (sync_to_async copia el contexto) y
+por tanto en otra conexión. Se registran número de consultas, tiempo total
+en base de datos y huellas (SQL normalizado) repetidas, que delatan
+patrones N+1.
+
+Los presupuestos se declaran por vista con @query_budget o por nombre de
+URL en settings.QUERY_BUDGETS. Con QUERY_BUDGET_STRICT (tests, ver
+QueryBudgetTestMixin en config/testing.py) superar un presupuesto lanza
+QueryBudgetExceeded; si no, solo se registra un warning.
+"""
+import re
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+
+from django.db import connections
+from django.db.backends.signals import connection_created
+
+_IN_LIST = re.compile(r"\bIN \((?:%s, )*%s\)", re.IGNORECASE)
+_NUMBER = re.compile(r"\b\d+\b")
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_SPACES = re.compile(r"\s+")
+
+
+class QueryBudgetExceeded(AssertionError):
+    pass
+
+
+def fingerprint(sql):
+    """
+    SQL normalizado: sin literales y con las listas IN colapsadas.
+    """
+    sql = _STRING.sub("?", sql)
+    sql = _NUMBER.sub("?", sql)
+    sql = _IN_LIST.sub("IN (...)", sql)
+    return _SPACES.sub(" ", sql).strip()
+
+
+class QueryRecorder:
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+        self.fingerprints = Counter()
+
+    def add(self, sql_fingerprint, seconds):
+        self.duration += seconds
+        self.count += 1
+        self.fingerprints[sql_fingerprint] += 1
+
+    @property
+    def duration_ms(self):
+        return round(self.duration * 1000, 2)
+
+    def duplicates(self, min_count=2):
+        """
+        Huellas ejecutadas min_count veces o más, de mayor a menor.
+        """
+        return [
+            (sql, count) for sql, count in self.fingerprints.most_common()
+            if count >= min_count
+        ]
+
+
+_active_recorders = ContextVar("query_recorders", default=())
+
+
+def _dispatch(execute, sql, params, many, context):
+    recorders = _active_recorders.get()
+    if not recorders:
+        return execute(sql, params, many, context)
+    start = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        elapsed = time.perf_counter() - start
+        sql_fingerprint = fingerprint(sql)
+        for recorder in recorders:
+            recorder.add(sql_fingerprint, elapsed)
+
+
+def install_wrapper(sender=None, connection=None, **kwargs):
+    if _dispatch not in connection.execute_wrappers:
+        connection.execute_wrappers.append(_dispatch)
+
+
+connection_created.connect(install_wrapper)
+
+
+@contextmanager
+def record_queries():
+    """
+    Registra las consultas de todas las conexiones dentro del bloque.
+    """
+    # Conexiones de este hilo abiertas antes de importar el módulo
+    for alias in connections:
+        install_wrapper(connection=connections[alias])
+    recorder = QueryRecorder()
+    token = _active_recorders.set(_active_recorders.get() + (recorder,))
+    try:
+        yield recorder
+    finally:
+        _active_recorders.reset(token)
+
+
+def query_budget(max_queries=None, max_db_ms=None, max_duplicates=None):
+    """
+    Declara el presupuesto de una vista. Debe ir por encima de @api_view
+    (DRF no conserva atributos de la función interna).
+    """
+    budget = {
+        "max_queries": max_queries,
+        "max_db_ms": max_db_ms,
+        "max_duplicates": max_duplicates,
+    }
+
+    def decorator(view_func):
+        @wraps(view_func)
+        def _wrapped_view(*args, **kwargs):
+            return view_func(*args, **kwargs)
+
+        _wrapped_view.query_budget = budget
+        return _wrapped_view
+
+    return decorator
+
+
+def budget_violations(recorder, budget):
+    """
+    Lista de textos con los límites superados (vacía si cumple).
+    """
+    violations = []
+    if not budget:
+        return violations
+    max_queries = budget.get("max_queries")
+    if max_queries is not None and recorder.count > max_queries:
+        violations.append(f"{recorder.count} consultas (máx. {max_queries})")
+    max_db_ms = budget.get("max_db_ms")
+    if max_db_ms is not None and recorder.duration_ms > max_db_ms:
+        violations.append(
+            f"{recorder.duration_ms} ms en base de datos (máx. {max_db_ms})")
+    max_duplicates = budget.get("max_duplicates")
+    if max_duplicates is not None:
+        worst = recorder.duplicates()
+        if worst and worst[0][1] > max_duplicates:
+            violations.append(
+                f"consulta repetida {worst[0][1]} veces "
+                f"(máx. {max_duplicates}): {worst[0][0][:200]}")
+    return violations
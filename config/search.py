@@ -0,0 +1,203 @@
+"""
+Autocompletado por prefijo sobre los maestros.
+
+Los textos se comparan normalizados: mayúsculas, sin tildes ni diéresis y
+con la Ñ como N ("peña" encuentra "PENA" y viceversa). En la base de datos
+la normalización es la función SQL inmutable meteorite_normalize
+(migraciones config 0007 y 0010), de modo que admite índices por expresión:
+
+    autocomplete_index("name", "cfg_district_name_ac_idx")
+
+crea meteorite_normalize(name) text_pattern_ops, que sirve las búsquedas
+LIKE 'PREFIJO%' con cualquier collation. normalize() replica la función en
+Python para el término buscado.
+
+Con AUTOCOMPLETE_TRIGRAM_ENABLED los términos de TRIGRAM_MIN_LENGTH o más
+caracteres buscan también en medio del texto ("ISTRI" encuentra
+"DISTRITO"): LIKE '%TÉRMINO%' lo sirve un índice GIN gin_trgm_ops (pg_trgm)
+sobre la misma expresión, uno por cada autocomplete_index (nombre _tg_idx).
+Se instalan tras cada migrate o con el comando autocomplete_trigram.
+
+Los prefijos cortos ("hot", los más repetidos al escribir) se guardan en la
+cache compartida por modelo; la versión del espacio se incrementa al
+guardar, eliminar o importar registros del modelo.
+"""
+import re
+
+from django.apps import apps
+from django.conf import settings
+from django.contrib.postgres.indexes import OpClass
+from django.db import DEFAULT_DB_ALIAS, connections, models, transaction
+from django.db.models import Func, Q
+
+from .cache import NamespacedCache
+
+NORMALIZE_FUNCTION = "meteorite_normalize"
+AUTOCOMPLETE_INDEX_SUFFIX = "_ac_idx"
+TRIGRAM_INDEX_SUFFIX = "_tg_idx"
+# Con menos caracteres un trigrama no acota la búsqueda
+TRIGRAM_MIN_LENGTH = 3
+ACCENTED = "ÁÀÄÂÉÈËÊÍÌÏÎÓÒÖÔÚÙÜÛÑÇ"
+PLAIN = "AAAAEEEEIIIIOOOOUUUUNC"
+
+_TRANSLATION = str.maketrans(ACCENTED, PLAIN)
+_SPACES = re.compile(r"\s+")
+
+
+def normalize(value):
+    """
+    Igual que meteorite_normalize en SQL.
+    """
+    return _SPACES.sub(" ", str(value or "").strip().upper().translate(
+        _TRANSLATION))
+
+
+class Normalize(Func):
+    function = NORMALIZE_FUNCTION
+    output_field = models.TextField()
+
+
+def autocomplete_index(field, name):
+    """
+    Índice para Autocomplete sobre field (usar en Meta.indexes).
+    """
+    return models.Index(
+        OpClass(Normalize(field), name="text_pattern_ops"), name=name)
+
+
+def trigram_enabled():
+    return settings.AUTOCOMPLETE_TRIGRAM_ENABLED
+
+
+def trigram_indexes():
+    """
+    (tabla, nombre, columna) del índice trigram de cada autocomplete_index
+    de los modelos instalados.
+    """
+    for model in apps.get_models():
+        for index in model._meta.indexes:
+            if not index.name.endswith(AUTOCOMPLETE_INDEX_SUFFIX):
+                continue
+            normalized = index.expressions[0].get_source_expressions()[0]
+            field = normalized.get_source_expressions()[0].name
+            yield (
+                model._meta.db_table,
+                index.name.removesuffix(AUTOCOMPLETE_INDEX_SUFFIX)
+                + TRIGRAM_INDEX_SUFFIX,
+                model._meta.get_field(field).column,
+            )
+
+
+def install_trigram_indexes(using=DEFAULT_DB_ALIAS):
+    """
+    Crea la extensión pg_trgm y los índices trigram que falten (de las
+    tablas ya creadas). Retorna los nombres de los índices.
+    """
+    connection = connections[using]
+    tables = set(connection.introspection.table_names())
+    names = []
+    with connection.cursor() as cursor:
+        cursor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        for table, name, column in trigram_indexes():
+            if table not in tables:
+                continue
+            cursor.execute(
+                f'CREATE INDEX IF NOT EXISTS "{name}" ON "{table}" USING gin '
+                f'({NORMALIZE_FUNCTION}("{column}") gin_trgm_ops)'
+            )
+            names.append(name)
+    return names
+
+
+def remove_trigram_indexes(using=DEFAULT_DB_ALIAS):
+    """
+    Elimina los índices trigram (la extensión se conserva).
+    """
+    names = []
+    with connections[using].cursor() as cursor:
+        for _, name, _ in trigram_indexes():
+            cursor.execute(f'DROP INDEX IF EXISTS "{name}"')
+            names.append(name)
+    return names
+
+
+def prefix_filter(queryset, term, search_fields, infix=False):
+    """
+    Filtra queryset por prefijo normalizado en cualquiera de los campos
+    (OR); cada campo usa su índice autocomplete_index. Con infix, por
+    contenido en cualquier posición (índices trigram). startswith y
+    contains escapan los comodines de LIKE del término.
+    """
+    lookup = "contains" if infix else "startswith"
+    aliases = {
+        f"_normalized_{field}": Normalize(field) for field in search_fields}
+    condition = Q()
+    for alias in aliases:
+        condition |= Q(**{f"{alias}__{lookup}": term})
+    return queryset.alias(**aliases).filter(condition)
+
+
+def autocomplete_limit(value):
+    """
+    Límite pedido acotado a AUTOCOMPLETE_MAX_LIMIT.
+    """
+    try:
+        limit = int(value)
+    except (TypeError, ValueError):
+        return settings.AUTOCOMPLETE_DEFAULT_LIMIT
+    return max(1, min(limit, settings.AUTOCOMPLETE_MAX_LIMIT))
+
+
+class Autocomplete:
+    """
+    Sugerencias por prefijo de un QuerySet:
+
+        users = Autocomplete(User, ["first_name", "last_name"], to_option)
+        users.search(User.objects.filter(is_active=True), "jo", limit=10)
+
+    to_option recibe cada instancia y retorna el dict de la respuesta.
+    """
+
+    def __init__(self, model, search_fields, to_option, order_by=None):
+        self.model = model
+        self.search_fields = search_fields
+        self.to_option = to_option
+        self.order_by = order_by or search_fields
+        self.cache = NamespacedCache(
+            f"autocomplete:{model._meta.label_lower}",
+            timeout=settings.AUTOCOMPLETE_CACHE_SECONDS,
+        )
+
+    def search(self, queryset, query, limit, cache_key=""):
+        """
+        Retorna hasta limit opciones cuyo campo empieza por query. Los
+        prefijos de hasta AUTOCOMPLETE_CACHE_PREFIX_LENGTH caracteres se
+        sirven de la cache (cache_key distingue filtros adicionales).
+        """
+        term = normalize(query)
+        if len(term) < settings.AUTOCOMPLETE_MIN_LENGTH:
+            return []
+        if len(term) > settings.AUTOCOMPLETE_CACHE_PREFIX_LENGTH:
+            return self._query(queryset, term, limit)
+
+        # Se guarda siempre el máximo y se recorta al límite pedido
+        key = f"{cache_key}|{term}"
+        options = self.cache.get_or_set(
+            key,
+            lambda: self._query(
+                queryset, term, settings.AUTOCOMPLETE_MAX_LIMIT),
+        )
+        return options[:limit]
+
+    def _query(self, queryset, term, limit):
+        infix = trigram_enabled() and len(term) >= TRIGRAM_MIN_LENGTH
+        qs = prefix_filter(
+            queryset, term, self.search_fields, infix=infix,
+        ).order_by(*self.order_by)[:limit]
+        return [self.to_option(obj) for obj in qs]
+
+    def invalidate(self):
+        transaction.on_commit(self.cache.invalidate)
+
+    def changed(self, sender, **kwargs):
+        self.invalidate()
@@ -1,6 +1,21 @@
 from rest_framework import serializers
 
 from .models import Status
+from .status_registry import status_name
+
+
+class StatusNameField(serializers.ReadOnlyField):
+    """
+    Nombre del estado resuelto desde el registro en memoria a partir de
+    status_id, sin join ni consulta por fila.
+    """
+
+    def __init__(self, **kwargs):
+        kwargs.setdefault("source", "status_id")
+        super().__init__(**kwargs)
+
+    def to_representation(self, value):
+        return status_name(value)
 
 
 class StatusSerializer(serializers.ModelSerializer):
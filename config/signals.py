@@ -0,0 +1,8 @@
+"""
+Señales propias del backend.
+"""
+from django.dispatch import Signal
+
+# Tras guardar las filas de una importación de ExcelMasterHandler (bulk_create
+# no emite post_save). Argumentos: sender (modelo) e instances.
+post_import = Signal()
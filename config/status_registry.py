@@ -0,0 +1,150 @@
+"""
+Registro en memoria del catálogo de estados (config_status).
+
+Se carga una vez por proceso y es inmutable: cada recarga sustituye el
+snapshot completo. Los cambios se propagan con señales (recarga local) y con
+la versión del espacio "statuses" en la cache compartida, que los demás
+procesos comprueban como máximo cada STATUS_REGISTRY_CHECK_SECONDS.
+"""
+import hashlib
+import threading
+import time
+from dataclasses import asdict, dataclass
+from types import MappingProxyType
+
+from django.conf import settings
+from django.db import transaction
+
+from .cache import bump_namespace, namespace_version
+
+CACHE_NAMESPACE = "statuses"
+
+
+@dataclass(frozen=True)
+class StatusEntry:
+    id: str
+    name: str
+    description: str
+    color_code: str
+    icon: str
+    type_status: str
+
+    def as_dict(self):
+        return asdict(self)
+
+
+@dataclass(frozen=True)
+class _Snapshot:
+    by_id: MappingProxyType
+    ordered: tuple
+    etag: str
+    version: object
+    checked_at: float
+
+
+_snapshot = None
+_lock = threading.Lock()
+
+
+def _load(version):
+    from .models import Status
+
+    entries = tuple(
+        StatusEntry(
+            id=str(s.id),
+            name=s.name,
+            description=s.description,
+            color_code=s.color_code,
+            icon=s.icon,
+            type_status=str(s.type_status_id),
+        )
+        for s in Status.objects.order_by("name", "id")
+    )
+    digest = hashlib.sha1(repr(entries).encode(), usedforsecurity=False)
+    return _Snapshot(
+        by_id=MappingProxyType({e.id: e for e in entries}),
+        ordered=entries,
+        etag=f'"{digest.hexdigest()}"',
+        version=version,
+        checked_at=time.monotonic(),
+    )
+
+
+def _current_version():
+    try:
+        return namespace_version(CACHE_NAMESPACE)
+    except Exception:
+        return None
+
+
+def _get_snapshot(force=False):
+    global _snapshot
+    snapshot = _snapshot
+    now = time.monotonic()
+    if not force and snapshot is not None and (
+            now - snapshot.checked_at
+            < settings.STATUS_REGISTRY_CHECK_SECONDS):
+        return snapshot
+
+    with _lock:
+        snapshot = _snapshot
+        if not force and snapshot is not None and (
+                now - snapshot.checked_at
+                < settings.STATUS_REGISTRY_CHECK_SECONDS):
+            return snapshot
+        version = _current_version()
+        if force or snapshot is None or version != snapshot.version:
+            _snapshot = _load(version)
+        else:
+            # Sin cambios en otros procesos: solo renovar la comprobación
+            _snapshot = _Snapshot(
+                snapshot.by_id, snapshot.ordered, snapshot.etag,
+                snapshot.version, now)
+        return _snapshot
+
+
+def all_statuses():
+    """
+    Tupla de StatusEntry ordenada por nombre.
+    """
+    return _get_snapshot().ordered
+
+
+def registry_etag():
+    return _get_snapshot().etag
+
+
+def get_status(status_id):
+    if status_id is None:
+        return None
+    key = str(status_id)
+    entry = _get_snapshot().by_id.get(key)
+    if entry is None:
+        # Estado creado después de la última carga
+        entry = _get_snapshot(force=True).by_id.get(key)
+    return entry
+
+
+def status_name(status_id):
+    entry = get_status(status_id)
+    return entry.name if entry else None
+
+
+def reload():
+    _get_snapshot(force=True)
+
+
+def invalidate():
+    """
+    Marca el catálogo como modificado en todos los procesos.
+    """
+    def _bump():
+        global _snapshot
+        bump_namespace(CACHE_NAMESPACE)
+        _snapshot = None
+
+    transaction.on_commit(_bump)
+
+
+def status_changed(sender, **kwargs):
+    invalidate()
@@ -0,0 +1,120 @@
+"""
+Utilidades para los tests de las apps (usuarios, permisos y presupuestos
+de consultas).
+"""
+from contextlib import contextmanager
+
+from django.test.utils import override_settings
+
+from access.models import Permission, PermissionRole, Role, UserRole
+from auth.models import User
+from general_master.config_master.models import (
+    Country,
+    Department,
+    District,
+    Province,
+    Society,
+)
+
+from .querycount import budget_violations, record_queries
+from .utils import STATUS_ACTIVO
+
+TEST_PASSWORD = "test-Password-1"
+
+
+def make_user(username, admin=False, **extra):
+    manager = User.objects
+    create = manager.create_superuser if admin else manager.create_user
+    return create(
+        username,
+        f"{username}@example.com",
+        TEST_PASSWORD,
+        first_name=username.upper(),
+        last_name="TEST",
+        **extra,
+    )
+
+
+def grant_permissions(test_case, user, *decorator_names):
+    """
+    Crea los permisos activos y los asigna a user con un rol propio
+    ("TEST <username>"). Ejecuta los on_commit: el recálculo de la tabla de
+    permisos efectivos (access/permissions.py) y la recarga del índice de
+    permisos en memoria.
+    """
+    audit = {
+        "key_user_created": user,
+        "key_user_updated": user,
+        "status_id": STATUS_ACTIVO,
+    }
+    with test_case.captureOnCommitCallbacks(execute=True):
+        role, _ = Role.objects.get_or_create(
+            name=f"TEST {user.username}"[:50], defaults=audit)
+        UserRole.objects.get_or_create(
+            user_id=user.id, role=role, defaults=audit)
+        for name in decorator_names:
+            permission, _ = Permission.objects.get_or_create(
+                decorator_name=name, defaults={"name": name[:50], **audit})
+            PermissionRole.objects.get_or_create(
+                permission=permission, role=role, defaults=audit)
+
+
+def make_location(user, code="01"):
+    """
+    Cadena País -> Departamento -> Provincia -> Distrito -> Sociedad
+    (activos) con el código dado en todos los niveles.
+    """
+    audit = {
+        "key_user_created": user,
+        "key_user_updated": user,
+        "status_id": STATUS_ACTIVO,
+    }
+    country = Country.objects.create(
+        code=code, name=f"PAIS {code}", abbreviation=code, **audit)
+    department = Department.objects.create(
+        code=code, name=f"DEPARTAMENTO {code}", key_country=country, **audit)
+    province = Province.objects.create(
+        code=code, name=f"PROVINCIA {code}", key_department=department,
+        **audit)
+    district = District.objects.create(
+        code=code, name=f"DISTRITO {code}", key_province=province, **audit)
+    society = Society.objects.create(
+        code=code, name=f"SOCIEDAD {code}", key_country=country,
+        key_department=department, key_province=province,
+        key_district=district, **audit)
+    return {
+        "key_country": country,
+        "key_department": department,
+        "key_province": province,
+        "key_district": district,
+        "key_society": society,
+    }
+
+
+class QueryBudgetTestMixin:
+    """
+    Mixin para TestCase: activa el modo estricto (las vistas que superan su
+    presupuesto fallan) y añade aserciones de consultas. Carga antes las
+    caches del proceso, como warmup() en producción.
+    """
+
+    def setUp(self):
+        super().setUp()
+        from .warmup import load_caches
+
+        load_caches()
+        self.enterContext(override_settings(QUERY_BUDGET_STRICT=True))
+
+    @contextmanager
+    def assertQueryBudget(
+            self, max_queries=None, max_db_ms=None, max_duplicates=None):
+        with record_queries() as recorder:
+            yield recorder
+        violations = budget_violations(recorder, {
+            "max_queries": max_queries,
+            "max_db_ms": max_db_ms,
+            "max_duplicates": max_duplicates,
+        })
+        if violations:
+            self.fail("Presupuesto de consultas superado: " + "; ".join(
+                violations))
@@ -1,2 +1,929 @@
+import json
+import os
+import runpy
+import tempfile
+import time
+import uuid
+from io import StringIO
+from types import SimpleNamespace
+from unittest import mock, skipUnless
 
-# Create your tests here.
+from asgiref.sync import async_to_sync, iscoroutinefunction
+from django.conf import settings
+from django.core import checks
+from django.core.cache import cache
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.management import CommandError, call_command
+from django.db import connection, connections, models
+from django.test import (
+    Client,
+    SimpleTestCase,
+    TestCase,
+    TransactionTestCase,
+    override_settings,
+)
+from django.test.utils import isolate_apps
+from django.urls import path, reverse
+from rest_framework import serializers
+
+from access.models import Action
+from access.views.action import factory as action_factory
+from auth.models import User
+from auth.views import (
+    async_logout_view,
+    async_session_view,
+    logout_view,
+    session_view,
+)
+from general_master.config_master.models import District
+from meteorite_backend import tracing
+
+from .benchmark import (
+    BenchmarkRunner,
+    bench_users,
+    collect_endpoints,
+    compare_results,
+    seed_data,
+)
+from . import checks as config_checks
+from . import ids, status_registry
+from .cache import NamespacedCache, bump_namespace, namespace_version
+from .db_router import REPLICA_DB, replica_available
+from .importtime import ImportEntry, imported_lazy_modules, measure
+from .middleware import REPLICA_STICKY_COOKIE
+from .models import BaseModel, Status, TypeStatus, soft_delete_indexes
+from .openapi import _artifacts
+from .querycount import QueryBudgetExceeded
+from .serializers import StatusNameField
+from .search import (
+    NORMALIZE_FUNCTION,
+    Autocomplete,
+    install_trigram_indexes,
+    normalize,
+    trigram_indexes,
+)
+from .testing import (
+    QueryBudgetTestMixin,
+    grant_permissions,
+    make_location,
+    make_user,
+)
+from .throttling import UserRateThrottle
+from .utils import STATUS_ACTIVO
+
+
+@skipUnless(replica_available(), "Sin réplica configurada")
+class ReplicaRoutingTests(TransactionTestCase):
+    """
+    La réplica de los tests es una base independiente: lo que se inserta
+    solo en ella permite ver a qué alias fue cada lectura.
+    """
+    # "__all__": sin réplica configurada el alias no existe
+    databases = "__all__"
+    serialized_rollback = True
+
+    def setUp(self):
+        # El flush de cada test vacía la réplica: se copian los estados
+        # sembrados por las migraciones
+        for model in (TypeStatus, Status):
+            model.objects.using(REPLICA_DB).bulk_create(
+                list(model.objects.all()), ignore_conflicts=True)
+        self.user = make_user("replica", admin=True)
+        User.objects.using(REPLICA_DB).bulk_create([self.user])
+        Action.objects.using(REPLICA_DB).create(
+            name="SOLO REPLICA",
+            key_user_created=self.user,
+            key_user_updated=self.user,
+            status_id=STATUS_ACTIVO,
+        )
+        self.client.force_login(self.user)
+
+    def select_names(self):
+        response = self.client.post(
+            "/access/action/select/", {}, content_type="application/json")
+        self.assertEqual(response.status_code, 200)
+        return {row["name"] for row in response.json()["data"]}
+
+    def test_marked_views_read_from_replica(self):
+        self.assertEqual(self.select_names(), {"SOLO REPLICA"})
+
+    def test_reads_stick_to_default_after_a_write(self):
+        response = self.client.post(
+            "/access/action/create/",
+            {"name": "SOLO DEFAULT"},
+            content_type="application/json",
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertIn(REPLICA_STICKY_COOKIE, response.cookies)
+        self.assertEqual(self.select_names(), {"SOLO DEFAULT"})
+
+    def test_unmarked_reads_use_default(self):
+        self.assertFalse(Action.objects.filter(name="SOLO REPLICA").exists())
+
+
+class MetricsViewTests(SimpleTestCase):
+    @override_settings(METRICS_TOKEN="", DEBUG=False)
+    def test_hidden_without_token(self):
+        self.assertEqual(self.client.get("/metrics").status_code, 404)
+
+    @override_settings(METRICS_TOKEN="", DEBUG=True)
+    def test_open_in_debug_without_token(self):
+        self.assertEqual(self.client.get("/metrics").status_code, 200)
+
+    @override_settings(METRICS_TOKEN="secreto", DEBUG=False)
+    def test_token_required(self):
+        self.assertEqual(self.client.get("/metrics").status_code, 401)
+        response = self.client.get(
+            "/metrics", headers={"Authorization": "Bearer secreto"})
+        self.assertEqual(response.status_code, 200)
+        self.assertIn(b"meteorite_", response.content)
+
+
+class MiddlewareAutenticationQueryTests(QueryBudgetTestMixin, TestCase):
+    """
+    Consultas del decorador por camino: el administrador no consulta
+    permisos; el resto, una búsqueda en la tabla de permisos efectivos.
+    """
+    url = "/access/action/get/"
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = make_user("admin", admin=True)
+        cls.viewer = make_user("viewer")
+        cls.denied = make_user("denied")
+
+    def setUp(self):
+        grant_permissions(self, self.viewer, "access_action_get")
+        super().setUp()
+
+    def post(self, user):
+        self.client.force_login(user)
+        with self.assertQueryBudget() as recorder:
+            response = self.client.post(
+                self.url, {}, content_type="application/json")
+        return response, recorder.count
+
+    def test_permission_lookup_costs_one_query(self):
+        response, admin_queries = self.post(self.admin)
+        self.assertEqual(response.status_code, 200)
+        response, viewer_queries = self.post(self.viewer)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(viewer_queries, admin_queries + 1)
+
+    def test_denied_skips_the_view(self):
+        _, viewer_queries = self.post(self.viewer)
+        response, denied_queries = self.post(self.denied)
+        self.assertEqual(response.status_code, 403)
+        # Sin COUNT ni página
+        self.assertEqual(denied_queries, viewer_queries - 2)
+
+    def test_anonymous_without_queries(self):
+        with self.assertQueryBudget(max_queries=0):
+            response = self.client.post(
+                self.url, {}, content_type="application/json")
+        self.assertEqual(response.status_code, 401)
+
+    @override_settings(QUERY_BUDGETS={"action-get": {"max_queries": 1}})
+    def test_strict_mode_fails_over_budget(self):
+        self.client.force_login(self.admin)
+        with self.assertRaises(QueryBudgetExceeded):
+            self.client.post(self.url, {}, content_type="application/json")
+
+
+BENCH_VOLUMES = {
+    "users": 3,
+    "roles": 2,
+    "menus": 12,
+    "countries": 3,
+    "departments": 6,
+    "audit_logs": 20,
+}
+BENCH_ENDPOINTS = ("menu-get", "menu-select", "country-get", "session")
+RESULT_KEYS = {
+    "path", "iterations", "status", "p50_ms", "p95_ms", "p99_ms", "mean_ms",
+    "queries", "db_ms", "max_repeated",
+}
+
+
+class BenchmarkTests(TestCase):
+    """
+    Harness de benchmark sobre una semilla pequeña: forma del JSON y
+    consultas dentro de settings.QUERY_BUDGETS.
+    """
+
+    def setUp(self):
+        # seed_data asigna al rol bench todos los permisos activos
+        grant_permissions(self, make_user("admin", admin=True), *(
+            "access_menu_get", "access_menu_select",
+            "general_master_country_get",
+        ))
+
+    def endpoints(self):
+        return [e for e in collect_endpoints() if e["name"] in BENCH_ENDPOINTS]
+
+    def test_runner_counts_queries(self):
+        user = seed_data(BENCH_VOLUMES)
+        runner = BenchmarkRunner(user, iterations=3, warmup=1)
+        results = runner.run(self.endpoints())
+        self.assertEqual(set(results), set(BENCH_ENDPOINTS))
+        for name, result in results.items():
+            with self.subTest(name):
+                self.assertEqual(set(result), RESULT_KEYS)
+                self.assertEqual(result["status"], [200])
+                self.assertEqual(result["iterations"], 3)
+                self.assertLessEqual(result["p50_ms"], result["p99_ms"])
+                budget = settings.QUERY_BUDGETS.get(name)
+                if budget:
+                    self.assertLessEqual(
+                        result["queries"], budget["max_queries"])
+                    self.assertLessEqual(
+                        result["max_repeated"], budget["max_duplicates"])
+                else:
+                    self.assertGreater(result["queries"], 0)
+
+    def test_command_report(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            output = os.path.join(tmp, "bench.json")
+            call_command(
+                "benchmark", "--iterations=2", "--warmup=1",
+                "--filter=/access/menu/", f"--output={output}",
+                *[f"--{k.replace('_', '-')}={v}"
+                  for k, v in BENCH_VOLUMES.items()],
+                stdout=StringIO(),
+            )
+            with open(output, encoding="utf-8") as f:
+                report = json.load(f)
+        self.assertEqual(set(report), {"meta", "results"})
+        self.assertEqual(report["meta"]["volumes"], BENCH_VOLUMES)
+        self.assertEqual(report["meta"]["iterations"], 2)
+        self.assertEqual(
+            report["results"]["menu-get"]["path"], "/access/menu/get/")
+        # Las escrituras se omiten sin --include-writes
+        self.assertIn("skipped", report["results"]["menu-create"])
+        # Los datos bench se eliminan al terminar
+        self.assertFalse(bench_users().exists())
+
+        rows = compare_results(report, report)
+        self.assertTrue(rows)
+        self.assertTrue(all(row["p95_change_pct"] == 0 for row in rows))
+
+
+class StartupImportTests(SimpleTestCase):
+    """
+    Arranque de un worker con gunicorn (SERVE_MODE) en un intérprete nuevo.
+    El presupuesto en milisegundos depende del equipo: lo valida
+    manage.py importtime --check (make ci), no la suite.
+    """
+
+    def test_lazy_modules_not_imported(self):
+        with mock.patch.dict(os.environ, {"SERVE_MODE": "gunicorn"}):
+            entries = measure()
+        self.assertEqual(imported_lazy_modules(entries), [])
+
+    def test_check_fails_over_budget(self):
+        entries = [ImportEntry("meteorite_backend.asgi", 1000, 700_000, 0)]
+        with mock.patch(
+                "config.management.commands.importtime.measure",
+                return_value=entries):
+            call_command(
+                "importtime", "--check", "--budget-ms=800", stdout=StringIO())
+            with self.assertRaisesMessage(CommandError, "700.0 ms"):
+                call_command(
+                    "importtime", "--check", "--budget-ms=600",
+                    stdout=StringIO())
+
+
+class TrigramAutocompleteTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        make_location(make_user("owner", admin=True), "01")
+        cls.autocomplete = Autocomplete(
+            District, ["name", "code"], lambda obj: obj.name)
+
+    def search(self, query):
+        return self.autocomplete.search(District.objects.all(), query, 10)
+
+    def install(self):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm'")
+            if cursor.fetchone() is None:
+                self.skipTest("PostgreSQL sin la extensión pg_trgm")
+        # DDL transaccional: se revierte con el test
+        return install_trigram_indexes()
+
+    def test_install_creates_missing_indexes(self):
+        names = self.install()
+        self.assertEqual(
+            sorted(names), sorted(name for _, name, _ in trigram_indexes()))
+        self.assertIn("cfg_district_name_tg_idx", names)
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT indexdef FROM pg_indexes WHERE indexname = %s",
+                ["cfg_district_name_tg_idx"])
+            self.assertIn("gin_trgm_ops", cursor.fetchone()[0])
+
+    @override_settings(AUTOCOMPLETE_TRIGRAM_ENABLED=True)
+    def test_infix_match_without_accents(self):
+        self.assertEqual(self.search("ístri"), ["DISTRITO 01"])
+        # Por debajo de TRIGRAM_MIN_LENGTH solo prefijos
+        self.assertEqual(self.search("is"), [])
+        self.assertEqual(self.search("di"), ["DISTRITO 01"])
+
+    @override_settings(AUTOCOMPLETE_TRIGRAM_ENABLED=False)
+    def test_prefix_only_when_disabled(self):
+        self.assertEqual(self.search("istri"), [])
+        self.assertEqual(self.search("distri"), ["DISTRITO 01"])
+
+    def test_sql_and_python_normalize_agree(self):
+        values = [
+            "  peña  ",
+            "\tSan\nMartín\r",
+            "a \t\n b",
+            "\n\n",
+            "Ñandú  ÁÉÍÓÚ üç",
+            "",
+        ]
+        with connection.cursor() as cursor:
+            for value in values:
+                with self.subTest(value):
+                    cursor.execute(
+                        f"SELECT {NORMALIZE_FUNCTION}(%s)", [value])
+                    self.assertEqual(cursor.fetchone()[0], normalize(value))
+
+
+class GunicornConfigTests(SimpleTestCase):
+    """
+    Directorio de métricas multiproceso al cargar gunicorn.conf.py.
+    """
+
+    def load(self, reexec):
+        with tempfile.TemporaryDirectory() as tmp:
+            metric = os.path.join(tmp, "counter_1.db")
+            open(metric, "w").close()
+            with mock.patch.dict(os.environ, PROMETHEUS_MULTIPROC_DIR=tmp):
+                os.environ.pop("GUNICORN_FD", None)
+                if reexec:
+                    os.environ["GUNICORN_FD"] = "3"
+                runpy.run_path(settings.BASE_DIR / "gunicorn.conf.py")
+            return os.path.exists(metric)
+
+    def test_cold_start_clears_metrics(self):
+        self.assertFalse(self.load(reexec=False))
+
+    def test_usr2_reexec_keeps_metrics(self):
+        self.assertTrue(self.load(reexec=True))
+
+
+class OpenApiSchemaTests(SimpleTestCase):
+    """
+    ETag por codificación del esquema precalculado.
+    """
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        with open(os.path.join(tmp.name, "schema.json"), "wb") as f:
+            f.write(b'{"openapi": "3.0.3"}')
+        settings_override = override_settings(OPENAPI_SCHEMA_DIR=tmp.name)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        _artifacts.clear()
+        self.addCleanup(_artifacts.clear)
+
+    def get(self, **headers):
+        return self.client.get(
+            "/api/schema/", {"format": "json"}, headers=headers)
+
+    def test_encodings_have_distinct_etags(self):
+        identity = self.get()
+        compressed = self.get(accept_encoding="gzip")
+        self.assertNotIn("Content-Encoding", identity)
+        self.assertEqual(compressed["Content-Encoding"], "gzip")
+        self.assertEqual(compressed["ETag"], identity["ETag"][:-1] + '-gz"')
+
+    def test_not_modified_with_either_etag(self):
+        identity = self.get()["ETag"]
+        compressed = self.get(accept_encoding="gzip")["ETag"]
+        for tag in (identity, compressed, f"W/{compressed}"):
+            with self.subTest(tag):
+                response = self.get(
+                    accept_encoding="gzip", if_none_match=tag)
+                self.assertEqual(response.status_code, 304)
+                self.assertEqual(response["ETag"], compressed)
+        self.assertEqual(
+            self.get(if_none_match='"otro"').status_code, 200)
+
+
+# Variantes DRF y async montadas a la vez (AsyncViewParityTests)
+urlpatterns = [
+    path("sync/get/", action_factory.get_view()),
+    path("async/get/", action_factory.async_get_view()),
+    path("sync/select/", action_factory.select_view()),
+    path("async/select/", action_factory.async_select_view()),
+    path("sync/session/", session_view),
+    path("async/session/", async_session_view),
+    path("sync/logout/", logout_view),
+    path("async/logout/", async_logout_view),
+]
+
+
+@override_settings(ROOT_URLCONF=__name__)
+class AsyncViewParityTests(TestCase):
+    """
+    Vistas async (ASYNC_VIEWS_ENABLED) frente a sus gemelas DRF: mismo
+    código de estado y mismo cuerpo.
+    """
+    actions = 5
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = make_user("admin", admin=True)
+        cls.reader = make_user("reader")
+        cls.denied = make_user("denied")
+        for i in range(cls.actions):
+            Action.objects.create(
+                name=f"ACCION {i}",
+                key_user_created=cls.admin,
+                key_user_updated=cls.admin,
+                status_id=STATUS_ACTIVO,
+            )
+
+    def setUp(self):
+        # Contadores de throttling
+        cache.clear()
+        grant_permissions(
+            self, self.reader, "access_action_get", "access_action_select")
+
+    def both(self, view, data=None, user=None, client=None):
+        """
+        Respuestas (DRF, async) de la vista; relogin entre ambas por si la
+        vista cierra la sesión.
+        """
+        client = client or self.client
+        responses = []
+        for variant in ("sync", "async"):
+            if user:
+                client.force_login(user)
+            if view == "session":
+                responses.append(client.get(f"/{variant}/{view}/"))
+            else:
+                responses.append(client.post(
+                    f"/{variant}/{view}/", data or {},
+                    content_type="application/json"))
+        return responses
+
+    def assertSame(self, responses, status_code):
+        sync, async_ = responses
+        self.assertEqual(
+            (sync.status_code, async_.status_code), (status_code, status_code))
+        self.assertEqual(sync.json(), async_.json())
+
+    @override_settings(ASYNC_VIEWS_ENABLED=True)
+    def test_flag_mounts_async_variants(self):
+        self.assertTrue(iscoroutinefunction(action_factory.get_view()))
+        self.assertTrue(iscoroutinefunction(action_factory.select_view()))
+
+    def test_page_maths(self):
+        for page in (1, 2, 3, 4):
+            with self.subTest(page=page):
+                responses = self.both(
+                    "get", {"page": page, "page_size": 2}, user=self.reader)
+                self.assertSame(responses, 200)
+                data = responses[1].json()["data"]
+                self.assertEqual(
+                    (data["total"], data["page"], data["pages"]),
+                    (self.actions, page, 3))
+                self.assertEqual(
+                    len(data["results"]),
+                    max(min(2, self.actions - (page - 1) * 2), 0))
+
+    def test_select(self):
+        self.assertSame(self.both("select", user=self.reader), 200)
+
+    def test_anonymous(self):
+        for view in ("get", "select", "session"):
+            with self.subTest(view):
+                responses = self.both(view)
+                self.assertEqual(
+                    [r.status_code for r in responses], [401, 401])
+                if view != "session":
+                    self.assertSame(responses, 401)
+
+    def test_forbidden(self):
+        for view in ("get", "select"):
+            with self.subTest(view):
+                self.assertSame(self.both(view, user=self.denied), 403)
+
+    def test_throttled(self):
+        with mock.patch.dict(
+                UserRateThrottle.THROTTLE_RATES, {"user": "2/minute"}):
+            self.client.force_login(self.reader)
+            responses = []
+            for variant in ("sync", "async"):
+                cache.clear()
+                for _ in range(3):
+                    response = self.client.post(
+                        f"/{variant}/get/", {},
+                        content_type="application/json")
+                responses.append(response)
+        self.assertSame(responses, 429)
+        self.assertEqual(
+            responses[0]["Retry-After"], responses[1]["Retry-After"])
+
+    def test_session(self):
+        sync, async_ = self.both("session", user=self.admin)
+        self.assertEqual((sync.status_code, async_.status_code), (200, 200))
+        sync_data, async_data = sync.json(), async_.json()
+        # Token enmascarado y caducidad de la sesión propios de cada petición
+        for data in (sync_data["data"], async_data["data"]):
+            data.pop("csrfToken")
+            data.pop("expires_at")
+        self.assertEqual(sync_data, async_data)
+
+    def test_logout_csrf(self):
+        client = Client(enforce_csrf_checks=True)
+        # Anónimo: sin comprobación, como SessionAuthentication
+        self.assertSame(self.both("logout", client=client), 200)
+        # Autenticado sin token: 403 de DRF en ambas
+        self.assertSame(
+            self.both("logout", user=self.admin, client=client), 403)
+        for variant in ("sync", "async"):
+            with self.subTest(variant):
+                client.force_login(self.admin)
+                client.get("/sync/session/")
+                response = client.post(
+                    f"/{variant}/logout/",
+                    headers={"X-CSRFToken": client.cookies["csrftoken"].value})
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(response.cookies["sessionid"].value, "")
+
+
+class UUID7Tests(SimpleTestCase):
+    def test_version_variant_and_time(self):
+        before = time.time_ns() // 1_000_000
+        value = ids.uuid7()
+        after = time.time_ns() // 1_000_000
+        self.assertEqual(value.version, 7)
+        self.assertEqual(value.variant, uuid.RFC_4122)
+        self.assertTrue(before <= ids.uuid7_time_ms(value) <= after)
+        self.assertIsNone(ids.uuid7_time_ms(uuid.uuid4()))
+
+    def test_monotonic_within_a_millisecond(self):
+        now = time.time_ns()
+        with mock.patch.object(ids.time, "time_ns", return_value=now):
+            # Más valores que el contador de 12 bits: avanza el milisegundo
+            values = [ids.uuid7() for _ in range(5000)]
+        self.assertEqual(values, sorted(values))
+        self.assertEqual(len(set(values)), len(values))
+        self.assertGreaterEqual(
+            ids.uuid7_time_ms(values[0]), now // 1_000_000)
+
+    @override_settings(UUID_V7_ENABLED=False)
+    def test_new_id_uuid4_without_option(self):
+        self.assertEqual(ids.new_id().version, 4)
+
+
+class StatusRegistryTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.type_status = TypeStatus.objects.create(name="TIPO")
+
+    def setUp(self):
+        cache.clear()
+        status_registry.reload()
+        self.addCleanup(status_registry.reload)
+
+    def create_status(self, name):
+        # bulk_create no emite post_save: el registro no se entera
+        return Status.objects.bulk_create(
+            [Status(name=name, type_status=self.type_status)])[0]
+
+    def test_snapshot_reloaded_when_version_changes(self):
+        Status.objects.filter(pk=STATUS_ACTIVO).update(name="RENOMBRADO")
+        self.assertEqual(status_registry.status_name(STATUS_ACTIVO), "ACTIVO")
+        with override_settings(STATUS_REGISTRY_CHECK_SECONDS=0):
+            # Misma versión: se conserva el snapshot
+            self.assertEqual(
+                status_registry.status_name(STATUS_ACTIVO), "ACTIVO")
+            # Otro proceso invalidó el catálogo
+            bump_namespace(status_registry.CACHE_NAMESPACE)
+            self.assertEqual(
+                status_registry.status_name(STATUS_ACTIVO), "RENOMBRADO")
+
+    def test_invalidate_bumps_namespace_on_commit(self):
+        version = status_registry._current_version()
+        status = Status.objects.get(pk=STATUS_ACTIVO)
+        with self.captureOnCommitCallbacks(execute=True):
+            status.name = "RENOMBRADO"
+            status.save()
+            self.assertEqual(status_registry._current_version(), version)
+            self.assertEqual(
+                status_registry.status_name(STATUS_ACTIVO), "ACTIVO")
+        self.assertEqual(status_registry._current_version(), version + 1)
+        self.assertEqual(
+            status_registry.status_name(STATUS_ACTIVO), "RENOMBRADO")
+
+    def test_unknown_id_forces_reload(self):
+        created = self.create_status("NUEVO")
+        self.assertNotIn(
+            "NUEVO", [s.name for s in status_registry.all_statuses()])
+        self.assertEqual(status_registry.get_status(created.pk).name, "NUEVO")
+        self.assertIsNone(status_registry.get_status(uuid.uuid4()))
+        self.assertIsNone(status_registry.get_status(None))
+
+    def test_status_name_field(self):
+        class RowSerializer(serializers.Serializer):
+            status_name = StatusNameField()
+
+        rows = [
+            SimpleNamespace(status_id=STATUS_ACTIVO),
+            SimpleNamespace(status_id=None),
+        ]
+        with self.assertNumQueries(0):
+            data = RowSerializer(rows, many=True).data
+        self.assertEqual(
+            [row["status_name"] for row in data], ["ACTIVO", None])
+
+    def test_get_all_statuses_etag(self):
+        url = reverse("get_all_statuses")
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        etag = response["ETag"]
+        self.assertEqual(
+            [row["id"] for row in response.json()["data"]],
+            [str(pk) for pk in Status.objects.order_by(
+                "name", "id").values_list("id", flat=True)])
+
+        with self.assertNumQueries(0):
+            response = self.client.get(url, headers={"if-none-match": etag})
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response["ETag"], etag)
+
+        self.create_status("NUEVO")
+        status_registry.reload()
+        response = self.client.get(url, headers={"if-none-match": etag})
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+
+
+class RateThrottle(UserRateThrottle):
+    scope = "test"
+    rate = "3/min"
+
+
+class AtomicRateThrottleTests(SimpleTestCase):
+    """
+    Ventana fija con cache.add + cache.incr sobre LocMemCache.
+    """
+
+    def setUp(self):
+        self.now = 120.0
+        self.cache = LocMemCache("throttle-tests", {})
+        self.cache.clear()
+        self.request = SimpleNamespace(
+            user=SimpleNamespace(is_authenticated=True, pk=1))
+
+    def throttle(self):
+        throttle = RateThrottle()
+        throttle.cache = self.cache
+        throttle.timer = lambda: self.now
+        return throttle
+
+    def allowed(self, times):
+        return [
+            self.throttle().allow_request(self.request, None)
+            for _ in range(times)
+        ]
+
+    def test_fixed_window(self):
+        self.assertEqual(self.allowed(4), [True, True, True, False])
+        throttle = self.throttle()
+        self.assertFalse(throttle.allow_request(self.request, None))
+        self.assertEqual(throttle.wait(), 60)
+        # Ventana siguiente
+        self.now = 180.0
+        self.assertEqual(self.allowed(1), [True])
+
+    def test_key_expired_between_add_and_incr(self):
+        add = self.cache.add
+        calls = []
+
+        def add_once_taken(*args, **kwargs):
+            # La primera llamada ve la clave; luego expira antes del incr
+            calls.append(args)
+            return False if len(calls) == 1 else add(*args, **kwargs)
+
+        with mock.patch.object(self.cache, "add", add_once_taken):
+            self.assertEqual(self.allowed(1), [True])
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(self.cache.get(calls[1][0]), 1)
+        self.assertEqual(self.allowed(3), [True, True, False])
+
+    def test_fail_open_without_cache(self):
+        with mock.patch.object(
+                self.cache, "add", side_effect=ConnectionError), \
+                self.assertLogs("meteorite.cache", "ERROR"):
+            self.assertEqual(self.allowed(5), [True] * 5)
+
+    def test_async_allow_request(self):
+        allowed = [
+            async_to_sync(self.throttle().aallow_request)(self.request, None)
+            for _ in range(4)
+        ]
+        self.assertEqual(allowed, [True, True, True, False])
+        # Comparte la ventana con la versión síncrona
+        self.assertEqual(self.allowed(1), [False])
+        with mock.patch.object(
+                self.cache, "aadd", side_effect=ConnectionError), \
+                self.assertLogs("meteorite.cache", "ERROR"):
+            self.assertTrue(async_to_sync(self.throttle().aallow_request)(
+                self.request, None))
+
+
+class NamespacedCacheTests(SimpleTestCase):
+    def setUp(self):
+        backend = LocMemCache("namespace-tests", {})
+        backend.clear()
+        patcher = mock.patch("config.cache.cache", backend)
+        self.backend = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_invalidate_bumps_only_its_namespace(self):
+        first, second = NamespacedCache("first"), NamespacedCache("second")
+        load = mock.Mock(side_effect=["A", "B"])
+        self.assertEqual(first.get_or_set("key", load), "A")
+        self.assertEqual(first.get_or_set("key", load), "A")
+        second.set("key", "OTRO")
+        version = namespace_version("first")
+
+        self.assertEqual(first.invalidate(), version + 1)
+        self.assertEqual(first.get_or_set("key", load), "B")
+        self.assertEqual(load.call_count, 2)
+        self.assertEqual(second.get("key"), "OTRO")
+
+    def test_bump_without_version(self):
+        before = int(time.time())
+        version = bump_namespace("missing")
+        self.assertGreater(version, before)
+        self.assertEqual(namespace_version("missing"), version)
+
+    def test_cache_errors_are_misses(self):
+        namespaced = NamespacedCache("broken")
+        with mock.patch.object(
+                self.backend, "get", side_effect=ConnectionError), \
+                self.assertLogs("meteorite.cache", "ERROR"):
+            self.assertEqual(namespaced.get("key", "default"), "default")
+
+
+@mock.patch.multiple(
+    tracing, DEFAULT_RATE=0.05, HOT_RATE=0.01, LOGIN_RATE=0.05,
+    OUTLIER_RATE=0.1, SLOW_TRANSACTION_MS=1000)
+class TracingTests(SimpleTestCase):
+    """
+    Muestreo de trazas de Sentry (meteorite_backend/tracing.py).
+    """
+    hot = "/api/access/action/get/"
+
+    def transaction(self, path, duration=0.1, status="ok"):
+        return {
+            "request": {"url": f"https://meteorito.test{path}?page=1"},
+            "contexts": {"trace": {"status": status}},
+            "start_timestamp": "2026-01-01T00:00:00.000000Z",
+            "timestamp": 1767225600 + duration,
+        }
+
+    def send(self, event, random_value):
+        with mock.patch.object(
+                tracing.random, "random", return_value=random_value):
+            return tracing.before_send_transaction(event, {})
+
+    def test_route_rate(self):
+        cases = {
+            "": 0.0,
+            "/metrics": 0.0,
+            "/static/app.js": 0.0,
+            "/api/access/action/import/": 1.0,
+            "/auth/login/": 0.05,
+            self.hot: 0.01,
+            "/config/status/all/": 0.01,
+            "/api/access/action/create/": 0.05,
+        }
+        for route, rate in cases.items():
+            with self.subTest(route):
+                self.assertEqual(tracing.route_rate(route), rate)
+
+    def test_sampler(self):
+        cases = [
+            ({"parent_sampled": True,
+              "asgi_scope": {"path": "/metrics"}}, 1.0),
+            ({"parent_sampled": False,
+              "asgi_scope": {"path": "/auth/login/"}}, 0.0),
+            ({"asgi_scope": {"path": "/metrics"}}, 0.0),
+            ({"asgi_scope": {"path": "/auth/login/"}}, 1.0),
+            ({"asgi_scope": {"path": "/api/access/action/import/"}}, 1.0),
+            ({"wsgi_environ": {"PATH_INFO": self.hot}}, 0.1),
+            ({"asgi_scope": {"type": "websocket"}}, 0.05),
+            ({}, 0.05),
+        ]
+        for context, rate in cases:
+            with self.subTest(context):
+                self.assertEqual(tracing.traces_sampler(context), rate)
+
+    def test_slow_or_failed_always_kept(self):
+        for event in (
+                self.transaction(self.hot, duration=1.5),
+                self.transaction(self.hot, status="internal_error"),
+                self.transaction("/api/access/action/import/")):
+            with self.subTest(event):
+                self.assertIs(self.send(event, 0.99), event)
+
+    def test_fast_reduced_to_route_rate(self):
+        # Muestra provisional 0.1 -> tasa 0.01: se conserva 1 de cada 10
+        event = self.transaction(self.hot)
+        self.assertIs(self.send(event, 0.05), event)
+        self.assertIsNone(self.send(event, 0.2))
+        # El login se muestreó al 100 %: se conserva el 5 %
+        login = self.transaction("/auth/login/")
+        self.assertIs(self.send(login, 0.04), login)
+        self.assertIsNone(self.send(login, 0.06))
+        self.assertIsNone(self.send(self.transaction("/metrics"), 0.0))
+
+    def test_duration_ms(self):
+        cases = [
+            ({"start_timestamp": "2026-01-01T00:00:00Z",
+              "timestamp": "2026-01-01T00:00:01.500000Z"}, 1500),
+            ({"start_timestamp": 100.0, "timestamp": 100.25}, 250),
+            ({"start_timestamp": "2026-01-01T00:00:00+00:00",
+              "timestamp": 1767225602}, 2000),
+            ({"timestamp": 100.0}, 0.0),
+            ({"start_timestamp": "ayer", "timestamp": 100.0}, 0.0),
+        ]
+        for event, duration in cases:
+            with self.subTest(event):
+                self.assertAlmostEqual(tracing._duration_ms(event), duration)
+
+
+class DbPoolStatsTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.viewer = make_user("viewer")
+        cls.denied = make_user("denied")
+
+    def setUp(self):
+        grant_permissions(self, self.viewer, "config_db_pool_stats")
+
+    def get(self, user=None):
+        if user:
+            self.client.force_login(user)
+        return self.client.get(reverse("db_pool_stats"))
+
+    def test_payload(self):
+        response = self.get(self.viewer)
+        self.assertEqual(response.status_code, 200)
+        data = response.json()["data"]
+        self.assertEqual(set(data), set(connections))
+        pool = connections["default"].pool
+        if pool is None:
+            self.assertEqual(data["default"], {"enabled": False})
+        else:
+            self.assertTrue(data["default"]["enabled"])
+            self.assertEqual(data["default"]["min_size"], pool.min_size)
+            self.assertEqual(data["default"]["max_size"], pool.max_size)
+            self.assertIn("pool_size", data["default"])
+
+    def test_without_pool(self):
+        with mock.patch.object(
+                type(connections["default"]), "pool",
+                new_callable=mock.PropertyMock, return_value=None):
+            response = self.get(self.viewer)
+        self.assertEqual(
+            response.json()["data"]["default"], {"enabled": False})
+
+    def test_permission_denied(self):
+        self.assertEqual(self.get().status_code, 401)
+        response = self.get(self.denied)
+        self.assertEqual(response.status_code, 403)
+        self.assertIn("config_db_pool_stats", response.json()["message"])
+
+
+class SoftDeleteIndexesCheckTests(SimpleTestCase):
+    def test_current_models_pass(self):
+        self.assertEqual(config_checks.soft_delete_indexes_check(), [])
+
+    @isolate_apps("config", kwarg_name="isolated")
+    def test_warns_without_live_index(self, isolated):
+        class Unindexed(BaseModel):
+            name = models.CharField(max_length=10)
+
+        class Indexed(BaseModel):
+            name = models.CharField(max_length=10)
+
+            class Meta:
+                indexes = soft_delete_indexes("cfg_indexed")
+
+        with mock.patch.object(config_checks, "apps", isolated):
+            errors = config_checks.soft_delete_indexes_check()
+        self.assertEqual([error.obj for error in errors], [Unindexed])
+        self.assertEqual(errors[0].id, "config.W001")
+        self.assertEqual(errors[0].level, checks.WARNING)
@@ -0,0 +1,87 @@
+"""
+Throttles de DRF con contador atómico en la cache compartida.
+
+SimpleRateThrottle guarda un historial de timestamps que lee, modifica y
+reescribe sin bloqueo: con varios procesos las peticiones concurrentes se
+pisan y el límite no se cumple. Aquí se usa una ventana fija por clave con
+cache.add + cache.incr (INCR atómico en Redis), válida entre procesos.
+"""
+import logging
+
+from rest_framework import throttling
+
+from .metrics import THROTTLED_REQUESTS
+
+logger = logging.getLogger("meteorite.cache")
+
+
+class AtomicRateThrottleMixin:
+    def _window_key(self, request, view):
+        """
+        Clave de la ventana actual, o None si no se limita la petición.
+        """
+        if self.rate is None:
+            return None
+        self.key = self.get_cache_key(request, view)
+        if self.key is None:
+            return None
+        self.now = self.timer()
+        window = int(self.now // self.duration)
+        self.window_end = (window + 1) * self.duration
+        return f"{self.key}:{window}"
+
+    def _decide(self, count):
+        if count > self.num_requests:
+            THROTTLED_REQUESTS.labels(self.scope).inc()
+            return self.throttle_failure()
+        return True
+
+    def allow_request(self, request, view):
+        key = self._window_key(request, view)
+        if key is None:
+            return True
+        try:
+            if self.cache.add(key, 1, self.duration + 1):
+                count = 1
+            else:
+                count = self.cache.incr(key)
+        except ValueError:
+            # La clave expiró entre add e incr: empieza una ventana nueva
+            self.cache.add(key, 1, self.duration + 1)
+            count = 1
+        except Exception:
+            # Sin cache no se bloquea el servicio
+            logger.exception("Throttle %s sin cache disponible", self.scope)
+            return True
+        return self._decide(count)
+
+    async def aallow_request(self, request, view):
+        """
+        Versión async para las vistas de config/async_views.py.
+        """
+        key = self._window_key(request, view)
+        if key is None:
+            return True
+        try:
+            if await self.cache.aadd(key, 1, self.duration + 1):
+                count = 1
+            else:
+                count = await self.cache.aincr(key)
+        except ValueError:
+            await self.cache.aadd(key, 1, self.duration + 1)
+            count = 1
+        except Exception:
+            logger.exception("Throttle %s sin cache disponible", self.scope)
+            return True
+        return self._decide(count)
+
+    def wait(self):
+        return max(self.window_end - self.now, 0)
+
+
+class AnonRateThrottle(AtomicRateThrottleMixin, throttling.AnonRateThrottle):
+    pass
+
+
+class UserRateThrottle(AtomicRateThrottleMixin, throttling.UserRateThrottle):
+    pass
@@ -4,4 +4,5 @@ from . import views
 
 urlpatterns = [
     path("status/all/", views.get_all_statuses, name="get_all_statuses"),
+    path("db/pool/", views.db_pool_stats_view, name="db_pool_stats"),
 ]
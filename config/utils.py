@@ -1,64 +1,24 @@
 from functools import wraps
 
+from asgiref.sync import iscoroutinefunction, sync_to_async
 from rest_framework import status
 from rest_framework.response import Response
 from django.http import JsonResponse
 
-from access.models import PermissionRole, UserRole, UserGroupRole, UserGroup
+from access.models import EffectiveUserPermission
+from access.permission_index import permission_id
 
-# ---------------------------------------------------------
-# CONSTANTES DE ESTADO (UUIDs)
-# ---------------------------------------------------------
-STATUS_BORRADOR = "ab8a2bef-e236-4d73-99b1-f8c988be2e99"
-STATUS_EN_REVISION = "09618606-d931-428a-aee4-e45032c00310"
-STATUS_APROBADO = "6d025ac4-3d4f-4889-b9d2-64afc723c299"
-STATUS_RECHAZADO = "c370c327-f93d-4cc6-b566-8945da77ee0d"
-STATUS_BLOQUEADO = "45eca1ed-2f98-4b92-b677-492d190cae86"
-STATUS_SUSPENDIDO = "91adf4bd-e05d-4230-9fd9-6510d6889516"
-STATUS_EXPIRADO = "29f770db-5d6b-49c9-8b58-87ede5b395fd"
-STATUS_ERROR = "a12400ea-0643-4ea1-ab7d-b9b54d55b0e8"
-STATUS_ENVIADO = "b4d35209-2fa2-422c-bf81-d647599310a5"
-STATUS_RECIBIDO = "8e5124d7-b0f1-4db0-820e-625f66b9b3b2"
-STATUS_FALLIDO = "c2807e6c-1730-46cc-8ede-3cb5bdf623e8"
-STATUS_SINCRONIZADO = "995a6208-2818-423c-badb-727237c967df"
-STATUS_ARCHIVADO = "e217fae9-6cf8-4a32-b2d2-d5de1adf6c00"
-STATUS_ACTIVO = "2bd04756-cf71-438d-b8be-7d6dd58e5e34"
-STATUS_INACTIVO = "742ab54f-c5ab-4a41-93e3-373e1d9c4105"
-STATUS_ANULADO = "bd7a3ed1-efdb-429b-9cb2-9999b7a12bab"
-STATUS_ELIMINADO = "87ed0a4c-df78-4c53-8fd8-0463d634ec98"
-STATUS_PENDIENTE = "ff2b0252-5a55-4789-90e6-a18ac3f6e569"
-STATUS_PROCESADO = "48d43356-2fd9-494f-989d-113bbfbc6f90"
-STATUS_COMPLETADO = "139b8dd1-f244-4295-9996-692a66a9c455"
-
-# Mapeo opcional para búsquedas inversas o iteraciones
-STATUS_MAP = {
-    STATUS_BORRADOR: "BORRADOR",
-    STATUS_EN_REVISION: "EN REVISIÓN",
-    STATUS_APROBADO: "APROBADO",
-    STATUS_RECHAZADO: "RECHAZADO",
-    STATUS_BLOQUEADO: "BLOQUEADO",
-    STATUS_SUSPENDIDO: "SUSPENDIDO",
-    STATUS_EXPIRADO: "EXPIRADO",
-    STATUS_ERROR: "ERROR",
-    STATUS_ENVIADO: "ENVIADO",
-    STATUS_RECIBIDO: "RECIBIDO",
-    STATUS_FALLIDO: "FALLIDO",
-    STATUS_SINCRONIZADO: "SINCRONIZADO",
-    STATUS_ARCHIVADO: "ARCHIVADO",
-    STATUS_ACTIVO: "ACTIVO",
-    STATUS_INACTIVO: "INACTIVO",
-    STATUS_ANULADO: "ANULADO",
-    STATUS_ELIMINADO: "ELIMINADO",
-    STATUS_PENDIENTE: "PENDIENTE",
-    STATUS_PROCESADO: "PROCESADO",
-    STATUS_COMPLETADO: "COMPLETADO",
-}
+from .metrics import API_RESPONSES, PERMISSION_CHECKS
+
+# Constantes de estado: definidas en status.py (sin dependencias)
+from .status import *  # noqa: F401,F403
 
 
 # ---------------------------------------------------------
 # FUNCIONES DE RESPUESTA PERSONALIZADAS
 # ---------------------------------------------------------
 def succescall(data=None, message="Operación exitosa"):
+    API_RESPONSES.labels("success", status.HTTP_200_OK).inc()
     return Response(
         {"status": "success", "message": message, "data": data},
         status=status.HTTP_200_OK,
@@ -70,6 +30,7 @@ def succesresponse(data=None, message="Operación exitosa"):
 
 
 def warningcall(message="Advertencia de negocio"):
+    API_RESPONSES.labels("warning", status.HTTP_400_BAD_REQUEST).inc()
     return Response(
         {"status": "warning", "message": message, "data": None},
         status=status.HTTP_400_BAD_REQUEST,
@@ -85,6 +46,7 @@ def errorcall(
     status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
     data=None,
 ):
+    API_RESPONSES.labels("error", status_code).inc()
     return Response(
         {"status": "error", "message": message, "data": data}, status=status_code
     )
@@ -101,80 +63,132 @@ def errorresponse(
 # ---------------------------------------------------------
 # MIDDLEWARE DE AUTENTICACIÓN PERSONALIZADO
 # ---------------------------------------------------------
+def _auth_error(message, status_code):
+    return JsonResponse(
+        {
+            "status": "error",
+            "message": message,
+            "data": None
+        },
+        status=status_code
+    )
+
+
+def _precheck(user):
+    """
+    Verificaciones sin consulta: retorna "unauthenticated", "inactive",
+    "admin" o None si hay que consultar los permisos efectivos.
+    """
+    if not user.is_authenticated:
+        return "unauthenticated"
+    if not getattr(user, "is_active", False):
+        return "inactive"
+    is_admin = getattr(user, "is_admin", False)
+    if is_admin or getattr(user, "is_superuser", False):
+        return "admin"
+    return None
+
+
+def _precheck_response(decision):
+    if decision == "unauthenticated":
+        return _auth_error("No autenticado", status.HTTP_401_UNAUTHORIZED)
+    return _auth_error("Usuario inactivo", status.HTTP_403_FORBIDDEN)
+
+
+def _permission_names(decorator_name):
+    return [decorator_name, EffectiveUserPermission.ALL_PERMISSIONS]
+
+
+def _granted_response(granted, decorator_name):
+    if granted:
+        PERMISSION_CHECKS.labels(
+            "admin" if granted == EffectiveUserPermission.ALL_PERMISSIONS
+            else "allowed").inc()
+        return None
+    PERMISSION_CHECKS.labels("denied").inc()
+    return _auth_error(
+        "No tiene permisos para realizar esta acción "
+        f"({decorator_name})",
+        status.HTTP_403_FORBIDDEN
+    )
+
+
+def permission_denied(request, decorator_name):
+    """
+    Verificación de MiddlewareAutentication: retorna la respuesta de error
+    o None si se permite. Sirve también para permisos que dependen de la
+    petición; con decorator_name=None solo exige un usuario activo.
+    """
+    # 1-3. Autenticado, activo y administradores (sin consulta)
+    decision = _precheck(request.user)
+    if decision is not None:
+        PERMISSION_CHECKS.labels(decision).inc()
+        if decision == "admin":
+            return None
+        return _precheck_response(decision)
+    if decorator_name is None:
+        return None
+
+    # 4. Permiso inexistente o inactivo: se deniega sin consulta
+    if permission_id(decorator_name) is None:
+        return _granted_response(None, decorator_name)
+
+    # 5. Permiso específico o rol "ALL PERMISSIONS" desde la tabla
+    # de permisos efectivos (búsqueda por clave primaria)
+    granted = EffectiveUserPermission.objects.filter(
+        user_id=request.user.id,
+        decorator_name__in=_permission_names(decorator_name),
+    ).values_list("decorator_name", flat=True).first()
+    return _granted_response(granted, decorator_name)
+
+
 def MiddlewareAutentication(decorator_name):
     def decorator(view_func):
+        if iscoroutinefunction(view_func):
+            return _async_authentication(view_func, decorator_name)
+
         @wraps(view_func)
         def _wrapped_view(request, *args, **kwargs):
-            if not request.user.is_authenticated:
-                return JsonResponse(
-                    {
-                        "status": "error",
-                        "message": "No autenticado",
-                        "data": None
-                    },
-                    status=status.HTTP_401_UNAUTHORIZED
-                )
-
-            # 2. Verificar si el usuario está ACTIVO
-            if not getattr(request.user, "is_active", False):
-                return JsonResponse(
-                    {
-                        "status": "error",
-                        "message": "Usuario inactivo",
-                        "data": None
-                    },
-                    status=status.HTTP_403_FORBIDDEN
-                )
-
-            # 3. Obtener Roles del usuario (Directos y por Grupo)
-            # Solo roles ACTIVOS y de grupos ACTIVOS
-            user_roles_qs = UserRole.objects.filter(
-                user_id=request.user.id,
-                status_id=STATUS_ACTIVO,
-                role__status_id=STATUS_ACTIVO
-            ).select_related("role")
-            
-            user_groups_roles_qs = UserGroupRole.objects.filter(
-                user_id=request.user.id,
-                status_id=STATUS_ACTIVO,
-                group__status_id=STATUS_ACTIVO,
-                role__status_id=STATUS_ACTIVO
-            ).select_related("role", "group")
-
-            roles = list(set([ur.role for ur in user_roles_qs] + [ugr.role for ugr in user_groups_roles_qs]))
-            role_names = [r.name for r in roles]
-
-            # 4. Verificar si es Superusuario o tiene "ALL PERMISSIONS"
-            if "ALL PERMISSIONS" in role_names or getattr(
-                request.user, "is_admin", False
-            ) or getattr(request.user, "is_superuser", False):
-                return view_func(request, *args, **kwargs)
-
-
-            # 3. Verificar permiso específico por decorator_name
-            # Asegurar que el permiso también esté activo
-            has_permission = PermissionRole.objects.filter(
-                role__in=roles, 
-                permission__decorator_name=decorator_name,
-                status_id=STATUS_ACTIVO,
-                permission__status_id=STATUS_ACTIVO
-            ).exists()
-
-            if has_permission:
-                return view_func(request, *args, **kwargs)
-
-            return JsonResponse(
-                {
-                    "status": "error",
-                    "message": (
-                        "No tiene permisos para realizar esta acción "
-                        f"({decorator_name})"
-                    ),
-                    "data": None
-                },
-                status=status.HTTP_403_FORBIDDEN
-            )
+            denied = permission_denied(request, decorator_name)
+            if denied is not None:
+                return denied
+            return view_func(request, *args, **kwargs)
 
+        # Usado por sync_permissions para descubrir el catálogo
+        _wrapped_view.permission_name = decorator_name
         return _wrapped_view
 
     return decorator
+
+
+def _async_authentication(view_func, decorator_name):
+    """
+    Variante de MiddlewareAutentication para vistas async: la sesión y la
+    consulta de permisos se resuelven con las APIs async de Django.
+    """
+    @wraps(view_func)
+    async def _wrapped_view(request, *args, **kwargs):
+        request.user = await request.auser()
+        decision = _precheck(request.user)
+        if decision is not None:
+            PERMISSION_CHECKS.labels(decision).inc()
+            if decision == "admin":
+                return await view_func(request, *args, **kwargs)
+            return _precheck_response(decision)
+
+        # El índice puede recargarse desde la base de datos (síncrono)
+        if await sync_to_async(permission_id)(decorator_name) is None:
+            granted = None
+        else:
+            granted = await EffectiveUserPermission.objects.filter(
+                user_id=request.user.id,
+                decorator_name__in=_permission_names(decorator_name),
+            ).values_list("decorator_name", flat=True).afirst()
+
+        denied = _granted_response(granted, decorator_name)
+        if denied is not None:
+            return denied
+        return await view_func(request, *args, **kwargs)
+
+    _wrapped_view.permission_name = decorator_name
+    return _wrapped_view
@@ -1,10 +1,17 @@
+import secrets
+
+from django.conf import settings
+from django.db import connections
+from django.http import HttpResponse
 from rest_framework import status
 from rest_framework.decorators import api_view
+from rest_framework.response import Response
 from drf_spectacular.utils import extend_schema
 
-from .models import Status
+from . import status_registry
+from .metrics import render_metrics
 from .serializers import StatusSerializer
-from .utils import errorcall, succescall
+from .utils import MiddlewareAutentication, errorcall, succescall
 
 # Create your views here.
 
@@ -14,10 +21,56 @@ from .utils import errorcall, succescall
 def get_all_statuses(request):
     """
     API general para obtener todos los estados configurados en el sistema.
+    Se sirve desde el registro en memoria; con If-None-Match igual al ETag
+    responde 304.
     """
     try:
-        statuses = Status.objects.all()
-        serializer = StatusSerializer(statuses, many=True)
-        return succescall(serializer.data, "Estados obtenidos correctamente")
+        etag = status_registry.registry_etag()
+        if request.headers.get("If-None-Match") == etag:
+            response = Response(status=status.HTTP_304_NOT_MODIFIED)
+        else:
+            data = [s.as_dict() for s in status_registry.all_statuses()]
+            response = succescall(data, "Estados obtenidos correctamente")
+        response["ETag"] = etag
+        return response
     except Exception as e:
         return errorcall(str(e), status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+@extend_schema(responses={200: dict})
+@MiddlewareAutentication("config_db_pool_stats")
+@api_view(["GET"])
+def db_pool_stats_view(request):
+    """
+    Métricas del pool de conexiones de este proceso (cada worker tiene su
+    propio pool) para dimensionar DB_POOL_MIN_SIZE / DB_POOL_MAX_SIZE.
+    """
+    data = {}
+    for alias in connections:
+        pool = getattr(connections[alias], "pool", None)
+        if pool is None:
+            data[alias] = {"enabled": False}
+            continue
+        data[alias] = {
+            "enabled": True,
+            "min_size": pool.min_size,
+            "max_size": pool.max_size,
+            **pool.get_stats(),
+        }
+    return succescall(data, "Estadísticas del pool obtenidas correctamente")
+
+
+def metrics_view(request):
+    """
+    Exposición Prometheus. Exige "Authorization: Bearer <METRICS_TOKEN>";
+    sin token configurado solo responde con DEBUG (404 en otro caso).
+    """
+    token = settings.METRICS_TOKEN
+    if not token and not settings.DEBUG:
+        return HttpResponse(status=404)
+    if token:
+        header = request.headers.get("Authorization", "")
+        if not secrets.compare_digest(header, f"Bearer {token}"):
+            return HttpResponse(status=401)
+    content, content_type = render_metrics()
+    return HttpResponse(content, content_type=content_type)
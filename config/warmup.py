@@ -0,0 +1,87 @@
+"""
+Precarga antes de crear los workers (gunicorn con preload_app).
+
+Importa todas las vistas y carga las caches en memoria del proceso para
+que los workers las hereden al hacer fork en lugar de construirlas con la
+primera petición. Después hay que cerrar las conexiones a base de datos:
+un socket o pool abierto en el proceso maestro no debe compartirse con los
+hijos.
+"""
+import logging
+import time
+
+from django.db import connections
+from django.urls import get_resolver
+
+logger = logging.getLogger("meteorite.warmup")
+
+
+def _load_urls():
+    # reverse_dict fuerza la importación de todos los URLconf y vistas
+    return len(get_resolver().reverse_dict)
+
+
+def _load_statuses():
+    from .status_registry import all_statuses
+
+    return len(all_statuses())
+
+
+def _load_permissions():
+    from access.permission_index import permission_index
+
+    return len(permission_index())
+
+
+def _load_geography():
+    from general_master.config_master.geography import index_etag
+
+    return index_etag()
+
+
+STEPS = (
+    ("urls", _load_urls),
+    ("statuses", _load_statuses),
+    ("permissions", _load_permissions),
+    ("geography", _load_geography),
+)
+
+
+def warmup():
+    """
+    Ejecuta cada paso y retorna {paso: (resultado, segundos)}. Un fallo
+    (p. ej. base de datos no disponible) se registra y no detiene el
+    arranque: la cache se cargará con la primera petición.
+    """
+    results = load_caches()
+    release_connections()
+    return results
+
+
+def load_caches():
+    """
+    Pasos de warmup() sin cerrar las conexiones (también para los tests
+    de presupuestos de consultas, que miden con las caches cargadas).
+    """
+    results = {}
+    for name, step in STEPS:
+        start = time.perf_counter()
+        try:
+            value = step()
+        except Exception:
+            logger.exception("Warmup %s falló", name)
+            value = None
+        results[name] = (value, round(time.perf_counter() - start, 3))
+    return results
+
+
+def release_connections():
+    """
+    Cierra las conexiones (y el pool, si existe) del proceso actual.
+    """
+    for alias in connections:
+        connection = connections[alias]
+        connection.close()
+        close_pool = getattr(connection, "close_pool", None)
+        if close_pool is not None:
+            close_pool()
@@ -1,5 +1,23 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_save
 
 
 class AgriculturalConfig(AppConfig):
     name = "general_master.agricultural"
+
+    def ready(self):
+        from config.signals import post_import
+
+        from .location import (
+            LOCATION_MODELS,
+            SOURCE_FK,
+            location_rows_imported,
+            location_source_changed,
+            location_sources_imported,
+        )
+
+        for model in SOURCE_FK:
+            post_save.connect(location_source_changed, sender=model)
+            post_import.connect(location_sources_imported, sender=model)
+        for model in LOCATION_MODELS:
+            post_import.connect(location_rows_imported, sender=model)
@@ -0,0 +1,111 @@
+"""
+Columnas de ubicación copiadas en Cultivo y Fundo (LocationModel).
+
+- Al guardar un registro cuya ubicación cambió (LocationModel.save), se
+  copian el código y el nombre de cada nivel: País a Distrito desde el
+  índice geográfico en memoria, la Sociedad con una consulta.
+- Al renombrar un País, Departamento, Provincia, Distrito o Sociedad, un
+  UPDATE por modelo corrige las filas que lo referencian.
+- Las cargas masivas (bulk_create/bulk_update no pasan por save() ni
+  emiten post_save) se corrigen con un UPDATE por subconsultas correlacionadas
+  desde la señal post_import, igual que refresh_locations.
+"""
+from django.db.models import OuterRef, Q, Subquery
+
+from general_master.config_master import geography
+from general_master.config_master.models import (
+    Country,
+    Department,
+    District,
+    Province,
+    Society,
+)
+
+from .models import LOCATION_FIELDS, Crop, Farm
+
+LOCATION_MODELS = (Crop, Farm)
+
+# FK -> (modelo origen, nivel del índice geográfico)
+SOURCES = {
+    "key_country": (Country, geography.COUNTRY),
+    "key_department": (Department, geography.DEPARTMENT),
+    "key_province": (Province, geography.PROVINCE),
+    "key_district": (District, geography.DISTRICT),
+    "key_society": (Society, None),
+}
+SOURCE_FK = {model: fk for fk, (model, _) in SOURCES.items()}
+
+
+def location_values(instance):
+    """
+    {columna copiada: valor} según las FK actuales de instance.
+    """
+    geography.refresh()
+    values = {}
+    for fk, prefix in LOCATION_FIELDS.items():
+        model, level = SOURCES[fk]
+        pk = getattr(instance, f"{fk}_id")
+        entry = geography.get(level, pk) if level else None
+        if entry is not None:
+            code, name = entry.code, entry.name
+        else:
+            # Sociedad, o un nivel anulado (el índice solo tiene no anulados)
+            code, name = model.objects.filter(pk=pk).values_list(
+                "code", "name").first() or (None, None)
+        values[f"{prefix}_code"] = code
+        values[f"{prefix}_name"] = name
+    return values
+
+
+def refresh_locations(model, queryset=None, fks=None):
+    """
+    Recalcula las columnas copiadas de queryset (default: todo el modelo)
+    con un solo UPDATE. fks limita los niveles. Retorna las filas afectadas.
+    """
+    if queryset is None:
+        queryset = model.objects.all()
+    values = {}
+    for fk in fks or LOCATION_FIELDS:
+        prefix = LOCATION_FIELDS[fk]
+        rows = SOURCES[fk][0].objects.filter(pk=OuterRef(f"{fk}_id"))
+        values[f"{prefix}_code"] = Subquery(rows.values("code")[:1])
+        values[f"{prefix}_name"] = Subquery(rows.values("name")[:1])
+    return queryset.update(**values)
+
+
+def location_source_changed(sender, instance, created=False, **kwargs):
+    """
+    post_save de los modelos origen: corrige solo las filas desactualizadas.
+    """
+    if created:
+        return
+    fk = SOURCE_FK[sender]
+    prefix = LOCATION_FIELDS[fk]
+    code_field, name_field = f"{prefix}_code", f"{prefix}_name"
+    for model in LOCATION_MODELS:
+        model.objects.filter(**{f"{fk}_id": instance.pk}).exclude(
+            Q(**{code_field: instance.code}) & Q(**{name_field: instance.name})
+        ).update(**{code_field: instance.code, name_field: instance.name})
+
+
+def location_sources_imported(sender, instances=(), **kwargs):
+    """
+    post_import de los modelos origen (p. ej. renombres de la carga de
+    ubigeos).
+    """
+    ids = [instance.pk for instance in instances]
+    if not ids:
+        return
+    fk = SOURCE_FK[sender]
+    for model in LOCATION_MODELS:
+        refresh_locations(
+            model, model.objects.filter(**{f"{fk}_id__in": ids}), [fk])
+
+
+def location_rows_imported(sender, instances=(), **kwargs):
+    """
+    post_import de Cultivo/Fundo.
+    """
+    ids = [instance.pk for instance in instances]
+    if ids:
+        refresh_locations(sender, sender.objects.filter(pk__in=ids))
@@ -0,0 +1,31 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from general_master.agricultural.location import (
+    LOCATION_MODELS,
+    refresh_locations,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Recalcula las columnas de ubicación copiadas (código y nombre de "
+        "País, Departamento, Provincia, Distrito y Sociedad) de Cultivos y "
+        "Fundos."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--model",
+            choices=[model._meta.model_name for model in LOCATION_MODELS],
+            help="Solo este modelo (default: todos).",
+        )
+
+    def handle(self, *args, **options):
+        for model in LOCATION_MODELS:
+            if options["model"] and model._meta.model_name != options["model"]:
+                continue
+            with transaction.atomic():
+                count = refresh_locations(model)
+            self.stdout.write(self.style.SUCCESS(
+                f"{model._meta.db_table}: {count} registros actualizados"))
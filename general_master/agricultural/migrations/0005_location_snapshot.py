@@ -0,0 +1,178 @@
+# Generated by Django 6.0.1 on 2026-10-19 17:37
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+LOCATION_FIELDS = {
+    "key_country": ("Country", "country"),
+    "key_department": ("Department", "department"),
+    "key_province": ("Province", "province"),
+    "key_district": ("District", "district"),
+    "key_society": ("Society", "society"),
+}
+
+
+def backfill_location(apps, schema_editor):
+    for model_name in ("Crop", "Farm"):
+        model = apps.get_model("agricultural", model_name)
+        values = {}
+        for fk, (source_name, prefix) in LOCATION_FIELDS.items():
+            source = apps.get_model("general_master_config_master", source_name)
+            rows = source.objects.filter(pk=OuterRef(f"{fk}_id"))
+            values[f"{prefix}_code"] = Subquery(rows.values("code")[:1])
+            values[f"{prefix}_name"] = Subquery(rows.values("name")[:1])
+        model.objects.update(**values)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("agricultural", "0004_alter_crop_abbreviation_alter_crop_name_and_more"),
+        ("config", "0006_alter_status_description_alter_status_name_and_more"),
+        (
+            "general_master_config_master",
+            "0007_province_district_society_unique_not_annulled",
+        ),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="crop",
+            name="country_code",
+            field=models.CharField(blank=True, max_length=10, null=True),
+        ),
+        migrations.AddField(
+            model_name="crop",
+            name="country_name",
+            field=models.CharField(blank=True, max_length=100, null=True),
+        ),
+        migrations.AddField(
+            model_name="crop",
+            name="department_code",
+            field=models.CharField(blank=True, max_length=10, null=True),
+        ),
+        migrations.AddField(
+            model_name="crop",
+            name="department_name",
+            field=models.CharField(blank=True, max_length=100, null=True),
+        ),
+        migrations.AddField(
+            model_name="crop",
+            name="district_code",
+            field=models.CharField(blank=True, max_length=10, null=True),
+        ),
+        migrations.AddField(
+            model_name="crop",
+            name="district_name",
+            field=models.CharField(blank=True, max_length=100, null=True),
+        ),
+        migrations.AddField(
+            model_name="crop",
+            name="province_code",
+            field=models.CharField(blank=True, max_length=10, null=True),
+        ),
+        migrations.AddField(
+            model_name="crop",
+            name="province_name",
+            field=models.CharField(blank=True, max_length=100, null=True),
+        ),
+        migrations.AddField(
+            model_name="crop",
+            name="society_code",
+            field=models.CharField(blank=True, max_length=10, null=True),
+        ),
+        migrations.AddField(
+            model_name="crop",
+            name="society_name",
+            field=models.CharField(blank=True, max_length=100, null=True),
+        ),
+        migrations.AddField(
+            model_name="farm",
+            name="country_code",
+            field=models.CharField(blank=True, max_length=10, null=True),
+        ),
+        migrations.AddField(
+            model_name="farm",
+            name="country_name",
+            field=models.CharField(blank=True, max_length=100, null=True),
+        ),
+        migrations.AddField(
+            model_name="farm",
+            name="department_code",
+            field=models.CharField(blank=True, max_length=10, null=True),
+        ),
+        migrations.AddField(
+            model_name="farm",
+            name="department_name",
+            field=models.CharField(blank=True, max_length=100, null=True),
+        ),
+        migrations.AddField(
+            model_name="farm",
+            name="district_code",
+            field=models.CharField(blank=True, max_length=10, null=True),
+        ),
+        migrations.AddField(
+            model_name="farm",
+            name="district_name",
+            field=models.CharField(blank=True, max_length=100, null=True),
+        ),
+        migrations.AddField(
+            model_name="farm",
+            name="province_code",
+            field=models.CharField(blank=True, max_length=10, null=True),
+        ),
+        migrations.AddField(
+            model_name="farm",
+            name="province_name",
+            field=models.CharField(blank=True, max_length=100, null=True),
+        ),
+        migrations.AddField(
+            model_name="farm",
+            name="society_code",
+            field=models.CharField(blank=True, max_length=10, null=True),
+        ),
+        migrations.AddField(
+            model_name="farm",
+            name="society_name",
+            field=models.CharField(blank=True, max_length=100, null=True),
+        ),
+        migrations.RunPython(backfill_location, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="crop",
+            index=models.Index(
+                fields=["key_society", "name"], name="agc_crop_society_name_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="crop",
+            index=models.Index(
+                fields=[
+                    "country_name",
+                    "department_name",
+                    "province_name",
+                    "district_name",
+                ],
+                name="agc_crop_location_names_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="farm",
+            index=models.Index(
+                fields=["key_society", "name"], name="agc_farm_society_name_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="farm",
+            index=models.Index(
+                fields=[
+                    "country_name",
+                    "department_name",
+                    "province_name",
+                    "district_name",
+                ],
+                name="agc_farm_location_names_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,64 @@
+# Generated by Django 6.0.1 on 2026-10-19 17:44
+
+import config.ids
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("agricultural", "0005_location_snapshot"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="crop",
+            name="id",
+            field=models.UUIDField(
+                default=config.ids.new_id,
+                editable=False,
+                primary_key=True,
+                serialize=False,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="farm",
+            name="id",
+            field=models.UUIDField(
+                default=config.ids.new_id,
+                editable=False,
+                primary_key=True,
+                serialize=False,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="field",
+            name="id",
+            field=models.UUIDField(
+                default=config.ids.new_id,
+                editable=False,
+                primary_key=True,
+                serialize=False,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="shift",
+            name="id",
+            field=models.UUIDField(
+                default=config.ids.new_id,
+                editable=False,
+                primary_key=True,
+                serialize=False,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="stage",
+            name="id",
+            field=models.UUIDField(
+                default=config.ids.new_id,
+                editable=False,
+                primary_key=True,
+                serialize=False,
+            ),
+        ),
+    ]
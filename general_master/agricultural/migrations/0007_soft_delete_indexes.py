@@ -0,0 +1,117 @@
+# Generated by Django 6.0.1 on 2026-10-19 17:48
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("agricultural", "0006_uuid7_default"),
+        ("config", "0008_meteorite_uuid7"),
+        ("general_master_config_master", "0009_uuid7_default"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="crop",
+            index=models.Index(
+                condition=models.Q(
+                    ("status_id", "bd7a3ed1-efdb-429b-9cb2-9999b7a12bab"), _negated=True
+                ),
+                fields=["-created_at"],
+                name="agc_crop_live_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="crop",
+            index=models.Index(
+                condition=models.Q(
+                    ("status_id", "2bd04756-cf71-438d-b8be-7d6dd58e5e34")
+                ),
+                fields=["name"],
+                name="agc_crop_active_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="farm",
+            index=models.Index(
+                condition=models.Q(
+                    ("status_id", "bd7a3ed1-efdb-429b-9cb2-9999b7a12bab"), _negated=True
+                ),
+                fields=["-created_at"],
+                name="agc_farm_live_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="farm",
+            index=models.Index(
+                condition=models.Q(
+                    ("status_id", "2bd04756-cf71-438d-b8be-7d6dd58e5e34")
+                ),
+                fields=["name"],
+                name="agc_farm_active_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="field",
+            index=models.Index(
+                condition=models.Q(
+                    ("status_id", "bd7a3ed1-efdb-429b-9cb2-9999b7a12bab"), _negated=True
+                ),
+                fields=["-created_at"],
+                name="agc_field_live_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="field",
+            index=models.Index(
+                condition=models.Q(
+                    ("status_id", "2bd04756-cf71-438d-b8be-7d6dd58e5e34")
+                ),
+                fields=["name"],
+                name="agc_field_active_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="shift",
+            index=models.Index(
+                condition=models.Q(
+                    ("status_id", "bd7a3ed1-efdb-429b-9cb2-9999b7a12bab"), _negated=True
+                ),
+                fields=["-created_at"],
+                name="agc_shift_live_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="shift",
+            index=models.Index(
+                condition=models.Q(
+                    ("status_id", "2bd04756-cf71-438d-b8be-7d6dd58e5e34")
+                ),
+                fields=["name"],
+                name="agc_shift_active_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="stage",
+            index=models.Index(
+                condition=models.Q(
+                    ("status_id", "bd7a3ed1-efdb-429b-9cb2-9999b7a12bab"), _negated=True
+                ),
+                fields=["-created_at"],
+                name="agc_stage_live_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="stage",
+            index=models.Index(
+                condition=models.Q(
+                    ("status_id", "2bd04756-cf71-438d-b8be-7d6dd58e5e34")
+                ),
+                fields=["name"],
+                name="agc_stage_active_idx",
+            ),
+        ),
+    ]
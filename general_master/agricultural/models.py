@@ -1,6 +1,6 @@
 from django.db import models
 
-from config.models import BaseModel
+from config.models import BaseModel, soft_delete_indexes
 from general_master.config_master.models import (
     Country,
     Department,
@@ -10,30 +10,96 @@ from general_master.config_master.models import (
 )
 
 
-# Create your models here.
-class Crop(BaseModel):
-    name = models.CharField(max_length=100, blank=True, null=True)
-    abbreviation = models.CharField(max_length=10, blank=True, null=True)
+# FK de ubicación -> prefijo de sus columnas copiadas
+LOCATION_FIELDS = {
+    "key_country": "country",
+    "key_department": "department",
+    "key_province": "province",
+    "key_district": "district",
+    "key_society": "society",
+}
+
+
+class LocationModel(BaseModel):
+    """
+    Registro ubicado en País -> Departamento -> Provincia -> Distrito ->
+    Sociedad. El código y el nombre de cada nivel se copian en la propia
+    fila (los mantiene location.py) para listar y filtrar sin joins.
+    """
     key_country = models.ForeignKey(Country, on_delete=models.CASCADE)
     key_department = models.ForeignKey(Department, on_delete=models.CASCADE)
     key_province = models.ForeignKey(Province, on_delete=models.CASCADE)
     key_district = models.ForeignKey(District, on_delete=models.CASCADE)
     key_society = models.ForeignKey(Society, on_delete=models.CASCADE)
+    country_code = models.CharField(max_length=10, blank=True, null=True)
+    country_name = models.CharField(max_length=100, blank=True, null=True)
+    department_code = models.CharField(max_length=10, blank=True, null=True)
+    department_name = models.CharField(max_length=100, blank=True, null=True)
+    province_code = models.CharField(max_length=10, blank=True, null=True)
+    province_name = models.CharField(max_length=100, blank=True, null=True)
+    district_code = models.CharField(max_length=10, blank=True, null=True)
+    district_name = models.CharField(max_length=100, blank=True, null=True)
+    society_code = models.CharField(max_length=10, blank=True, null=True)
+    society_name = models.CharField(max_length=100, blank=True, null=True)
 
     class Meta:
+        abstract = True
+        indexes = soft_delete_indexes("agc_%(class)s") + [
+            # Listados filtrados por sociedad u ordenados por ubicación
+            models.Index(
+                fields=["key_society", "name"],
+                name="agc_%(class)s_society_name_idx",
+            ),
+            models.Index(
+                fields=[
+                    "country_name",
+                    "department_name",
+                    "province_name",
+                    "district_name",
+                ],
+                name="agc_%(class)s_location_names_idx",
+            ),
+        ]
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Ubicación con la que se cargó: save() solo recalcula las
+        # columnas copiadas si cambia
+        instance._loaded_location = instance.location_ids()
+        return instance
+
+    def location_ids(self):
+        return tuple(
+            self.__dict__.get(f"{field}_id") for field in LOCATION_FIELDS)
+
+    def save(self, *args, **kwargs):
+        if getattr(self, "_loaded_location", None) != self.location_ids():
+            # Import diferido: location.py importa este módulo
+            from .location import location_values
+
+            values = location_values(self)
+            for field, value in values.items():
+                setattr(self, field, value)
+            if kwargs.get("update_fields") is not None:
+                kwargs["update_fields"] = {*kwargs["update_fields"], *values}
+            self._loaded_location = self.location_ids()
+        super().save(*args, **kwargs)
+
+
+class Crop(LocationModel):
+    name = models.CharField(max_length=100, blank=True, null=True)
+    abbreviation = models.CharField(max_length=10, blank=True, null=True)
+
+    class Meta(LocationModel.Meta):
         db_table = "agc_crop"
 
 
-class Farm(BaseModel):
+class Farm(LocationModel):
     name = models.CharField(max_length=100, blank=True, null=True)
     abbreviation = models.CharField(max_length=10, blank=True, null=True)
-    key_country = models.ForeignKey(Country, on_delete=models.CASCADE)
-    key_department = models.ForeignKey(Department, on_delete=models.CASCADE)
-    key_province = models.ForeignKey(Province, on_delete=models.CASCADE)
-    key_district = models.ForeignKey(District, on_delete=models.CASCADE)
-    key_society = models.ForeignKey(Society, on_delete=models.CASCADE)
 
-    class Meta:
+    class Meta(LocationModel.Meta):
         db_table = "agc_farm"
 
 
@@ -44,6 +110,7 @@ class Field(BaseModel):
 
     class Meta:
         db_table = "agc_field"
+        indexes = soft_delete_indexes("agc_field")
 
 
 class Stage(BaseModel):
@@ -53,6 +120,7 @@ class Stage(BaseModel):
 
     class Meta:
         db_table = "agc_stage"
+        indexes = soft_delete_indexes("agc_stage")
 
 
 class Shift(BaseModel):
@@ -62,3 +130,4 @@ class Shift(BaseModel):
 
     class Meta:
         db_table = "agc_shift"
+        indexes = soft_delete_indexes("agc_shift")
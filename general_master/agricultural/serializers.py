@@ -0,0 +1,54 @@
+from rest_framework import serializers
+
+from config.serializers import StatusNameField
+
+from .models import Crop, Farm
+
+LOCATION_FIELDS = [
+    "key_country",
+    "key_department",
+    "key_province",
+    "key_district",
+    "key_society",
+    "country_code",
+    "country_name",
+    "department_code",
+    "department_name",
+    "province_code",
+    "province_name",
+    "district_code",
+    "district_name",
+    "society_code",
+    "society_name",
+]
+# Columnas copiadas: las calcula LocationModel.save
+LOCATION_READ_ONLY = [f for f in LOCATION_FIELDS if not f.startswith("key_")]
+AUDIT_FIELDS = [
+    "status_name",
+    "key_user_created",
+    "key_user_updated",
+    "created_at",
+    "updated_at",
+    "status",
+]
+READ_ONLY = ["key_user_created", "key_user_updated", "status"]
+
+
+class CropSerializer(serializers.ModelSerializer):
+    status_name = StatusNameField()
+
+    class Meta:
+        model = Crop
+        fields = (
+            ["id", "name", "abbreviation"] + LOCATION_FIELDS + AUDIT_FIELDS)
+        read_only_fields = READ_ONLY + LOCATION_READ_ONLY
+
+
+class FarmSerializer(serializers.ModelSerializer):
+    status_name = StatusNameField()
+
+    class Meta:
+        model = Farm
+        fields = (
+            ["id", "name", "abbreviation"] + LOCATION_FIELDS + AUDIT_FIELDS)
+        read_only_fields = READ_ONLY + LOCATION_READ_ONLY
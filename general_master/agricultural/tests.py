@@ -1,2 +1,233 @@
+from io import StringIO
+from unittest import mock
 
-# Create your tests here.
+from django.conf import settings
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from config.models import Status
+from config.signals import post_import
+from config.testing import (
+    QueryBudgetTestMixin,
+    grant_permissions,
+    make_location,
+    make_user,
+)
+from config.utils import STATUS_ACTIVO
+from general_master.config_master import geography
+
+from . import location as location_module
+from .models import LOCATION_FIELDS, Crop, Farm, Field, Shift, Stage
+from .tree import MAX_DEPTH, build_tree, level_querysets
+
+# Nombre de URL -> permiso de las vistas de BaseViewFactory
+FACTORY_VIEWS = {
+    "crop-get": "general_master_crop_get",
+    "crop-select": "general_master_crop_select",
+    "farm-get": "general_master_farm_get",
+    "farm-select": "general_master_farm_select",
+}
+
+
+class FactoryQueryBudgetTests(QueryBudgetTestMixin, TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = make_user("owner", admin=True)
+        cls.viewer = make_user("viewer")
+        audit = {
+            "key_user_created": cls.owner,
+            "key_user_updated": cls.owner,
+            "status_id": STATUS_ACTIVO,
+        }
+        for code in ("01", "02", "03"):
+            location = make_location(cls.owner, code)
+            Crop.objects.create(name=f"CULTIVO {code}", **location, **audit)
+            Farm.objects.create(name=f"FUNDO {code}", **location, **audit)
+
+    def setUp(self):
+        grant_permissions(self, self.viewer, *FACTORY_VIEWS.values())
+        super().setUp()
+        self.client.force_login(self.viewer)
+
+    def test_factory_views(self):
+        for name in FACTORY_VIEWS:
+            with self.subTest(name):
+                self.assertIn(name, settings.QUERY_BUDGETS)
+                response = self.client.post(
+                    reverse(name), {"page": 1, "page_size": 50},
+                    content_type="application/json")
+                self.assertEqual(response.status_code, 200)
+
+
+class FarmTreeTests(QueryBudgetTestMixin, TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = make_user("owner", admin=True)
+        audit = {
+            "key_user_created": cls.owner,
+            "key_user_updated": cls.owner,
+            "status_id": STATUS_ACTIVO,
+        }
+        location = make_location(cls.owner)
+        cls.farm = Farm.objects.create(name="FUNDO", **location, **audit)
+        for i in range(2):
+            field = Field.objects.create(
+                name=f"CAMPO {i}", key_farm=cls.farm, **audit)
+            stage = Stage.objects.create(
+                name=f"ETAPA {i}", key_field=field, **audit)
+            Shift.objects.create(name=f"TURNO {i}", key_stage=stage, **audit)
+
+    def setUp(self):
+        super().setUp()
+        self.client.force_login(self.owner)
+
+    def test_one_query_per_level_without_status_join(self):
+        with CaptureQueriesContext(connection) as queries:
+            farms, _ = build_tree(level_querysets(self.farm.id))
+        self.assertEqual(len(queries), MAX_DEPTH + 1)
+        status_table = Status._meta.db_table
+        for query in queries:
+            self.assertNotIn(status_table, query["sql"])
+        shift = farms[0]["fields"][0]["stages"][0]["shifts"][0]
+        self.assertEqual(shift["status_name"], "ACTIVO")
+
+    def test_invalid_ids(self):
+        for param in ("farm", "society"):
+            with self.subTest(param):
+                response = self.client.get(
+                    reverse("farm-tree"), {param: "no-es-un-uuid"})
+                self.assertEqual(response.status_code, 400)
+
+
+class LocationColumnsTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = make_user("owner", admin=True)
+        cls.audit = {
+            "key_user_created": cls.owner,
+            "key_user_updated": cls.owner,
+            "status_id": STATUS_ACTIVO,
+        }
+        cls.first = make_location(cls.owner, "01")
+        cls.second = make_location(cls.owner, "02")
+
+    def setUp(self):
+        geography.reload()
+
+    def copied(self, instance):
+        instance.refresh_from_db()
+        return {
+            field: getattr(instance, field)
+            for prefix in LOCATION_FIELDS.values()
+            for field in (f"{prefix}_code", f"{prefix}_name")
+        }
+
+    def expected(self, location):
+        return {
+            f"{prefix}_{attr}": getattr(location[fk], attr)
+            for fk, prefix in LOCATION_FIELDS.items()
+            for attr in ("code", "name")
+        }
+
+    def ctid(self, instance):
+        # Cambia con cada UPDATE de la fila, aunque no cambie ningún valor
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"SELECT ctid::text FROM {instance._meta.db_table} "
+                "WHERE id = %s", [instance.pk])
+            return cursor.fetchone()[0]
+
+    def test_save_fills_columns(self):
+        for model in (Crop, Farm):
+            with self.subTest(model.__name__):
+                instance = model.objects.create(
+                    name="REGISTRO", **self.first, **self.audit)
+                self.assertEqual(
+                    self.copied(instance), self.expected(self.first))
+
+    def test_save_extends_update_fields(self):
+        crop = Crop.objects.create(name="CULTIVO", **self.first, **self.audit)
+        crop = Crop.objects.get(pk=crop.pk)
+        for fk, value in self.second.items():
+            setattr(crop, fk, value)
+        crop.save(update_fields=list(LOCATION_FIELDS))
+        self.assertEqual(self.copied(crop), self.expected(self.second))
+
+    def test_save_unchanged_location_skips_copy(self):
+        crop = Crop.objects.create(name="CULTIVO", **self.first, **self.audit)
+        crop = Crop.objects.get(pk=crop.pk)
+        crop.name = "RENOMBRADO"
+        with mock.patch.object(
+                location_module, "location_values",
+                wraps=location_module.location_values) as values:
+            crop.save(update_fields=["name"])
+        values.assert_not_called()
+
+    def test_rename_updates_only_stale_rows(self):
+        for fk in ("key_department", "key_society"):
+            with self.subTest(fk):
+                source = self.first[fk]
+                prefix = LOCATION_FIELDS[fk]
+                stale = Crop.objects.create(
+                    name="DESACTUALIZADO", **self.first, **self.audit)
+                # Ya tiene el nombre nuevo: el UPDATE no debe tocarla
+                current = Farm.objects.create(
+                    name="AL DIA", **self.first, **self.audit)
+                Farm.objects.filter(pk=current.pk).update(
+                    **{f"{prefix}_name": f"{source.name} NUEVO"})
+                other = Crop.objects.create(
+                    name="OTRA", **self.second, **self.audit)
+                before = {
+                    row.pk: self.ctid(row) for row in (current, other)}
+
+                source.name = f"{source.name} NUEVO"
+                source.save()
+
+                self.assertEqual(
+                    self.copied(stale)[f"{prefix}_name"], source.name)
+                for row in (current, other):
+                    self.assertEqual(self.ctid(row), before[row.pk])
+                self.assertEqual(
+                    self.copied(other), self.expected(self.second))
+
+    def test_source_import_fixes_columns(self):
+        crop = Crop.objects.create(name="CULTIVO", **self.first, **self.audit)
+        district = self.first["key_district"]
+        district.name = "DISTRITO IMPORTADO"
+        # Como la carga de ubigeos: bulk_update no emite post_save
+        type(district).objects.bulk_update([district], ["name"])
+        self.assertNotEqual(self.copied(crop)["district_name"], district.name)
+
+        post_import.send(sender=type(district), instances=[district])
+        self.assertEqual(self.copied(crop)["district_name"], district.name)
+
+    def test_rows_import_fills_columns(self):
+        farms = Farm.objects.bulk_create([
+            Farm(name="FUNDO", **self.first, **self.audit)])
+        self.assertIsNone(self.copied(farms[0])["country_code"])
+
+        post_import.send(sender=Farm, instances=farms)
+        self.assertEqual(self.copied(farms[0]), self.expected(self.first))
+
+    def test_refresh_locations_command(self):
+        crop = Crop.objects.create(name="CULTIVO", **self.first, **self.audit)
+        farm = Farm.objects.create(name="FUNDO", **self.second, **self.audit)
+        blank = {
+            f"{prefix}_{attr}": None
+            for prefix in LOCATION_FIELDS.values()
+            for attr in ("code", "name")
+        }
+        Crop.objects.update(**blank)
+        Farm.objects.update(**blank)
+
+        call_command("refresh_locations", "--model=crop", stdout=StringIO())
+        self.assertEqual(self.copied(crop), self.expected(self.first))
+        self.assertEqual(self.copied(farm), blank)
+
+        out = StringIO()
+        call_command("refresh_locations", stdout=out)
+        self.assertEqual(self.copied(farm), self.expected(self.second))
+        self.assertIn("agc_farm: 1 registros actualizados", out.getvalue())
@@ -0,0 +1,112 @@
+"""
+Árbol Fundo -> Campo -> Etapa -> Turno.
+
+Se carga con una consulta por nivel (cada nivel filtra a su padre con una
+subconsulta del nivel anterior, sin listas de ids) y se arma en tiempo
+lineal agrupando cada nivel por su padre. Los registros anulados, y los
+hijos de un padre anulado, no forman parte del árbol. El nombre del estado
+sale del registro en memoria (config/status_registry.py), sin join.
+
+El ETag del subárbol depende del máximo updated_at y de la cantidad de
+registros de cada nivel: cambia al crear, editar, anular o eliminar un
+nodo, y se puede comprobar con una consulta de agregados por nivel sin
+cargar el árbol.
+"""
+import hashlib
+
+from django.db.models import Count, Max
+
+from config.status_registry import status_name
+from config.utils import STATUS_ANULADO
+
+from .models import Farm, Field, Shift, Stage
+
+# (nivel, modelo, campo del padre, clave de los hijos en el nodo padre)
+LEVELS = (
+    ("farm", Farm, None, None),
+    ("field", Field, "key_farm_id", "fields"),
+    ("stage", Stage, "key_field_id", "stages"),
+    ("shift", Shift, "key_stage_id", "shifts"),
+)
+MAX_DEPTH = len(LEVELS) - 1
+NODE_FIELDS = ("id", "name", "abbreviation", "status_id")
+
+
+def level_querysets(farm_id=None, society_id=None, depth=MAX_DEPTH):
+    """
+    QuerySets no anulados de cada nivel hasta depth (0 = solo fundos).
+    """
+    farms = Farm.objects.exclude(status_id=STATUS_ANULADO)
+    if farm_id:
+        farms = farms.filter(id=farm_id)
+    if society_id:
+        farms = farms.filter(key_society_id=society_id)
+
+    querysets = [farms]
+    for _, model, parent_field, _ in LEVELS[1:depth + 1]:
+        querysets.append(
+            model.objects.exclude(status_id=STATUS_ANULADO).filter(
+                **{f"{parent_field}__in": querysets[-1].values("id")}))
+    return querysets
+
+
+def _etag(stats, depth):
+    digest = hashlib.sha1(usedforsecurity=False)
+    digest.update(str(depth).encode())
+    for latest, count in stats:
+        value = latest.isoformat() if latest else ""
+        digest.update(f"|{value}:{count}".encode())
+    return f'"{digest.hexdigest()}"'
+
+
+def tree_etag(querysets):
+    """
+    ETag sin cargar el árbol: una consulta de agregados por nivel.
+    """
+    stats = []
+    for qs in querysets:
+        result = qs.order_by().aggregate(
+            latest=Max("updated_at"), count=Count("id"))
+        stats.append((result["latest"], result["count"]))
+    return _etag(stats, len(querysets) - 1)
+
+
+def build_tree(querysets):
+    """
+    Retorna (fundos anidados, etag). Cada nivel se ordena por nombre.
+    """
+    roots = []
+    parents = None
+    stats = []
+    for (_, _, parent_field, children_key), qs in zip(LEVELS, querysets):
+        fields = ["updated_at", *NODE_FIELDS]
+        if parent_field:
+            fields.append(parent_field)
+        rows = qs.order_by("name", "id").values(*fields)
+
+        nodes = {}
+        latest = None
+        for row in rows:
+            updated_at = row.pop("updated_at")
+            parent_id = row.pop(parent_field) if parent_field else None
+            node = {key: row[key] for key in NODE_FIELDS}
+            node["status_name"] = status_name(node["status_id"])
+            if parents is None:
+                roots.append(node)
+            elif parent_id in parents:
+                parents[parent_id][children_key].append(node)
+            else:
+                # El padre se anuló entre la consulta de su nivel y esta
+                continue
+            nodes[node["id"]] = node
+            if latest is None or updated_at > latest:
+                latest = updated_at
+        stats.append((latest, len(nodes)))
+
+        # Los nodos del nivel son padres del siguiente
+        if len(stats) < len(querysets):
+            next_key = LEVELS[len(stats)][3]
+            for node in nodes.values():
+                node[next_key] = []
+        parents = nodes
+    return roots, _etag(stats, len(querysets) - 1)
@@ -0,0 +1,37 @@
+from django.urls import path
+
+from .views import (
+    crop_get_view,
+    crop_select_view,
+    crop_create_view,
+    crop_update_view,
+    crop_inactivate_view,
+    crop_restore_view,
+    crop_annul_view,
+    farm_get_view,
+    farm_select_view,
+    farm_create_view,
+    farm_update_view,
+    farm_inactivate_view,
+    farm_restore_view,
+    farm_annul_view,
+    farm_tree_view,
+)
+
+urlpatterns = [
+    path("crop/get/", crop_get_view, name="crop-get"),
+    path("crop/select/", crop_select_view, name="crop-select"),
+    path("crop/create/", crop_create_view, name="crop-create"),
+    path("crop/update/", crop_update_view, name="crop-update"),
+    path("crop/inactivate/", crop_inactivate_view, name="crop-inactivate"),
+    path("crop/restore/", crop_restore_view, name="crop-restore"),
+    path("crop/annul/", crop_annul_view, name="crop-annul"),
+    path("farm/get/", farm_get_view, name="farm-get"),
+    path("farm/select/", farm_select_view, name="farm-select"),
+    path("farm/create/", farm_create_view, name="farm-create"),
+    path("farm/update/", farm_update_view, name="farm-update"),
+    path("farm/inactivate/", farm_inactivate_view, name="farm-inactivate"),
+    path("farm/restore/", farm_restore_view, name="farm-restore"),
+    path("farm/annul/", farm_annul_view, name="farm-annul"),
+    path("farm/tree/", farm_tree_view, name="farm-tree"),
+]
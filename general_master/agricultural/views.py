@@ -1,2 +1,128 @@
+import uuid
 
-# Create your views here.
+from rest_framework import status
+from rest_framework.decorators import api_view
+from rest_framework.response import Response
+from drf_spectacular.utils import extend_schema, OpenApiParameter, OpenApiTypes
+
+from audit.utils import EVENT_ANNUL, EVENT_INACTIVATE, EVENT_RESTORE
+from config.base_views import BaseViewFactory
+from config.db_router import use_replica
+from config.utils import (
+    STATUS_ACTIVO,
+    STATUS_ANULADO,
+    STATUS_INACTIVO,
+    MiddlewareAutentication,
+    errorcall,
+    succescall,
+)
+
+from .models import Crop, Farm
+from .serializers import CropSerializer, FarmSerializer
+from .tree import MAX_DEPTH, build_tree, level_querysets, tree_etag
+
+# Los listados filtran y muestran la ubicación con las columnas copiadas
+# en la propia tabla (sin joins)
+LOCATION_FILTERS = [
+    "key_country",
+    "key_department",
+    "key_province",
+    "key_district",
+    "key_society",
+]
+
+crop_factory = BaseViewFactory(
+    Crop, CropSerializer, "cultivos", "general_master_crop")
+
+crop_get_view = crop_factory.get_view(filters=LOCATION_FILTERS)
+crop_select_view = crop_factory.select_view()
+crop_create_view = crop_factory.create_view(
+    unique_fields=["name", "key_society"])
+crop_update_view = crop_factory.update_view(
+    unique_fields=["name", "key_society"])
+crop_inactivate_view = crop_factory.status_change_view(
+    STATUS_INACTIVO, EVENT_INACTIVATE)
+crop_restore_view = crop_factory.status_change_view(
+    STATUS_ACTIVO, EVENT_RESTORE)
+crop_annul_view = crop_factory.status_change_view(
+    STATUS_ANULADO, EVENT_ANNUL)
+
+farm_factory = BaseViewFactory(
+    Farm, FarmSerializer, "fundos", "general_master_farm")
+
+farm_get_view = farm_factory.get_view(filters=LOCATION_FILTERS)
+farm_select_view = farm_factory.select_view()
+farm_create_view = farm_factory.create_view(
+    unique_fields=["name", "key_society"])
+farm_update_view = farm_factory.update_view(
+    unique_fields=["name", "key_society"])
+farm_inactivate_view = farm_factory.status_change_view(
+    STATUS_INACTIVO, EVENT_INACTIVATE)
+farm_restore_view = farm_factory.status_change_view(
+    STATUS_ACTIVO, EVENT_RESTORE)
+farm_annul_view = farm_factory.status_change_view(
+    STATUS_ANULADO, EVENT_ANNUL)
+
+
+@extend_schema(
+    request=None,
+    parameters=[
+        OpenApiParameter("farm", str),
+        OpenApiParameter("society", str),
+        OpenApiParameter("depth", int, description="0 = solo fundos"),
+    ],
+    responses={200: OpenApiTypes.OBJECT},
+)
+@MiddlewareAutentication("general_master_farm_tree")
+@api_view(["GET"])
+@use_replica
+def farm_tree_view(request):
+    """
+    Fundo (o fundos de una sociedad) con sus Campos, Etapas y Turnos
+    anidados; una consulta por nivel. Con If-None-Match igual al ETag del
+    subárbol responde 304 sin cargarlo.
+    """
+    farm_id = request.query_params.get("farm")
+    society_id = request.query_params.get("society")
+    if not (farm_id or society_id):
+        return errorcall(
+            "Debe indicar el parámetro 'farm' o 'society'",
+            status.HTTP_400_BAD_REQUEST,
+        )
+    for name, value in (("farm", farm_id), ("society", society_id)):
+        try:
+            if value:
+                uuid.UUID(value)
+        except ValueError:
+            return errorcall(
+                f"El parámetro '{name}' no es un ID válido",
+                status.HTTP_400_BAD_REQUEST,
+            )
+    try:
+        depth = int(request.query_params.get("depth", MAX_DEPTH))
+    except ValueError:
+        depth = -1
+    if not 0 <= depth <= MAX_DEPTH:
+        return errorcall(
+            f"El parámetro 'depth' debe estar entre 0 y {MAX_DEPTH}",
+            status.HTTP_400_BAD_REQUEST,
+        )
+
+    querysets = level_querysets(farm_id, society_id, depth)
+    if_none_match = request.headers.get("If-None-Match")
+    if if_none_match:
+        etag = tree_etag(querysets)
+        if if_none_match == etag:
+            response = Response(status=status.HTTP_304_NOT_MODIFIED)
+            response["ETag"] = etag
+            return response
+
+    farms, etag = build_tree(querysets)
+    if farm_id and not farms:
+        return errorcall("Fundo no encontrado", status.HTTP_404_NOT_FOUND)
+    response = succescall(
+        {"results": farms, "total": len(farms)},
+        "Árbol de fundos obtenido correctamente",
+    )
+    response["ETag"] = etag
+    return response
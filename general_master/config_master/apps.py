@@ -1,7 +1,18 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_delete, post_save
 
 
 class ConfigMasterConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "general_master.config_master"
     label = "general_master_config_master"
+
+    def ready(self):
+        from config.signals import post_import
+
+        from .geography import LEVELS, geography_changed
+
+        for model, _ in LEVELS.values():
+            post_save.connect(geography_changed, sender=model)
+            post_delete.connect(geography_changed, sender=model)
+            post_import.connect(geography_changed, sender=model)
@@ -0,0 +1,234 @@
+"""
+Índice en memoria de la jerarquía geográfica
+País -> Departamento -> Provincia -> Distrito.
+
+Se carga una vez por proceso (una consulta por nivel, solo registros no
+anulados) y es inmutable: cada recarga sustituye el snapshot completo. Los
+selects en cascada y los validadores de importación lo leen sin consultar
+la base de datos. Se invalida al guardar/eliminar un registro de cualquier
+nivel o tras una importación, con la versión del espacio "geography" en la
+cache compartida; los demás procesos la comprueban como máximo cada
+GEOGRAPHY_CHECK_SECONDS.
+"""
+import hashlib
+import threading
+import time
+from dataclasses import dataclass
+from types import MappingProxyType
+
+from django.conf import settings
+from django.db import transaction
+
+from config.cache import bump_namespace, namespace_version
+from config.utils import STATUS_ACTIVO, STATUS_ANULADO
+
+from .models import Country, Department, District, Province
+
+CACHE_NAMESPACE = "geography"
+
+COUNTRY = "country"
+DEPARTMENT = "department"
+PROVINCE = "province"
+DISTRICT = "district"
+
+# nivel -> (modelo, campo del padre)
+LEVELS = {
+    COUNTRY: (Country, None),
+    DEPARTMENT: (Department, "key_country_id"),
+    PROVINCE: (Province, "key_department_id"),
+    DISTRICT: (District, "key_province_id"),
+}
+# nivel -> nivel padre
+PARENT_LEVEL = {DEPARTMENT: COUNTRY, PROVINCE: DEPARTMENT, DISTRICT: PROVINCE}
+
+
+@dataclass(frozen=True)
+class GeoEntry:
+    level: str
+    id: str
+    code: str
+    name: str
+    abbreviation: str
+    parent_id: str
+    status_id: str
+
+    @property
+    def is_active(self):
+        return self.status_id == str(STATUS_ACTIVO)
+
+    def as_option(self):
+        return {"id": self.id, "code": self.code, "name": self.name}
+
+
+@dataclass(frozen=True)
+class _Snapshot:
+    by_id: MappingProxyType
+    # (nivel, padre) -> opciones activas ordenadas por nombre
+    options: MappingProxyType
+    # (nivel, padre, código) / (nivel, padre, nombre) -> GeoEntry
+    by_code: MappingProxyType
+    by_name: MappingProxyType
+    etag: str
+    version: object
+    checked_at: float
+
+
+_snapshot = None
+_lock = threading.Lock()
+
+
+def _key(value):
+    return str(value or "").strip().upper()
+
+
+def _load(version):
+    by_id, options, by_code, by_name = {}, {}, {}, {}
+    for level, (model, parent_field) in LEVELS.items():
+        fields = ["id", "code", "name", "abbreviation", "status_id"]
+        if parent_field:
+            fields.append(parent_field)
+        rows = model.objects.exclude(status_id=STATUS_ANULADO).order_by(
+            "name", "id").values_list(*fields)
+        for row in rows:
+            pk, code, name, abbreviation, status_id = row[:5]
+            parent_id = str(row[5]) if parent_field else None
+            entry = GeoEntry(
+                level=level,
+                id=str(pk),
+                code=code,
+                name=name,
+                abbreviation=abbreviation,
+                parent_id=parent_id,
+                status_id=str(status_id),
+            )
+            by_id[(level, entry.id)] = entry
+            if code:
+                by_code.setdefault((level, parent_id, _key(code)), entry)
+            if name:
+                by_name.setdefault((level, parent_id, _key(name)), entry)
+            if entry.is_active:
+                options.setdefault((level, parent_id), []).append(
+                    entry.as_option())
+
+    digest = hashlib.sha1(usedforsecurity=False)
+    for key in sorted(by_id):
+        digest.update(repr(by_id[key]).encode())
+    return _Snapshot(
+        by_id=MappingProxyType(by_id),
+        options=MappingProxyType(
+            {key: tuple(value) for key, value in options.items()}),
+        by_code=MappingProxyType(by_code),
+        by_name=MappingProxyType(by_name),
+        etag=f'"{digest.hexdigest()}"',
+        version=version,
+        checked_at=time.monotonic(),
+    )
+
+
+def _current_version():
+    try:
+        return namespace_version(CACHE_NAMESPACE)
+    except Exception:
+        return None
+
+
+def _get_snapshot(force=False, check=False):
+    global _snapshot
+    snapshot = _snapshot
+    now = time.monotonic()
+    if not (force or check) and snapshot is not None and (
+            now - snapshot.checked_at < settings.GEOGRAPHY_CHECK_SECONDS):
+        return snapshot
+
+    with _lock:
+        snapshot = _snapshot
+        if not (force or check) and snapshot is not None and (
+                now - snapshot.checked_at < settings.GEOGRAPHY_CHECK_SECONDS):
+            return snapshot
+        version = _current_version()
+        if force or snapshot is None or version != snapshot.version:
+            _snapshot = _load(version)
+        else:
+            _snapshot = _Snapshot(
+                snapshot.by_id, snapshot.options, snapshot.by_code,
+                snapshot.by_name, snapshot.etag, snapshot.version, now)
+        return _snapshot
+
+
+def index_etag():
+    return _get_snapshot().etag
+
+
+def options(level, parent_id=None):
+    """
+    Opciones activas {id, code, name} de un nivel, ordenadas por nombre.
+    Para los niveles inferiores parent_id es obligatorio.
+    """
+    key = (level, str(parent_id) if parent_id else None)
+    return _get_snapshot().options.get(key, ())
+
+
+def get(level, pk):
+    if not pk:
+        return None
+    return _get_snapshot().by_id.get((level, str(pk)))
+
+
+def find_by_code(level, code, parent_id=None, active_only=False):
+    entry = _get_snapshot().by_code.get(
+        (level, str(parent_id) if parent_id else None, _key(code)))
+    if entry is None or (active_only and not entry.is_active):
+        return None
+    return entry
+
+
+def find_by_name(level, name, parent_id=None, active_only=False):
+    """
+    Búsqueda por nombre sin distinguir mayúsculas dentro del padre.
+    """
+    entry = _get_snapshot().by_name.get(
+        (level, str(parent_id) if parent_id else None, _key(name)))
+    if entry is None or (active_only and not entry.is_active):
+        return None
+    return entry
+
+
+def ancestors(level, pk):
+    """
+    Cadena [entrada, padre, abuelo...] hasta el país.
+    """
+    chain = []
+    entry = get(level, pk)
+    while entry is not None:
+        chain.append(entry)
+        parent_level = PARENT_LEVEL.get(entry.level)
+        entry = get(parent_level, entry.parent_id) if parent_level else None
+    return chain
+
+
+def refresh():
+    """
+    Comprueba ya la versión compartida (p. ej. antes de validar una
+    importación) en lugar de esperar a GEOGRAPHY_CHECK_SECONDS.
+    """
+    _get_snapshot(check=True)
+
+
+def reload():
+    _get_snapshot(force=True)
+
+
+def invalidate():
+    """
+    Marca el índice como modificado en todos los procesos.
+    """
+    def _bump():
+        global _snapshot
+        bump_namespace(CACHE_NAMESPACE)
+        _snapshot = None
+
+    transaction.on_commit(_bump)
+
+
+def geography_changed(sender, **kwargs):
+    invalidate()
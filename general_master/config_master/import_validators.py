@@ -1,6 +1,7 @@
 from django.db.models import Q
 from config.utils import STATUS_ACTIVO, STATUS_INACTIVO
-from .models import Country, Department
+from . import geography
+from .models import Country, Society
 
 
 def validate_department_import_row(row_data, seen_codes):
@@ -33,16 +34,14 @@ def validate_department_import_row(row_data, seen_codes):
     # Buscar el país SOLO por nombre y SOLO si está Activo
     country = None
     if country_val:
-        country = Country.objects.filter(
-            name__iexact=country_val,
-            status_id=STATUS_ACTIVO
-        ).first()
+        country = geography.find_by_name(
+            geography.COUNTRY, country_val, active_only=True)
         if not country:
             errors["PAÍS"] = f"País activo '{country_val}' no encontrado"
         else:
             # Inject UUID for the handler's auto-merge but keep the name in
             # "PAÍS" for display
-            row_data["key_country_id"] = str(country.id)
+            row_data["key_country_id"] = country.id
 
     if status_name:
         if status_name == "ACTIVO":
@@ -66,38 +65,174 @@ def validate_department_import_row(row_data, seen_codes):
         return False, errors
     seen_codes.add(row_key)
 
-    # Verificar duplicados en la base de datos
-    exists = Department.objects.filter(
-        Q(code=code) | Q(name=name),
-        key_country_id=country.id,
-        status_id__in=[STATUS_ACTIVO, STATUS_INACTIVO],
-    ).exists()
-
-    if exists:
-        if Department.objects.filter(
-            code=code,
-            key_country_id=country.id,
-            status_id__in=[
-                STATUS_ACTIVO,
-                STATUS_INACTIVO]).exists():
-            errors["CÓDIGO"] = f"El código '{code}' ya existe en este país"
-        if Department.objects.filter(
-            name=name,
-            key_country_id=country.id,
-            status_id__in=[
-                STATUS_ACTIVO,
-                STATUS_INACTIVO]).exists():
-            errors["NOMBRE"] = f"El nombre '{name}' ya existe en este país"
-
-        if not errors:
-            errors["CÓDIGO"] = (
-                "Registro duplicado en base de datos para este país"
-            )
+    # Verificar duplicados en la base de datos (departamentos activos o
+    # inactivos del país, desde el índice geográfico)
+    if geography.find_by_code(geography.DEPARTMENT, code, country.id):
+        errors["CÓDIGO"] = f"El código '{code}' ya existe en este país"
+    if geography.find_by_name(geography.DEPARTMENT, name, country.id):
+        errors["NOMBRE"] = f"El nombre '{name}' ya existe en este país"
+    if errors:
         return False, errors
 
     return True, {}
 
 
+# Columnas de ubicación del Excel: el país se busca por nombre y los demás
+# niveles por código dentro del padre (en el índice geográfico, sin
+# consultas por fila). Columna -> (nivel, campo a inyectar, etiqueta)
+GEOGRAPHY_COLUMNS = (
+    ("PAÍS", geography.COUNTRY, "key_country_id", "País"),
+    ("DEPARTAMENTO", geography.DEPARTMENT, "key_department_id",
+     "Departamento"),
+    ("PROVINCIA", geography.PROVINCE, "key_province_id", "Provincia"),
+    ("DISTRITO", geography.DISTRICT, "key_district_id", "Distrito"),
+)
+
+
+def _resolve_geography(row_data, errors, depth, inject=None):
+    """
+    Resuelve las primeras depth columnas de ubicación (solo registros
+    activos). Inyecta en row_data los campos de inject (por defecto todos)
+    y retorna la última entrada resuelta, o None con el error en errors.
+    """
+    parent = None
+    for column, level, field, label in GEOGRAPHY_COLUMNS[:depth]:
+        value = str(row_data.get(column, "")).strip()
+        if not value:
+            errors[column] = f"{label} es obligatorio"
+            return None
+        if parent is None:
+            entry = geography.find_by_name(level, value, active_only=True)
+            message = f"{label} activo '{value}' no encontrado"
+        else:
+            entry = geography.find_by_code(
+                level, value, parent.id, active_only=True)
+            message = (
+                f"{label} activo con código '{value}' no encontrado en "
+                f"{parent.name}")
+        if entry is None:
+            errors[column] = message
+            return None
+        if inject is None or field in inject:
+            row_data[field] = entry.id
+        parent = entry
+    return parent
+
+
+def _resolve_status(row_data, errors):
+    status_name = str(row_data.get("ESTADO", "")).strip().upper()
+    if not status_name or status_name == "ACTIVO":
+        row_data["status_id"] = STATUS_ACTIVO
+    elif status_name == "INACTIVO":
+        row_data["status_id"] = STATUS_INACTIVO
+    else:
+        errors["ESTADO"] = "El estado debe ser 'Activo' o 'Inactivo'"
+
+
+def _normalize_row(row_data):
+    errors = {}
+    for column, message in (
+            ("CÓDIGO", "El código es obligatorio"),
+            ("NOMBRE", "El nombre es obligatorio"),
+            ("ABREVIACIÓN", "La abreviación es obligatoria")):
+        value = str(row_data.get(column, "")).strip().upper()
+        row_data[column] = value
+        if not value:
+            errors[column] = message
+    return row_data["CÓDIGO"], row_data["NOMBRE"], errors
+
+
+def _geography_level_validator(level, depth, parent_field, parent_label):
+    """
+    Validador de filas para Provincia (depth=2) y Distrito (depth=3): los
+    padres y los duplicados se resuelven en el índice geográfico.
+    """
+    def validate(row_data, seen_codes):
+        code, name, errors = _normalize_row(row_data)
+        parent = _resolve_geography(
+            row_data, errors, depth, inject=(parent_field,))
+        _resolve_status(row_data, errors)
+        if errors:
+            return False, errors
+
+        # Duplicados en el mismo archivo (código + padre)
+        row_key = f"{code}_{parent.id}"
+        if row_key in seen_codes:
+            errors["CÓDIGO"] = (
+                f"Código '{code}' duplicado para {parent_label} "
+                "en el archivo")
+            return False, errors
+        seen_codes.add(row_key)
+
+        # Duplicados en la base de datos (activos o inactivos del padre)
+        if geography.find_by_code(level, code, parent.id):
+            errors["CÓDIGO"] = (
+                f"El código '{code}' ya existe en {parent_label} "
+                f"{parent.name}")
+        if geography.find_by_name(level, name, parent.id):
+            errors["NOMBRE"] = (
+                f"El nombre '{name}' ya existe en {parent_label} "
+                f"{parent.name}")
+        if errors:
+            return False, errors
+        return True, {}
+
+    return validate
+
+
+# Factorías de validadores (BaseViewFactory.import_view): se llaman una vez
+# por importación y traen antes los cambios del índice de otros procesos.
+def province_import_validator():
+    geography.refresh()
+    return _geography_level_validator(
+        geography.PROVINCE, 2, "key_department_id", "el departamento")
+
+
+def district_import_validator():
+    geography.refresh()
+    return _geography_level_validator(
+        geography.DISTRICT, 3, "key_province_id", "la provincia")
+
+
+def society_import_validator():
+    """
+    Validador de filas para Sociedad. La ubicación se resuelve en el índice
+    geográfico y los códigos/nombres existentes se cargan una sola vez por
+    importación.
+    """
+    geography.refresh()
+    existing = Society.objects.filter(
+        status_id__in=[STATUS_ACTIVO, STATUS_INACTIVO],
+    ).values_list("code", "name", "key_district_id")
+    existing_codes = {code for code, _, _ in existing if code}
+    existing_names = {
+        (name, str(district_id)) for _, name, district_id in existing if name
+    }
+
+    def validate(row_data, seen_codes):
+        code, name, errors = _normalize_row(row_data)
+        district = _resolve_geography(row_data, errors, 4)
+        _resolve_status(row_data, errors)
+        if errors:
+            return False, errors
+
+        if code in seen_codes:
+            errors["CÓDIGO"] = MSG_DUPLICATE_IN_FILE.format(code=code)
+            return False, errors
+        seen_codes.add(code)
+
+        if code in existing_codes:
+            errors["CÓDIGO"] = f"El código '{code}' ya existe"
+        if (name, district.id) in existing_names:
+            errors["NOMBRE"] = (
+                f"El nombre '{name}' ya existe en el distrito {district.name}")
+        if errors:
+            return False, errors
+        return True, {}
+
+    return validate
+
+
 # Mensajes de error para la importación
 MSG_COLUMN_MISSING = (
     "El archivo Excel no tiene las columnas requeridas: "
@@ -0,0 +1,96 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from audit.triggers import set_audit_user
+from audit.utils import is_trigger_mode
+from auth.models import User
+from general_master.config_master import geography
+from general_master.config_master.ubigeo import (
+    HEADERS,
+    UbigeoError,
+    load_ubigeo,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Carga Departamentos, Provincias y Distritos de un país desde un "
+        "Excel con formato INEI (UBIGEO, DEPARTAMENTO, PROVINCIA, DISTRITO)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="Archivo .xlsx a cargar.")
+        parser.add_argument(
+            "--country",
+            required=True,
+            help="ID, código o nombre del país.",
+        )
+        parser.add_argument(
+            "--user",
+            help="Usuario registrado como creador (default: primer "
+                 "administrador activo).",
+        )
+        parser.add_argument(
+            "--no-update-names",
+            action="store_true",
+            help="No actualiza el nombre de los registros existentes.",
+        )
+
+    def handle(self, *args, **options):
+        if options["user"]:
+            user = User.objects.filter(username=options["user"]).first()
+        else:
+            user = User.objects.filter(
+                is_admin=True, is_active=True).order_by("date_created").first()
+        if user is None:
+            raise CommandError("No se encontró el usuario creador")
+
+        value = options["country"]
+        country = (
+            geography.get(geography.COUNTRY, value)
+            or geography.find_by_code(geography.COUNTRY, value)
+            or geography.find_by_name(geography.COUNTRY, value)
+        )
+        if country is None or not country.is_active:
+            raise CommandError(f"País {value} no existe o no está activo")
+
+        rows = self._read(options["path"])
+        if is_trigger_mode():
+            set_audit_user(user.id)
+        try:
+            summary = load_ubigeo(
+                rows, country.id, user.id,
+                update_names=not options["no_update_names"])
+        except UbigeoError as exc:
+            for error in exc.errors:
+                self.stderr.write(f"  {error}")
+            raise CommandError(f"{len(exc.errors)} filas inválidas")
+        finally:
+            if is_trigger_mode():
+                set_audit_user(None)
+
+        for level, counts in summary.items():
+            self.stdout.write(
+                f"  {level}: {counts['created']} creados, "
+                f"{counts['updated']} actualizados")
+        self.stdout.write(self.style.SUCCESS(
+            f"Ubigeos cargados en {country.name}"))
+
+    def _read(self, path):
+        from openpyxl import load_workbook
+
+        try:
+            wb = load_workbook(path, read_only=True)
+        except (OSError, ValueError) as exc:
+            raise CommandError(f"No se pudo leer {path}: {exc}")
+        rows = wb.active.iter_rows(values_only=True)
+        header_row = [
+            str(h).strip() if h else "" for h in next(rows, ())]
+        missing = [h for h in HEADERS if h not in header_row]
+        if missing:
+            raise CommandError(
+                f"Columnas requeridas faltantes: {', '.join(missing)}")
+        indexes = [header_row.index(h) for h in HEADERS]
+        return [
+            [row[i] if i < len(row) else None for i in indexes]
+            for row in rows
+        ]
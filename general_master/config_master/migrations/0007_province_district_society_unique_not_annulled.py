@@ -0,0 +1,79 @@
+# Generated by Django 6.0.1 on 2026-10-19 17:30
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("config", "0006_alter_status_description_alter_status_name_and_more"),
+        (
+            "general_master_config_master",
+            "0006_alter_country_abbreviation_alter_country_code_and_more",
+        ),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name="district",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(
+                    ("status_id", "bd7a3ed1-efdb-429b-9cb2-9999b7a12bab"), _negated=True
+                ),
+                fields=("code", "key_province"),
+                name="unique_district_code_per_province_not_annulled",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="district",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(
+                    ("status_id", "bd7a3ed1-efdb-429b-9cb2-9999b7a12bab"), _negated=True
+                ),
+                fields=("name", "key_province"),
+                name="unique_district_name_per_province_not_annulled",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="province",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(
+                    ("status_id", "bd7a3ed1-efdb-429b-9cb2-9999b7a12bab"), _negated=True
+                ),
+                fields=("code", "key_department"),
+                name="unique_province_code_per_department_not_annulled",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="province",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(
+                    ("status_id", "bd7a3ed1-efdb-429b-9cb2-9999b7a12bab"), _negated=True
+                ),
+                fields=("name", "key_department"),
+                name="unique_province_name_per_department_not_annulled",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="society",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(
+                    ("status_id", "bd7a3ed1-efdb-429b-9cb2-9999b7a12bab"), _negated=True
+                ),
+                fields=("code",),
+                name="unique_society_code_not_annulled",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="society",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(
+                    ("status_id", "bd7a3ed1-efdb-429b-9cb2-9999b7a12bab"), _negated=True
+                ),
+                fields=("name", "key_district"),
+                name="unique_society_name_per_district_not_annulled",
+            ),
+        ),
+    ]
@@ -0,0 +1,57 @@
+# Generated by Django 6.0.1 on 2026-10-19 17:41
+
+import config.search
+import django.contrib.postgres.indexes
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("config", "0007_meteorite_normalize"),
+        (
+            "general_master_config_master",
+            "0007_province_district_society_unique_not_annulled",
+        ),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="district",
+            index=models.Index(
+                django.contrib.postgres.indexes.OpClass(
+                    config.search.Normalize("code"), name="text_pattern_ops"
+                ),
+                name="cfg_district_code_ac_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="district",
+            index=models.Index(
+                django.contrib.postgres.indexes.OpClass(
+                    config.search.Normalize("name"), name="text_pattern_ops"
+                ),
+                name="cfg_district_name_ac_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="society",
+            index=models.Index(
+                django.contrib.postgres.indexes.OpClass(
+                    config.search.Normalize("code"), name="text_pattern_ops"
+                ),
+                name="cfg_society_code_ac_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="society",
+            index=models.Index(
+                django.contrib.postgres.indexes.OpClass(
+                    config.search.Normalize("name"), name="text_pattern_ops"
+                ),
+                name="cfg_society_name_ac_idx",
+            ),
+        ),
+    ]
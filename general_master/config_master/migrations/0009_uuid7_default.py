@@ -0,0 +1,74 @@
+# Generated by Django 6.0.1 on 2026-10-19 17:44
+
+import config.ids
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("general_master_config_master", "0008_autocomplete_indexes"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="country",
+            name="id",
+            field=models.UUIDField(
+                default=config.ids.new_id,
+                editable=False,
+                primary_key=True,
+                serialize=False,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="department",
+            name="id",
+            field=models.UUIDField(
+                default=config.ids.new_id,
+                editable=False,
+                primary_key=True,
+                serialize=False,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="district",
+            name="id",
+            field=models.UUIDField(
+                default=config.ids.new_id,
+                editable=False,
+                primary_key=True,
+                serialize=False,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="money",
+            name="id",
+            field=models.UUIDField(
+                default=config.ids.new_id,
+                editable=False,
+                primary_key=True,
+                serialize=False,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="province",
+            name="id",
+            field=models.UUIDField(
+                default=config.ids.new_id,
+                editable=False,
+                primary_key=True,
+                serialize=False,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="society",
+            name="id",
+            field=models.UUIDField(
+                default=config.ids.new_id,
+                editable=False,
+                primary_key=True,
+                serialize=False,
+            ),
+        ),
+    ]
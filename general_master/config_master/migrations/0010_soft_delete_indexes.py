@@ -0,0 +1,136 @@
+# Generated by Django 6.0.1 on 2026-10-19 17:48
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("config", "0008_meteorite_uuid7"),
+        ("general_master_config_master", "0009_uuid7_default"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="country",
+            index=models.Index(
+                condition=models.Q(
+                    ("status_id", "bd7a3ed1-efdb-429b-9cb2-9999b7a12bab"), _negated=True
+                ),
+                fields=["-created_at"],
+                name="cfg_country_live_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="country",
+            index=models.Index(
+                condition=models.Q(
+                    ("status_id", "2bd04756-cf71-438d-b8be-7d6dd58e5e34")
+                ),
+                fields=["name"],
+                name="cfg_country_active_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="department",
+            index=models.Index(
+                condition=models.Q(
+                    ("status_id", "bd7a3ed1-efdb-429b-9cb2-9999b7a12bab"), _negated=True
+                ),
+                fields=["-created_at"],
+                name="cfg_department_live_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="department",
+            index=models.Index(
+                condition=models.Q(
+                    ("status_id", "2bd04756-cf71-438d-b8be-7d6dd58e5e34")
+                ),
+                fields=["name"],
+                name="cfg_department_active_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="district",
+            index=models.Index(
+                condition=models.Q(
+                    ("status_id", "bd7a3ed1-efdb-429b-9cb2-9999b7a12bab"), _negated=True
+                ),
+                fields=["-created_at"],
+                name="cfg_district_live_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="district",
+            index=models.Index(
+                condition=models.Q(
+                    ("status_id", "2bd04756-cf71-438d-b8be-7d6dd58e5e34")
+                ),
+                fields=["name"],
+                name="cfg_district_active_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="money",
+            index=models.Index(
+                condition=models.Q(
+                    ("status_id", "bd7a3ed1-efdb-429b-9cb2-9999b7a12bab"), _negated=True
+                ),
+                fields=["-created_at"],
+                name="cfg_money_live_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="money",
+            index=models.Index(
+                condition=models.Q(
+                    ("status_id", "2bd04756-cf71-438d-b8be-7d6dd58e5e34")
+                ),
+                fields=["name"],
+                name="cfg_money_active_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="province",
+            index=models.Index(
+                condition=models.Q(
+                    ("status_id", "bd7a3ed1-efdb-429b-9cb2-9999b7a12bab"), _negated=True
+                ),
+                fields=["-created_at"],
+                name="cfg_province_live_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="province",
+            index=models.Index(
+                condition=models.Q(
+                    ("status_id", "2bd04756-cf71-438d-b8be-7d6dd58e5e34")
+                ),
+                fields=["name"],
+                name="cfg_province_active_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="society",
+            index=models.Index(
+                condition=models.Q(
+                    ("status_id", "bd7a3ed1-efdb-429b-9cb2-9999b7a12bab"), _negated=True
+                ),
+                fields=["-created_at"],
+                name="cfg_society_live_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="society",
+            index=models.Index(
+                condition=models.Q(
+                    ("status_id", "2bd04756-cf71-438d-b8be-7d6dd58e5e34")
+                ),
+                fields=["name"],
+                name="cfg_society_active_idx",
+            ),
+        ),
+    ]
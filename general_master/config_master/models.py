@@ -1,6 +1,7 @@
 from django.db import models
 from django.db.models import Q
-from config.models import BaseModel
+from config.models import BaseModel, soft_delete_indexes
+from config.search import autocomplete_index
 from config.utils import STATUS_ANULADO
 
 # Create your models here.
@@ -16,6 +17,7 @@ class Country(BaseModel):
 
     class Meta:
         db_table = "config_master_country"
+        indexes = soft_delete_indexes("cfg_country")
         constraints = [
             models.UniqueConstraint(
                 fields=["code"],
@@ -48,6 +50,7 @@ class Money(BaseModel):
 
     class Meta:
         db_table = "config_master_money"
+        indexes = soft_delete_indexes("cfg_money")
 
 
 class Department(BaseModel):
@@ -58,6 +61,7 @@ class Department(BaseModel):
 
     class Meta:
         db_table = "config_master_department"
+        indexes = soft_delete_indexes("cfg_department")
         constraints = [
             models.UniqueConstraint(
                 fields=["code", "key_country"],
@@ -80,6 +84,19 @@ class Province(BaseModel):
 
     class Meta:
         db_table = "config_master_province"
+        indexes = soft_delete_indexes("cfg_province")
+        constraints = [
+            models.UniqueConstraint(
+                fields=["code", "key_department"],
+                condition=~Q(status_id=STATUS_ANULADO),
+                name="unique_province_code_per_department_not_annulled"
+            ),
+            models.UniqueConstraint(
+                fields=["name", "key_department"],
+                condition=~Q(status_id=STATUS_ANULADO),
+                name="unique_province_name_per_department_not_annulled"
+            )
+        ]
 
 
 class District(BaseModel):
@@ -90,6 +107,22 @@ class District(BaseModel):
 
     class Meta:
         db_table = "config_master_district"
+        indexes = soft_delete_indexes("cfg_district") + [
+            autocomplete_index("code", "cfg_district_code_ac_idx"),
+            autocomplete_index("name", "cfg_district_name_ac_idx"),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["code", "key_province"],
+                condition=~Q(status_id=STATUS_ANULADO),
+                name="unique_district_code_per_province_not_annulled"
+            ),
+            models.UniqueConstraint(
+                fields=["name", "key_province"],
+                condition=~Q(status_id=STATUS_ANULADO),
+                name="unique_district_name_per_province_not_annulled"
+            )
+        ]
 
 
 class Society(BaseModel):
@@ -103,3 +136,19 @@ class Society(BaseModel):
 
     class Meta:
         db_table = "config_master_society"
+        indexes = soft_delete_indexes("cfg_society") + [
+            autocomplete_index("code", "cfg_society_code_ac_idx"),
+            autocomplete_index("name", "cfg_society_name_ac_idx"),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["code"],
+                condition=~Q(status_id=STATUS_ANULADO),
+                name="unique_society_code_not_annulled"
+            ),
+            models.UniqueConstraint(
+                fields=["name", "key_district"],
+                condition=~Q(status_id=STATUS_ANULADO),
+                name="unique_society_name_per_district_not_annulled"
+            )
+        ]
@@ -1,9 +1,33 @@
 from rest_framework import serializers
-from .models import Country, Department
+
+from config.serializers import StatusNameField
+
+from . import geography
+from .models import Country, Department, District, Province, Society
+
+
+class GeographyField(serializers.ReadOnlyField):
+    """
+    Atributo (name o code) de un nivel geográfico resuelto desde el índice
+    en memoria a partir del id de source, sin join ni consulta por fila.
+    source_level es el nivel del id; level, si se indica, un ancestro.
+    """
+
+    def __init__(self, source_level, level=None, attr="name", **kwargs):
+        self.source_level = source_level
+        self.level = level or source_level
+        self.attr = attr
+        super().__init__(**kwargs)
+
+    def to_representation(self, value):
+        for entry in geography.ancestors(self.source_level, value):
+            if entry.level == self.level:
+                return getattr(entry, self.attr)
+        return None
 
 
 class CountrySerializer(serializers.ModelSerializer):
-    status_name = serializers.CharField(source="status.name", read_only=True)
+    status_name = StatusNameField()
 
     class Meta:
         model = Country
@@ -26,7 +50,7 @@ class CountrySerializer(serializers.ModelSerializer):
 
 
 class DepartmentSerializer(serializers.ModelSerializer):
-    status_name = serializers.CharField(source="status.name", read_only=True)
+    status_name = StatusNameField()
     country_name = serializers.CharField(
         source="key_country.name", read_only=True)
 
@@ -47,3 +71,157 @@ class DepartmentSerializer(serializers.ModelSerializer):
             "status",
         ]
         read_only_fields = ["key_user_created", "key_user_updated", "status"]
+
+
+class GeographyOptionSerializer(serializers.Serializer):
+    """
+    Opción de los selects en cascada (índice geográfico).
+    """
+    id = serializers.UUIDField()
+    code = serializers.CharField()
+    name = serializers.CharField()
+
+
+AUDIT_FIELDS = [
+    "status_name",
+    "key_user_created",
+    "key_user_updated",
+    "created_at",
+    "updated_at",
+    "status",
+]
+
+
+class ProvinceSerializer(serializers.ModelSerializer):
+    status_name = StatusNameField()
+    department_name = GeographyField(
+        geography.DEPARTMENT, source="key_department_id")
+    department_code = GeographyField(
+        geography.DEPARTMENT, attr="code", source="key_department_id")
+    country_name = GeographyField(
+        geography.DEPARTMENT, geography.COUNTRY, source="key_department_id")
+
+    class Meta:
+        model = Province
+        fields = [
+            "id",
+            "code",
+            "name",
+            "abbreviation",
+            "key_department",
+            "department_name",
+            "department_code",
+            "country_name",
+        ] + AUDIT_FIELDS
+        read_only_fields = ["key_user_created", "key_user_updated", "status"]
+
+
+class DistrictSerializer(serializers.ModelSerializer):
+    status_name = StatusNameField()
+    province_name = GeographyField(
+        geography.PROVINCE, source="key_province_id")
+    province_code = GeographyField(
+        geography.PROVINCE, attr="code", source="key_province_id")
+    department_code = GeographyField(
+        geography.PROVINCE, geography.DEPARTMENT, attr="code",
+        source="key_province_id")
+    country_name = GeographyField(
+        geography.PROVINCE, geography.COUNTRY, source="key_province_id")
+
+    class Meta:
+        model = District
+        fields = [
+            "id",
+            "code",
+            "name",
+            "abbreviation",
+            "key_province",
+            "province_name",
+            "province_code",
+            "department_code",
+            "country_name",
+        ] + AUDIT_FIELDS
+        read_only_fields = ["key_user_created", "key_user_updated", "status"]
+
+
+def _district_chain(district):
+    """
+    {nivel: id} de la rama del distrito. Usa el índice geográfico recién
+    comprobado y, si no conoce el distrito (aún no recargado o anulado),
+    la cadena de FKs en la base de datos.
+    """
+    geography.refresh()
+    chain = {
+        entry.level: entry.id
+        for entry in geography.ancestors(geography.DISTRICT, district.pk)
+    }
+    if chain:
+        return chain
+    row = District.objects.filter(pk=district.pk).values_list(
+        "key_province_id",
+        "key_province__key_department_id",
+        "key_province__key_department__key_country_id",
+    ).first()
+    if row is None:
+        return {}
+    return {
+        level: str(pk) for level, pk in zip(
+            (geography.PROVINCE, geography.DEPARTMENT, geography.COUNTRY),
+            row)
+    }
+
+
+class SocietySerializer(serializers.ModelSerializer):
+    status_name = StatusNameField()
+    country_name = GeographyField(
+        geography.COUNTRY, source="key_country_id")
+    department_code = GeographyField(
+        geography.DEPARTMENT, attr="code", source="key_department_id")
+    province_code = GeographyField(
+        geography.PROVINCE, attr="code", source="key_province_id")
+    district_code = GeographyField(
+        geography.DISTRICT, attr="code", source="key_district_id")
+    district_name = GeographyField(
+        geography.DISTRICT, source="key_district_id")
+
+    class Meta:
+        model = Society
+        fields = [
+            "id",
+            "code",
+            "name",
+            "abbreviation",
+            "key_country",
+            "key_department",
+            "key_province",
+            "key_district",
+            "country_name",
+            "department_code",
+            "province_code",
+            "district_code",
+            "district_name",
+        ] + AUDIT_FIELDS
+        read_only_fields = ["key_user_created", "key_user_updated", "status"]
+
+    def validate(self, attrs):
+        """
+        La ubicación debe ser una misma rama de la jerarquía.
+        """
+        attrs = super().validate(attrs)
+
+        def value(field):
+            return attrs.get(field) or getattr(self.instance, field, None)
+
+        district = value("key_district")
+        if district is None:
+            return attrs
+        chain = _district_chain(district)
+        for field, level in (
+                ("key_province", geography.PROVINCE),
+                ("key_department", geography.DEPARTMENT),
+                ("key_country", geography.COUNTRY)):
+            current = value(field)
+            if current is not None and chain.get(level) != str(current.pk):
+                raise serializers.ValidationError(
+                    {field: "No corresponde al distrito indicado"})
+        return attrs
@@ -0,0 +1,119 @@
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.test import TestCase
+from django.urls import reverse
+
+from config.testing import (
+    QueryBudgetTestMixin,
+    grant_permissions,
+    make_location,
+    make_user,
+)
+from config.utils import STATUS_ACTIVO
+
+from . import geography
+from .models import District
+from .serializers import SocietySerializer
+from .ubigeo import INTEGRITY_MESSAGE, integrity_message
+
+# Nombre de URL -> permiso de las vistas de BaseViewFactory
+FACTORY_VIEWS = {
+    "province-get": "general_master_province_get",
+    "district-get": "general_master_district_get",
+    "society-get": "general_master_society_get",
+    "society-select": "general_master_society_select",
+}
+
+
+class FactoryQueryBudgetTests(QueryBudgetTestMixin, TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = make_user("owner", admin=True)
+        cls.viewer = make_user("viewer")
+        for code in ("01", "02", "03"):
+            make_location(cls.owner, code)
+
+    def setUp(self):
+        grant_permissions(self, self.viewer, *FACTORY_VIEWS.values())
+        super().setUp()
+        self.client.force_login(self.viewer)
+
+    def test_factory_views(self):
+        for name in FACTORY_VIEWS:
+            with self.subTest(name):
+                self.assertIn(name, settings.QUERY_BUDGETS)
+                response = self.client.post(
+                    reverse(name), {"page": 1, "page_size": 50},
+                    content_type="application/json")
+                self.assertEqual(response.status_code, 200)
+
+
+class SocietyLocationTests(TestCase):
+    """
+    La validación de la rama geográfica no depende de que el índice en
+    memoria esté al día.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = make_user("owner", admin=True)
+        cls.base = make_location(cls.owner, "01")
+
+    def setUp(self):
+        geography.reload()
+
+    def serializer(self, location, **overrides):
+        data = {
+            "code": "99",
+            "name": "SOCIEDAD NUEVA",
+            **{
+                field: str(location[field].pk) for field in (
+                    "key_country", "key_department", "key_province",
+                    "key_district")
+            },
+            **overrides,
+        }
+        return SocietySerializer(data=data)
+
+    def test_district_missing_from_index(self):
+        # Sin on_commit el índice no se entera de la nueva rama
+        location = make_location(self.owner, "02")
+        self.assertEqual(
+            geography.ancestors(
+                geography.DISTRICT, location["key_district"].pk), [])
+        self.assertTrue(self.serializer(location).is_valid())
+        serializer = self.serializer(
+            location, key_province=str(self.base["key_province"].pk))
+        self.assertFalse(serializer.is_valid())
+        self.assertIn("key_province", serializer.errors)
+
+    def test_index_refreshed_after_a_move(self):
+        district = self.base["key_district"]
+        with self.captureOnCommitCallbacks(execute=True):
+            other = make_location(self.owner, "02")
+            district.key_province = other["key_province"]
+            district.save()
+        location = {**other, "key_district": district}
+        self.assertTrue(self.serializer(location).is_valid())
+        self.assertFalse(self.serializer(self.base).is_valid())
+
+
+class UbigeoIntegrityMessageTests(TestCase):
+    def test_known_constraint(self):
+        owner = make_user("owner", admin=True)
+        location = make_location(owner)
+        with self.assertRaises(IntegrityError) as raised:
+            with transaction.atomic():
+                District.objects.create(
+                    code="01", name="OTRO DISTRITO",
+                    key_province=location["key_province"],
+                    key_user_created=owner, key_user_updated=owner,
+                    status_id=STATUS_ACTIVO)
+        self.assertEqual(
+            integrity_message(raised.exception),
+            "Ya existe un distrito con ese código en la provincia",
+        )
+
+    def test_unknown_error_hides_details(self):
+        error = IntegrityError('duplicate key value violates "otra"')
+        self.assertEqual(integrity_message(error), INTEGRITY_MESSAGE)
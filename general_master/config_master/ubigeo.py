@@ -0,0 +1,167 @@
+"""
+Carga masiva del catálogo de ubigeos (Departamento -> Provincia -> Distrito)
+de un país.
+
+Formato INEI: columnas UBIGEO (6 dígitos DDPPdd), DEPARTAMENTO, PROVINCIA y
+DISTRITO; los códigos de departamento y provincia son los prefijos de 2 y 4
+dígitos del ubigeo. Toda la jerarquía se carga en una transacción y con
+operaciones por conjuntos: por nivel, una consulta de los registros
+existentes, bulk_create de los nuevos y bulk_update de los nombres que
+cambiaron. Los registros que ya no vienen en el archivo no se tocan.
+"""
+from django.db import transaction
+
+from audit.triggers import audit_event
+from audit.utils import EVENT_IMPORT, save_audit_logs
+from config.signals import post_import
+from config.utils import STATUS_ACTIVO, STATUS_ANULADO
+
+from .models import Department, District, Province
+
+HEADERS = ["UBIGEO", "DEPARTAMENTO", "PROVINCIA", "DISTRITO"]
+BATCH_SIZE = 1000
+
+# Restricciones únicas que puede violar una carga concurrente -> mensaje
+CONSTRAINT_MESSAGES = {
+    "unique_department_code_per_country_not_annulled":
+        "Ya existe un departamento con ese código en el país",
+    "unique_department_name_per_country_not_annulled":
+        "Ya existe un departamento con ese nombre en el país",
+    "unique_province_code_per_department_not_annulled":
+        "Ya existe una provincia con ese código en el departamento",
+    "unique_province_name_per_department_not_annulled":
+        "Ya existe una provincia con ese nombre en el departamento",
+    "unique_district_code_per_province_not_annulled":
+        "Ya existe un distrito con ese código en la provincia",
+    "unique_district_name_per_province_not_annulled":
+        "Ya existe un distrito con ese nombre en la provincia",
+}
+INTEGRITY_MESSAGE = (
+    "El catálogo entra en conflicto con registros existentes; "
+    "vuelva a intentarlo")
+
+
+class UbigeoError(ValueError):
+    def __init__(self, errors):
+        self.errors = errors
+        super().__init__("; ".join(errors[:5]))
+
+
+def integrity_message(error):
+    """
+    Mensaje para el usuario de un IntegrityError de la carga, sin el SQL
+    ni los valores que incluye el error de la base de datos.
+    """
+    diag = getattr(error.__cause__, "diag", None)
+    constraint = getattr(diag, "constraint_name", None)
+    return CONSTRAINT_MESSAGES.get(constraint, INTEGRITY_MESSAGE)
+
+
+def _clean(value):
+    if value is None:
+        return ""
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    return str(value).strip()
+
+
+def parse_rows(rows):
+    """
+    Agrupa las filas por nivel. Retorna (departamentos, provincias,
+    distritos) como {código: nombre}; lanza UbigeoError si hay filas
+    inválidas o un mismo código con nombres distintos.
+    """
+    levels = ({}, {}, {})
+    errors = []
+    for number, row in enumerate(rows, start=2):
+        ubigeo, *names = (_clean(value) for value in row[:4])
+        if not any([ubigeo, *names]):
+            continue
+        # Las celdas numéricas pierden los ceros a la izquierda
+        ubigeo = ubigeo.zfill(6)
+        names = [name.upper() for name in names]
+        if len(ubigeo) != 6 or not ubigeo.isdigit():
+            errors.append(f"Fila {number}: ubigeo '{ubigeo}' inválido")
+            continue
+        if len(names) < 3 or not all(names):
+            errors.append(f"Fila {number}: faltan nombres")
+            continue
+        for level, code, name in zip(
+                levels, (ubigeo[:2], ubigeo[:4], ubigeo), names):
+            if level.setdefault(code, name) != name:
+                errors.append(
+                    f"Fila {number}: el código {code} ya tiene el nombre "
+                    f"'{level[code]}'")
+    if errors:
+        raise UbigeoError(errors)
+    return levels
+
+
+def _sync_level(model, parent_field, wanted, parent_ids, user_id,
+                update_names):
+    """
+    wanted: {código: (código del padre, nombre)}. parent_ids: {código del
+    padre: id}. Retorna ({código: id}, creados, actualizados).
+    """
+    existing = {
+        (str(getattr(obj, parent_field)), obj.code): obj
+        for obj in model.objects.filter(
+            **{f"{parent_field}__in": set(parent_ids.values())},
+        ).exclude(status_id=STATUS_ANULADO).only(
+            "id", "code", "name", parent_field)
+    }
+
+    to_create, to_update = [], []
+    ids = {}
+    for code, (parent_code, name) in wanted.items():
+        obj = existing.get((str(parent_ids[parent_code]), code))
+        if obj is None:
+            to_create.append(model(
+                code=code,
+                name=name,
+                abbreviation=code,
+                **{parent_field: parent_ids[parent_code]},
+                key_user_created_id=user_id,
+                key_user_updated_id=user_id,
+                status_id=STATUS_ACTIVO,
+            ))
+            continue
+        ids[code] = obj.id
+        if update_names and obj.name != name:
+            obj.name = name
+            obj.key_user_updated_id = user_id
+            to_update.append(obj)
+
+    created = model.objects.bulk_create(to_create, batch_size=BATCH_SIZE)
+    if to_update:
+        model.objects.bulk_update(
+            to_update, ["name", "key_user_updated"], batch_size=BATCH_SIZE)
+
+    ids.update({obj.code: obj.id for obj in created})
+    return ids, created, to_update
+
+
+def load_ubigeo(rows, country_id, user_id, update_names=True):
+    """
+    Carga las filas (sin cabecera) en el país indicado. Retorna
+    {nivel: {"created": n, "updated": n}}.
+    """
+    departments, provinces, districts = parse_rows(rows)
+    summary = {}
+    with transaction.atomic(), audit_event(EVENT_IMPORT):
+        ids = {"": country_id}
+        for level, model, parent_field, wanted in (
+                ("departments", Department, "key_country_id",
+                 {code: ("", name) for code, name in departments.items()}),
+                ("provinces", Province, "key_department_id",
+                 {code: (code[:2], name) for code, name in provinces.items()}),
+                ("districts", District, "key_province_id",
+                 {code: (code[:4], name) for code, name in districts.items()}),
+        ):
+            ids, created, updated = _sync_level(
+                model, parent_field, wanted, ids, user_id, update_names)
+            save_audit_logs(created + updated, user_id, EVENT_IMPORT)
+            # bulk_create/bulk_update no emiten post_save
+            post_import.send(sender=model, instances=created + updated)
+            summary[level] = {"created": len(created), "updated": len(updated)}
+    return summary
@@ -7,4 +7,16 @@ urlpatterns = [
     path(
         "department/",
         include("general_master.config_master.urls.department")),
+    path(
+        "province/",
+        include("general_master.config_master.urls.province")),
+    path(
+        "district/",
+        include("general_master.config_master.urls.district")),
+    path(
+        "society/",
+        include("general_master.config_master.urls.society")),
+    path(
+        "ubigeo/",
+        include("general_master.config_master.urls.ubigeo")),
 ]
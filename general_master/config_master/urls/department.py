@@ -1,6 +1,7 @@
 from django.urls import path
 from ..views.department import (
     department_get_view,
+    department_select_view,
     department_create_view,
     department_update_view,
     department_inactivate_view,
@@ -15,6 +16,7 @@ from ..views.department import (
 
 urlpatterns = [
     path("get/", department_get_view, name="department-get"),
+    path("select/", department_select_view, name="department-select"),
     path("create/", department_create_view, name="department-create"),
     path("update/", department_update_view, name="department-update"),
     path(
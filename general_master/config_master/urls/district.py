@@ -0,0 +1,32 @@
+from django.urls import path
+from ..views.district import (
+    district_get_view,
+    district_select_view,
+    district_autocomplete_view,
+    district_create_view,
+    district_update_view,
+    district_inactivate_view,
+    district_restore_view,
+    district_annul_view,
+    district_export_view,
+    district_template_view,
+    district_import_view,
+)
+
+urlpatterns = [
+    path("get/", district_get_view, name="district-get"),
+    path("select/", district_select_view, name="district-select"),
+    path(
+        "autocomplete/",
+        district_autocomplete_view,
+        name="district-autocomplete",
+    ),
+    path("create/", district_create_view, name="district-create"),
+    path("update/", district_update_view, name="district-update"),
+    path("inactivate/", district_inactivate_view, name="district-inactivate"),
+    path("restore/", district_restore_view, name="district-restore"),
+    path("annul/", district_annul_view, name="district-annul"),
+    path("export/", district_export_view, name="district-export"),
+    path("template/", district_template_view, name="district-template"),
+    path("import/", district_import_view, name="district-import"),
+]
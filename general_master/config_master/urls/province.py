@@ -0,0 +1,26 @@
+from django.urls import path
+from ..views.province import (
+    province_get_view,
+    province_select_view,
+    province_create_view,
+    province_update_view,
+    province_inactivate_view,
+    province_restore_view,
+    province_annul_view,
+    province_export_view,
+    province_template_view,
+    province_import_view,
+)
+
+urlpatterns = [
+    path("get/", province_get_view, name="province-get"),
+    path("select/", province_select_view, name="province-select"),
+    path("create/", province_create_view, name="province-create"),
+    path("update/", province_update_view, name="province-update"),
+    path("inactivate/", province_inactivate_view, name="province-inactivate"),
+    path("restore/", province_restore_view, name="province-restore"),
+    path("annul/", province_annul_view, name="province-annul"),
+    path("export/", province_export_view, name="province-export"),
+    path("template/", province_template_view, name="province-template"),
+    path("import/", province_import_view, name="province-import"),
+]
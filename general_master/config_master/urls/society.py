@@ -0,0 +1,32 @@
+from django.urls import path
+from ..views.society import (
+    society_get_view,
+    society_select_view,
+    society_autocomplete_view,
+    society_create_view,
+    society_update_view,
+    society_inactivate_view,
+    society_restore_view,
+    society_annul_view,
+    society_export_view,
+    society_template_view,
+    society_import_view,
+)
+
+urlpatterns = [
+    path("get/", society_get_view, name="society-get"),
+    path("select/", society_select_view, name="society-select"),
+    path(
+        "autocomplete/",
+        society_autocomplete_view,
+        name="society-autocomplete",
+    ),
+    path("create/", society_create_view, name="society-create"),
+    path("update/", society_update_view, name="society-update"),
+    path("inactivate/", society_inactivate_view, name="society-inactivate"),
+    path("restore/", society_restore_view, name="society-restore"),
+    path("annul/", society_annul_view, name="society-annul"),
+    path("export/", society_export_view, name="society-export"),
+    path("template/", society_template_view, name="society-template"),
+    path("import/", society_import_view, name="society-import"),
+]
@@ -0,0 +1,7 @@
+from django.urls import path
+from ..views.ubigeo import ubigeo_template_view, ubigeo_import_view
+
+urlpatterns = [
+    path("template/", ubigeo_template_view, name="ubigeo-template"),
+    path("import/", ubigeo_import_view, name="ubigeo-import"),
+]
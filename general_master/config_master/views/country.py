@@ -5,6 +5,7 @@ from rest_framework.decorators import api_view
 from drf_spectacular.utils import extend_schema, OpenApiTypes
 
 from config.excel_handler import ExcelMasterHandler
+from config.db_router import use_replica
 from config.utils import (
     STATUS_ACTIVO,
     STATUS_ANULADO,
@@ -26,11 +27,14 @@ from audit.utils import (
     EVENT_MASS_ANNUL,
     save_audit_log,
 )
+from ..geography import COUNTRY
 from ..import_validators import validate_country_import_row
 from ..models import Country
 from ..serializers import CountrySerializer
-from audit.models import AuditLog, AuditLogDetail
-from audit.serializers import AuditLogSerializer, AuditLogDetailSerializer
+from audit.serializers import AuditLogDetailSerializer, AuditLogSerializer
+from audit.triggers import audit_event
+from audit.views import audit_detail_response, audit_history_response
+from .geography import geography_select_response
 
 
 @extend_schema(request=None, responses={200: CountrySerializer(many=True)})
@@ -70,14 +74,12 @@ def country_get_view(request):
 def country_select_view(request):
     """
     Endpoint optimizado para selectores/dropdowns.
-    Solo retorna países ACTIVOS con los campos mínimos necesarios: id y name.
+    Solo retorna países ACTIVOS con los campos mínimos (id, code, name),
+    desde el índice geográfico en memoria.
     """
-    countries = list(
-        Country.objects.filter(
-            status_id=STATUS_ACTIVO).order_by("name").values(
-            "id", "name"))
-    return succescall(
-        {"results": countries, "total": len(countries)},
+    return geography_select_response(
+        request,
+        COUNTRY,
         "Lista de países activos para selector obtenida correctamente",
     )
 
@@ -187,7 +189,7 @@ def country_inactivate_view(request):
     event_type = EVENT_MASS_INACTIVATE if is_mass else EVENT_INACTIVATE
 
     count = 0
-    with transaction.atomic():
+    with transaction.atomic(), audit_event(event_type):
         for country in countries:
             country.status_id = STATUS_INACTIVO
             country.key_user_updated_id = request.user.id
@@ -218,7 +220,7 @@ def country_restore_view(request):
     event_type = EVENT_MASS_ACTIVATE if is_mass else EVENT_RESTORE
 
     count = 0
-    with transaction.atomic():
+    with transaction.atomic(), audit_event(event_type):
         for country in countries:
             country.status_id = STATUS_ACTIVO
             country.key_user_updated_id = request.user.id
@@ -249,7 +251,7 @@ def country_annul_view(request):
     event_type = EVENT_MASS_ANNUL if is_mass else EVENT_ANNUL
 
     count = 0
-    with transaction.atomic():
+    with transaction.atomic(), audit_event(event_type):
         for country in countries:
             country.status_id = STATUS_ANULADO
             country.key_user_updated_id = request.user.id
@@ -263,35 +265,19 @@ def country_annul_view(request):
 @extend_schema(request=None, responses={200: AuditLogSerializer(many=True)})
 @MiddlewareAutentication("general_master_country_log")
 @api_view(["POST"])
+@use_replica
 def country_log_view(request):
     pk = request.data.get("id")
-    page = int(request.data.get("page", 1))
-    page_size = min(int(request.data.get("page_size", 10)), 200)
-
     if not pk:
         return errorcall("ID no proporcionado", status.HTTP_400_BAD_REQUEST)
 
-    country = Country.objects.filter(pk=pk).first()
-    if not country:
+    if not Country.objects.filter(pk=pk).exists():
         return errorcall("País no encontrado", status.HTTP_404_NOT_FOUND)
 
-    qs = AuditLog.objects.filter(
-        record_id=pk,
-        name_table=Country._meta.db_table
-    ).order_by("-created_at")
-
-    total = qs.count()
-    start = (page - 1) * page_size
-    end = start + page_size
-    serializer = AuditLogSerializer(qs[start:end], many=True)
-
-    return succescall(
-        {
-            "results": serializer.data,
-            "total": total,
-            "page": page,
-            "page_size": page_size,
-        },
+    return audit_history_response(
+        request.data,
+        Country._meta.db_table,
+        [pk],
         "Logs del país obtenidos correctamente"
     )
 
@@ -301,28 +287,19 @@ def country_log_view(request):
     responses={200: AuditLogDetailSerializer(many=True)})
 @MiddlewareAutentication("general_master_country_log_detail")
 @api_view(["POST"])
+@use_replica
 def country_log_detail_view(request):
-    pk = request.data.get("id")
-    if not pk:
-        return errorcall("ID no proporcionado", status.HTTP_400_BAD_REQUEST)
-
-    log = AuditLog.objects.filter(pk=pk).first()
-    if not log:
-        return errorcall("Log no encontrado", status.HTTP_404_NOT_FOUND)
-
-    details = AuditLogDetail.objects.filter(
-        key_audit_log=log,
-        key_audit_log__name_table=Country._meta.db_table
+    return audit_detail_response(
+        request.data.get("id"),
+        Country._meta.db_table,
+        "Detalles del log obtenidos correctamente"
     )
-    serializer = AuditLogDetailSerializer(details, many=True)
-    return succescall(
-        serializer.data,
-        "Detalles del log obtenidos correctamente")
 
 
 @extend_schema(request=None, responses={200: OpenApiTypes.STR})
 @api_view(["GET"])
 @MiddlewareAutentication("general_master_country_export")
+@use_replica
 def country_export_view(request):
     countries = Country.objects.exclude(
         status_id=STATUS_ANULADO
@@ -2,9 +2,10 @@ import copy
 from django.db import transaction
 from rest_framework import status
 from rest_framework.decorators import api_view
-from drf_spectacular.utils import extend_schema, OpenApiTypes
+from drf_spectacular.utils import extend_schema, OpenApiParameter, OpenApiTypes
 
 from config.excel_handler import ExcelMasterHandler
+from config.db_router import use_replica
 from config.utils import (
     STATUS_ACTIVO,
     STATUS_ANULADO,
@@ -26,11 +27,14 @@ from audit.utils import (
     EVENT_MASS_ANNUL,
     save_audit_log,
 )
+from .. import geography
 from ..import_validators import validate_department_import_row
 from ..models import Department
-from ..serializers import DepartmentSerializer
-from audit.models import AuditLog, AuditLogDetail
-from audit.serializers import AuditLogSerializer, AuditLogDetailSerializer
+from ..serializers import DepartmentSerializer, GeographyOptionSerializer
+from audit.serializers import AuditLogDetailSerializer, AuditLogSerializer
+from audit.triggers import audit_event
+from audit.views import audit_detail_response, audit_history_response
+from .geography import geography_select_response
 
 
 @extend_schema(request=None, responses={200: DepartmentSerializer(many=True)})
@@ -42,13 +46,15 @@ def department_get_view(request):
     page = int(request.data.get("page", 1))
     page_size = min(int(request.data.get("page_size", 10)), 200)
 
-    qs = Department.objects.exclude(status_id=STATUS_ANULADO)
+    # country_name del serializer sin una consulta por fila
+    departments = Department.objects.select_related("key_country")
+    qs = departments.exclude(status_id=STATUS_ANULADO)
     if status_filter == "activo":
-        qs = Department.objects.filter(status_id=STATUS_ACTIVO)
+        qs = departments.filter(status_id=STATUS_ACTIVO)
     elif status_filter == "inactivo":
-        qs = Department.objects.filter(status_id=STATUS_INACTIVO)
+        qs = departments.filter(status_id=STATUS_INACTIVO)
     elif status_filter == "anulado":
-        qs = Department.objects.filter(status_id=STATUS_ANULADO)
+        qs = departments.filter(status_id=STATUS_ANULADO)
 
     if country_id:
         qs = qs.filter(key_country_id=country_id)
@@ -70,6 +76,24 @@ def department_get_view(request):
     )
 
 
+@extend_schema(
+    parameters=[OpenApiParameter("country", str, required=True)],
+    responses={200: GeographyOptionSerializer(many=True)},
+)
+@MiddlewareAutentication("general_master_department_get")
+@api_view(["GET"])
+def department_select_view(request):
+    """
+    Departamentos ACTIVOS de un país para selectores en cascada.
+    """
+    return geography_select_response(
+        request,
+        geography.DEPARTMENT,
+        "Lista de departamentos activos para selector obtenida correctamente",
+        parent_param="country",
+    )
+
+
 @extend_schema(
     request=DepartmentSerializer, responses={201: DepartmentSerializer})
 @api_view(["POST"])
@@ -179,7 +203,7 @@ def department_inactivate_view(request):
             status.HTTP_404_NOT_FOUND)
 
     count = 0
-    with transaction.atomic():
+    with transaction.atomic(), audit_event(event_type):
         for dept in depts:
             dept.status_id = STATUS_INACTIVO
             dept.key_user_updated_id = request.user.id
@@ -212,7 +236,7 @@ def department_restore_view(request):
             status.HTTP_404_NOT_FOUND)
 
     count = 0
-    with transaction.atomic():
+    with transaction.atomic(), audit_event(event_type):
         for dept in depts:
             dept.status_id = STATUS_ACTIVO
             dept.key_user_updated_id = request.user.id
@@ -245,7 +269,7 @@ def department_annul_view(request):
             status.HTTP_404_NOT_FOUND)
 
     count = 0
-    with transaction.atomic():
+    with transaction.atomic(), audit_event(event_type):
         for dept in depts:
             dept.status_id = STATUS_ANULADO
             dept.key_user_updated_id = request.user.id
@@ -259,37 +283,21 @@ def department_annul_view(request):
 @extend_schema(request=None, responses={200: AuditLogSerializer(many=True)})
 @MiddlewareAutentication("general_master_department_log")
 @api_view(["POST"])
+@use_replica
 def department_log_view(request):
     pk = request.data.get("id")
-    page = int(request.data.get("page", 1))
-    page_size = min(int(request.data.get("page_size", 10)), 200)
-
     if not pk:
         return errorcall("ID no proporcionado", status.HTTP_400_BAD_REQUEST)
 
-    dept = Department.objects.filter(pk=pk).first()
-    if not dept:
+    if not Department.objects.filter(pk=pk).exists():
         return errorcall(
             "Departamento no encontrado",
             status.HTTP_404_NOT_FOUND)
 
-    qs = AuditLog.objects.filter(
-        record_id=pk,
-        name_table=Department._meta.db_table
-    ).order_by("-created_at")
-
-    total = qs.count()
-    start = (page - 1) * page_size
-    end = start + page_size
-    serializer = AuditLogSerializer(qs[start:end], many=True)
-
-    return succescall(
-        {
-            "results": serializer.data,
-            "total": total,
-            "page": page,
-            "page_size": page_size,
-        },
+    return audit_history_response(
+        request.data,
+        Department._meta.db_table,
+        [pk],
         "Logs del departamento obtenidos correctamente"
     )
 
@@ -299,28 +307,19 @@ def department_log_view(request):
     responses={200: AuditLogDetailSerializer(many=True)})
 @api_view(["POST"])
 @MiddlewareAutentication("general_master_department_log_detail")
+@use_replica
 def department_log_detail_view(request):
-    pk = request.data.get("id")
-    if not pk:
-        return errorcall("ID no proporcionado", status.HTTP_400_BAD_REQUEST)
-
-    log = AuditLog.objects.filter(pk=pk).first()
-    if not log:
-        return errorcall("Log no encontrado", status.HTTP_404_NOT_FOUND)
-
-    details = AuditLogDetail.objects.filter(
-        key_audit_log=log,
-        key_audit_log__name_table=Department._meta.db_table
+    return audit_detail_response(
+        request.data.get("id"),
+        Department._meta.db_table,
+        "Detalles del log obtenidos correctamente"
     )
-    serializer = AuditLogDetailSerializer(details, many=True)
-    return succescall(
-        serializer.data,
-        "Detalles del log obtenidos correctamente")
 
 
 @extend_schema(request=None, responses={200: OpenApiTypes.STR})
 @api_view(["GET"])
 @MiddlewareAutentication("general_master_department_export")
+@use_replica
 def department_export_view(request):
     depts = Department.objects.exclude(
         status_id=STATUS_ANULADO).order_by(
@@ -374,6 +373,9 @@ def department_import_view(request):
     def _audit_import(instance):
         save_audit_log(instance, request.user.id, EVENT_IMPORT)
 
+    # Las validaciones leen el índice geográfico: traer cambios de otros
+    # procesos antes de empezar
+    geography.refresh()
     return handler.import_data(
         request,
         validate_department_import_row,
@@ -0,0 +1,80 @@
+from rest_framework.decorators import api_view
+from drf_spectacular.utils import extend_schema, OpenApiParameter
+
+from config.base_views import BaseViewFactory
+from config.utils import (
+    STATUS_ACTIVO,
+    STATUS_ANULADO,
+    STATUS_INACTIVO,
+    MiddlewareAutentication,
+)
+from audit.utils import EVENT_ANNUL, EVENT_INACTIVATE, EVENT_RESTORE
+
+from ..geography import DISTRICT
+from ..import_validators import district_import_validator
+from ..models import District
+from ..serializers import DistrictSerializer, GeographyOptionSerializer
+from .geography import geography_select_response
+
+HEADERS = [
+    "CÓDIGO",
+    "NOMBRE",
+    "ABREVIACIÓN",
+    "PAÍS",
+    "DEPARTAMENTO",
+    "PROVINCIA",
+    "ESTADO",
+]
+
+factory = BaseViewFactory(
+    District, DistrictSerializer, "distritos", "general_master_district")
+
+district_get_view = factory.get_view(filters=["key_province"])
+district_autocomplete_view = factory.autocomplete_view(
+    filters=["key_province"])
+district_create_view = factory.create_view(
+    unique_fields=["code", "key_province"])
+district_update_view = factory.update_view(
+    unique_fields=["code", "key_province"])
+district_inactivate_view = factory.status_change_view(
+    STATUS_INACTIVO, EVENT_INACTIVATE)
+district_restore_view = factory.status_change_view(
+    STATUS_ACTIVO, EVENT_RESTORE)
+district_annul_view = factory.status_change_view(STATUS_ANULADO, EVENT_ANNUL)
+district_export_view = factory.export_view(
+    {
+        "code": "CÓDIGO",
+        "name": "NOMBRE",
+        "abbreviation": "ABREVIACIÓN",
+        "country_name": "PAÍS",
+        "department_code": "DEPARTAMENTO",
+        "province_code": "PROVINCIA",
+        "status_name": "ESTADO",
+    },
+    "distritos",
+)
+district_template_view = factory.template_view(HEADERS, "distritos")
+district_import_view = factory.import_view(
+    HEADERS,
+    {"CÓDIGO": "code", "NOMBRE": "name", "ABREVIACIÓN": "abbreviation"},
+    "distritos",
+    district_import_validator,
+)
+
+
+@extend_schema(
+    parameters=[OpenApiParameter("province", str, required=True)],
+    responses={200: GeographyOptionSerializer(many=True)},
+)
+@MiddlewareAutentication("general_master_district_get")
+@api_view(["GET"])
+def district_select_view(request):
+    """
+    Distritos ACTIVOS de una provincia para selectores en cascada.
+    """
+    return geography_select_response(
+        request,
+        DISTRICT,
+        "Lista de distritos activos para selector obtenida correctamente",
+        parent_param="province",
+    )
@@ -0,0 +1,31 @@
+from rest_framework import status
+from rest_framework.response import Response
+
+from config.utils import errorcall, succescall
+
+from .. import geography
+
+
+def geography_select_response(request, level, message, parent_param=None):
+    """
+    Respuesta de los selects en cascada desde el índice geográfico (sin
+    consultas). Con If-None-Match igual al ETag del índice responde 304.
+    """
+    parent_id = None
+    if parent_param:
+        parent_id = request.query_params.get(parent_param)
+        if not parent_id:
+            return errorcall(
+                f"El parámetro '{parent_param}' es obligatorio",
+                status.HTTP_400_BAD_REQUEST,
+            )
+
+    etag = geography.index_etag()
+    if request.headers.get("If-None-Match") == etag:
+        response = Response(status=status.HTTP_304_NOT_MODIFIED)
+    else:
+        results = geography.options(level, parent_id)
+        response = succescall(
+            {"results": list(results), "total": len(results)}, message)
+    response["ETag"] = etag
+    return response
@@ -0,0 +1,76 @@
+from rest_framework.decorators import api_view
+from drf_spectacular.utils import extend_schema, OpenApiParameter
+
+from config.base_views import BaseViewFactory
+from config.utils import (
+    STATUS_ACTIVO,
+    STATUS_ANULADO,
+    STATUS_INACTIVO,
+    MiddlewareAutentication,
+)
+from audit.utils import EVENT_ANNUL, EVENT_INACTIVATE, EVENT_RESTORE
+
+from ..geography import PROVINCE
+from ..import_validators import province_import_validator
+from ..models import Province
+from ..serializers import GeographyOptionSerializer, ProvinceSerializer
+from .geography import geography_select_response
+
+HEADERS = [
+    "CÓDIGO",
+    "NOMBRE",
+    "ABREVIACIÓN",
+    "PAÍS",
+    "DEPARTAMENTO",
+    "ESTADO",
+]
+
+factory = BaseViewFactory(
+    Province, ProvinceSerializer, "provincias", "general_master_province")
+
+province_get_view = factory.get_view(filters=["key_department"])
+province_create_view = factory.create_view(
+    unique_fields=["code", "key_department"])
+province_update_view = factory.update_view(
+    unique_fields=["code", "key_department"])
+province_inactivate_view = factory.status_change_view(
+    STATUS_INACTIVO, EVENT_INACTIVATE)
+province_restore_view = factory.status_change_view(
+    STATUS_ACTIVO, EVENT_RESTORE)
+province_annul_view = factory.status_change_view(STATUS_ANULADO, EVENT_ANNUL)
+province_export_view = factory.export_view(
+    {
+        "code": "CÓDIGO",
+        "name": "NOMBRE",
+        "abbreviation": "ABREVIACIÓN",
+        "country_name": "PAÍS",
+        "department_code": "DEPARTAMENTO",
+        "status_name": "ESTADO",
+    },
+    "provincias",
+)
+province_template_view = factory.template_view(HEADERS, "provincias")
+province_import_view = factory.import_view(
+    HEADERS,
+    {"CÓDIGO": "code", "NOMBRE": "name", "ABREVIACIÓN": "abbreviation"},
+    "provincias",
+    province_import_validator,
+)
+
+
+@extend_schema(
+    parameters=[OpenApiParameter("department", str, required=True)],
+    responses={200: GeographyOptionSerializer(many=True)},
+)
+@MiddlewareAutentication("general_master_province_get")
+@api_view(["GET"])
+def province_select_view(request):
+    """
+    Provincias ACTIVAS de un departamento para selectores en cascada.
+    """
+    return geography_select_response(
+        request,
+        PROVINCE,
+        "Lista de provincias activas para selector obtenida correctamente",
+        parent_param="department",
+    )
@@ -0,0 +1,53 @@
+from config.base_views import BaseViewFactory
+from config.utils import STATUS_ACTIVO, STATUS_ANULADO, STATUS_INACTIVO
+from audit.utils import EVENT_ANNUL, EVENT_INACTIVATE, EVENT_RESTORE
+
+from ..import_validators import society_import_validator
+from ..models import Society
+from ..serializers import SocietySerializer
+
+HEADERS = [
+    "CÓDIGO",
+    "NOMBRE",
+    "ABREVIACIÓN",
+    "PAÍS",
+    "DEPARTAMENTO",
+    "PROVINCIA",
+    "DISTRITO",
+    "ESTADO",
+]
+
+factory = BaseViewFactory(
+    Society, SocietySerializer, "sociedades", "general_master_society")
+
+society_get_view = factory.get_view(filters=["key_district"])
+society_select_view = factory.select_view()
+society_autocomplete_view = factory.autocomplete_view(
+    filters=["key_district"])
+society_create_view = factory.create_view(unique_fields=["code"])
+society_update_view = factory.update_view(unique_fields=["code"])
+society_inactivate_view = factory.status_change_view(
+    STATUS_INACTIVO, EVENT_INACTIVATE)
+society_restore_view = factory.status_change_view(
+    STATUS_ACTIVO, EVENT_RESTORE)
+society_annul_view = factory.status_change_view(STATUS_ANULADO, EVENT_ANNUL)
+society_export_view = factory.export_view(
+    {
+        "code": "CÓDIGO",
+        "name": "NOMBRE",
+        "abbreviation": "ABREVIACIÓN",
+        "country_name": "PAÍS",
+        "department_code": "DEPARTAMENTO",
+        "province_code": "PROVINCIA",
+        "district_code": "DISTRITO",
+        "status_name": "ESTADO",
+    },
+    "sociedades",
+)
+society_template_view = factory.template_view(HEADERS, "sociedades")
+society_import_view = factory.import_view(
+    HEADERS,
+    {"CÓDIGO": "code", "NOMBRE": "name", "ABREVIACIÓN": "abbreviation"},
+    "sociedades",
+    society_import_validator,
+)
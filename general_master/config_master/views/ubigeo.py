@@ -0,0 +1,96 @@
+import logging
+
+from django.db import IntegrityError
+from rest_framework import status
+from rest_framework.decorators import api_view
+from drf_spectacular.utils import extend_schema, OpenApiTypes
+
+from config.excel_handler import ExcelMasterHandler
+from config.utils import MiddlewareAutentication, errorcall, succescall
+
+from .. import geography
+from ..models import District
+from ..ubigeo import (
+    HEADERS,
+    UbigeoError,
+    integrity_message,
+    load_ubigeo,
+    parse_rows,
+)
+
+logger = logging.getLogger("meteorite.ubigeo")
+
+
+@extend_schema(request=None, responses={200: OpenApiTypes.BINARY})
+@MiddlewareAutentication("general_master_ubigeo_template")
+@api_view(["GET"])
+def ubigeo_template_view(request):
+    handler = ExcelMasterHandler(District, HEADERS, "ubigeo", request.user.id)
+    return handler.generate_template()
+
+
+@extend_schema(request=None, responses={200: OpenApiTypes.OBJECT})
+@MiddlewareAutentication("general_master_ubigeo_import")
+@api_view(["POST"])
+def ubigeo_import_view(request):
+    """
+    Carga Departamentos, Provincias y Distritos de un país desde un Excel
+    con formato INEI (UBIGEO, DEPARTAMENTO, PROVINCIA, DISTRITO).
+    """
+    handler = ExcelMasterHandler(District, HEADERS, "ubigeo", request.user.id)
+    file = request.FILES.get("file")
+    dry_run = request.data.get("dry_run", "false").lower() == "true"
+    update_names = request.data.get(
+        "update_names", "true").lower() == "true"
+
+    country = geography.get(geography.COUNTRY, request.data.get("country"))
+    if country is None or not country.is_active:
+        return errorcall(
+            "El país no existe o no está activo",
+            status.HTTP_400_BAD_REQUEST,
+        )
+
+    error = handler.check_file(file)
+    if error:
+        return error
+    try:
+        rows, error = handler.read_rows(file)
+    except Exception as e:
+        return errorcall(
+            f"Error al leer el archivo: {str(e)}",
+            status.HTTP_400_BAD_REQUEST,
+        )
+    if error:
+        return error
+
+    # Columnas en el orden de HEADERS, sin importar el orden del archivo
+    header_row = [str(h).strip() if h else "" for h in rows[0]]
+    indexes = [header_row.index(h) for h in HEADERS]
+    data = [
+        [row[i] if i < len(row) else None for i in indexes]
+        for row in rows[1:]
+    ]
+
+    try:
+        if dry_run:
+            departments, provinces, districts = parse_rows(data)
+            return succescall(
+                {
+                    "departments": len(departments),
+                    "provinces": len(provinces),
+                    "districts": len(districts),
+                },
+                "Validación completada",
+            )
+        summary = load_ubigeo(
+            data, country.id, request.user.id, update_names=update_names)
+    except UbigeoError as e:
+        return errorcall(
+            "El archivo contiene filas inválidas",
+            status.HTTP_400_BAD_REQUEST,
+            e.errors,
+        )
+    except IntegrityError as e:
+        logger.warning("Carga de ubigeos rechazada: %s", e)
+        return errorcall(integrity_message(e), status.HTTP_400_BAD_REQUEST)
+    return succescall(summary, "Catálogo de ubigeos cargado correctamente")
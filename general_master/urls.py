@@ -2,4 +2,5 @@ from django.urls import path, include
 
 urlpatterns = [
     path("", include("general_master.config_master.urls")),
+    path("agricultural/", include("general_master.agricultural.urls")),
 ]
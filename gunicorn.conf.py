@@ -0,0 +1,128 @@
+"""
+Configuración de gunicorn para el modo multiproceso (SERVE_MODE=gunicorn).
+
+Workers ASGI (uvicorn) para HTTP y websockets; el channel layer en Redis
+reparte los eventos entre procesos. El número de workers se calcula con
+los CPU y la memoria disponibles para el contenedor (cgroup), salvo que se
+fije WEB_CONCURRENCY.
+
+Con preload_app la aplicación se importa y precalienta una vez en el
+proceso maestro (config/warmup.py) y los workers la heredan con fork.
+Recarga sin cortes:
+  - kill -HUP <master>: recrea los workers de forma gradual (misma versión
+    de código, al estar precargada).
+  - kill -USR2 <master> y luego -TERM al maestro anterior: arranca un
+    maestro nuevo con el código actualizado (ver serve.sh reload).
+"""
+import os
+import shutil
+
+# ---------------------------------------------------------
+# DIMENSIONAMIENTO
+# ---------------------------------------------------------
+WORKER_MEMORY_MB = int(os.getenv("GUNICORN_WORKER_MEMORY_MB", "256"))
+MAX_WORKERS = int(os.getenv("GUNICORN_MAX_WORKERS", "8"))
+
+
+def _read_int(path):
+    try:
+        with open(path) as f:
+            value = f.read().split()[0]
+        return None if value == "max" else int(value)
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def cpu_limit():
+    """
+    CPU disponibles: afinidad del proceso y cuota del cgroup.
+    """
+    cpus = len(os.sched_getaffinity(0))
+    try:
+        with open("/sys/fs/cgroup/cpu.max") as f:
+            quota, period = f.read().split()
+        if quota != "max":
+            cpus = min(cpus, max(int(int(quota) / int(period)), 1))
+    except (OSError, ValueError):
+        quota = _read_int("/sys/fs/cgroup/cpu/cpu.cfs_quota_us")
+        period = _read_int("/sys/fs/cgroup/cpu/cpu.cfs_period_us")
+        if quota and quota > 0 and period:
+            cpus = min(cpus, max(quota // period, 1))
+    return cpus
+
+
+def memory_limit_mb():
+    """
+    Memoria disponible: límite del cgroup (v2 o v1) o memoria física.
+    """
+    limit = _read_int("/sys/fs/cgroup/memory.max") or _read_int(
+        "/sys/fs/cgroup/memory/memory.limit_in_bytes")
+    physical = os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES")
+    if not limit or limit > physical:
+        limit = physical
+    return limit // (1024 * 1024)
+
+
+def worker_count():
+    if os.getenv("WEB_CONCURRENCY"):
+        return max(int(os.environ["WEB_CONCURRENCY"]), 1)
+    # Workers async: uno por CPU, sin superar la memoria disponible
+    by_memory = memory_limit_mb() // WORKER_MEMORY_MB
+    return max(min(cpu_limit(), by_memory, MAX_WORKERS), 1)
+
+
+# ---------------------------------------------------------
+# MÉTRICAS MULTIPROCESO
+# ---------------------------------------------------------
+# Debe definirse antes de importar la aplicación (prometheus_client lo lee
+# al crear las métricas) y vaciarse en cada arranque en frío. Tras USR2 el
+# maestro nuevo hereda los sockets (GUNICORN_FD) y los workers del anterior
+# siguen escribiendo en el directorio: no se vacía.
+os.environ.setdefault(
+    "PROMETHEUS_MULTIPROC_DIR", "/tmp/meteorite-prometheus")  # nosec B108
+if "GUNICORN_FD" not in os.environ:
+    shutil.rmtree(os.environ["PROMETHEUS_MULTIPROC_DIR"], ignore_errors=True)
+os.makedirs(os.environ["PROMETHEUS_MULTIPROC_DIR"], exist_ok=True)
+
+# ---------------------------------------------------------
+# SERVIDOR
+# ---------------------------------------------------------
+bind = f"0.0.0.0:{os.getenv('PORT', '10000')}"
+worker_class = "meteorite_backend.workers.UvicornWorker"
+workers = worker_count()
+preload_app = os.getenv("GUNICORN_PRELOAD", "True") == "True"
+
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "60"))
+graceful_timeout = int(os.getenv("GUNICORN_GRACEFUL_TIMEOUT", "30"))
+keepalive = 5
+# Reciclar workers periódicamente acota fugas de memoria
+max_requests = int(os.getenv("GUNICORN_MAX_REQUESTS", "2000"))
+max_requests_jitter = max_requests // 10
+forwarded_allow_ips = os.getenv("FORWARDED_ALLOW_IPS", "*")
+accesslog = os.getenv("GUNICORN_ACCESS_LOG") or None
+errorlog = "-"
+
+
+def on_starting(server):
+    server.log.info(
+        "Workers: %s (CPU %s, memoria %s MB)",
+        workers, cpu_limit(), memory_limit_mb())
+    if preload_app:
+        from config.warmup import warmup
+
+        for name, (value, seconds) in warmup().items():
+            server.log.info("Warmup %s: %s (%ss)", name, value, seconds)
+
+
+def pre_fork(server, worker):
+    # Ninguna conexión del maestro debe heredarse
+    if preload_app:
+        from config.warmup import release_connections
+
+        release_connections()
+
+
+def child_exit(server, worker):
+    from prometheus_client import multiprocess
+
+    multiprocess.mark_process_dead(worker.pid)
@@ -11,8 +11,6 @@ https://docs.djangoproject.com/en/6.0/ref/settings/
 """
 
 import os
-import sentry_sdk
-from sentry_sdk.integrations.django import DjangoIntegration
 from pathlib import Path
 from dotenv import load_dotenv
 
@@ -54,13 +52,14 @@ if DEBUG or IS_LOCAL or "*" in ALLOWED_HOSTS or not os.getenv("RENDER"):
 # Application definition
 
 INSTALLED_APPS = [
-    "daphne",
     "django.contrib.admin",
     "django.contrib.auth",
     "django.contrib.contenttypes",
     "django.contrib.sessions",
     "django.contrib.messages",
     "django.contrib.staticfiles",
+    # OpClass en los índices de autocompletado (config/search.py)
+    "django.contrib.postgres",
     # Mis aplicaciones
     "auth.apps.AuthConfig",
     "config.apps.ConfigConfig",
@@ -74,13 +73,23 @@ INSTALLED_APPS = [
     "drf_spectacular",
 ]
 
+# daphne solo hace falta para su runserver; con gunicorn (SERVE_MODE) se omite
+# porque importa twisted en cada arranque de worker.
+SERVE_MODE = os.getenv("SERVE_MODE", "daphne")
+if SERVE_MODE != "gunicorn":
+    INSTALLED_APPS.insert(0, "daphne")
+
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
+    "config.middleware.MetricsMiddleware",
+    "config.middleware.QueryInstrumentationMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "corsheaders.middleware.CorsMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
+    "audit.middleware.AuditUserMiddleware",
+    "config.middleware.ReplicaStickinessMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
 ]
@@ -176,6 +185,54 @@ else:
         }
     }
 
+# Pool de conexiones (psycopg3). Cada proceso mantiene entre
+# DB_POOL_MIN_SIZE y DB_POOL_MAX_SIZE conexiones abiertas y las valida antes
+# de entregarlas (CONN_HEALTH_CHECKS). Django exige CONN_MAX_AGE = 0 con el
+# pool activo. Con DB_POOL_ENABLED=False se usan conexiones persistentes
+# por hilo.
+DB_POOL_ENABLED = os.getenv("DB_POOL_ENABLED", "True") == "True"
+DATABASES["default"]["CONN_HEALTH_CHECKS"] = True
+
+if DB_POOL_ENABLED:
+    DATABASES["default"]["OPTIONS"] = {
+        "pool": {
+            "min_size": int(os.getenv("DB_POOL_MIN_SIZE", "2")),
+            "max_size": int(os.getenv("DB_POOL_MAX_SIZE", "10")),
+            # Segundos de espera por una conexión libre antes de fallar
+            "timeout": float(os.getenv("DB_POOL_TIMEOUT", "10")),
+            # Cierra conexiones ociosas por encima de min_size
+            "max_idle": float(os.getenv("DB_POOL_MAX_IDLE", "300")),
+        }
+    }
+else:
+    DATABASES["default"]["CONN_MAX_AGE"] = int(
+        os.getenv("DB_CONN_MAX_AGE", "60"))
+
+# Réplica de lectura (ver config/db_router.py). Solo se define con
+# POSTGRES_REPLICA_HOST o POSTGRES_REPLICA_DB; sin ellos todas las lecturas
+# van a default y no se abre un segundo pool contra la primaria. En los
+# tests la réplica es una base propia (TEST.NAME) que se migra aparte.
+if os.getenv("POSTGRES_REPLICA_HOST") or os.getenv("POSTGRES_REPLICA_DB"):
+    _replica_name = os.getenv(
+        "POSTGRES_REPLICA_DB", DATABASES["default"]["NAME"])
+    DATABASES["replica"] = {
+        **DATABASES["default"],
+        "OPTIONS": dict(DATABASES["default"].get("OPTIONS", {})),
+        "NAME": _replica_name,
+        "USER": os.getenv(
+            "POSTGRES_REPLICA_USER", DATABASES["default"]["USER"]),
+        "PASSWORD": os.getenv(
+            "POSTGRES_REPLICA_PASSWORD", DATABASES["default"]["PASSWORD"]),
+        "HOST": os.getenv(
+            "POSTGRES_REPLICA_HOST", DATABASES["default"]["HOST"]),
+        "PORT": os.getenv(
+            "POSTGRES_REPLICA_PORT", DATABASES["default"]["PORT"]),
+        "TEST": {"NAME": f"test_{_replica_name}_replica"},
+    }
+DATABASE_ROUTERS = ["config.db_router.PrimaryReplicaRouter"]
+# Segundos que un cliente lee de default después de escribir
+REPLICA_STICKY_SECONDS = int(os.getenv("REPLICA_STICKY_SECONDS", "15"))
+
 
 # Password validation
 # https://docs.djangoproject.com/en/6.0/ref/settings/#auth-password-validators
@@ -269,8 +326,8 @@ REST_FRAMEWORK = {
         "rest_framework.authentication.SessionAuthentication",
     ),
     "DEFAULT_THROTTLE_CLASSES": [
-        "rest_framework.throttling.AnonRateThrottle",
-        "rest_framework.throttling.UserRateThrottle",
+        "config.throttling.AnonRateThrottle",
+        "config.throttling.UserRateThrottle",
     ],
     "DEFAULT_THROTTLE_RATES": {
         "anon": os.getenv("THROTTLE_RATE_ANON", "100/day"),
@@ -282,15 +339,42 @@ REST_FRAMEWORK = {
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
 }
 
+REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+
 CHANNEL_LAYERS = {
     "default": {
         "BACKEND": "channels_redis.core.RedisChannelLayer",
         "CONFIG": {
-            "hosts": [os.getenv("REDIS_URL", "redis://localhost:6379/0")],
+            "hosts": [REDIS_URL],
         },
     },
 }
 
+# Cache compartida entre procesos (throttling y caches de aplicación, ver
+# config/cache.py). Por defecto Redis si REDIS_URL está definido; con
+# CACHE_BACKEND=locmem la cache es por proceso (solo desarrollo).
+CACHE_BACKEND = os.getenv(
+    "CACHE_BACKEND", "redis" if os.getenv("REDIS_URL") else "locmem")
+if CACHE_BACKEND == "redis":
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": os.getenv("REDIS_CACHE_URL", REDIS_URL),
+            "KEY_PREFIX": os.getenv("CACHE_KEY_PREFIX", "meteorite"),
+            "TIMEOUT": 300,
+            "OPTIONS": {
+                "socket_connect_timeout": 1,
+                "socket_timeout": 1,
+            },
+        },
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        },
+    }
+
 SPECTACULAR_SETTINGS = {
     "TITLE": "Meteorito API",
     "DESCRIPTION": "API para el sistema Meteorito / Yachay Agro",
@@ -298,21 +382,165 @@ SPECTACULAR_SETTINGS = {
     "SERVE_INCLUDE_SCHEMA": False,
 }
 
+# Esquema precalculado en el build (manage.py build_openapi_schema); sin él
+# /api/schema/ lo genera en cada petición (config/openapi.py)
+OPENAPI_SCHEMA_DIR = os.getenv(
+    "OPENAPI_SCHEMA_DIR", os.path.join(BASE_DIR, "openapi"))
+OPENAPI_SCHEMA_MAX_AGE = int(os.getenv("OPENAPI_SCHEMA_MAX_AGE", "86400"))
+
 # Inicialización de Sentry
 SENTRY_DSN = os.getenv("SENTRY_DSN")
 if SENTRY_DSN:
+    # Importado solo si se usa: sentry_sdk suma tiempo a cada arranque
+    import sentry_sdk
+    from sentry_sdk.integrations.django import DjangoIntegration
+
+    from meteorite_backend.tracing import (
+        before_send_transaction,
+        traces_sampler,
+    )
+
+    # Muestreo por ruta y por latencia (ver meteorite_backend/tracing.py)
     sentry_sdk.init(
         dsn=SENTRY_DSN,
         integrations=[DjangoIntegration()],
-        traces_sample_rate=1.0,
+        traces_sampler=traces_sampler,
+        before_send_transaction=before_send_transaction,
         send_default_pii=True,
     )
 
+# Instrumentación de consultas por petición (config/querycount.py).
+# QUERY_SERVER_TIMING expone consultas y tiempo de BD en Server-Timing.
+# QUERY_BUDGET_STRICT hace fallar las peticiones que superan su presupuesto
+# (se activa en los tests con QueryBudgetTestMixin).
+QUERY_INSTRUMENTATION_ENABLED = os.getenv(
+    "QUERY_INSTRUMENTATION_ENABLED", "True") == "True"
+QUERY_SERVER_TIMING = os.getenv(
+    "QUERY_SERVER_TIMING", str(DEBUG)) == "True"
+QUERY_BUDGET_STRICT = os.getenv("QUERY_BUDGET_STRICT", "False") == "True"
+# Una misma consulta repetida tantas veces se registra como warning (N+1)
+QUERY_DUPLICATE_WARNING = int(os.getenv("QUERY_DUPLICATE_WARNING", "10"))
+# Presupuestos por nombre de URL. Cuentan sesión, usuario, permiso de
+# MiddlewareAutentication, COUNT + página (get) o lista (select) y el
+# guardado de la sesión (con SAVEPOINT dentro de los tests). Sin consultas
+# repetidas: una por fila delata un N+1.
+QUERY_LIST_BUDGET = {"max_queries": 8, "max_duplicates": 1}
+QUERY_SELECT_BUDGET = {"max_queries": 7, "max_duplicates": 1}
+QUERY_BUDGETS = {
+    **{
+        f"{name}-get": QUERY_LIST_BUDGET
+        for name in (
+            "action", "event", "system", "role", "group", "permission",
+            "menu", "user-role", "permission-role", "permission-system",
+            "role-menu", "province", "district", "society", "crop", "farm",
+        )
+    },
+    **{
+        f"{name}-select": QUERY_SELECT_BUDGET
+        for name in (
+            "action", "event", "system", "role", "group", "permission",
+            "menu", "society", "crop", "farm",
+        )
+    },
+    # + nombres de usuario (user_id no es FK)
+    "user-group-get": {"max_queries": 9, "max_duplicates": 1},
+    "user-group-role-get": {"max_queries": 9, "max_duplicates": 1},
+    # + permisos efectivos, roles y menús
+    "session": {"max_queries": 9, "max_duplicates": 1},
+}
+
+# Métricas Prometheus en /metrics (config/metrics.py). Con varios workers
+# definir PROMETHEUS_MULTIPROC_DIR (directorio vacío al arrancar).
+# METRICS_TOKEN protege el endpoint con "Authorization: Bearer <token>";
+# sin él /metrics responde 404 salvo con DEBUG.
+METRICS_TOKEN = os.getenv("METRICS_TOKEN", "")
+
+LOGGING = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "handlers": {
+        "console": {"class": "logging.StreamHandler"},
+    },
+    "loggers": {
+        "meteorite": {
+            "handlers": ["console"],
+            "level": os.getenv("METEORITE_LOG_LEVEL", "WARNING"),
+        },
+    },
+}
+
+# Variantes async de las vistas de lectura de BaseViewFactory y de
+# sesión/logout (config/async_views.py). Útil bajo ASGI (daphne/uvicorn).
+ASYNC_VIEWS_ENABLED = os.getenv("ASYNC_VIEWS_ENABLED", "False") == "True"
+
+# Cada cuántos segundos un proceso comprueba si otro modificó el catálogo
+# de estados (config/status_registry.py)
+STATUS_REGISTRY_CHECK_SECONDS = int(
+    os.getenv("STATUS_REGISTRY_CHECK_SECONDS", "30"))
+# Ídem para el índice de permisos (access/permission_index.py)
+PERMISSION_INDEX_CHECK_SECONDS = int(
+    os.getenv("PERMISSION_INDEX_CHECK_SECONDS", "30"))
+# Mínimo entre comprobaciones del índice de permisos ante un nombre
+# desconocido
+PERMISSION_INDEX_RECHECK_SECONDS = int(
+    os.getenv("PERMISSION_INDEX_RECHECK_SECONDS", "5"))
+# Ídem para el índice geográfico (general_master/config_master/geography.py)
+GEOGRAPHY_CHECK_SECONDS = int(os.getenv("GEOGRAPHY_CHECK_SECONDS", "30"))
+
+# Claves primarias UUIDv7 ordenadas por tiempo para las filas nuevas de
+# BaseModel y auditoría (config/ids.py); sin la opción, uuid4
+UUID_V7_ENABLED = os.getenv("UUID_V7_ENABLED", "False") == "True"
+# La misma opción para los ids que generan los triggers de auditoría
+# (meteorite_new_id): parámetro de sesión fijado una vez por conexión física
+# con las opciones de arranque de libpq (SQL_ID_SETTING en config/ids.py)
+for _database in DATABASES.values():
+    _database.setdefault("OPTIONS", {})["options"] = (
+        f"-c meteorite.uuid_v7={'on' if UUID_V7_ENABLED else 'off'}")
+
+# Autocompletado de maestros (config/search.py): longitud mínima del
+# término, límites de resultados y prefijos de hasta
+# AUTOCOMPLETE_CACHE_PREFIX_LENGTH caracteres cacheados por
+# AUTOCOMPLETE_CACHE_SECONDS
+AUTOCOMPLETE_MIN_LENGTH = int(os.getenv("AUTOCOMPLETE_MIN_LENGTH", "1"))
+AUTOCOMPLETE_DEFAULT_LIMIT = int(os.getenv("AUTOCOMPLETE_DEFAULT_LIMIT", "10"))
+AUTOCOMPLETE_MAX_LIMIT = int(os.getenv("AUTOCOMPLETE_MAX_LIMIT", "50"))
+AUTOCOMPLETE_CACHE_PREFIX_LENGTH = int(
+    os.getenv("AUTOCOMPLETE_CACHE_PREFIX_LENGTH", "3"))
+AUTOCOMPLETE_CACHE_SECONDS = int(
+    os.getenv("AUTOCOMPLETE_CACHE_SECONDS", "300"))
+# Búsqueda también en medio del texto con índices trigram (extensión
+# pg_trgm; se instalan tras cada migrate o con el comando
+# autocomplete_trigram)
+AUTOCOMPLETE_TRIGRAM_ENABLED = (
+    os.getenv("AUTOCOMPLETE_TRIGRAM_ENABLED", "False") == "True")
+
+# Presupuesto de importación del arranque de un worker (manage.py
+# importtime --check en make ci, 0 = sin límite; ~420-460 ms medidos con
+# SERVE_MODE=gunicorn) y módulos que no deben importarse al arrancar
+# (también en config/tests.py).
+STARTUP_IMPORT_BUDGET_MS = float(
+    os.getenv("STARTUP_IMPORT_BUDGET_MS", "600"))
+STARTUP_LAZY_MODULES = ["openpyxl", "sentry_sdk"]
+
 # Tamaño máximo permitido para imports de Excel (en bytes). Default: 5 MB.
 MAX_EXCEL_UPLOAD_SIZE = int(
     os.getenv(
         "MAX_EXCEL_UPLOAD_SIZE", str(
             5 * 1024 * 1024)))
+
+# Particionado mensual de auditoría (comando audit_partitions).
+# Las particiones con más de AUDIT_RETENTION_MONTHS meses se exportan a
+# AUDIT_ARCHIVE_DIR como .csv.gz y se eliminan (0 = sin archivado).
+AUDIT_PARTITIONS_AHEAD = int(os.getenv("AUDIT_PARTITIONS_AHEAD", "3"))
+AUDIT_RETENTION_MONTHS = int(os.getenv("AUDIT_RETENTION_MONTHS", "12"))
+AUDIT_ARCHIVE_DIR = os.getenv(
+    "AUDIT_ARCHIVE_DIR", os.path.join(BASE_DIR, "audit_archive"))
+
+# Captura de auditoría: "python" (save_audit_log desde las vistas) o
+# "trigger" (triggers de PostgreSQL con diff completo OLD/NEW; se instalan
+# tras cada migrate o con el comando audit_triggers).
+AUDIT_CAPTURE_MODE = os.getenv("AUDIT_CAPTURE_MODE", "python").strip().lower()
+
 # Configuración de Email (SMTP)
 EMAIL_BACKEND = "django.core.mail.backends.smtp.EmailBackend"
 EMAIL_HOST = os.getenv("EMAIL_HOST", "smtp.gmail.com")
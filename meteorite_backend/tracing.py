@@ -0,0 +1,120 @@
+"""
+Política de muestreo de trazas de Sentry.
+
+El muestreo se decide en dos pasos:
+1. traces_sampler (al iniciar la petición): importaciones y login se trazan
+   siempre; el resto con max(tasa de la ruta, SENTRY_TRACES_OUTLIER_RATE),
+   una muestra provisional para poder detectar latencias atípicas.
+2. before_send_transaction (al terminar): se conservan siempre las
+   transacciones lentas o con error; las demás se descartan hasta dejar la
+   tasa configurada de la ruta.
+"""
+import os
+import random  # nosec B311 - muestreo, no criptografía
+from datetime import datetime
+from urllib.parse import urlsplit
+
+
+def _rate(name, default):
+    return min(max(float(os.getenv(name, default)), 0.0), 1.0)
+
+
+DEFAULT_RATE = _rate("SENTRY_TRACES_DEFAULT_RATE", "0.05")
+# Listados y selects muy frecuentes
+HOT_RATE = _rate("SENTRY_TRACES_HOT_RATE", "0.01")
+# Login exitoso (los fallidos se conservan siempre)
+LOGIN_RATE = _rate("SENTRY_TRACES_LOGIN_RATE", "0.05")
+# Muestra provisional para detectar transacciones lentas
+OUTLIER_RATE = _rate("SENTRY_TRACES_OUTLIER_RATE", "0.1")
+SLOW_TRANSACTION_MS = float(os.getenv("SENTRY_SLOW_TRANSACTION_MS", "1000"))
+
+ALWAYS_PATHS = ("/import/",)
+LOGIN_PATHS = ("/auth/login/",)
+HOT_PATHS = ("/get/", "/select/", "/auth/session/", "/config/status/all/")
+IGNORED_PATHS = ("/metrics", "/static/")
+
+
+def route_rate(path):
+    """
+    Tasa de muestreo definitiva para una ruta.
+    """
+    if not path or path.startswith(IGNORED_PATHS):
+        return 0.0
+    if path.endswith(ALWAYS_PATHS):
+        return 1.0
+    if path.startswith(LOGIN_PATHS):
+        return LOGIN_RATE
+    if path.endswith(HOT_PATHS):
+        return HOT_RATE
+    return DEFAULT_RATE
+
+
+def _sampling_path(sampling_context):
+    scope = sampling_context.get("asgi_scope")
+    if scope:
+        return scope.get("path", "")
+    environ = sampling_context.get("wsgi_environ")
+    if environ:
+        return environ.get("PATH_INFO", "")
+    return ""
+
+
+def traces_sampler(sampling_context):
+    parent_sampled = sampling_context.get("parent_sampled")
+    if parent_sampled is not None:
+        return float(parent_sampled)
+
+    path = _sampling_path(sampling_context)
+    if not path:
+        # Tareas fuera de HTTP (websocket, comandos)
+        return DEFAULT_RATE
+    rate = route_rate(path)
+    if rate == 0.0 or path.startswith(LOGIN_PATHS):
+        # El login se traza siempre para conservar todos los fallos
+        return 1.0 if rate else 0.0
+    return max(rate, OUTLIER_RATE)
+
+
+def _event_path(event):
+    url = (event.get("request") or {}).get("url")
+    if url:
+        return urlsplit(url).path
+    return event.get("transaction", "")
+
+
+def _is_failed(event):
+    status = (event.get("contexts") or {}).get("trace", {}).get("status")
+    return status not in (None, "ok")
+
+
+def _timestamp(value):
+    # El evento llega serializado: fechas ISO 8601 (o datetime/epoch)
+    if isinstance(value, datetime):
+        return value.timestamp()
+    if isinstance(value, str):
+        return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+    return float(value)
+
+
+def _duration_ms(event):
+    try:
+        return (_timestamp(event["timestamp"]) - _timestamp(
+            event["start_timestamp"])) * 1000
+    except (KeyError, TypeError, ValueError):
+        return 0.0
+
+
+def before_send_transaction(event, hint):
+    path = _event_path(event)
+    rate = route_rate(path)
+    if rate >= 1.0 or _is_failed(event):
+        return event
+    if _duration_ms(event) >= SLOW_TRANSACTION_MS:
+        return event
+
+    # Reducir la muestra provisional a la tasa de la ruta
+    sampled_at = 1.0 if path.startswith(LOGIN_PATHS) else max(
+        rate, OUTLIER_RATE)
+    if sampled_at and random.random() < rate / sampled_at:  # nosec B311
+        return event
+    return None
@@ -17,11 +17,9 @@ Including another URLconf
 
 from django.contrib import admin
 from django.urls import include, path
-from drf_spectacular.views import (
-    SpectacularAPIView,
-    SpectacularRedocView,
-    SpectacularSwaggerView,
-)
+from config.openapi import schema_view
+from config.views import metrics_view
+from drf_spectacular.views import SpectacularRedocView, SpectacularSwaggerView
 
 urlpatterns = [
     path("admin/", admin.site.urls),
@@ -29,8 +27,10 @@ urlpatterns = [
     path("config/", include("config.urls")),
     path("config-master/", include("general_master.urls")),
     path("access/", include("access.urls")),
+    path("audit/", include("audit.urls")),
+    path("metrics", metrics_view, name="metrics"),
     # API Documentation
-    path("api/schema/", SpectacularAPIView.as_view(), name="schema"),
+    path("api/schema/", schema_view, name="schema"),
     path(
         "api/docs/",
         SpectacularSwaggerView.as_view(url_name="schema"),
@@ -0,0 +1,9 @@
+"""
+Worker ASGI para gunicorn (ver gunicorn.conf.py).
+"""
+from uvicorn_worker import UvicornWorker as BaseUvicornWorker
+
+
+class UvicornWorker(BaseUvicornWorker):
+    # Django no implementa el protocolo lifespan de ASGI
+    CONFIG_KWARGS = {**BaseUvicornWorker.CONFIG_KWARGS, "lifespan": "off"}
@@ -0,0 +1,41 @@
+#!/bin/sh
+# Arranque del servidor según SERVE_MODE:
+#   gunicorn (producción): varios workers ASGI, ver gunicorn.conf.py
+#   daphne: un único proceso
+# "serve.sh reload" recarga gunicorn con el código nuevo sin cortar
+# conexiones (USR2 + TERM al maestro anterior).
+set -e
+
+PIDFILE="${GUNICORN_PIDFILE:-/tmp/gunicorn.pid}"
+
+if [ "$1" = "reload" ]; then
+    OLD_PID=$(cat "$PIDFILE")
+    kill -USR2 "$OLD_PID"
+    # El maestro nuevo escribe <pidfile>.2 mientras el anterior sigue vivo
+    TRIES=0
+    while [ ! -f "$PIDFILE.2" ]; do
+        TRIES=$((TRIES + 1))
+        if [ "$TRIES" -gt 60 ]; then
+            echo "El nuevo maestro no arrancó; se mantiene $OLD_PID" >&2
+            exit 1
+        fi
+        sleep 1
+    done
+    kill -TERM "$OLD_PID"
+    exit 0
+fi
+
+case "${SERVE_MODE:-gunicorn}" in
+    gunicorn)
+        exec gunicorn -c gunicorn.conf.py --pid "$PIDFILE" \
+            meteorite_backend.asgi:application
+        ;;
+    daphne)
+        exec daphne -b 0.0.0.0 -p "${PORT:-10000}" \
+            meteorite_backend.asgi:application
+        ;;
+    *)
+        echo "SERVE_MODE desconocido: ${SERVE_MODE}" >&2
+        exit 1
+        ;;
+esac